@@ -0,0 +1,116 @@
+# noqa: D100
+import time
+
+from collections.abc import Callable, Hashable
+from dataclasses import dataclass
+
+
+# ----------------------------------------------------------------------
+@dataclass
+class _Entry:
+    interval: float
+    due: float
+    is_polling: bool = False
+    is_marked: bool = False
+
+
+# ----------------------------------------------------------------------
+class AdaptivePoller:
+    """Determines when items (e.g. repositories) should be polled, based on their recent activity.
+
+    Items that changed when last polled are polled again after `min_interval`; the interval doubles
+    each time an item is polled without changes (up to `max_interval`). An item is not due again until
+    the results of its current poll have been reported via `Update`. Items known to have changed (for
+    example, through an events feed) can be made due immediately with `MarkDue`.
+    """
+
+    DEFAULT_INITIAL_INTERVAL = 5 * 60.0
+    DEFAULT_MIN_INTERVAL = 60.0
+    DEFAULT_MAX_INTERVAL = 60 * 60.0
+
+    # ----------------------------------------------------------------------
+    def __init__(
+        self,
+        initial_interval: float = DEFAULT_INITIAL_INTERVAL,
+        min_interval: float = DEFAULT_MIN_INTERVAL,
+        max_interval: float = DEFAULT_MAX_INTERVAL,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        assert min_interval <= initial_interval <= max_interval
+
+        self._initial_interval = initial_interval
+        self._min_interval = min_interval
+        self._max_interval = max_interval
+        self._clock = clock
+
+        self._entries: dict[Hashable, _Entry] = {}
+
+    # ----------------------------------------------------------------------
+    def Add(self, key: Hashable) -> None:
+        """Start polling the item (or restart polling it with the initial interval)."""
+        self._entries[key] = _Entry(self._initial_interval, self._clock() + self._initial_interval)
+
+    # ----------------------------------------------------------------------
+    def Clear(self) -> None:
+        """Stop polling all items."""
+        self._entries.clear()
+
+    # ----------------------------------------------------------------------
+    def GetInterval(self, key: Hashable) -> float:
+        """Return the current polling interval of the item."""
+        return self._entries[key].interval
+
+    # ----------------------------------------------------------------------
+    def MarkDue(self, key: Hashable) -> None:
+        """Poll the item as soon as possible (or again once its current poll completes)."""
+
+        entry = self._entries.get(key)
+        if entry is None:
+            return
+
+        if entry.is_polling:
+            entry.is_marked = True
+        else:
+            entry.due = self._clock()
+
+    # ----------------------------------------------------------------------
+    def GetDue(self) -> list[Hashable]:
+        """Return the items that should be polled now; they are not due again until `Update` is called."""
+
+        now = self._clock()
+        due: list[Hashable] = []
+
+        for key, entry in self._entries.items():
+            if not entry.is_polling and entry.due <= now:
+                entry.is_polling = True
+                due.append(key)
+
+        return due
+
+    # ----------------------------------------------------------------------
+    def Update(
+        self,
+        key: Hashable,
+        *,
+        changed: bool,
+        poll_interval: float | None = None,
+    ) -> None:
+        """Schedule the next poll of the item based on the results of the current poll.
+
+        `poll_interval` is the minimum interval requested by the server (e.g. `X-Poll-Interval`).
+        """
+
+        entry = self._entries.get(key)
+        if entry is None:
+            # The item was removed while it was being polled
+            return
+
+        interval = self._min_interval if changed else min(entry.interval * 2, self._max_interval)
+
+        if poll_interval is not None:
+            interval = max(interval, poll_interval)
+
+        entry.interval = interval
+        entry.due = self._clock() if entry.is_marked else self._clock() + interval
+        entry.is_polling = False
+        entry.is_marked = False
@@ -0,0 +1,146 @@
+# noqa: D100
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+
+from AllGitStatus.Sources.Source import DeferredInfo
+
+
+# ----------------------------------------------------------------------
+@dataclass
+class _Entry:
+    value: object
+    rebuild: Callable[[], Awaitable[object]] | None
+
+
+# ----------------------------------------------------------------------
+class AdditionalInfoStore:
+    """Stores the additional info of each cell, evicting large payloads once the store is full.
+
+    Payloads of at least `min_evictable_size` characters that can be rebuilt are evicted (least recently
+    used first) once their combined size exceeds `max_size`. An evicted payload is replaced with
+    DeferredInfo that rebuilds it when it is next displayed; smaller payloads are always retained.
+    """
+
+    DEFAULT_MAX_SIZE = 8_000_000
+    DEFAULT_MIN_EVICTABLE_SIZE = 1024
+
+    # Estimated size of payloads that are not text (e.g. tracebacks)
+    NON_TEXT_SIZE = 4096
+
+    # ----------------------------------------------------------------------
+    def __init__(
+        self,
+        max_size: int = DEFAULT_MAX_SIZE,
+        min_evictable_size: int = DEFAULT_MIN_EVICTABLE_SIZE,
+    ) -> None:
+        self._max_size = max_size
+        self._min_evictable_size = min_evictable_size
+
+        self._entries: dict[tuple[int, int], _Entry] = {}
+
+        # Evictable entries and their sizes, from least to most recently used
+        self._evictable: OrderedDict[tuple[int, int], int] = OrderedDict()
+        self._size = 0
+
+    # ----------------------------------------------------------------------
+    @property
+    def size(self) -> int:
+        """Combined size of the evictable payloads currently retained."""
+        return self._size
+
+    # ----------------------------------------------------------------------
+    def Get(self, row_index: int, col_index: int) -> object | None:
+        """Return the additional info of the cell (if any)."""
+
+        key = (row_index, col_index)
+
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+
+        if key in self._evictable:
+            self._evictable.move_to_end(key)
+
+        return entry.value
+
+    # ----------------------------------------------------------------------
+    def Set(
+        self,
+        row_index: int,
+        col_index: int,
+        value: object,
+        rebuild: Callable[[], Awaitable[object]] | None = None,
+    ) -> None:
+        """Set the additional info of the cell; `rebuild` recreates the info if it is evicted."""
+
+        self._Remove((row_index, col_index))
+        self._entries[(row_index, col_index)] = _Entry(value, rebuild)
+        self._Track((row_index, col_index))
+
+    # ----------------------------------------------------------------------
+    def Update(self, row_index: int, col_index: int, value: object) -> None:
+        """Replace the additional info of the cell (e.g. once deferred info is resolved)."""
+
+        entry = self._entries.get((row_index, col_index))
+        self.Set(row_index, col_index, value, None if entry is None else entry.rebuild)
+
+    # ----------------------------------------------------------------------
+    def RemoveRow(self, row_index: int) -> None:
+        """Remove the additional info of all cells in the row."""
+
+        for key in [key for key in self._entries if key[0] == row_index]:
+            self._Remove(key)
+
+    # ----------------------------------------------------------------------
+    def Clear(self) -> None:
+        """Remove the additional info of all cells."""
+
+        self._entries.clear()
+        self._evictable.clear()
+        self._size = 0
+
+    # ----------------------------------------------------------------------
+    # |
+    # |  Private Methods
+    # |
+    # ----------------------------------------------------------------------
+    def _Track(self, key: tuple[int, int]) -> None:
+        entry = self._entries[key]
+
+        if entry.rebuild is None or isinstance(entry.value, DeferredInfo):
+            return
+
+        size = len(entry.value) if isinstance(entry.value, str) else self.NON_TEXT_SIZE
+        if size < self._min_evictable_size:
+            return
+
+        self._evictable[key] = size
+        self._size += size
+
+        # The payload that was just added is never evicted, so that it can be displayed once it is rebuilt
+        while self._size > self._max_size and len(self._evictable) > 1:
+            evicted_key, evicted_size = self._evictable.popitem(last=False)
+            self._size -= evicted_size
+
+            evicted = self._entries[evicted_key]
+            assert evicted.rebuild is not None
+
+            evicted.value = DeferredInfo(self._CreatePlaceholder(evicted.value), evicted.rebuild)
+
+    # ----------------------------------------------------------------------
+    def _Remove(self, key: tuple[int, int]) -> None:
+        self._entries.pop(key, None)
+
+        size = self._evictable.pop(key, None)
+        if size is not None:
+            self._size -= size
+
+    # ----------------------------------------------------------------------
+    @staticmethod
+    def _CreatePlaceholder(value: object) -> str:
+        # The first line of the info is typically a heading (e.g. "Issues: <url>")
+        if isinstance(value, str) and (heading := value.split("\n", 1)[0]):
+            return f"{heading}\n\nLoading..."
+
+        return "Loading..."
@@ -1,9 +1,16 @@
 # noqa: D100
 import contextlib
+import functools
+import math
+import sqlite3
 import textwrap
+import zipfile
 
+from collections.abc import AsyncGenerator, Awaitable, Callable, Coroutine
 from dataclasses import dataclass
+from datetime import datetime, timedelta, UTC
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 import aiohttp
 from rich.text import Text
@@ -12,15 +19,36 @@ from textual.app import App, ComposeResult, ScreenStackError
 from textual.containers import Horizontal, Vertical
 from textual.coordinate import Coordinate
 from textual.screen import ModalScreen
-from textual.widgets import DataTable, Footer, Header, Label, RichLog
+from textual.widgets import DataTable, Footer, Header, Label, RichLog, Static
 
 from AllGitStatus import __version__
+from AllGitStatus.AdaptivePoller import AdaptivePoller
+from AllGitStatus.AdditionalInfoStore import AdditionalInfoStore
 from AllGitStatus.Repository import EnumerateRepositories, Repository
+from AllGitStatus.Sources.AdvisoryDatabase import AdvisoryDatabase
+from AllGitStatus.Sources.DependencyVulnerabilities import DependencyVulnerabilities
+from AllGitStatus.Sources.GitHubCICDCache import GitHubCICDCache
+from AllGitStatus.Sources.GitHubCircuitBreaker import GitHubCircuitBreaker
+from AllGitStatus.Sources.GitHubConnection import ConnectionMetrics, ConnectionStats, ConnectorConfig
+from AllGitStatus.Sources.GitHubEventsFeed import GitHubEventsFeed
+from AllGitStatus.Sources.GitHubIssueStore import GitHubIssueStore
+from AllGitStatus.Sources.GitHubOwnerListings import GitHubOwnerListings
+from AllGitStatus.Sources.GitHubRequestScheduler import GitHubRequestScheduler, RateLimitStatus
+from AllGitStatus.Sources.GitHubResponseCache import GitHubResponseCache
+from AllGitStatus.Sources.GitHubSearchCounts import GitHubSearchCounts
+from AllGitStatus.Sources.GitHubSession import GitHubSession, RetryPolicy
 from AllGitStatus.Sources.GitHubSource import GitHubSource
+from AllGitStatus.Sources.GitHubTokenPool import GitHubTokenPool
 from AllGitStatus.Sources.LocalGitSource import LocalGitSource
-from AllGitStatus.Sources.Source import ErrorInfo, ResultInfo
+from AllGitStatus.Sources.Source import DeferredInfo, ErrorInfo, ResultInfo
+from AllGitStatus.Sources.UvAuditCache import UvAuditCache
+from AllGitStatus.Sources.UvAuditRunner import UvAuditRunner
 from AllGitStatus.Sources.UvAuditSource import UvAuditSource
 
+if TYPE_CHECKING:
+    from textual.timer import Timer  # pragma: no cover
+    from textual.worker import Worker  # pragma: no cover
+
 
 # ----------------------------------------------------------------------
 # ----------------------------------------------------------------------
@@ -89,20 +117,77 @@ class MainApp(App):
         ("q", "quit", "Quit"),
     ]
 
+    # Frequency (in seconds) at which repositories are checked to see if they are due to be polled
+    POLL_TIMER_INTERVAL = 5.0
+
+    # Frequency (in seconds) at which buffered cell updates are applied to the table
+    CELL_UPDATE_INTERVAL = 0.05
+
     # ----------------------------------------------------------------------
-    def __init__(
+    def __init__(  # noqa: PLR0913
         self,
         working_dir: Path,
-        github_pat: str | None,
+        github_pat: str | list[str] | None,
         *args,
         debug: bool = False,
+        cache_dir: Path | None = None,
+        lazy_details: bool = False,
+        search_counts: bool = False,
+        owner_listings: bool = False,
+        lean_cicd: bool = False,
+        auto_refresh: bool = False,
+        events_refresh: bool = False,
+        connector_config: ConnectorConfig | None = None,
+        connection_metrics: bool = False,
+        uv_audit_max_age: timedelta = UvAuditCache.DEFAULT_MAX_AGE,
+        uv_audit_concurrency: int = UvAuditRunner.DEFAULT_MAX_CONCURRENT_AUDITS,
+        uv_audit_low_priority: bool = False,
+        shared_audit: bool = False,
+        advisory_database: Path | None = None,
+        sync_advisory_database: bool = False,
         **kwargs,
     ) -> None:
         super().__init__(*args, **kwargs)
 
         self._working_dir = working_dir
-        self._github_pat = github_pat
+        self._github_pats = [github_pat] if isinstance(github_pat, str) else list(github_pat or [])
         self._debug = debug
+        self._cache_dir = cache_dir
+        self._lazy_details = lazy_details
+        self._search_counts = search_counts
+        self._owner_listings = owner_listings
+        self._lean_cicd = lean_cicd
+
+        self._events_refresh = events_refresh
+        self._connector_config = connector_config or ConnectorConfig()
+        self._uv_audit_max_age = uv_audit_max_age
+
+        # Audits are limited across all repositories so that they don't starve the git queries
+        self._uv_audit_runner = UvAuditRunner(uv_audit_concurrency, low_priority=uv_audit_low_priority)
+        self._shared_audit = shared_audit
+        self._advisory_database_filename = advisory_database
+        self._sync_advisory_database = sync_advisory_database and advisory_database is not None
+
+        # Connection metrics are displayed alongside the GitHub status when enabled
+        self._connection_metrics = (
+            ConnectionMetrics(self._OnConnectionStatsChanged) if connection_metrics else None
+        )
+
+        self._github_rate_limit_status: RateLimitStatus | None = None
+        self._connection_stats: ConnectionStats | None = None
+
+        # GitHub information is polled in the background when auto refresh is enabled; when events
+        # refresh is enabled (without auto refresh), repositories are only polled when their owner's
+        # events feed reveals activity.
+        self._poller: AdaptivePoller | None = None
+
+        if auto_refresh:
+            self._poller = AdaptivePoller()
+        elif events_refresh:
+            self._poller = AdaptivePoller(math.inf, math.inf, math.inf)
+
+        self._github_events_feed: GitHubEventsFeed | None = None
+        self._dependency_vulnerabilities: DependencyVulnerabilities | None = None
 
         self.title = "AllGitStatus{}".format(" [DEBUG]" if debug else "")
 
@@ -117,9 +202,14 @@ class MainApp(App):
         self._additional_info = RichLog(id="additional_info", auto_scroll=False)
         self._additional_info.border_title = "[2] Additional Info"
 
+        self._github_status = Static(id="github_status")
+
         self._repositories: list[Repository] | None = None
 
-        self._additional_info_data: dict[
+        # Large payloads are evicted when memory is constrained and rebuilt when they are next displayed
+        self._additional_info_data = AdditionalInfoStore()
+
+        self._state_data: dict[
             int,  # row_index
             dict[
                 int,  # column_index
@@ -127,7 +217,8 @@ class MainApp(App):
             ],
         ] = {}
 
-        self._state_data: dict[
+        # Used to detect changes in polled values
+        self._cell_signatures: dict[
             int,  # row_index
             dict[
                 int,  # column_index
@@ -135,9 +226,25 @@ class MainApp(App):
             ],
         ] = {}
 
+        # Cell updates are buffered and applied in batches, as updating the table for every result
+        # while thousands of results are arriving keeps the UI from responding
+        self._pending_cell_updates: dict[Coordinate, Text] = {}
+        self._cell_update_timer: Timer | None = None
+
+        # Number of repositories whose cells are being loaded by a refresh
+        self._num_loading_repositories = 0
+
         # The lifetime of this object is defined by `on_mount` and `on_unmount` as aiohttp.ClientSession
         # requires an active event loop
-        self._github_session: aiohttp.ClientSession | None = None
+        self._github_session: GitHubSession | None = None
+        self._github_issue_store: GitHubIssueStore | None = None
+        self._uv_audit_cache: UvAuditCache | None = None
+        self._advisory_session: aiohttp.ClientSession | None = None
+        self._advisory_database: AdvisoryDatabase | None = None
+        self._advisory_database_sync: Worker[None] | None = None
+
+        # CI/CD status is cached for the lifetime of the app
+        self._github_cicd_cache = GitHubCICDCache()
 
     # ----------------------------------------------------------------------
     def compose(self) -> ComposeResult:  # noqa: D102
@@ -147,18 +254,63 @@ class MainApp(App):
             self._additional_info,
             id="vertical_group",
         )
-        yield Horizontal(Footer(), Label(__version__), id="footer")
+        yield Horizontal(Footer(), self._github_status, Label(__version__), id="footer")
 
     # ----------------------------------------------------------------------
     async def on_mount(self) -> None:  # noqa: D102
         assert self._github_session is None
-        self._github_session = aiohttp.ClientSession(
-            headers=GitHubSource.CreateGitHubHttpHeaders(self._github_pat)
+
+        # Requests are distributed across the tokens when multiple tokens are provided
+        github_token_pool = GitHubTokenPool(self._github_pats) if len(self._github_pats) > 1 else None
+        github_identity = "\n".join(self._github_pats) or None
+
+        self._github_session = GitHubSession(
+            aiohttp.ClientSession(
+                headers=GitHubSource.CreateGitHubHttpHeaders(None if github_token_pool else github_identity),
+                connector=self._connector_config.CreateConnector(),
+                trace_configs=None
+                if self._connection_metrics is None
+                else [self._connection_metrics.CreateTraceConfig()],
+            ),
+            cache=None
+            if self._cache_dir is None
+            else GitHubResponseCache(self._cache_dir / "GitHubResponses.db", github_identity),
+            scheduler=GitHubRequestScheduler(
+                on_status_changed=self._OnGitHubStatusChanged,
+                token_pool=github_token_pool,
+            ),
+            search_scheduler=GitHubRequestScheduler(token_pool=github_token_pool, resource="search"),
+            token_pool=github_token_pool,
+            retry_policy=RetryPolicy(),
+            circuit_breaker=GitHubCircuitBreaker(),
         )
 
+        if self._cache_dir is not None:
+            assert self._github_issue_store is None
+            self._github_issue_store = GitHubIssueStore(self._cache_dir / "GitHubIssues.db", github_identity)
+
+            assert self._uv_audit_cache is None
+            self._uv_audit_cache = UvAuditCache(self._cache_dir / "UvAudit.db", self._uv_audit_max_age)
+
+        if self._advisory_database_filename is not None:
+            assert self._advisory_database is None
+            self._advisory_database = AdvisoryDatabase(self._advisory_database_filename)
+
+        if self._shared_audit or self._sync_advisory_database:
+            assert self._advisory_session is None
+            self._advisory_session = aiohttp.ClientSession()
+
+        if self._sync_advisory_database:
+            # Dependencies are audited with the snapshot once it has been synced
+            assert self._advisory_database_sync is None
+            self._advisory_database_sync = self.run_worker(self._SyncAdvisoryDatabase())
+
         for column in COLUMN_MAP.values():
             self._data_table.add_column(Text(column.name, justify=column.justify))  # ty: ignore[invalid-argument-type]
 
+        if self._poller is not None:
+            self.set_interval(self.POLL_TIMER_INTERVAL, self._OnPollTimer)
+
         await self._ResetAllRepositories()
 
     # ----------------------------------------------------------------------
@@ -168,22 +320,50 @@ class MainApp(App):
             await self._github_session.close()
             self._github_session = None
 
+        if self._github_issue_store is not None:
+            self._github_issue_store.Close()
+            self._github_issue_store = None
+
+        if self._uv_audit_cache is not None:
+            self._uv_audit_cache.Close()
+            self._uv_audit_cache = None
+
+        if self._advisory_session is not None:
+            await self._advisory_session.close()
+            self._advisory_session = None
+
+        self._advisory_database_sync = None
+
+        if self._advisory_database is not None:
+            self._advisory_database.Close()
+            self._advisory_database = None
+
     # ----------------------------------------------------------------------
     async def on_data_table_cell_highlighted(self, message: DataTable.ColumnSelected) -> None:  # noqa: ARG002, D102
         await self._OnSelectionChanged()
 
     # ----------------------------------------------------------------------
     async def action_RefreshAll(self) -> None:  # noqa: D102
+        # Explicit refreshes should display the latest CI/CD status
+        self._github_cicd_cache.Clear()
+
         await self._ResetAllRepositories()
 
     # ----------------------------------------------------------------------
     async def action_RefreshSelected(self) -> None:  # noqa: D102
         assert self._repositories is not None
+        assert self._github_session is not None
 
-        await self._ResetRepository(
-            self._repositories[self._data_table.cursor_coordinate.row],
-            self._data_table.cursor_coordinate.row,
-        )
+        # Refreshing a repository should not reuse GitHub requests from the previous refresh
+        self._StartGeneration()
+
+        repository = self._repositories[self._data_table.cursor_coordinate.row]
+
+        # Explicit refreshes should display the latest CI/CD status
+        if repository.github_owner and repository.github_repo:
+            self._github_cicd_cache.Remove(repository.github_owner, repository.github_repo)
+
+        await self._ResetRepository(repository, self._data_table.cursor_coordinate.row)
 
     # ----------------------------------------------------------------------
     async def action_PullSelected(self) -> None:  # noqa: D102
@@ -201,6 +381,9 @@ class MainApp(App):
         repository = self._repositories[self._data_table.cursor_coordinate.row]
 
         await LocalGitSource.Push(repository)
+
+        # The repository on GitHub has changed
+        self._StartGeneration()
         await self._ResetRepository(repository, self._data_table.cursor_coordinate.row)
 
     # ----------------------------------------------------------------------
@@ -256,10 +439,18 @@ class MainApp(App):
     # ----------------------------------------------------------------------
     async def _ResetAllRepositories(self) -> None:
         self._repositories = None
-        self._additional_info_data.clear()
+        self._additional_info_data.Clear()
         self._state_data.clear()
+        self._cell_signatures.clear()
+        self._ClearCellUpdates()
         self._data_table.clear()
 
+        if self._poller is not None:
+            self._poller.Clear()
+
+        self._github_events_feed = None
+        self._dependency_vulnerabilities = None
+
         await self._OnSelectionChanged()
 
         # Get the repositories
@@ -272,25 +463,103 @@ class MainApp(App):
             assert self._repositories is None
             self._repositories = repositories
 
+            assert self._github_session is not None
+            self._github_session.StartGeneration()
+
+            # Repository information for owners with many repositories is listed in bulk once per refresh
+            # (the listings don't include the number of watchers, which is retrieved when selected)
+            github_owner_listings = (
+                GitHubOwnerListings(self._github_session, repositories) if self._owner_listings else None
+            )
+
+            # Issue and pull request counts are searched for in batches of repositories
+            github_search_counts = (
+                GitHubSearchCounts(self._github_session, repositories) if self._search_counts else None
+            )
+
+            if self._events_refresh:
+                self._github_events_feed = GitHubEventsFeed(self._github_session, repositories)
+
+            # The dependencies of all repositories are audited together, once per unique pinned package
+            self._dependency_vulnerabilities = self._CreateDependencyVulnerabilities(repositories)
+
             for repository_index, repository in enumerate(repositories):
                 self._data_table.add_row()
 
-                await self._ResetRepository(repository, repository_index)
+                await self._ResetRepository(
+                    repository,
+                    repository_index,
+                    github_owner_listings=github_owner_listings,
+                    github_search_counts=github_search_counts,
+                    dependency_vulnerabilities=self._dependency_vulnerabilities,
+                )
 
         # ----------------------------------------------------------------------
 
         self.push_screen(_GetRepositoriesModal(self._working_dir), OnRepositoriesComplete)
 
     # ----------------------------------------------------------------------
-    async def _ResetRepository(self, repository: Repository, repository_index: int) -> None:
-        self._additional_info_data.pop(repository_index, None)
+    def _CreateDependencyVulnerabilities(
+        self,
+        repositories: list[Repository],
+    ) -> DependencyVulnerabilities | None:
+        if self._advisory_database is not None:
+            return DependencyVulnerabilities(
+                self._advisory_session,
+                repositories,
+                advisory_database=self._advisory_database,
+                wait_for_advisory_database=(
+                    None if self._advisory_database_sync is None else self._advisory_database_sync.wait
+                ),
+            )
+
+        if self._shared_audit:
+            assert self._advisory_session is not None
+            return DependencyVulnerabilities(self._advisory_session, repositories)
+
+        return None
+
+    # ----------------------------------------------------------------------
+    async def _SyncAdvisoryDatabase(self) -> None:
+        assert self._advisory_database is not None
+        assert self._advisory_session is not None
+
+        # The snapshot is refreshed as often as cached uv audit results expire
+        synced = self._advisory_database.synced
+        if synced is not None and datetime.now(UTC) - synced < self._uv_audit_max_age:
+            return
+
+        # Hosts without network access (or given an invalid export) continue to use the existing snapshot
+        with contextlib.suppress(
+            aiohttp.ClientError,
+            OSError,
+            TimeoutError,
+            ValueError,
+            zipfile.BadZipFile,
+            sqlite3.Error,
+        ):
+            await self._advisory_database.Sync(self._advisory_session)
+
+    # ----------------------------------------------------------------------
+    async def _ResetRepository(
+        self,
+        repository: Repository,
+        repository_index: int,
+        *,
+        github_owner_listings: GitHubOwnerListings | None = None,
+        github_search_counts: GitHubSearchCounts | None = None,
+        dependency_vulnerabilities: DependencyVulnerabilities | None = None,
+    ) -> None:
+        # The local advisory database is inexpensive to query for a single repository
+        if dependency_vulnerabilities is None and self._advisory_database is not None:
+            dependency_vulnerabilities = self._CreateDependencyVulnerabilities([repository])
+
+        self._additional_info_data.RemoveRow(repository_index)
         self._state_data.pop(repository_index, None)
+        self._cell_signatures.pop(repository_index, None)
 
         for column in COLUMN_MAP.values():
-            self._data_table.update_cell_at(
-                Coordinate(repository_index, column.value),
-                "",
-            )
+            self._UpdateCell(Coordinate(repository_index, column.value), Text(""))
 
         if repository_index == self._data_table.cursor_coordinate.row:
             await self._OnSelectionChanged()
@@ -302,17 +571,20 @@ class MainApp(App):
         else:
             repo_name = str(repository.path.relative_to(self._working_dir))
 
-        self._data_table.update_cell_at(
+        self._UpdateCell(
             Coordinate(repository_index, NameColumn.value),
             Text(f"📂 {repo_name}", justify=NameColumn.justify),  # ty: ignore[invalid-argument-type]
-            update_width=True,
         )
 
-        self._additional_info_data.setdefault(repository_index, {})[NameColumn.value] = textwrap.dedent(
-            f"""\
-            Local:  {repository.path}
-            Origin: {repository.remote_url or ""}
-            """,
+        self._additional_info_data.Set(
+            repository_index,
+            NameColumn.value,
+            textwrap.dedent(
+                f"""\
+                Local:  {repository.path}
+                Origin: {repository.remote_url or ""}
+                """,
+            ),
         )
 
         # Load the content
@@ -323,8 +595,16 @@ class MainApp(App):
 
             sources = [
                 LocalGitSource(),
-                GitHubSource(self._github_session),
-                UvAuditSource(),
+                GitHubSource(
+                    self._github_session,
+                    github_owner_listings,
+                    self._github_issue_store,
+                    lazy_details=self._lazy_details,
+                    search_counts=github_search_counts,
+                    cicd_cache=self._github_cicd_cache,
+                    lean_cicd=self._lean_cicd,
+                ),
+                UvAuditSource(self._uv_audit_cache, dependency_vulnerabilities, self._uv_audit_runner),
             ]
 
             # Set all of the column values to pending
@@ -339,10 +619,9 @@ class MainApp(App):
                     if column_key[0] != source.__class__.__name__:
                         continue
 
-                    self._data_table.update_cell_at(
+                    self._UpdateCell(
                         Coordinate(repository_index, column.value),
                         Text("⏳", justify=column.justify),  # ty: ignore[invalid-argument-type]
-                        update_width=True,
                     )
 
             # Get the actual values
@@ -353,9 +632,32 @@ class MainApp(App):
                 async for info in source.Query(repository):
                     await self._PopulateCell(repository_index, info)
 
+                if self._poller is not None and isinstance(source, GitHubSource):
+                    self._poller.Add(repository_index)
+
         # ----------------------------------------------------------------------
 
-        self.run_worker(LoadCells())
+        self.run_worker(self._TrackLoading(LoadCells()))
+
+    # ----------------------------------------------------------------------
+    async def _TrackLoading(self, coroutine: Coroutine[object, object, None]) -> None:
+        self._num_loading_repositories += 1
+
+        try:
+            await coroutine
+        finally:
+            self._num_loading_repositories -= 1
+
+    # ----------------------------------------------------------------------
+    def _StartGeneration(self) -> None:
+        assert self._github_session is not None
+
+        # Requests made by a refresh that is in progress are shared with the new requests, as starting a
+        # new generation would send duplicate requests for the remainder of the refresh.
+        if self._num_loading_repositories:
+            return
+
+        self._github_session.StartGeneration()
 
     # ----------------------------------------------------------------------
     async def _PopulateCell(self, repository_index: int, info: ResultInfo | ErrorInfo) -> None:
@@ -363,11 +665,7 @@ class MainApp(App):
 
         if isinstance(info, ErrorInfo):
             display_value = "💥"
-            additional_info = Traceback.from_exception(
-                type(info.error),
-                info.error,
-                info.error.__traceback__ if self._debug else None,
-            )
+            additional_info = self._CreateTraceback(info.error)
 
         elif isinstance(info, ResultInfo):
             display_value = info.display_value
@@ -382,17 +680,151 @@ class MainApp(App):
         else:
             assert False, info  # noqa: B011, PT015  # pragma: no cover
 
-        self._data_table.update_cell_at(
+        self._UpdateCell(
             Coordinate(repository_index, column.value),
             Text(display_value, justify=column.justify),  # ty: ignore[invalid-argument-type]
-            update_width=True,
         )
 
-        self._additional_info_data.setdefault(repository_index, {})[column.value] = additional_info
+        self._additional_info_data.Set(
+            repository_index,
+            column.value,
+            additional_info,
+            self._CreateRebuild(repository_index, info.key, additional_info),
+        )
+        self._cell_signatures.setdefault(repository_index, {})[column.value] = self._CreateSignature(info)
 
         if self._data_table.cursor_row == repository_index and self._data_table.cursor_column == column.value:
             await self._OnSelectionChanged()
 
+    # ----------------------------------------------------------------------
+    def _UpdateCell(self, coordinate: Coordinate, value: Text) -> None:
+        # Only the latest value is applied when a cell is updated multiple times within an interval
+        self._pending_cell_updates[coordinate] = value
+
+        if self._cell_update_timer is None:
+            self._cell_update_timer = self.set_timer(self.CELL_UPDATE_INTERVAL, self._FlushCellUpdates)
+
+    # ----------------------------------------------------------------------
+    def _FlushCellUpdates(self) -> None:
+        self._cell_update_timer = None
+
+        pending_cell_updates = self._pending_cell_updates
+        self._pending_cell_updates = {}
+
+        # The table recalculates column widths once for all of the updated cells when it is next idle,
+        # and the screen is repainted once for the batch.
+        with self.batch_update():
+            for coordinate, value in pending_cell_updates.items():
+                if not self._data_table.is_valid_coordinate(coordinate):
+                    continue
+
+                self._data_table.update_cell_at(coordinate, value, update_width=True)
+
+    # ----------------------------------------------------------------------
+    def _ClearCellUpdates(self) -> None:
+        if self._cell_update_timer is not None:
+            self._cell_update_timer.stop()
+            self._cell_update_timer = None
+
+        self._pending_cell_updates.clear()
+
+    # ----------------------------------------------------------------------
+    @staticmethod
+    def _CreateSignature(info: ResultInfo | ErrorInfo) -> object:
+        if isinstance(info, ErrorInfo):
+            return (type(info.error), str(info.error))
+
+        additional_info = info.additional_info
+
+        # Deferred info is compared by its placeholder, as it is created anew each time it is queried
+        if isinstance(additional_info, DeferredInfo):
+            additional_info = additional_info.placeholder
+
+        return (info.display_value, additional_info, info.state_data)
+
+    # ----------------------------------------------------------------------
+    async def _OnPollTimer(self) -> None:
+        assert self._poller is not None
+
+        if self._repositories is None:
+            return
+
+        github_events_feed = self._github_events_feed
+        if github_events_feed is not None and not github_events_feed.is_due:
+            github_events_feed = None
+
+        due = self._poller.GetDue()
+
+        if not due and github_events_feed is None:
+            return
+
+        assert self._github_session is not None
+
+        # Polls should not reuse GitHub requests from the previous refresh
+        self._StartGeneration()
+
+        if github_events_feed is not None:
+            self.run_worker(self._PollEventsFeed(github_events_feed))
+
+        for repository_index in due:
+            assert isinstance(repository_index, int)
+            self.run_worker(self._PollRepository(self._repositories[repository_index], repository_index))
+
+    # ----------------------------------------------------------------------
+    async def _PollEventsFeed(self, github_events_feed: GitHubEventsFeed) -> None:
+        assert self._poller is not None
+
+        active_repositories = await github_events_feed.GetActiveRepositories()
+
+        if self._repositories is None or github_events_feed is not self._github_events_feed:
+            # The repositories were refreshed while the feed was being polled
+            return
+
+        for repository_index, repository in enumerate(self._repositories):
+            if f"{repository.github_owner}/{repository.github_repo}".lower() in active_repositories:
+                self._poller.MarkDue(repository_index)
+
+    # ----------------------------------------------------------------------
+    async def _PollRepository(self, repository: Repository, repository_index: int) -> None:
+        assert self._poller is not None
+        assert self._github_session is not None
+
+        poller = self._poller
+        github_session = self._github_session
+        repositories = self._repositories
+
+        source = GitHubSource(
+            github_session,
+            None,
+            self._github_issue_store,
+            lazy_details=self._lazy_details,
+            cicd_cache=self._github_cicd_cache,
+            lean_cicd=self._lean_cicd,
+        )
+
+        changed = False
+
+        try:
+            async for info in source.Query(repository):
+                if self._repositories is not repositories:
+                    # The repositories were refreshed while this one was being polled
+                    return
+
+                column = COLUMN_MAP[info.key]
+
+                # Only update the cells whose values have changed
+                signature = self._CreateSignature(info)
+
+                if self._cell_signatures.get(repository_index, {}).get(column.value) == signature:
+                    continue
+
+                changed = True
+                await self._PopulateCell(repository_index, info)
+
+        finally:
+            if self._repositories is repositories:
+                poller.Update(repository_index, changed=changed, poll_interval=github_session.poll_interval)
+
     # ----------------------------------------------------------------------
     async def _OnSelectionChanged(self) -> None:
         self._additional_info.clear()
@@ -401,12 +833,140 @@ class MainApp(App):
         row_index = self._data_table.cursor_coordinate.row
         col_index = self._data_table.cursor_coordinate.column
 
-        additional_info = self._additional_info_data.get(row_index, {}).get(col_index)
+        additional_info = self._additional_info_data.Get(row_index, col_index)
+
+        if isinstance(additional_info, DeferredInfo):
+            self.run_worker(self._ResolveDeferredInfo(row_index, col_index, additional_info))
+            additional_info = additional_info.placeholder
 
         if additional_info:
             self._additional_info.write(additional_info)
             self._additional_info.scroll_home()
 
+    # ----------------------------------------------------------------------
+    async def _ResolveDeferredInfo(self, row_index: int, col_index: int, deferred_info: DeferredInfo) -> None:
+        try:
+            additional_info = await deferred_info.Resolve()
+        except Exception as ex:
+            additional_info = self._CreateTraceback(ex)
+
+        if self._additional_info_data.Get(row_index, col_index) is not deferred_info:
+            # The cell was refreshed while the info was being retrieved
+            return
+
+        self._additional_info_data.Update(row_index, col_index, additional_info)
+
+        if self._data_table.cursor_row == row_index and self._data_table.cursor_column == col_index:
+            await self._OnSelectionChanged()
+
+    # ----------------------------------------------------------------------
+    def _CreateRebuild(
+        self,
+        repository_index: int,
+        key: tuple[str, str | None],
+        additional_info: object,
+    ) -> Callable[[], Awaitable[object]] | None:
+        # Deferred info is rebuilt by retrieving it again, which doesn't require querying the source
+        if isinstance(additional_info, DeferredInfo):
+            return additional_info.factory
+
+        if self._repositories is None:
+            return None
+
+        return functools.partial(self._RebuildAdditionalInfo, self._repositories[repository_index], key)
+
+    # ----------------------------------------------------------------------
+    async def _RebuildAdditionalInfo(self, repository: Repository, key: tuple[str, str | None]) -> object:
+        assert self._github_session is not None
+
+        # Only the source that provided the info is queried again
+        infos: AsyncGenerator[ResultInfo | ErrorInfo]
+
+        if key[0] == GitHubSource.__name__:
+            assert key[1] is not None
+
+            # Only the requests needed for the info are made
+            infos = GitHubSource(
+                self._github_session,
+                None,
+                self._github_issue_store,
+                cicd_cache=self._github_cicd_cache,
+                lean_cicd=self._lean_cicd,
+            ).QueryInfo(repository, key[1])
+        elif key[0] == UvAuditSource.__name__:
+            infos = UvAuditSource(
+                self._uv_audit_cache,
+                self._dependency_vulnerabilities,
+                self._uv_audit_runner,
+            ).Query(repository)
+        else:
+            infos = LocalGitSource().Query(repository)
+
+        async with contextlib.aclosing(infos) as infos:
+            async for info in infos:
+                if info.key != key:
+                    continue
+
+                if isinstance(info, ErrorInfo):
+                    return self._CreateTraceback(info.error)
+
+                additional_info = info.additional_info
+
+                if isinstance(additional_info, DeferredInfo):
+                    additional_info = await additional_info.Resolve()
+
+                return additional_info
+
+        return None
+
+    # ----------------------------------------------------------------------
+    def _CreateTraceback(self, error: Exception) -> Traceback:
+        return Traceback.from_exception(
+            type(error),
+            error,
+            error.__traceback__ if self._debug else None,
+        )
+
+    # ----------------------------------------------------------------------
+    def _OnGitHubStatusChanged(self, status: RateLimitStatus) -> None:
+        self._github_rate_limit_status = status
+        self._UpdateGitHubStatus()
+
+    # ----------------------------------------------------------------------
+    def _OnConnectionStatsChanged(self, stats: ConnectionStats) -> None:
+        self._connection_stats = stats
+        self._UpdateGitHubStatus()
+
+    # ----------------------------------------------------------------------
+    def _UpdateGitHubStatus(self) -> None:
+        parts: list[str] = []
+
+        status = self._github_rate_limit_status
+
+        if status is not None and status.remaining is not None and status.limit is not None:
+            parts.append(f"GitHub: {status.remaining:,}/{status.limit:,}")
+
+        if status is not None and status.queued:
+            queued = f"{status.queued:,} queued"
+
+            if status.eta is not None:
+                queued += f" (ETA {timedelta(seconds=round(status.eta))})"
+
+            parts.append(queued)
+
+        stats = self._connection_stats
+
+        if stats is not None:
+            parts.append(f"Connections: {stats.new_connections:,} new, {stats.reused_connections:,} reused")
+            parts.append(f"DNS: {stats.dns_lookups:,} lookups, {stats.dns_cache_hits:,} cached")
+
+            if stats.average_time_to_first_byte is not None and stats.max_time_to_first_byte is not None:
+                parts.append(
+                    f"TTFB: {stats.average_time_to_first_byte * 1000:,.0f} ms avg, {stats.max_time_to_first_byte * 1000:,.0f} ms max"
+                )
+
+        self._github_status.update(" | ".join(parts))
+
     # ----------------------------------------------------------------------
     def _RefreshBindings(self) -> None:
         # ScreenStackErrors are occasionally raised when testing
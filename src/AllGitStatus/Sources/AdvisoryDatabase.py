@@ -0,0 +1,298 @@
+# noqa: D100
+import asyncio
+import json
+import re
+import sqlite3
+import tempfile
+import threading
+import zipfile
+
+from collections.abc import Iterable
+from datetime import datetime, UTC
+from pathlib import Path
+
+import aiohttp
+
+from AllGitStatus.Sources.DependencyVulnerabilities import (
+    GetSeverity,
+    GetSummary,
+    NormalizeName,
+    Pin,
+    Vulnerability,
+)
+
+
+# ----------------------------------------------------------------------
+class AdvisoryDatabase:
+    """Local snapshot of the OSV advisory database for PyPI packages, queried without network access.
+
+    The snapshot is created from the OSV export of all PyPI advisories (either downloaded by `Sync` or
+    copied to air-gapped hosts and imported with `ImportArchive`). Affected versions are indexed by
+    package name and version; advisories that only provide version ranges are indexed by package name
+    and matched against the release segment of the version.
+    """
+
+    EXPORT_URL = "https://osv-vulnerabilities.storage.googleapis.com/PyPI/all.zip"
+
+    DOWNLOAD_CHUNK_SIZE = 1024 * 1024
+
+    # ----------------------------------------------------------------------
+    def __init__(self, filename: Path) -> None:
+        filename.parent.mkdir(parents=True, exist_ok=True)
+
+        # Queries and imports are run in worker threads so that they don't block the event loop
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(filename, check_same_thread=False)
+
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.executescript(
+            """
+            CREATE TABLE IF NOT EXISTS vulnerabilities (
+                id TEXT PRIMARY KEY,
+                summary TEXT NOT NULL,
+                severity TEXT
+            );
+
+            CREATE TABLE IF NOT EXISTS affected_versions (
+                name TEXT NOT NULL,
+                version TEXT NOT NULL,
+                id TEXT NOT NULL
+            );
+
+            CREATE INDEX IF NOT EXISTS affected_versions_index ON affected_versions (name, version);
+
+            CREATE TABLE IF NOT EXISTS affected_ranges (
+                name TEXT NOT NULL,
+                introduced TEXT NOT NULL,
+                fixed TEXT,
+                last_affected TEXT,
+                id TEXT NOT NULL
+            );
+
+            CREATE INDEX IF NOT EXISTS affected_ranges_index ON affected_ranges (name);
+
+            CREATE TABLE IF NOT EXISTS metadata (
+                key TEXT PRIMARY KEY,
+                value TEXT NOT NULL
+            );
+            """,
+        )
+
+    # ----------------------------------------------------------------------
+    def Close(self) -> None:
+        """Close the underlying database."""
+
+        with self._lock:
+            self._connection.close()
+
+    # ----------------------------------------------------------------------
+    @property
+    def synced(self) -> datetime | None:
+        """Time at which the snapshot was last imported (if ever)."""
+
+        with self._lock:
+            row = self._connection.execute("SELECT value FROM metadata WHERE key = 'synced'").fetchone()
+
+        return None if row is None else datetime.fromisoformat(row[0])
+
+    # ----------------------------------------------------------------------
+    async def Sync(self, session: aiohttp.ClientSession, url: str = EXPORT_URL) -> None:
+        """Download the latest export of the advisory database and import it."""
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            archive = Path(temp_dir) / "all.zip"
+
+            async with session.get(url) as response:
+                response.raise_for_status()
+
+                with archive.open("wb") as f:
+                    async for chunk in response.content.iter_chunked(self.DOWNLOAD_CHUNK_SIZE):
+                        f.write(chunk)
+
+            await asyncio.to_thread(self.ImportArchive, archive)
+
+    # ----------------------------------------------------------------------
+    def ImportArchive(self, archive: Path) -> None:
+        """Replace the snapshot with the records in an OSV export (a zip file of JSON records)."""
+
+        with zipfile.ZipFile(archive) as zip_file:
+            self.Import(
+                json.loads(zip_file.read(name)) for name in zip_file.namelist() if name.endswith(".json")
+            )
+
+    # ----------------------------------------------------------------------
+    def Import(self, records: Iterable[dict]) -> None:
+        """Replace the snapshot with the OSV records."""
+
+        with self._lock, self._connection:
+            self._connection.execute("DELETE FROM vulnerabilities")
+            self._connection.execute("DELETE FROM affected_versions")
+            self._connection.execute("DELETE FROM affected_ranges")
+
+            for record in records:
+                if record.get("withdrawn"):
+                    continue
+
+                # Malformed records are skipped rather than preventing the other records from being imported
+                self._connection.execute("SAVEPOINT record")
+
+                try:
+                    self._ImportRecord(record)
+                except (KeyError, TypeError, AttributeError):
+                    self._connection.execute("ROLLBACK TO record")
+
+                self._connection.execute("RELEASE record")
+
+            self._connection.execute(
+                "INSERT OR REPLACE INTO metadata VALUES ('synced', ?)",
+                (datetime.now(UTC).isoformat(),),
+            )
+
+    # ----------------------------------------------------------------------
+    def Query(self, pins: Iterable[Pin]) -> dict[Pin, list[Vulnerability]] | None:
+        """Return the vulnerable pins and their vulnerabilities (or None if the snapshot was never imported)."""
+
+        # An empty snapshot would report that nothing is vulnerable
+        if self.synced is None:
+            return None
+
+        results: dict[Pin, list[Vulnerability]] = {}
+
+        with self._lock:
+            for pin in pins:
+                vulnerabilities: set[Vulnerability] = {
+                    Vulnerability(id_, summary, severity)
+                    for id_, summary, severity in self._connection.execute(
+                        """
+                        SELECT vulnerabilities.id, vulnerabilities.summary, vulnerabilities.severity
+                        FROM affected_versions
+                        JOIN vulnerabilities ON vulnerabilities.id = affected_versions.id
+                        WHERE affected_versions.name = ? AND affected_versions.version = ?
+                        """,
+                        (pin.name, pin.version),
+                    )
+                }
+
+                release = self._GetRelease(pin.version)
+
+                if release is not None:
+                    for id_, summary, severity, introduced, fixed, last_affected in self._connection.execute(
+                        """
+                        SELECT
+                            vulnerabilities.id,
+                            vulnerabilities.summary,
+                            vulnerabilities.severity,
+                            introduced,
+                            fixed,
+                            last_affected
+                        FROM affected_ranges
+                        JOIN vulnerabilities ON vulnerabilities.id = affected_ranges.id
+                        WHERE affected_ranges.name = ?
+                        """,
+                        (pin.name,),
+                    ):
+                        if self._IsInRange(release, introduced, fixed, last_affected):
+                            vulnerabilities.add(Vulnerability(id_, summary, severity))
+
+                if vulnerabilities:
+                    results[pin] = sorted(vulnerabilities, key=lambda vulnerability: vulnerability.id)
+
+        return results
+
+    # ----------------------------------------------------------------------
+    # |
+    # |  Private Methods
+    # |
+    # ----------------------------------------------------------------------
+    def _ImportRecord(self, record: dict) -> None:
+        id_ = record["id"]
+
+        self._connection.execute(
+            "INSERT OR REPLACE INTO vulnerabilities VALUES (?, ?, ?)",
+            (id_, GetSummary(record), GetSeverity(record)),
+        )
+
+        for affected in record.get("affected", []):
+            package = affected.get("package", {})
+
+            if package.get("ecosystem") != "PyPI":
+                continue
+
+            name = NormalizeName(package["name"])
+
+            # Versions are enumerated for most PyPI advisories, in which case the ranges are redundant
+            if versions := affected.get("versions"):
+                self._connection.executemany(
+                    "INSERT INTO affected_versions VALUES (?, ?, ?)",
+                    ((name, version, id_) for version in versions),
+                )
+                continue
+
+            for range_ in affected.get("ranges", []):
+                if range_.get("type") != "ECOSYSTEM":
+                    continue
+
+                self._connection.executemany(
+                    "INSERT INTO affected_ranges VALUES (?, ?, ?, ?, ?)",
+                    (
+                        (name, introduced, fixed, last_affected, id_)
+                        for introduced, fixed, last_affected in self._GetIntervals(range_.get("events", []))
+                    ),
+                )
+
+    # ----------------------------------------------------------------------
+    @staticmethod
+    def _GetIntervals(events: list[dict[str, str]]) -> list[tuple[str, str | None, str | None]]:
+        intervals: list[tuple[str, str | None, str | None]] = []
+        introduced: str | None = None
+
+        for event in events:
+            if "introduced" in event:
+                introduced = event["introduced"]
+            elif introduced is not None and ("fixed" in event or "last_affected" in event):
+                intervals.append((introduced, event.get("fixed"), event.get("last_affected")))
+                introduced = None
+
+        if introduced is not None:
+            intervals.append((introduced, None, None))
+
+        return intervals
+
+    # ----------------------------------------------------------------------
+    @staticmethod
+    def _GetRelease(version: str) -> tuple[int, ...] | None:
+        # Only final releases (e.g. "1.2.3") can be compared without a full PEP 440 implementation
+        if not re.fullmatch(r"\d+(\.\d+)*", version):
+            return None
+
+        release = [int(part) for part in version.split(".")]
+
+        while len(release) > 1 and release[-1] == 0:
+            release.pop()
+
+        return tuple(release)
+
+    # ----------------------------------------------------------------------
+    @classmethod
+    def _IsInRange(
+        cls,
+        release: tuple[int, ...],
+        introduced: str,
+        fixed: str | None,
+        last_affected: str | None,
+    ) -> bool:
+        introduced_release = cls._GetRelease(introduced)
+        if introduced_release is None or release < introduced_release:
+            return False
+
+        if fixed is not None:
+            fixed_release = cls._GetRelease(fixed)
+            if fixed_release is None or release >= fixed_release:
+                return False
+
+        if last_affected is not None:
+            last_affected_release = cls._GetRelease(last_affected)
+            if last_affected_release is None or release > last_affected_release:
+                return False
+
+        return True
@@ -0,0 +1,304 @@
+# noqa: D100
+import asyncio
+import os
+import re
+import tomllib
+
+from collections.abc import Awaitable, Callable, Iterable
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+import aiohttp
+
+from AllGitStatus.Repository import Repository
+
+if TYPE_CHECKING:
+    from AllGitStatus.Sources.AdvisoryDatabase import AdvisoryDatabase  # pragma: no cover
+
+
+# ----------------------------------------------------------------------
+@dataclass(frozen=True, order=True)
+class Pin:
+    """A package pinned to a specific version."""
+
+    name: str  # Normalized name (see `NormalizeName`)
+    version: str
+
+
+# ----------------------------------------------------------------------
+@dataclass(frozen=True)
+class Vulnerability:
+    """A known vulnerability."""
+
+    id: str
+    summary: str
+    severity: str | None = None  # One of `SEVERITIES` (if known)
+
+
+# ----------------------------------------------------------------------
+# Severities, from most to least severe
+SEVERITIES = ("critical", "high", "medium", "low")
+
+
+# ----------------------------------------------------------------------
+def NormalizeName(name: str) -> str:
+    """Normalize a Python package name (PEP 503)."""
+    return re.sub(r"[-_.]+", "-", name).lower()
+
+
+# ----------------------------------------------------------------------
+def GetSummary(record: dict) -> str:
+    """Return the summary of an OSV vulnerability record."""
+
+    summary = record.get("summary") or (record.get("details") or "").strip().split("\n", 1)[0]
+    return summary or "No summary"
+
+
+# ----------------------------------------------------------------------
+def NormalizeSeverity(severity: object) -> str | None:
+    """Normalize a severity rating (e.g. "CRITICAL" or "MODERATE") to one of `SEVERITIES`."""
+
+    if not isinstance(severity, str):
+        return None
+
+    severity = severity.lower()
+
+    if severity == "moderate":
+        return "medium"
+
+    return severity if severity in SEVERITIES else None
+
+
+# ----------------------------------------------------------------------
+def GetSeverity(record: dict) -> str | None:
+    """Return the severity of an OSV vulnerability record (if known)."""
+
+    # CVSS vectors aren't scored; GitHub advisories include a qualitative rating
+    return NormalizeSeverity((record.get("database_specific") or {}).get("severity"))
+
+
+# ----------------------------------------------------------------------
+# Directories that are not searched for lockfiles (in addition to hidden directories)
+PRUNED_DIRECTORY_NAMES = frozenset(["__pycache__", "node_modules", "site-packages", "venv"])
+
+
+# ----------------------------------------------------------------------
+def FindLockfiles(path: Path) -> list[Path]:
+    """Return the uv.lock files within a repository.
+
+    The members of a uv workspace share the lockfile at the root of the workspace, while other projects
+    within the repository have their own lockfiles. Nested repositories (e.g. submodules) are not
+    searched, so their lockfiles are not audited (`EnumerateRepositories` doesn't descend into them
+    either).
+    """
+
+    lockfiles: list[Path] = []
+
+    for this_root_str, directories, filenames in os.walk(path):
+        this_root = Path(this_root_str)
+
+        if this_root != path and ".git" in directories + filenames:
+            directories[:] = []
+            continue
+
+        if "uv.lock" in filenames:
+            lockfiles.append(this_root / "uv.lock")
+
+        directories[:] = [
+            directory
+            for directory in directories
+            if not directory.startswith(".") and directory not in PRUNED_DIRECTORY_NAMES
+        ]
+
+    return sorted(lockfiles)
+
+
+# ----------------------------------------------------------------------
+def ParseLockfile(path: Path) -> list[Pin]:
+    """Return the packages pinned by a uv.lock file that were resolved from a package registry."""
+
+    with path.open("rb") as f:
+        content = tomllib.load(f)
+
+    return [
+        Pin(NormalizeName(package["name"]), package["version"])
+        for package in content.get("package", [])
+        # Packages from git repositories, local directories, etc. can't be matched against advisories
+        if "version" in package and "registry" in package.get("source", {})
+    ]
+
+
+# ----------------------------------------------------------------------
+class DependencyVulnerabilities:
+    """Known vulnerabilities of the dependencies of all repositories, resolved once per unique pin.
+
+    The uv.lock files of each repository are parsed in-process, and the vulnerabilities of the set of
+    unique (package, version) pins across all lockfiles are queried from the OSV advisory database in
+    batches (or from a local snapshot of the database, when provided). The details of each unique
+    vulnerability are then retrieved once. Vulnerabilities are not available (and callers should audit
+    the project some other way) for lockfiles that could not be parsed, when the advisory database
+    could not be queried, or when the local snapshot has never been imported.
+    """
+
+    QUERY_BATCH_URL = "https://api.osv.dev/v1/querybatch"
+    VULNERABILITY_URL = "https://api.osv.dev/v1/vulns/{id}"
+
+    MAX_BATCH_SIZE = 1000
+    MAX_CONCURRENT_REQUESTS = 10
+
+    # ----------------------------------------------------------------------
+    def __init__(
+        self,
+        session: aiohttp.ClientSession | None,
+        repositories: Iterable[Repository],
+        max_batch_size: int = MAX_BATCH_SIZE,
+        advisory_database: "AdvisoryDatabase | None" = None,
+        wait_for_advisory_database: Callable[[], Awaitable[object]] | None = None,
+    ) -> None:
+        assert session is not None or advisory_database is not None
+
+        self._session = session
+        self._repositories = list(repositories)
+        self._max_batch_size = max_batch_size
+        self._advisory_database = advisory_database
+
+        # Waits for the local snapshot to be synced (when it is being synced)
+        self._wait_for_advisory_database = wait_for_advisory_database
+
+        self._task: (
+            asyncio.Task[tuple[dict[Path, list[Pin]], dict[Pin, list[Vulnerability]] | None]] | None
+        ) = None
+
+    # ----------------------------------------------------------------------
+    async def GetVulnerabilities(self, lockfile: Path) -> dict[Pin, list[Vulnerability]] | None:
+        """Return the vulnerable pins of a uv.lock file within one of the repositories (if available)."""
+
+        if self._task is None:
+            self._task = asyncio.create_task(self._Resolve())
+
+        try:
+            # Shield the task so that it isn't cancelled when a single caller is cancelled
+            lockfile_pins, vulnerabilities = await asyncio.shield(self._task)
+        except Exception:
+            # Callers will audit the repository directly
+            return None
+
+        pins = lockfile_pins.get(lockfile)
+        if pins is None or vulnerabilities is None:
+            return None
+
+        return {pin: vulnerabilities[pin] for pin in pins if pin in vulnerabilities}
+
+    # ----------------------------------------------------------------------
+    # |
+    # |  Private Methods
+    # |
+    # ----------------------------------------------------------------------
+    async def _Resolve(self) -> tuple[dict[Path, list[Pin]], dict[Pin, list[Vulnerability]] | None]:
+        # Parsing hundreds of lockfiles would otherwise block the event loop
+        lockfile_pins = await asyncio.to_thread(self._ParseLockfiles)
+
+        pins = sorted({pin for pins in lockfile_pins.values() for pin in pins})
+
+        if self._advisory_database is not None:
+            # Querying the snapshot before it has been synced would miss the latest advisories (or, on
+            # the first run, all of them)
+            if self._wait_for_advisory_database is not None:
+                await self._wait_for_advisory_database()
+
+            return lockfile_pins, await asyncio.to_thread(self._advisory_database.Query, pins)
+
+        return lockfile_pins, await self._QueryAdvisoryService(pins)
+
+    # ----------------------------------------------------------------------
+    async def _QueryAdvisoryService(self, pins: list[Pin]) -> dict[Pin, list[Vulnerability]]:
+        vulnerability_ids: dict[Pin, list[str]] = {}
+
+        for batch_ids in await asyncio.gather(
+            *(
+                self._QueryBatch(pins[index : index + self._max_batch_size])
+                for index in range(0, len(pins), self._max_batch_size)
+            ),
+        ):
+            vulnerability_ids.update(batch_ids)
+
+        # The same vulnerability often affects many pins (e.g. multiple versions of a package)
+        unique_ids = sorted({id_ for ids in vulnerability_ids.values() for id_ in ids})
+        semaphore = asyncio.Semaphore(self.MAX_CONCURRENT_REQUESTS)
+
+        details = dict(
+            zip(
+                unique_ids,
+                await asyncio.gather(*(self._GetVulnerability(id_, semaphore) for id_ in unique_ids)),
+                strict=True,
+            ),
+        )
+
+        return {pin: [details[id_] for id_ in ids] for pin, ids in vulnerability_ids.items() if ids}
+
+    # ----------------------------------------------------------------------
+    def _ParseLockfiles(self) -> dict[Path, list[Pin]]:
+        lockfile_pins: dict[Path, list[Pin]] = {}
+
+        for repo in self._repositories:
+            for lockfile in FindLockfiles(repo.path):
+                try:
+                    lockfile_pins[lockfile] = ParseLockfile(lockfile)
+                except (OSError, tomllib.TOMLDecodeError, KeyError, TypeError):
+                    # The project will be audited directly
+                    continue
+
+        return lockfile_pins
+
+    # ----------------------------------------------------------------------
+    async def _QueryBatch(self, pins: list[Pin]) -> dict[Pin, list[str]]:
+        results: dict[Pin, list[str]] = {pin: [] for pin in pins}
+
+        queries: list[tuple[Pin, str | None]] = [(pin, None) for pin in pins]
+
+        assert self._session is not None
+
+        while queries:
+            async with self._session.post(
+                self.QUERY_BATCH_URL,
+                json={"queries": [self._CreateQuery(pin, page_token) for pin, page_token in queries]},
+            ) as response:
+                response.raise_for_status()
+                result = await response.json()
+
+            next_queries: list[tuple[Pin, str | None]] = []
+
+            for (pin, _), query_result in zip(queries, result["results"], strict=True):
+                results[pin] += [vulnerability["id"] for vulnerability in query_result.get("vulns", [])]
+
+                # Pins with many vulnerabilities are returned across multiple pages
+                if page_token := query_result.get("next_page_token"):
+                    next_queries.append((pin, page_token))
+
+            queries = next_queries
+
+        return results
+
+    # ----------------------------------------------------------------------
+    @staticmethod
+    def _CreateQuery(pin: Pin, page_token: str | None) -> dict[str, object]:
+        query: dict[str, object] = {
+            "package": {"name": pin.name, "ecosystem": "PyPI"},
+            "version": pin.version,
+        }
+
+        if page_token is not None:
+            query["page_token"] = page_token
+
+        return query
+
+    # ----------------------------------------------------------------------
+    async def _GetVulnerability(self, id_: str, semaphore: asyncio.Semaphore) -> Vulnerability:
+        assert self._session is not None
+
+        async with semaphore, self._session.get(self.VULNERABILITY_URL.format(id=id_)) as response:
+            response.raise_for_status()
+            result = await response.json()
+
+        return Vulnerability(id_, GetSummary(result), GetSeverity(result))
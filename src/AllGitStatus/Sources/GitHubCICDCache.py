@@ -0,0 +1,97 @@
+# noqa: D100
+from dataclasses import dataclass
+from datetime import datetime, timedelta, UTC
+
+
+# ----------------------------------------------------------------------
+IN_PROGRESS_STATUSES = frozenset(["in_progress", "queued", "pending", "waiting"])
+
+
+# ----------------------------------------------------------------------
+@dataclass(frozen=True)
+class CICDCacheEntry:
+    """The most recent workflow runs for a branch."""
+
+    head_sha: str
+    updated_at: str  # `updated_at` of the most recent run of the branch ("" when there are no runs)
+    workflow_runs: list[dict]  # The most recent run for each workflow
+    created: datetime
+
+    # ----------------------------------------------------------------------
+    @property
+    def in_progress_runs(self) -> list[dict]:
+        """Runs that have not completed."""
+        return [run for run in self.workflow_runs if run.get("status") in IN_PROGRESS_STATUSES]
+
+
+# ----------------------------------------------------------------------
+class GitHubCICDCache:
+    """In-memory cache of the workflow runs of default branches.
+
+    Entries are keyed by the branch's head commit and the `updated_at` of the branch's most recent run.
+    Runs only change when a run starts or completes, so the list of runs does not need to be requested
+    again while the head commit and most recent run are unchanged and all runs have completed; while
+    runs are in progress, only those runs need to be requested. Changes that don't affect the most
+    recent run (for example, re-runs of older workflows' runs) are detected once the entry is older than
+    `max_age`.
+
+    The workflows defined in a repository are also cached (for `max_age`) for use by lean CI/CD queries.
+    """
+
+    DEFAULT_MAX_AGE = timedelta(hours=1)
+
+    # ----------------------------------------------------------------------
+    def __init__(self, max_age: timedelta = DEFAULT_MAX_AGE) -> None:
+        self._max_age = max_age
+        self._entries: dict[tuple[str, str, str], CICDCacheEntry] = {}
+        self._workflows: dict[tuple[str, str], tuple[datetime, list[dict]]] = {}
+
+    # ----------------------------------------------------------------------
+    def Get(self, owner: str, repo: str, branch: str, head_sha: str) -> CICDCacheEntry | None:
+        """Return the entry for the branch if it is associated with the head commit and is not too old."""
+
+        entry = self._entries.get((owner.lower(), repo.lower(), branch))
+
+        if entry is None or entry.head_sha != head_sha or datetime.now(UTC) - entry.created > self._max_age:
+            return None
+
+        return entry
+
+    # ----------------------------------------------------------------------
+    def Set(self, owner: str, repo: str, branch: str, entry: CICDCacheEntry) -> None:
+        """Associate the entry with the branch."""
+        self._entries[(owner.lower(), repo.lower(), branch)] = entry
+
+    # ----------------------------------------------------------------------
+    def Remove(self, owner: str, repo: str) -> None:
+        """Remove the entries and workflows of the repository."""
+
+        key = (owner.lower(), repo.lower())
+
+        self._entries = {
+            entry_key: entry for entry_key, entry in self._entries.items() if entry_key[:2] != key
+        }
+        self._workflows.pop(key, None)
+
+    # ----------------------------------------------------------------------
+    def Clear(self) -> None:
+        """Remove all entries and workflows."""
+
+        self._entries.clear()
+        self._workflows.clear()
+
+    # ----------------------------------------------------------------------
+    def GetWorkflows(self, owner: str, repo: str) -> list[dict] | None:
+        """Return the workflows defined in the repository if they are not too old."""
+
+        value = self._workflows.get((owner.lower(), repo.lower()))
+
+        if value is None or datetime.now(UTC) - value[0] > self._max_age:
+            return None
+
+        return value[1]
+
+    # ----------------------------------------------------------------------
+    def SetWorkflows(self, owner: str, repo: str, workflows: list[dict]) -> None:
+        """Associate the workflows with the repository."""
+        self._workflows[(owner.lower(), repo.lower())] = (datetime.now(UTC), workflows)
@@ -0,0 +1,105 @@
+# noqa: D100
+import asyncio
+import time
+
+from collections.abc import Callable
+from dataclasses import dataclass
+
+
+# ----------------------------------------------------------------------
+class CircuitOpenError(Exception):
+    """Raised when requests to a host are paused for longer than the caller is willing to wait."""
+
+    # ----------------------------------------------------------------------
+    def __init__(self, host: str) -> None:
+        super().__init__(f"Requests to '{host}' are paused because of repeated failures.")
+        self.host = host
+
+
+# ----------------------------------------------------------------------
+@dataclass
+class _HostState:
+    failures: int = 0
+    open_until: float = 0.0
+    is_probing: bool = False
+
+
+# ----------------------------------------------------------------------
+class GitHubCircuitBreaker:
+    """Pauses requests to a host after repeated transient failures.
+
+    Once `failure_threshold` consecutive requests to a host have failed, requests to that host are held
+    for `open_duration` seconds. A single request is then sent to probe the host; requests resume once
+    the probe succeeds, and are held again if it fails.
+    """
+
+    DEFAULT_FAILURE_THRESHOLD = 5
+    DEFAULT_OPEN_DURATION = 30.0
+
+    # Frequency (in seconds) at which held requests check if the probe has completed
+    PROBE_POLL_INTERVAL = 0.5
+
+    # ----------------------------------------------------------------------
+    def __init__(
+        self,
+        failure_threshold: int = DEFAULT_FAILURE_THRESHOLD,
+        open_duration: float = DEFAULT_OPEN_DURATION,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        assert failure_threshold > 0, failure_threshold
+
+        self._failure_threshold = failure_threshold
+        self._open_duration = open_duration
+        self._clock = clock
+
+        self._states: dict[str, _HostState] = {}
+
+    # ----------------------------------------------------------------------
+    def IsOpen(self, host: str) -> bool:
+        """Determine if requests to the host are currently paused."""
+
+        state = self._states.get(host)
+        return state is not None and state.failures >= self._failure_threshold
+
+    # ----------------------------------------------------------------------
+    async def Wait(self, host: str, deadline: float) -> None:
+        """Wait until a request can be sent to the host; raises CircuitOpenError if that is after `deadline`."""
+
+        while True:
+            state = self._states.setdefault(host, _HostState())
+
+            if state.failures < self._failure_threshold:
+                return
+
+            now = self._clock()
+
+            if state.open_until <= now and not state.is_probing:
+                state.is_probing = True
+                return
+
+            resume_time = state.open_until if state.open_until > now else now + self.PROBE_POLL_INTERVAL
+
+            if resume_time > deadline:
+                raise CircuitOpenError(host)
+
+            await asyncio.sleep(resume_time - now)
+
+    # ----------------------------------------------------------------------
+    def Report(self, host: str, *, success: bool | None) -> None:
+        """Report the outcome of a request to the host (None if the request did not complete)."""
+
+        state = self._states.setdefault(host, _HostState())
+
+        state.is_probing = False
+
+        if success is None:
+            return
+
+        if success:
+            state.failures = 0
+            return
+
+        state.failures += 1
+
+        if state.failures >= self._failure_threshold:
+            state.open_until = self._clock() + self._open_duration
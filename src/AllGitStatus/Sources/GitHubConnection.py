@@ -0,0 +1,155 @@
+# noqa: D100
+import time
+
+from collections.abc import Callable
+from dataclasses import dataclass
+from types import SimpleNamespace
+
+import aiohttp
+
+
+# ----------------------------------------------------------------------
+@dataclass(frozen=True)
+class ConnectorConfig:
+    """Configuration of the connection pool used to send GitHub API requests (defaults match aiohttp)."""
+
+    DEFAULT_LIMIT = 100
+    DEFAULT_LIMIT_PER_HOST = 0
+    DEFAULT_KEEPALIVE_TIMEOUT = 15.0
+    DEFAULT_TTL_DNS_CACHE = 10
+
+    limit: int = DEFAULT_LIMIT  # Maximum number of simultaneous connections (0 for no limit)
+    limit_per_host: int = DEFAULT_LIMIT_PER_HOST  # Maximum number of connections per host (0 for no limit)
+    keepalive_timeout: float = DEFAULT_KEEPALIVE_TIMEOUT  # Seconds that idle connections are kept open
+
+    # Seconds that DNS lookups are cached (None to cache them forever)
+    ttl_dns_cache: int | None = DEFAULT_TTL_DNS_CACHE
+
+    # ----------------------------------------------------------------------
+    def CreateConnector(self) -> aiohttp.TCPConnector:
+        """Create a connector with this configuration; must be called with an active event loop."""
+
+        return aiohttp.TCPConnector(
+            limit=self.limit,
+            limit_per_host=self.limit_per_host,
+            keepalive_timeout=self.keepalive_timeout,
+            ttl_dns_cache=self.ttl_dns_cache,
+        )
+
+
+# ----------------------------------------------------------------------
+@dataclass(frozen=True)
+class ConnectionStats:
+    """Snapshot of the connections used to send requests."""
+
+    requests: int
+    new_connections: int
+    reused_connections: int
+    dns_lookups: int
+    dns_cache_hits: int
+    average_time_to_first_byte: float | None  # Seconds between sending a request and receiving its headers
+    max_time_to_first_byte: float | None
+
+
+# ----------------------------------------------------------------------
+class ConnectionMetrics:
+    """Collects connection reuse, DNS and time-to-first-byte metrics via aiohttp trace hooks."""
+
+    # ----------------------------------------------------------------------
+    def __init__(
+        self,
+        on_changed: Callable[[ConnectionStats], None] | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._on_changed = on_changed
+        self._clock = clock
+
+        self._requests = 0
+        self._new_connections = 0
+        self._reused_connections = 0
+        self._dns_lookups = 0
+        self._dns_cache_hits = 0
+        self._total_time_to_first_byte = 0.0
+        self._max_time_to_first_byte: float | None = None
+
+    # ----------------------------------------------------------------------
+    @property
+    def stats(self) -> ConnectionStats:
+        """Current metrics."""
+
+        return ConnectionStats(
+            self._requests,
+            self._new_connections,
+            self._reused_connections,
+            self._dns_lookups,
+            self._dns_cache_hits,
+            self._total_time_to_first_byte / self._requests if self._requests else None,
+            self._max_time_to_first_byte,
+        )
+
+    # ----------------------------------------------------------------------
+    def CreateTraceConfig(self) -> aiohttp.TraceConfig:
+        """Create a trace config that updates these metrics; provide it to `aiohttp.ClientSession`."""
+
+        trace_config = aiohttp.TraceConfig()
+
+        trace_config.on_request_start.append(self._OnRequestStart)
+        trace_config.on_request_end.append(self._OnRequestEnd)
+        trace_config.on_connection_create_end.append(self._OnConnectionCreateEnd)
+        trace_config.on_connection_reuseconn.append(self._OnConnectionReuseconn)
+        trace_config.on_dns_resolvehost_end.append(self._OnDnsResolvehostEnd)
+        trace_config.on_dns_cache_hit.append(self._OnDnsCacheHit)
+
+        return trace_config
+
+    # ----------------------------------------------------------------------
+    # |
+    # |  Private Methods
+    # |
+    # ----------------------------------------------------------------------
+    async def _OnRequestStart(
+        self, _session: aiohttp.ClientSession, context: SimpleNamespace, _params: object
+    ) -> None:
+        context.start_time = self._clock()
+
+    # ----------------------------------------------------------------------
+    async def _OnRequestEnd(
+        self, _session: aiohttp.ClientSession, context: SimpleNamespace, _params: object
+    ) -> None:
+        # The request ends once the response headers have been received (the content is read later)
+        time_to_first_byte = self._clock() - context.start_time
+
+        self._requests += 1
+        self._total_time_to_first_byte += time_to_first_byte
+        self._max_time_to_first_byte = max(self._max_time_to_first_byte or 0.0, time_to_first_byte)
+
+        self._NotifyChanged()
+
+    # ----------------------------------------------------------------------
+    async def _OnConnectionCreateEnd(
+        self, _session: aiohttp.ClientSession, _context: SimpleNamespace, _params: object
+    ) -> None:
+        self._new_connections += 1
+
+    # ----------------------------------------------------------------------
+    async def _OnConnectionReuseconn(
+        self, _session: aiohttp.ClientSession, _context: SimpleNamespace, _params: object
+    ) -> None:
+        self._reused_connections += 1
+
+    # ----------------------------------------------------------------------
+    async def _OnDnsResolvehostEnd(
+        self, _session: aiohttp.ClientSession, _context: SimpleNamespace, _params: object
+    ) -> None:
+        self._dns_lookups += 1
+
+    # ----------------------------------------------------------------------
+    async def _OnDnsCacheHit(
+        self, _session: aiohttp.ClientSession, _context: SimpleNamespace, _params: object
+    ) -> None:
+        self._dns_cache_hits += 1
+
+    # ----------------------------------------------------------------------
+    def _NotifyChanged(self) -> None:
+        if self._on_changed is not None:
+            self._on_changed(self.stats)
@@ -0,0 +1,127 @@
+# noqa: D100
+import asyncio
+import math
+import time
+
+from collections.abc import Callable, Iterable
+from http import HTTPStatus
+
+import aiohttp
+
+from AllGitStatus.Repository import Repository
+from AllGitStatus.Sources.GitHubSession import GitHubSession
+
+
+# ----------------------------------------------------------------------
+class GitHubEventsFeed:
+    """Detects the repositories with recent activity by polling the events feeds of their owners.
+
+    A single request to `/orgs/{owner}/events` (or `/users/{owner}/events`) reveals which of the owner's
+    repositories had activity, which is far less expensive than polling each repository. The first poll
+    of an owner establishes a baseline; subsequent polls report the repositories with events newer than
+    those previously seen. Owners are polled no more frequently than the `X-Poll-Interval` requested by
+    GitHub.
+    """
+
+    DEFAULT_POLL_INTERVAL = 60.0
+
+    # ----------------------------------------------------------------------
+    def __init__(
+        self,
+        session: aiohttp.ClientSession | GitHubSession,
+        repositories: Iterable[Repository],
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._session = session
+        self._clock = clock
+
+        self._urls: dict[str, str] = {}
+        self._last_event_ids: dict[str, int] = {}
+        self._next_polls: dict[str, float] = {
+            repo.github_owner.lower(): 0.0 for repo in repositories if repo.github_owner and repo.github_repo
+        }
+
+    # ----------------------------------------------------------------------
+    @property
+    def is_due(self) -> bool:
+        """True if any of the owners should be polled now."""
+
+        now = self._clock()
+        return any(next_poll <= now for next_poll in self._next_polls.values())
+
+    # ----------------------------------------------------------------------
+    async def GetActiveRepositories(self) -> set[str]:
+        """Return the names ("owner/repo", lowercase) of repositories with activity since the previous poll."""
+
+        now = self._clock()
+
+        due = [owner for owner, next_poll in self._next_polls.items() if next_poll <= now]
+
+        # Owners are not polled again until the current poll completes
+        for owner in due:
+            self._next_polls[owner] = math.inf
+
+        active: set[str] = set()
+
+        for owner, result in zip(
+            due,
+            await asyncio.gather(*(self._PollOwner(owner) for owner in due), return_exceptions=True),
+            strict=True,
+        ):
+            if isinstance(result, BaseException):
+                # Activity will be detected when the owner is polled again
+                self._next_polls[owner] = self._clock() + self.DEFAULT_POLL_INTERVAL
+                continue
+
+            names, poll_interval = result
+
+            active |= names
+            self._next_polls[owner] = self._clock() + poll_interval
+
+        return active
+
+    # ----------------------------------------------------------------------
+    # |
+    # |  Private Methods
+    # |
+    # ----------------------------------------------------------------------
+    async def _PollOwner(self, owner: str) -> tuple[set[str], float]:
+        url = self._urls.get(owner, f"https://api.github.com/orgs/{owner}/events")
+
+        while True:
+            async with self._session.get(url, params={"per_page": 100}) as response:
+                if response.status == HTTPStatus.NOT_FOUND and "/orgs/" in url:
+                    # The owner is a user rather than an organization
+                    url = f"https://api.github.com/users/{owner}/events"
+                    continue
+
+                response.raise_for_status()
+
+                self._urls[owner] = url
+
+                events = await response.json()
+
+                poll_interval = self.DEFAULT_POLL_INTERVAL
+
+                poll_interval_header = response.headers.get("X-Poll-Interval", "")
+                if poll_interval_header.isdigit():
+                    poll_interval = max(poll_interval, float(poll_interval_header))
+
+                break
+
+        last_event_id = self._last_event_ids.get(owner)
+
+        names: set[str] = set()
+        max_event_id = last_event_id or 0
+
+        for event in events:
+            event_id = int(event["id"])
+
+            if last_event_id is not None and event_id > last_event_id:
+                names.add(event["repo"]["name"].lower())
+
+            max_event_id = max(max_event_id, event_id)
+
+        self._last_event_ids[owner] = max_event_id
+
+        return names, poll_interval
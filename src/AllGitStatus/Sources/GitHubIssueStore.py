@@ -0,0 +1,183 @@
+# noqa: D100
+import hashlib
+import json
+import sqlite3
+
+from collections.abc import Iterable
+from datetime import datetime, timedelta, UTC
+from pathlib import Path
+from typing import Literal
+
+
+# ----------------------------------------------------------------------
+ItemKind = Literal["issues", "pulls"]
+
+
+# ----------------------------------------------------------------------
+class GitHubIssueStore:
+    """On-disk store of the open issues and pull requests of GitHub repositories.
+
+    The store allows refreshes to request only the items that have been updated since the previous
+    sync (which is usually a single page) rather than every open item. Items are keyed by repository
+    and by the identity of the credentials used to retrieve them. Incremental syncs cannot detect
+    items that were deleted or transferred, so a full sync is required once `max_sync_age` has elapsed.
+    """
+
+    DEFAULT_MAX_SYNC_AGE = timedelta(days=7)
+
+    # ----------------------------------------------------------------------
+    def __init__(
+        self,
+        filename: Path,
+        identity: str | None,
+        max_sync_age: timedelta = DEFAULT_MAX_SYNC_AGE,
+    ) -> None:
+        filename.parent.mkdir(parents=True, exist_ok=True)
+
+        self._identity = hashlib.sha256((identity or "").encode()).hexdigest()
+        self._max_sync_age = max_sync_age
+
+        self._connection = sqlite3.connect(filename, isolation_level=None)
+
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute("PRAGMA synchronous=NORMAL")
+        self._connection.execute(
+            """
+            CREATE TABLE IF NOT EXISTS items (
+                repository TEXT NOT NULL,
+                kind TEXT NOT NULL,
+                number INTEGER NOT NULL,
+                data TEXT NOT NULL,
+                PRIMARY KEY (repository, kind, number)
+            )
+            """,
+        )
+        self._connection.execute(
+            """
+            CREATE TABLE IF NOT EXISTS syncs (
+                repository TEXT NOT NULL,
+                kind TEXT NOT NULL,
+                last_sync TEXT NOT NULL,
+                last_full_sync TEXT NOT NULL,
+                PRIMARY KEY (repository, kind)
+            )
+            """,
+        )
+
+    # ----------------------------------------------------------------------
+    def Close(self) -> None:
+        """Close the underlying database."""
+        self._connection.close()
+
+    # ----------------------------------------------------------------------
+    def GetLastSync(self, owner: str, repo: str, kind: ItemKind) -> datetime | None:
+        """Return the time of the last sync, or None if a full sync is required."""
+
+        row = self._connection.execute(
+            "SELECT last_sync, last_full_sync FROM syncs WHERE repository = ? AND kind = ?",
+            (self._CreateRepositoryKey(owner, repo), kind),
+        ).fetchone()
+
+        if row is None:
+            return None
+
+        last_sync, last_full_sync = (datetime.fromisoformat(value) for value in row)
+
+        if datetime.now(UTC) - last_full_sync > self._max_sync_age:
+            return None
+
+        return last_sync
+
+    # ----------------------------------------------------------------------
+    def Update(
+        self,
+        owner: str,
+        repo: str,
+        kind: ItemKind,
+        items: Iterable[dict],
+        sync_time: datetime,
+        *,
+        full: bool,
+    ) -> None:
+        """Apply changes retrieved from GitHub.
+
+        When `full` is True, `items` contains every open item and replaces the existing items. Otherwise,
+        `items` contains the items updated since the last sync; closed items are removed.
+        """
+
+        repository = self._CreateRepositoryKey(owner, repo)
+
+        self._connection.execute("BEGIN")
+
+        try:
+            if full:
+                self._connection.execute(
+                    "DELETE FROM items WHERE repository = ? AND kind = ?",
+                    (repository, kind),
+                )
+
+            for item in items:
+                if item.get("state", "open") == "open":
+                    self._connection.execute(
+                        "INSERT OR REPLACE INTO items VALUES (?, ?, ?, ?)",
+                        (repository, kind, item["number"], json.dumps(self._TrimItem(item))),
+                    )
+                else:
+                    self._connection.execute(
+                        "DELETE FROM items WHERE repository = ? AND kind = ? AND number = ?",
+                        (repository, kind, item["number"]),
+                    )
+
+            if full:
+                self._connection.execute(
+                    "INSERT OR REPLACE INTO syncs VALUES (?, ?, ?, ?)",
+                    (repository, kind, sync_time.isoformat(), sync_time.isoformat()),
+                )
+            else:
+                self._connection.execute(
+                    "UPDATE syncs SET last_sync = ? WHERE repository = ? AND kind = ?",
+                    (sync_time.isoformat(), repository, kind),
+                )
+
+            self._connection.execute("COMMIT")
+
+        except:
+            self._connection.execute("ROLLBACK")
+            raise
+
+    # ----------------------------------------------------------------------
+    def GetItems(self, owner: str, repo: str, kind: ItemKind) -> list[dict]:
+        """Return the open items, most recently created first."""
+
+        return [
+            json.loads(row[0])
+            for row in self._connection.execute(
+                "SELECT data FROM items WHERE repository = ? AND kind = ? ORDER BY number DESC",
+                (self._CreateRepositoryKey(owner, repo), kind),
+            )
+        ]
+
+    # ----------------------------------------------------------------------
+    # |
+    # |  Private Methods
+    # |
+    # ----------------------------------------------------------------------
+    def _CreateRepositoryKey(self, owner: str, repo: str) -> str:
+        return f"{self._identity}/{owner.lower()}/{repo.lower()}"
+
+    # ----------------------------------------------------------------------
+    @staticmethod
+    def _TrimItem(item: dict) -> dict:
+        # Only persist the information used to display the item
+        result: dict = {
+            "number": item["number"],
+            "title": item.get("title", "No title"),
+            "user": {"login": (item.get("user") or {}).get("login", "unknown")},
+            "labels": [{"name": label.get("name", "")} for label in item.get("labels", [])],
+            "draft": item.get("draft", False),
+        }
+
+        if "pull_request" in item:
+            result["pull_request"] = {}
+
+        return result
@@ -0,0 +1,56 @@
+# noqa: D100
+import json
+
+from collections.abc import Callable, Mapping
+from typing import Any
+
+
+# The fields to retain from a decoded object; a field that maps to None is retained as-is, while a field
+# that maps to a projection is projected in turn. Projections are applied to each item of a list.
+Projection = Mapping[str, "Projection | None"]
+
+
+# orjson (installed with the `fast-json` extra) is used when it is available
+try:
+    import orjson
+
+    # ----------------------------------------------------------------------
+    def Loads(content: str | bytes) -> Any:  # noqa: ANN401
+        """Decode JSON content."""
+        return orjson.loads(content)
+
+except ImportError:  # pragma: no cover
+    # ----------------------------------------------------------------------
+    def Loads(content: str | bytes) -> Any:  # noqa: ANN401
+        """Decode JSON content."""
+        return json.loads(content)
+
+
+# ----------------------------------------------------------------------
+def Project(value: Any, projection: Projection) -> Any:  # noqa: ANN401
+    """Reduce the decoded value to the fields in the projection; fields that are not present are omitted."""
+
+    if isinstance(value, list):
+        return [Project(item, projection) for item in value]
+
+    if not isinstance(value, dict):
+        return value
+
+    return {
+        name: value[name] if sub_projection is None else Project(value[name], sub_projection)
+        for name, sub_projection in projection.items()
+        if name in value
+    }
+
+
+# ----------------------------------------------------------------------
+def CreateLoads(projection: Projection) -> Callable[[str | bytes], Any]:
+    """Create a function that decodes JSON content and reduces it to the fields in the projection."""
+
+    # ----------------------------------------------------------------------
+    def ProjectedLoads(content: str | bytes) -> Any:  # noqa: ANN401
+        return Project(Loads(content), projection)
+
+    # ----------------------------------------------------------------------
+
+    return ProjectedLoads
@@ -0,0 +1,130 @@
+# noqa: D100
+import asyncio
+
+from collections.abc import Iterable
+from http import HTTPStatus
+
+import aiohttp
+
+from yarl import URL
+
+from AllGitStatus.Repository import Repository
+from AllGitStatus.Sources.GitHubSession import GitHubSession, ParseLinkHeader
+
+
+# ----------------------------------------------------------------------
+class GitHubOwnerListings:
+    """Repository information for owners with many repositories, listed in bulk once per refresh.
+
+    `/orgs/{owner}/repos` (or `/users/{owner}/repos`) returns the metadata of 100 repositories per
+    request, which is far less expensive than requesting `/repos/{owner}/{repo}` for each repository
+    when many repositories share the same owner. Owners with fewer than `min_repositories` repositories
+    are not listed, as listing all of the owner's repositories would likely cost more than it saves.
+    Listings are also abandoned when the remaining pages outnumber the repositories that they would
+    replace (e.g. a few clones from an organization with thousands of repositories).
+    """
+
+    DEFAULT_MIN_REPOSITORIES = 3
+
+    # ----------------------------------------------------------------------
+    def __init__(
+        self,
+        session: aiohttp.ClientSession | GitHubSession,
+        repositories: Iterable[Repository],
+        min_repositories: int = DEFAULT_MIN_REPOSITORIES,
+    ) -> None:
+        owner_repositories: dict[str, set[str]] = {}
+
+        for repo in repositories:
+            if repo.github_owner and repo.github_repo:
+                owner_repositories.setdefault(repo.github_owner.lower(), set()).add(repo.github_repo.lower())
+
+        self._session = session
+        self._owner_repositories = {
+            owner: names for owner, names in owner_repositories.items() if len(names) >= min_repositories
+        }
+        self._listings: dict[str, asyncio.Task[dict[str, dict]]] = {}
+
+    # ----------------------------------------------------------------------
+    async def GetRepository(self, repo: Repository) -> dict | None:
+        """Return the repository information from the owner's listing (if available)."""
+
+        if not repo.github_owner or not repo.github_repo:
+            return None
+
+        owner = repo.github_owner.lower()
+
+        if owner not in self._owner_repositories:
+            return None
+
+        task = self._listings.get(owner)
+        if task is None:
+            task = asyncio.create_task(self._ListRepositories(owner))
+            self._listings[owner] = task
+
+        try:
+            # Shield the listing so that it isn't cancelled when a single caller is cancelled
+            listing = await asyncio.shield(task)
+        except Exception:
+            # Callers will request the repository information directly
+            return None
+
+        return listing.get(repo.github_repo.lower())
+
+    # ----------------------------------------------------------------------
+    # |
+    # |  Private Methods
+    # |
+    # ----------------------------------------------------------------------
+    async def _ListRepositories(self, owner: str) -> dict[str, dict]:
+        listing: dict[str, dict] = {}
+
+        url: str | None = f"https://api.github.com/orgs/{owner}/repos"
+        params: dict[str, str | int] | None = {"type": "all", "per_page": 100}
+        num_pages = 0
+
+        while url:
+            async with self._session.get(url, params=params) as response:
+                if response.status == HTTPStatus.NOT_FOUND and "/orgs/" in url:
+                    # The owner is a user rather than an organization
+                    url = f"https://api.github.com/users/{owner}/repos"
+                    params = {"type": "owner", "per_page": 100}
+                    continue
+
+                response.raise_for_status()
+                num_pages += 1
+
+                for result in await response.json():
+                    listing[result["name"].lower()] = result
+
+                links = ParseLinkHeader(response.headers.get("Link", ""))
+
+                url = links.get("next")
+                params = None
+
+                if url and self._IsLargerThanRemaining(owner, links.get("last"), num_pages, listing):
+                    # The repositories that haven't been listed yet are requested individually
+                    break
+
+        return listing
+
+    # ----------------------------------------------------------------------
+    def _IsLargerThanRemaining(
+        self,
+        owner: str,
+        last_url: str | None,
+        num_listed_pages: int,
+        listing: dict[str, dict],
+    ) -> bool:
+        if last_url is None:
+            return False
+
+        try:
+            num_pages = int(URL(last_url).query.get("page", ""))
+        except ValueError:
+            return False
+
+        remaining_repositories = self._owner_repositories[owner] - listing.keys()
+
+        # Each remaining page costs one request, as does each repository that is requested individually
+        return num_pages - num_listed_pages > len(remaining_repositories)
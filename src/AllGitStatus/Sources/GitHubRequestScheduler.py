@@ -0,0 +1,229 @@
+# noqa: D100
+import asyncio
+import contextlib
+import math
+import random
+import time
+
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+from http import HTTPStatus
+from typing import TYPE_CHECKING
+
+from AllGitStatus.Sources.GitHubTokenPool import GitHubTokenPool
+
+if TYPE_CHECKING:
+    from AllGitStatus.Sources.GitHubSession import GitHubResponse  # pragma: no cover
+
+
+# ----------------------------------------------------------------------
+@dataclass(frozen=True)
+class RateLimitStatus:
+    """Snapshot of the GitHub rate limit and the requests waiting to be sent."""
+
+    limit: int | None
+    remaining: int | None
+    reset: float | None  # Time (in seconds since the epoch) when the quota is replenished
+    active: int
+    queued: int
+    eta: float | None  # Estimated number of seconds until all queued requests have been sent
+
+
+# ----------------------------------------------------------------------
+class GitHubRequestScheduler:
+    """Throttles GitHub API requests according to the rate limits reported by GitHub.
+
+    Requests are limited to `max_concurrent_requests` at a time. The primary rate limit is tracked via
+    the `X-RateLimit-*` headers and requests are held (rather than sent and rejected) once the quota is
+    exhausted. Requests rejected by the primary or secondary rate limits are retried after `Retry-After`
+    (or the quota reset) with jitter, so that queued requests do not all resume at the same moment.
+
+    When a token pool is provided, the rate limit is the combined quota of the pool's tokens for
+    `resource`, and requests are only held once the quota of every token is exhausted.
+    """
+
+    DEFAULT_MAX_CONCURRENT_REQUESTS = 10
+    DEFAULT_MAX_ATTEMPTS = 5
+
+    SECONDARY_RATE_LIMIT_DELAY = 60.0
+
+    # ----------------------------------------------------------------------
+    def __init__(
+        self,
+        max_concurrent_requests: int = DEFAULT_MAX_CONCURRENT_REQUESTS,
+        max_attempts: int = DEFAULT_MAX_ATTEMPTS,
+        on_status_changed: Callable[[RateLimitStatus], None] | None = None,
+        token_pool: GitHubTokenPool | None = None,
+        resource: str = GitHubTokenPool.DEFAULT_RESOURCE,
+    ) -> None:
+        assert max_concurrent_requests > 0, max_concurrent_requests
+        assert max_attempts > 0, max_attempts
+
+        self._max_concurrent_requests = max_concurrent_requests
+        self._max_attempts = max_attempts
+        self._on_status_changed = on_status_changed
+        self._token_pool = token_pool
+        self._resource = resource
+
+        self._semaphore = asyncio.Semaphore(max_concurrent_requests)
+
+        self._limit: int | None = None
+        self._remaining: int | None = None
+        self._reset: float | None = None
+        self._paused_until = 0.0
+
+        self._active = 0
+        self._queued = 0
+        self._average_duration: float | None = None
+
+    # ----------------------------------------------------------------------
+    @property
+    def status(self) -> RateLimitStatus:
+        """Current status of the rate limit and queued requests."""
+
+        eta: float | None = None
+
+        if self._queued:
+            eta = max(0.0, self._GetResumeTime() - time.time())
+
+            if self._average_duration is not None:
+                eta += math.ceil(self._queued / self._max_concurrent_requests) * self._average_duration
+
+        return RateLimitStatus(self._limit, self._remaining, self._reset, self._active, self._queued, eta)
+
+    # ----------------------------------------------------------------------
+    async def Execute(self, func: Callable[[], Awaitable["GitHubResponse"]]) -> "GitHubResponse":
+        """Invoke `func` once the rate limit allows it, retrying when the request was rate limited."""
+
+        attempt = 0
+
+        while True:
+            attempt += 1
+
+            response = await self._ExecuteOnce(func)
+
+            delay = self._GetRetryDelay(response, attempt)
+            if delay is None or attempt == self._max_attempts:
+                return response
+
+            self._paused_until = max(self._paused_until, time.time() + delay)
+
+    # ----------------------------------------------------------------------
+    # |
+    # |  Private Methods
+    # |
+    # ----------------------------------------------------------------------
+    async def _ExecuteOnce(self, func: Callable[[], Awaitable["GitHubResponse"]]) -> "GitHubResponse":
+        self._queued += 1
+        self._NotifyStatusChanged()
+
+        try:
+            async with self._semaphore:
+                try:
+                    await self._WaitForQuota()
+                finally:
+                    self._queued -= 1
+
+                if self._remaining is not None:
+                    # Assume that this request will consume quota until GitHub tells us otherwise
+                    self._remaining = max(0, self._remaining - 1)
+
+                self._active += 1
+                self._NotifyStatusChanged()
+
+                start_time = time.monotonic()
+
+                try:
+                    response = await func()
+                finally:
+                    self._active -= 1
+
+                duration = time.monotonic() - start_time
+
+                if self._average_duration is None:
+                    self._average_duration = duration
+                else:
+                    self._average_duration = 0.8 * self._average_duration + 0.2 * duration
+
+                self._UpdateRateLimit(response)
+
+                return response
+
+        finally:
+            self._NotifyStatusChanged()
+
+    # ----------------------------------------------------------------------
+    async def _WaitForQuota(self) -> None:
+        while True:
+            delay = self._GetResumeTime() - time.time()
+            if delay <= 0:
+                return
+
+            self._NotifyStatusChanged()
+            await asyncio.sleep(delay)
+
+    # ----------------------------------------------------------------------
+    def _GetResumeTime(self) -> float:
+        resume_time = self._paused_until
+
+        if self._remaining == 0 and self._reset is not None:
+            resume_time = max(resume_time, self._reset)
+
+        return resume_time
+
+    # ----------------------------------------------------------------------
+    def _UpdateRateLimit(self, response: "GitHubResponse") -> None:
+        if self._token_pool is not None:
+            rate_limit = self._token_pool.GetRateLimit(self._resource)
+
+            if rate_limit is not None:
+                self._limit, self._remaining, self._reset = rate_limit
+
+            return
+
+        limit = response.headers.get("X-RateLimit-Limit")
+        remaining = response.headers.get("X-RateLimit-Remaining")
+        reset = response.headers.get("X-RateLimit-Reset")
+
+        if limit is None or remaining is None or reset is None:
+            return
+
+        try:
+            self._limit = int(limit)
+            self._remaining = int(remaining)
+            self._reset = float(reset)
+        except ValueError:
+            pass
+
+    # ----------------------------------------------------------------------
+    def _GetRetryDelay(self, response: "GitHubResponse", attempt: int) -> float | None:
+        if response.status not in (HTTPStatus.FORBIDDEN, HTTPStatus.TOO_MANY_REQUESTS):
+            return None
+
+        delay: float | None = None
+
+        if (retry_after := response.headers.get("Retry-After")) is not None:
+            with contextlib.suppress(ValueError):
+                delay = float(retry_after)
+
+        if delay is None:
+            if response.headers.get("X-RateLimit-Remaining") == "0" and self._reset is not None:
+                # Retry immediately when other tokens in the pool have quota remaining
+                delay = 0.0 if self._token_pool is not None and self._remaining else self._reset - time.time()
+            elif (
+                response.status == HTTPStatus.TOO_MANY_REQUESTS
+                or b"secondary rate limit" in response.content.lower()
+            ):
+                delay = self.SECONDARY_RATE_LIMIT_DELAY * 2 ** (attempt - 1)
+            else:
+                # This is a permissions error rather than a rate limit
+                return None
+
+        delay = max(delay, 0.0)
+
+        return delay + random.uniform(0.0, max(1.0, delay * 0.1))  # noqa: S311
+
+    # ----------------------------------------------------------------------
+    def _NotifyStatusChanged(self) -> None:
+        if self._on_status_changed is not None:
+            self._on_status_changed(self.status)
@@ -0,0 +1,224 @@
+# noqa: D100
+import hashlib
+import json
+import re
+import sqlite3
+import time
+
+from collections.abc import Mapping
+from dataclasses import dataclass
+from pathlib import Path
+from urllib.parse import urlencode
+
+
+# ----------------------------------------------------------------------
+@dataclass(frozen=True)
+class CacheEntry:
+    """A response persisted in the cache."""
+
+    key: str
+    etag: str | None
+    last_modified: str | None
+    expires: float
+    headers: dict[str, str]
+    content: bytes
+
+    # ----------------------------------------------------------------------
+    @property
+    def is_fresh(self) -> bool:
+        """True if the entry can be used without revalidating it with the server."""
+        return self.expires > time.time()
+
+
+# ----------------------------------------------------------------------
+class GitHubResponseCache:
+    """On-disk cache of GitHub API responses that supports conditional requests.
+
+    Entries are keyed by the request url, its parameters, and the identity of the credentials used to
+    make the request (so that responses are never shared between different tokens). The cache is
+    capped at `max_size` bytes; the least recently used entries are evicted when that size is exceeded.
+    """
+
+    DEFAULT_MAX_SIZE = 256 * 1024 * 1024
+
+    # ----------------------------------------------------------------------
+    def __init__(
+        self,
+        filename: Path,
+        identity: str | None,
+        max_size: int = DEFAULT_MAX_SIZE,
+    ) -> None:
+        filename.parent.mkdir(parents=True, exist_ok=True)
+
+        self._identity = hashlib.sha256((identity or "").encode()).hexdigest()
+        self._max_size = max_size
+
+        self._connection = sqlite3.connect(filename, isolation_level=None)
+
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute("PRAGMA synchronous=NORMAL")
+        self._connection.execute(
+            """
+            CREATE TABLE IF NOT EXISTS responses (
+                key TEXT PRIMARY KEY,
+                etag TEXT,
+                last_modified TEXT,
+                expires REAL NOT NULL,
+                headers TEXT NOT NULL,
+                content BLOB NOT NULL,
+                size INTEGER NOT NULL,
+                last_access REAL NOT NULL
+            )
+            """,
+        )
+        self._connection.execute(
+            "CREATE INDEX IF NOT EXISTS responses_last_access ON responses (last_access)",
+        )
+
+        self._size: int = self._connection.execute(
+            "SELECT COALESCE(SUM(size), 0) FROM responses",
+        ).fetchone()[0]
+
+    # ----------------------------------------------------------------------
+    @property
+    def size(self) -> int:
+        """Total size (in bytes) of the content in the cache."""
+        return self._size
+
+    # ----------------------------------------------------------------------
+    def Close(self) -> None:
+        """Close the underlying database."""
+        self._connection.close()
+
+    # ----------------------------------------------------------------------
+    def CreateKey(self, url: str, params: Mapping[str, object] | None = None) -> str:
+        """Create the key used to persist the response for the url and parameters."""
+
+        if params:
+            url = f"{url}?{urlencode(sorted((k, str(v)) for k, v in params.items()))}"
+
+        return hashlib.sha256(f"{self._identity}\n{url}".encode()).hexdigest()
+
+    # ----------------------------------------------------------------------
+    def Get(self, key: str) -> CacheEntry | None:
+        """Return the entry associated with the key (if any)."""
+
+        row = self._connection.execute(
+            "SELECT etag, last_modified, expires, headers, content FROM responses WHERE key = ?",
+            (key,),
+        ).fetchone()
+
+        if row is None:
+            return None
+
+        self._connection.execute(
+            "UPDATE responses SET last_access = ? WHERE key = ?",
+            (time.time(), key),
+        )
+
+        etag, last_modified, expires, headers, content = row
+
+        return CacheEntry(key, etag, last_modified, expires, json.loads(headers), content)
+
+    # ----------------------------------------------------------------------
+    def Set(
+        self,
+        key: str,
+        headers: Mapping[str, str],
+        content: bytes,
+    ) -> CacheEntry | None:
+        """Persist a successful response; returns None if the response should not be cached."""
+
+        cache_control = headers.get("Cache-Control", "")
+
+        if "no-store" in cache_control:
+            return None
+
+        etag = headers.get("ETag")
+        last_modified = headers.get("Last-Modified")
+
+        if etag is None and last_modified is None and self._GetMaxAge(cache_control) == 0:
+            # There is no way to reuse this response
+            return None
+
+        entry = CacheEntry(
+            key,
+            etag,
+            last_modified,
+            time.time() + self._GetMaxAge(cache_control),
+            dict(headers),
+            content,
+        )
+
+        previous_size = self._connection.execute(
+            "SELECT size FROM responses WHERE key = ?",
+            (key,),
+        ).fetchone()
+
+        self._connection.execute(
+            "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+            (
+                entry.key,
+                entry.etag,
+                entry.last_modified,
+                entry.expires,
+                json.dumps(entry.headers),
+                entry.content,
+                len(entry.content),
+                time.time(),
+            ),
+        )
+
+        self._size += len(entry.content) - (previous_size[0] if previous_size else 0)
+        self._Evict()
+
+        return entry
+
+    # ----------------------------------------------------------------------
+    def Refresh(self, entry: CacheEntry, headers: Mapping[str, str]) -> CacheEntry:
+        """Update the expiration of an entry after the server reported that it has not been modified."""
+
+        entry = CacheEntry(
+            entry.key,
+            headers.get("ETag", entry.etag),
+            headers.get("Last-Modified", entry.last_modified),
+            time.time() + self._GetMaxAge(headers.get("Cache-Control", "")),
+            entry.headers,
+            entry.content,
+        )
+
+        self._connection.execute(
+            "UPDATE responses SET etag = ?, last_modified = ?, expires = ?, last_access = ? WHERE key = ?",
+            (entry.etag, entry.last_modified, entry.expires, time.time(), entry.key),
+        )
+
+        return entry
+
+    # ----------------------------------------------------------------------
+    # |
+    # |  Private Methods
+    # |
+    # ----------------------------------------------------------------------
+    @staticmethod
+    def _GetMaxAge(cache_control: str) -> int:
+        if "no-cache" in cache_control:
+            return 0
+
+        match = re.search(r"(?:^|[\s,])max-age=(\d+)", cache_control)
+        if match is None:
+            return 0
+
+        return int(match.group(1))
+
+    # ----------------------------------------------------------------------
+    def _Evict(self) -> None:
+        while self._size > self._max_size:
+            row = self._connection.execute(
+                "SELECT key, size FROM responses ORDER BY last_access LIMIT 1",
+            ).fetchone()
+
+            if row is None:
+                break  # pragma: no cover
+
+            self._connection.execute("DELETE FROM responses WHERE key = ?", (row[0],))
+            self._size -= row[1]
@@ -0,0 +1,163 @@
+# noqa: D100
+import asyncio
+
+from collections import Counter
+from collections.abc import Iterable
+from dataclasses import dataclass
+from typing import Literal
+
+import aiohttp
+
+from AllGitStatus.Repository import Repository
+from AllGitStatus.Sources.GitHubSession import GitHubSession, ParseLinkHeader
+
+
+# ----------------------------------------------------------------------
+@dataclass(frozen=True)
+class SearchCounts:
+    """The number of open issues and pull requests in a repository."""
+
+    issues: int
+    pull_requests: int
+
+
+# ----------------------------------------------------------------------
+class GitHubSearchCounts:
+    """Open issue and pull request counts for batches of repositories, retrieved with the search api.
+
+    The search api accepts multiple `repo:` qualifiers in a single query, so the open issues (or pull
+    requests) of a batch of repositories are searched together and counted per repository. Batches are
+    bounded by the maximum length of a search query. Counts are not available (and callers should
+    calculate them some other way) when a batch has too many results to be counted.
+    """
+
+    MAX_QUERY_LENGTH = 256
+    MAX_RESULTS = 1000
+
+    # ----------------------------------------------------------------------
+    def __init__(
+        self,
+        session: aiohttp.ClientSession | GitHubSession,
+        repositories: Iterable[Repository],
+        max_query_length: int = MAX_QUERY_LENGTH,
+    ) -> None:
+        batches: list[list[str]] = []
+        batch_indexes: dict[str, int] = {}
+
+        # The longest prefix is used so that all queries fit within the max length
+        prefix_length = len(self._CreateQuery("issue", []))
+        query_length = prefix_length
+
+        for repo in repositories:
+            name = self._CreateName(repo)
+
+            if name is None or name in batch_indexes:
+                continue
+
+            qualifier_length = len(f" repo:{name}")
+
+            if not batches or query_length + qualifier_length > max_query_length:
+                batches.append([])
+                query_length = prefix_length
+
+            batches[-1].append(name)
+            batch_indexes[name] = len(batches) - 1
+            query_length += qualifier_length
+
+        self._session = session
+        self._batches = batches
+        self._batch_indexes = batch_indexes
+        self._searches: dict[int, asyncio.Task[dict[str, SearchCounts] | None]] = {}
+
+    # ----------------------------------------------------------------------
+    async def GetCounts(self, repo: Repository) -> SearchCounts | None:
+        """Return the counts for the repository (if available)."""
+
+        name = self._CreateName(repo)
+        if name is None:
+            return None
+
+        batch_index = self._batch_indexes.get(name)
+        if batch_index is None:
+            return None
+
+        task = self._searches.get(batch_index)
+        if task is None:
+            task = asyncio.create_task(self._SearchBatch(self._batches[batch_index]))
+            self._searches[batch_index] = task
+
+        try:
+            # Shield the search so that it isn't cancelled when a single caller is cancelled
+            counts = await asyncio.shield(task)
+        except Exception:
+            # Callers will calculate the counts directly
+            return None
+
+        if counts is None:
+            return None
+
+        return counts[name]
+
+    # ----------------------------------------------------------------------
+    # |
+    # |  Private Methods
+    # |
+    # ----------------------------------------------------------------------
+    @staticmethod
+    def _CreateName(repo: Repository) -> str | None:
+        if not repo.github_owner or not repo.github_repo:
+            return None
+
+        return f"{repo.github_owner}/{repo.github_repo}".lower()
+
+    # ----------------------------------------------------------------------
+    @staticmethod
+    def _CreateQuery(kind: Literal["issue", "pr"], names: list[str]) -> str:
+        return " ".join([f"is:{kind}", "is:open", *(f"repo:{name}" for name in names)])
+
+    # ----------------------------------------------------------------------
+    async def _SearchBatch(self, names: list[str]) -> dict[str, SearchCounts] | None:
+        issue_counts = await self._Count("issue", names)
+        if issue_counts is None:
+            return None
+
+        pull_request_counts = await self._Count("pr", names)
+        if pull_request_counts is None:
+            return None
+
+        return {name: SearchCounts(issue_counts[name], pull_request_counts[name]) for name in names}
+
+    # ----------------------------------------------------------------------
+    async def _Count(self, kind: Literal["issue", "pr"], names: list[str]) -> Counter[str] | None:
+        counts: Counter[str] = Counter()
+
+        url: str | None = "https://api.github.com/search/issues"
+        params: dict[str, str | int] | None = {
+            "q": self._CreateQuery(kind, names),
+            # The total count is sufficient for a single repository; otherwise, the results must be
+            # counted by repository.
+            "per_page": 1 if len(names) == 1 else 100,
+        }
+
+        while url:
+            async with self._session.get(url, params=params) as response:
+                response.raise_for_status()
+                result = await response.json()
+
+                if result.get("incomplete_results"):
+                    return None
+
+                if len(names) == 1:
+                    counts[names[0]] = result["total_count"]
+                    break
+
+                if result["total_count"] > self.MAX_RESULTS:
+                    return None
+
+                for item in result["items"]:
+                    counts[item["repository_url"].removeprefix("https://api.github.com/repos/").lower()] += 1
+
+                url = ParseLinkHeader(response.headers.get("Link", "")).get("next")
+                params = None
+
+        return counts
@@ -0,0 +1,376 @@
+# noqa: D100
+import asyncio
+import random
+import re
+import time
+
+from collections.abc import AsyncIterator, Callable, Mapping
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+from http import HTTPStatus
+from typing import Any
+
+import aiohttp
+
+from multidict import CIMultiDict, CIMultiDictProxy
+from yarl import URL
+
+from AllGitStatus.Sources.GitHubCircuitBreaker import GitHubCircuitBreaker
+from AllGitStatus.Sources.GitHubJson import Loads
+from AllGitStatus.Sources.GitHubRequestScheduler import GitHubRequestScheduler
+from AllGitStatus.Sources.GitHubResponseCache import CacheEntry, GitHubResponseCache
+from AllGitStatus.Sources.GitHubTokenPool import GitHubTokenPool
+
+
+# ----------------------------------------------------------------------
+def ParseLinkHeader(link_header: str) -> dict[str, str]:
+    """Parse a `Link` header into a dict of urls keyed by relation (e.g. "next", "last")."""
+
+    return {
+        match.group("rel"): match.group("url")
+        for match in re.finditer(r'<(?P<url>[^>]+)>\s*;\s*rel="(?P<rel>[^"]+)"', link_header)
+    }
+
+
+# ----------------------------------------------------------------------
+@dataclass(frozen=True)
+class GitHubResponse:
+    """A fully-read response to a GitHub API request."""
+
+    request_info: aiohttp.RequestInfo
+    status: int
+    headers: CIMultiDictProxy[str]
+    content: bytes
+    from_cache: bool = field(kw_only=True, default=False)
+
+    # ----------------------------------------------------------------------
+    def raise_for_status(self) -> None:
+        """Raise an exception if the response represents an error."""
+
+        if self.status >= HTTPStatus.BAD_REQUEST:
+            raise aiohttp.ClientResponseError(
+                self.request_info,
+                (),
+                status=self.status,
+                message=HTTPStatus(self.status).phrase if self.status in HTTPStatus else "",
+                headers=self.headers,
+            )
+
+    # ----------------------------------------------------------------------
+    async def json(self, *, loads: Callable[[bytes], Any] = Loads) -> Any:  # noqa: ANN401
+        """Decode the response content (consistent with `aiohttp.ClientResponse.json`)."""
+        return loads(self.content)
+
+
+# ----------------------------------------------------------------------
+@dataclass(frozen=True)
+class RetryPolicy:
+    """Retries of requests that failed because of transient errors (e.g. 502s, timeouts and connection resets)."""
+
+    max_attempts: int = 4
+    initial_delay: float = 1.0  # Seconds before the first retry; the delay doubles with each retry
+    max_delay: float = 16.0
+    attempt_timeout: float = 30.0  # Seconds allowed for each attempt
+    deadline: float = 90.0  # Seconds after which failed requests are no longer retried
+
+
+# ----------------------------------------------------------------------
+class GitHubSession:
+    """Issues GitHub API requests on behalf of GitHubSource.
+
+    The session exposes the same `get` interface used with `aiohttp.ClientSession`, but responses are
+    fully read before they are returned and, when a cache is provided, are revalidated with conditional
+    requests (`304 Not Modified` responses do not count against the GitHub rate limit). When a scheduler
+    is provided, every request sent to GitHub is throttled by it. Search requests are subject to a
+    separate rate limit, and are throttled by `search_scheduler` when it is provided.
+
+    Identical requests made during a refresh (for example, from multiple local clones of the same GitHub
+    repository) share a single request, whether or not the original request is still in flight.
+    Successful responses are retained until `StartGeneration` is called at the beginning of the next
+    refresh; error responses and exceptions are not retained.
+
+    When a retry policy is provided, requests that fail because of transient errors are retried with
+    exponential backoff; when a circuit breaker is also provided, requests are paused while GitHub is
+    failing repeatedly.
+
+    When a token pool is provided, each request is authorized with the token that has the most quota
+    remaining.
+
+    The most recent `X-Poll-Interval` header sent by GitHub is available via `poll_interval`; clients
+    polling for changes should not poll more frequently than this.
+    """
+
+    TRANSIENT_ERROR_STATUSES = frozenset(
+        [
+            HTTPStatus.INTERNAL_SERVER_ERROR,
+            HTTPStatus.BAD_GATEWAY,
+            HTTPStatus.SERVICE_UNAVAILABLE,
+            HTTPStatus.GATEWAY_TIMEOUT,
+        ],
+    )
+
+    # ----------------------------------------------------------------------
+    def __init__(
+        self,
+        session: aiohttp.ClientSession,
+        *,
+        cache: GitHubResponseCache | None = None,
+        scheduler: GitHubRequestScheduler | None = None,
+        search_scheduler: GitHubRequestScheduler | None = None,
+        token_pool: GitHubTokenPool | None = None,
+        retry_policy: RetryPolicy | None = None,
+        circuit_breaker: GitHubCircuitBreaker | None = None,
+    ) -> None:
+        self._session = session
+        self._cache = cache
+        self._scheduler = scheduler
+        self._search_scheduler = search_scheduler
+        self._token_pool = token_pool
+        self._retry_policy = retry_policy
+        self._circuit_breaker = circuit_breaker
+
+        self._in_flight: dict[tuple, asyncio.Task[GitHubResponse]] = {}
+        self._responses: dict[tuple, GitHubResponse] = {}
+
+        self._poll_interval: float | None = None
+
+    # ----------------------------------------------------------------------
+    @property
+    def poll_interval(self) -> float | None:
+        """The minimum number of seconds between polls most recently requested by GitHub (if any)."""
+        return self._poll_interval
+
+    # ----------------------------------------------------------------------
+    async def close(self) -> None:
+        """Close the session and its cache."""
+
+        await self._session.close()
+
+        if self._cache is not None:
+            self._cache.Close()
+
+    # ----------------------------------------------------------------------
+    def StartGeneration(self) -> None:
+        """Start a new refresh generation; earlier requests and responses are no longer shared."""
+
+        self._in_flight.clear()
+        self._responses.clear()
+
+    # ----------------------------------------------------------------------
+    @asynccontextmanager
+    async def get(
+        self,
+        url: str,
+        params: Mapping[str, str | int] | None = None,
+    ) -> AsyncIterator[GitHubResponse]:
+        """Issue a GET request."""
+
+        yield await self._GetCoalesced(url, params)
+
+    # ----------------------------------------------------------------------
+    # |
+    # |  Private Methods
+    # |
+    # ----------------------------------------------------------------------
+    async def _GetCoalesced(
+        self,
+        url: str,
+        params: Mapping[str, str | int] | None,
+    ) -> GitHubResponse:
+        key = (url, tuple(sorted((name, str(value)) for name, value in (params or {}).items())))
+
+        response = self._responses.get(key)
+        if response is not None:
+            return response
+
+        task = self._in_flight.get(key)
+        if task is None:
+            task = asyncio.create_task(self._Get(url, params))
+            self._in_flight[key] = task
+
+            # ----------------------------------------------------------------------
+            def OnDone(task: asyncio.Task[GitHubResponse]) -> None:
+                # The request may have been removed when a new generation was started while it was in flight
+                if self._in_flight.get(key) is not task:
+                    return
+
+                del self._in_flight[key]
+
+                if (
+                    not task.cancelled()
+                    and task.exception() is None
+                    and task.result().status == HTTPStatus.OK
+                ):
+                    self._responses[key] = task.result()
+
+            # ----------------------------------------------------------------------
+
+            task.add_done_callback(OnDone)
+
+        # Shield the request so that it isn't cancelled when a single caller is cancelled
+        return await asyncio.shield(task)
+
+    # ----------------------------------------------------------------------
+    async def _Get(
+        self,
+        url: str,
+        params: Mapping[str, str | int] | None,
+    ) -> GitHubResponse:
+        if self._cache is None:
+            return await self._Request(url, params, {})
+
+        key = self._cache.CreateKey(url, params)
+        entry = self._cache.Get(key)
+
+        headers: dict[str, str] = {}
+
+        if entry is not None:
+            if entry.is_fresh:
+                return self._CreateCachedResponse(url, entry)
+
+            if entry.etag is not None:
+                headers["If-None-Match"] = entry.etag
+            if entry.last_modified is not None:
+                headers["If-Modified-Since"] = entry.last_modified
+
+        response = await self._Request(url, params, headers)
+
+        if response.status == HTTPStatus.NOT_MODIFIED and entry is not None:
+            return self._CreateCachedResponse(url, self._cache.Refresh(entry, response.headers))
+
+        if response.status == HTTPStatus.OK:
+            self._cache.Set(key, response.headers, response.content)
+
+        return response
+
+    # ----------------------------------------------------------------------
+    async def _Request(
+        self,
+        url: str,
+        params: Mapping[str, str | int] | None,
+        headers: Mapping[str, str],
+    ) -> GitHubResponse:
+        if self._retry_policy is None:
+            return await self._ScheduleRequest(url, params, headers)
+
+        host = URL(url).host or ""
+        deadline = time.monotonic() + self._retry_policy.deadline
+        attempt = 0
+
+        while True:
+            attempt += 1
+
+            if self._circuit_breaker is not None:
+                await self._circuit_breaker.Wait(host, deadline)
+
+            try:
+                response = await self._ScheduleRequest(url, params, headers)
+
+            except (aiohttp.ClientConnectionError, aiohttp.ClientPayloadError, TimeoutError):
+                self._ReportOutcome(host, success=False)
+
+                delay = self._GetRetryDelay(attempt, deadline)
+                if delay is None:
+                    raise
+
+            except BaseException:
+                self._ReportOutcome(host, success=None)
+                raise
+
+            else:
+                is_transient_error = response.status in self.TRANSIENT_ERROR_STATUSES
+
+                self._ReportOutcome(host, success=not is_transient_error)
+
+                delay = self._GetRetryDelay(attempt, deadline) if is_transient_error else None
+                if delay is None:
+                    return response
+
+            await asyncio.sleep(delay)
+
+    # ----------------------------------------------------------------------
+    def _ReportOutcome(self, host: str, *, success: bool | None) -> None:
+        if self._circuit_breaker is not None:
+            self._circuit_breaker.Report(host, success=success)
+
+    # ----------------------------------------------------------------------
+    def _GetRetryDelay(self, attempt: int, deadline: float) -> float | None:
+        assert self._retry_policy is not None
+
+        if attempt >= self._retry_policy.max_attempts:
+            return None
+
+        delay = min(self._retry_policy.initial_delay * 2 ** (attempt - 1), self._retry_policy.max_delay)
+        delay += random.uniform(0.0, delay * 0.1)  # noqa: S311
+
+        if time.monotonic() + delay > deadline:
+            return None
+
+        return delay
+
+    # ----------------------------------------------------------------------
+    async def _ScheduleRequest(
+        self,
+        url: str,
+        params: Mapping[str, str | int] | None,
+        headers: Mapping[str, str],
+    ) -> GitHubResponse:
+        scheduler = self._scheduler
+
+        if self._search_scheduler is not None and self._IsSearchUrl(url):
+            scheduler = self._search_scheduler
+
+        if scheduler is None:
+            return await self._RawRequest(url, params, headers)
+
+        return await scheduler.Execute(lambda: self._RawRequest(url, params, headers))
+
+    # ----------------------------------------------------------------------
+    async def _RawRequest(
+        self,
+        url: str,
+        params: Mapping[str, str | int] | None,
+        headers: Mapping[str, str],
+    ) -> GitHubResponse:
+        token: str | None = None
+
+        if self._token_pool is not None:
+            token = self._token_pool.Acquire("search" if self._IsSearchUrl(url) else "core")
+            headers = {**headers, "Authorization": f"Bearer {token}"}
+
+        async with (
+            asyncio.timeout(None if self._retry_policy is None else self._retry_policy.attempt_timeout),
+            self._session.get(url, params=params, headers=headers) as response,
+        ):
+            if token is not None:
+                assert self._token_pool is not None
+                self._token_pool.Update(token, response.headers)
+
+            poll_interval = response.headers.get("X-Poll-Interval")
+            if poll_interval is not None and poll_interval.isdigit():
+                self._poll_interval = float(poll_interval)
+
+            return GitHubResponse(
+                response.request_info,
+                response.status,
+                response.headers,
+                await response.read(),
+            )
+
+    # ----------------------------------------------------------------------
+    @staticmethod
+    def _IsSearchUrl(url: str) -> bool:
+        return url.startswith("https://api.github.com/search/")
+
+    # ----------------------------------------------------------------------
+    @staticmethod
+    def _CreateCachedResponse(url: str, entry: CacheEntry) -> GitHubResponse:
+        headers = CIMultiDictProxy(CIMultiDict(entry.headers))
+
+        return GitHubResponse(
+            aiohttp.RequestInfo(URL(url), "GET", CIMultiDictProxy(CIMultiDict()), URL(url)),
+            HTTPStatus.OK,
+            headers,
+            entry.content,
+            from_cache=True,
+        )
@@ -1,21 +1,59 @@
 # noqa: D100
-import re
+import asyncio
+import functools
 import textwrap
 
-from collections.abc import AsyncGenerator
+from collections import deque
+from collections.abc import AsyncGenerator, Callable
 from datetime import datetime, timedelta, UTC
 from http import HTTPStatus
+from typing import ClassVar
 
 import aiohttp
 
+from yarl import URL
+
 from AllGitStatus.Repository import Repository
-from AllGitStatus.Sources.Source import ErrorInfo, ResultInfo, Source
+from AllGitStatus.Sources.GitHubCICDCache import CICDCacheEntry, GitHubCICDCache, IN_PROGRESS_STATUSES
+from AllGitStatus.Sources.GitHubJson import CreateLoads, Projection
+from AllGitStatus.Sources.GitHubIssueStore import GitHubIssueStore, ItemKind
+from AllGitStatus.Sources.GitHubOwnerListings import GitHubOwnerListings
+from AllGitStatus.Sources.GitHubSearchCounts import GitHubSearchCounts
+from AllGitStatus.Sources.GitHubSession import GitHubSession, ParseLinkHeader
+from AllGitStatus.Sources.Source import DeferredInfo, ErrorInfo, ResultInfo, Source
 
 
 # ----------------------------------------------------------------------
 class GitHubSource(Source):
     """Source for GitHub repository information (stars, forks, issues, etc.)."""
 
+    MAX_CONCURRENT_PAGES = 10
+
+    # Items updated shortly before the previous sync are requested again to account for clock skew
+    # between this machine and GitHub
+    SYNC_OVERLAP = timedelta(minutes=5)
+
+    # Pages of issues, pull requests and alerts are reduced to the fields used to generate information as
+    # they are decoded, so that bodies, reactions, full user objects, etc. are not retained
+    ITEM_PROJECTION: ClassVar[Projection] = {
+        "number": None,
+        "title": None,
+        "state": None,
+        "updated_at": None,
+        "draft": None,
+        "pull_request": {},
+        "user": {"login": None},
+        "labels": {"name": None},
+    }
+
+    ALERT_PROJECTION: ClassVar[Projection] = {
+        "security_advisory": {"severity": None, "summary": None},
+        "security_vulnerability": {"package": {"name": None}},
+    }
+
+    # Information provided by the repository (or the owner listing)
+    STANDARD_INFO_NAMES = frozenset(["stars", "forks", "watchers", "archived"])
+
     # ----------------------------------------------------------------------
     @staticmethod
     def CreateGitHubHttpHeaders(github_pat: str | None = None) -> dict[str, str]:
@@ -34,9 +72,22 @@ class GitHubSource(Source):
     # ----------------------------------------------------------------------
     def __init__(
         self,
-        session: aiohttp.ClientSession,
+        session: aiohttp.ClientSession | GitHubSession,
+        owner_listings: GitHubOwnerListings | None = None,
+        issue_store: GitHubIssueStore | None = None,
+        *,
+        lazy_details: bool = False,
+        search_counts: GitHubSearchCounts | None = None,
+        cicd_cache: GitHubCICDCache | None = None,
+        lean_cicd: bool = False,
     ) -> None:
         self._session = session
+        self._owner_listings = owner_listings
+        self._issue_store = issue_store
+        self._lazy_details = lazy_details
+        self._search_counts = search_counts
+        self._cicd_cache = cicd_cache
+        self._lean_cicd = lean_cicd
 
     # ----------------------------------------------------------------------
     def Applies(self, repo: Repository) -> bool:  # noqa: D102
@@ -44,36 +95,98 @@ class GitHubSource(Source):
 
     # ----------------------------------------------------------------------
     async def Query(self, repo: Repository) -> AsyncGenerator[ResultInfo | ErrorInfo]:  # noqa: D102  # ty: ignore[invalid-method-override]
-        assert self.Applies(repo)
-        assert repo.remote_url is not None
-
-        github_url = repo.remote_url.removesuffix(".git")
-
-        persisted_info: dict[str, object] = {}
-
-        async for info in self._GenerateStandardInfo(repo, github_url, persisted_info):
+        async for info in self._Query(repo):
             yield info
 
-        async for info in self._GenerateIssueInfo(repo, github_url):
-            yield info
+    # ----------------------------------------------------------------------
+    async def QueryInfo(self, repo: Repository, name: str) -> AsyncGenerator[ResultInfo | ErrorInfo]:
+        """Generate a single piece of information (e.g. to rebuild details that are no longer retained).
 
-        async for info in self._GeneratePullRequestInfo(repo, github_url):
-            yield info
+        Only the requests needed to generate the information are made, and details are always retrieved.
+        """
 
-        async for info in self._GenerateSecurityAlertInfo(repo, github_url):
-            yield info
+        async for info in self._Query(repo, name):
+            if info.key[1] == name:
+                yield info
 
-        async for info in self._GenerateReleaseInfo(repo, github_url):
-            yield info
+    # ----------------------------------------------------------------------
+    async def _Query(
+        self,
+        repo: Repository,
+        name: str | None = None,
+    ) -> AsyncGenerator[ResultInfo | ErrorInfo]:
+        assert self.Applies(repo)
+        assert repo.remote_url is not None
 
-        default_branch = persisted_info.get("default_branch")
+        github_url = repo.remote_url.removesuffix(".git")
 
-        if default_branch:
-            assert isinstance(default_branch, str), default_branch
+        # The queries are independent of each other (with the exception of CI/CD status, which needs the
+        # default branch from the standard info), so issue them concurrently and yield the results as
+        # they become available.
+        repository_info: asyncio.Future[dict | None] = asyncio.get_running_loop().create_future()
+
+        # When details are retrieved lazily, the number of open pull requests is used by both the issues
+        # and pull requests columns
+        pull_request_count: asyncio.Task[int] | None = None
+
+        if self._lazy_details and name is None:
+            pull_request_count = asyncio.create_task(self._GetOpenPullRequestCount(repo))
+
+        # ----------------------------------------------------------------------
+        async def GenerateStandardInfo() -> AsyncGenerator[ResultInfo | ErrorInfo]:
+            try:
+                async for info in self._GenerateStandardInfo(repo, github_url, repository_info):
+                    yield info
+            finally:
+                if not repository_info.done():
+                    repository_info.set_result(None)
+
+        # ----------------------------------------------------------------------
+        async def GenerateCICDInfo() -> AsyncGenerator[ResultInfo | ErrorInfo]:
+            branch = (await repository_info or {}).get("default_branch")
+            if not branch:
+                return
+
+            async for info in self._GenerateCICDInfo(repo, github_url, branch):
+                yield info
 
-            async for info in self._GenerateCICDInfo(repo, github_url, default_branch):
+        # ----------------------------------------------------------------------
+
+        # The names of the information provided by each generator
+        generator_factories: list[
+            tuple[frozenset[str], Callable[[], AsyncGenerator[ResultInfo | ErrorInfo]]]
+        ] = [
+            # CI/CD status needs the default branch from the standard info
+            (self.STANDARD_INFO_NAMES | {"cicd_status"}, GenerateStandardInfo),
+            (
+                frozenset(["issues"]),
+                functools.partial(
+                    self._GenerateIssueInfo, repo, github_url, repository_info, pull_request_count
+                ),
+            ),
+            (
+                frozenset(["pull_requests"]),
+                functools.partial(self._GeneratePullRequestInfo, repo, github_url, pull_request_count),
+            ),
+            (
+                frozenset(["security_alerts"]),
+                functools.partial(self._GenerateSecurityAlertInfo, repo, github_url),
+            ),
+            (frozenset(["release"]), functools.partial(self._GenerateReleaseInfo, repo, github_url)),
+            (frozenset(["cicd_status"]), GenerateCICDInfo),
+        ]
+
+        try:
+            async for info in self._MergeGenerators(
+                *(factory() for names, factory in generator_factories if name is None or name in names),
+            ):
                 yield info
 
+        finally:
+            if pull_request_count is not None:
+                pull_request_count.cancel()
+                await asyncio.gather(pull_request_count, return_exceptions=True)
+
     # ----------------------------------------------------------------------
     # ----------------------------------------------------------------------
     # ----------------------------------------------------------------------
@@ -81,8 +194,46 @@ class GitHubSource(Source):
         self,
         repo: Repository,
         github_url: str,
-        persisted_info: dict[str, object],
+        repository_info: asyncio.Future[dict | None],
     ) -> AsyncGenerator[ResultInfo | ErrorInfo]:
+        result: dict | None = None
+
+        if self._owner_listings is not None:
+            result = await self._owner_listings.GetRepository(repo)
+
+        if result is not None:
+            # Provide the repository info for use by the other queries (e.g. CI/CD status)
+            repository_info.set_result(result)
+
+            standard_info = self._CreateStandardInfo(repo, github_url, result)
+
+            # The number of watchers is not included in the owner listing; requesting it for every
+            # repository would negate the savings of the listing, so it is only requested when selected.
+
+            # ----------------------------------------------------------------------
+            async def GetWatchers() -> object:
+                async with self._session.get(
+                    f"https://api.github.com/repos/{repo.github_owner}/{repo.github_repo}"
+                ) as response:
+                    response.raise_for_status()
+                    result = await response.json()
+
+                return f"Watchers: {result.get('subscribers_count', 0)}\n\n{github_url}/watchers"
+
+            # ----------------------------------------------------------------------
+
+            standard_info["watchers"] = ResultInfo(
+                repo,
+                (self.__class__.__name__, "watchers"),
+                f"{'?':>5} 👀",
+                DeferredInfo(f"{github_url}/watchers\n\nLoading...", GetWatchers),
+            )
+
+            for info in standard_info.values():
+                yield info
+
+            return
+
         try:
             async with self._session.get(
                 f"https://api.github.com/repos/{repo.github_owner}/{repo.github_repo}"
@@ -90,38 +241,11 @@ class GitHubSource(Source):
                 response.raise_for_status()
                 result = await response.json()
 
-                # Capture default_branch for use by CI/CD status
-                persisted_info["default_branch"] = result.get("default_branch")
-
-                yield ResultInfo(
-                    repo,
-                    (self.__class__.__name__, "stars"),
-                    f"{result.get('stargazers_count', 0):5} ⭐",
-                    f"{github_url}/stargazers",
-                )
+                # Provide the repository info for use by the other queries (e.g. CI/CD status)
+                repository_info.set_result(result)
 
-                yield ResultInfo(
-                    repo,
-                    (self.__class__.__name__, "forks"),
-                    f"{result.get('forks_count', 0):5} 🍴",
-                    f"{github_url}/forks",
-                )
-
-                yield ResultInfo(
-                    repo,
-                    (self.__class__.__name__, "watchers"),
-                    f"{result.get('subscribers_count', 0):5} 👀",
-                    f"{github_url}/watchers",
-                )
-
-                is_archived = result.get("archived", False)
-
-                yield ResultInfo(
-                    repo,
-                    (self.__class__.__name__, "archived"),
-                    "📦" if is_archived else "-",
-                    f"Archived: {'Yes' if is_archived else 'No'}",
-                )
+                for info in self._CreateStandardInfo(repo, github_url, result).values():
+                    yield info
 
         except Exception as ex:
             # Yield ErrorInfo for ALL columns that would have been populated
@@ -133,118 +257,252 @@ class GitHubSource(Source):
             # Also yield error for cicd_status since it depends on default_branch from this method
             yield ErrorInfo(repo, (self.__class__.__name__, "cicd_status"), ex)
 
+    # ----------------------------------------------------------------------
+    def _CreateStandardInfo(
+        self,
+        repo: Repository,
+        github_url: str,
+        result: dict,
+    ) -> dict[str, ResultInfo]:
+        is_archived = result.get("archived", False)
+
+        return {
+            "stars": ResultInfo(
+                repo,
+                (self.__class__.__name__, "stars"),
+                f"{result.get('stargazers_count', 0):5} ⭐",
+                f"{github_url}/stargazers",
+            ),
+            "forks": ResultInfo(
+                repo,
+                (self.__class__.__name__, "forks"),
+                f"{result.get('forks_count', 0):5} 🍴",
+                f"{github_url}/forks",
+            ),
+            "watchers": ResultInfo(
+                repo,
+                (self.__class__.__name__, "watchers"),
+                f"{result.get('subscribers_count', 0):5} 👀",
+                f"{github_url}/watchers",
+            ),
+            "archived": ResultInfo(
+                repo,
+                (self.__class__.__name__, "archived"),
+                "📦" if is_archived else "-",
+                f"Archived: {'Yes' if is_archived else 'No'}",
+            ),
+        }
+
     # ----------------------------------------------------------------------
     async def _GenerateIssueInfo(
         self,
         repo: Repository,
         github_url: str,
+        repository_info: asyncio.Future[dict | None],
+        pull_request_count: asyncio.Task[int] | None,
     ) -> AsyncGenerator[ResultInfo | ErrorInfo]:
         key = (self.__class__.__name__, "issues")
 
         try:
-            label_counts: dict[str, int] = {}
-            total_count = 0
-            issue_data: list[str] = []
+            if pull_request_count is not None:
+                total_count: int | None = None
 
-            async for issue in self._GeneratePaginatedResults(
-                f"https://api.github.com/repos/{repo.github_owner}/{repo.github_repo}/issues"
-            ):
-                # GitHub API returns pull requests as issues with a "pull_request" key - skip them
-                if "pull_request" in issue:
-                    continue
+                if self._search_counts is not None:
+                    search_counts = await self._search_counts.GetCounts(repo)
 
-                labels = issue.get("labels", [])
+                    if search_counts is not None:
+                        total_count = search_counts.issues
 
-                for label in labels:
-                    label_name = label.get("name", "")
+                if total_count is None:
+                    info = await repository_info
 
-                    if label_name:
-                        label_counts[label_name] = label_counts.get(label_name, 0) + 1
+                    if info is not None and "open_issues_count" in info:
+                        # GitHub includes open pull requests in the open issue count
+                        total_count = info["open_issues_count"] - await pull_request_count
 
-                total_count += 1
+                if total_count is not None:
+                    # ----------------------------------------------------------------------
+                    async def GetDetails() -> object:
+                        return (await self._GetIssueDetails(repo, github_url))[1]
 
-                issue_number = issue.get("number", "?")
-                issue_title = issue.get("title", "No title")
-                issue_author = issue.get("user", {}).get("login", "unknown")
-                issue_labels = [label.get("name", "") for label in issue.get("labels", [])]
+                    # ----------------------------------------------------------------------
 
-                label_str = f" [{', '.join(issue_labels)}]" if issue_labels else ""
-
-                issue_data.append(f"- #{issue_number}{label_str} {issue_title} (by {issue_author})")
-
-            # Build additional info with issue details
-            additional_info_lines = [
-                f"Issues: {github_url}/issues",
-                "",
-                f"Total Open Issues: {total_count}",
-                "",
-            ]
-
-            if label_counts:
-                additional_info_lines.append("By Label:")
-
-                for label_name, count in sorted(label_counts.items(), key=lambda x: -x[1]):
-                    additional_info_lines.append(f"  {label_name}: {count}")
+                    yield ResultInfo(
+                        repo,
+                        key,
+                        f"{total_count:5} 🐛",
+                        DeferredInfo(f"Issues: {github_url}/issues\n\nLoading...", GetDetails),
+                    )
 
-                additional_info_lines.append("")
+                    return
 
-            additional_info_lines.extend(issue_data)
+            total_count, additional_info = await self._GetIssueDetails(repo, github_url)
 
             yield ResultInfo(
                 repo,
                 key,
                 f"{total_count:5} 🐛",
-                "\n".join(additional_info_lines),
+                additional_info,
             )
 
         except Exception as ex:
             yield ErrorInfo(repo, key, ex)
 
+    # ----------------------------------------------------------------------
+    async def _GetIssueDetails(
+        self,
+        repo: Repository,
+        github_url: str,
+    ) -> tuple[int, str]:
+        label_counts: dict[str, int] = {}
+        total_count = 0
+        issue_data: list[str] = []
+
+        for issue in await self._GetOpenItems(repo, "issues"):
+            # GitHub API returns pull requests as issues with a "pull_request" key - skip them
+            if "pull_request" in issue:
+                continue
+
+            labels = issue.get("labels", [])
+
+            for label in labels:
+                label_name = label.get("name", "")
+
+                if label_name:
+                    label_counts[label_name] = label_counts.get(label_name, 0) + 1
+
+            total_count += 1
+
+            issue_number = issue.get("number", "?")
+            issue_title = issue.get("title", "No title")
+            issue_author = issue.get("user", {}).get("login", "unknown")
+            issue_labels = [label.get("name", "") for label in issue.get("labels", [])]
+
+            label_str = f" [{', '.join(issue_labels)}]" if issue_labels else ""
+
+            issue_data.append(f"- #{issue_number}{label_str} {issue_title} (by {issue_author})")
+
+        # Build additional info with issue details
+        additional_info_lines = [
+            f"Issues: {github_url}/issues",
+            "",
+            f"Total Open Issues: {total_count}",
+            "",
+        ]
+
+        if label_counts:
+            additional_info_lines.append("By Label:")
+
+            for label_name, count in sorted(label_counts.items(), key=lambda x: -x[1]):
+                additional_info_lines.append(f"  {label_name}: {count}")
+
+            additional_info_lines.append("")
+
+        additional_info_lines.extend(issue_data)
+
+        return total_count, "\n".join(additional_info_lines)
+
     # ----------------------------------------------------------------------
     async def _GeneratePullRequestInfo(
         self,
         repo: Repository,
         github_url: str,
+        pull_request_count: asyncio.Task[int] | None,
     ) -> AsyncGenerator[ResultInfo | ErrorInfo]:
         key = (self.__class__.__name__, "pull_requests")
 
         try:
-            total_count = 0
-            pr_data: list[str] = []
-
-            async for pr in self._GeneratePaginatedResults(
-                f"https://api.github.com/repos/{repo.github_owner}/{repo.github_repo}/pulls"
-            ):
-                total_count += 1
+            if pull_request_count is not None:
+                total_count = await pull_request_count
 
-                pr_number = pr.get("number", "?")
-                pr_title = pr.get("title", "No title")
-                pr_author = pr.get("user", {}).get("login", "unknown")
-                pr_draft = pr.get("draft", False)
+                # ----------------------------------------------------------------------
+                async def GetDetails() -> object:
+                    return (await self._GetPullRequestDetails(repo, github_url))[1]
 
-                draft_indicator = "[DRAFT] " if pr_draft else ""
+                # ----------------------------------------------------------------------
 
-                pr_data.append(f"- #{pr_number} {draft_indicator}{pr_title} (by {pr_author})")
+                yield ResultInfo(
+                    repo,
+                    key,
+                    f"{total_count:5} 🔀",
+                    DeferredInfo(f"Pull Requests: {github_url}/pulls\n\nLoading...", GetDetails),
+                )
 
-            additional_info_lines = [
-                f"Pull Requests: {github_url}/pulls",
-                "",
-                f"Total Open PRs: {total_count}",
-                "",
-            ]
+                return
 
-            additional_info_lines.extend(pr_data)
+            total_count, additional_info = await self._GetPullRequestDetails(repo, github_url)
 
             yield ResultInfo(
                 repo,
                 key,
                 f"{total_count:5} 🔀",
-                "\n".join(additional_info_lines),
+                additional_info,
             )
 
         except Exception as ex:
             yield ErrorInfo(repo, key, ex)
 
+    # ----------------------------------------------------------------------
+    async def _GetPullRequestDetails(
+        self,
+        repo: Repository,
+        github_url: str,
+    ) -> tuple[int, str]:
+        total_count = 0
+        pr_data: list[str] = []
+
+        for pr in await self._GetOpenItems(repo, "pulls"):
+            total_count += 1
+
+            pr_number = pr.get("number", "?")
+            pr_title = pr.get("title", "No title")
+            pr_author = pr.get("user", {}).get("login", "unknown")
+            pr_draft = pr.get("draft", False)
+
+            draft_indicator = "[DRAFT] " if pr_draft else ""
+
+            pr_data.append(f"- #{pr_number} {draft_indicator}{pr_title} (by {pr_author})")
+
+        additional_info_lines = [
+            f"Pull Requests: {github_url}/pulls",
+            "",
+            f"Total Open PRs: {total_count}",
+            "",
+        ]
+
+        additional_info_lines.extend(pr_data)
+
+        return total_count, "\n".join(additional_info_lines)
+
+    # ----------------------------------------------------------------------
+    async def _GetOpenPullRequestCount(self, repo: Repository) -> int:
+        if self._search_counts is not None:
+            search_counts = await self._search_counts.GetCounts(repo)
+
+            if search_counts is not None:
+                return search_counts.pull_requests
+
+        # With a single result per page, the number of the last page is the number of open pull requests
+        results, links = await self._GetPage(
+            f"https://api.github.com/repos/{repo.github_owner}/{repo.github_repo}/pulls",
+            {"state": "open", "per_page": 1},
+            self.ITEM_PROJECTION,
+        )
+
+        last_url = links.get("last")
+
+        if last_url is not None:
+            page = URL(last_url).query.get("page")
+
+            if page is not None and page.isdigit():
+                return int(page)
+
+        if "next" in links:
+            # The number of pages can't be determined, so count the pull requests
+            return len(await self._GetOpenItems(repo, "pulls"))
+
+        return len(results)
+
     # ----------------------------------------------------------------------
     async def _GenerateSecurityAlertInfo(
         self,
@@ -264,7 +522,8 @@ class GitHubSource(Source):
             alert_data: list[str] = []
 
             async for alert in self._GeneratePaginatedResults(
-                f"https://api.github.com/repos/{repo.github_owner}/{repo.github_repo}/dependabot/alerts"
+                f"https://api.github.com/repos/{repo.github_owner}/{repo.github_repo}/dependabot/alerts",
+                projection=self.ALERT_PROJECTION,
             ):
                 severity = alert.get("security_advisory", {}).get("severity", "").lower()
 
@@ -329,110 +588,280 @@ class GitHubSource(Source):
         try:
             prev_month = datetime.now(tz=UTC) - timedelta(days=30)
 
-            url = f"https://api.github.com/repos/{repo.github_owner}/{repo.github_repo}/actions/runs"
+            if self._cicd_cache is None:
+                workflow_runs = await self._GetLatestWorkflowRuns(repo, default_branch, prev_month)
+            else:
+                workflow_runs = await self._GetCachedWorkflowRuns(repo, default_branch, prev_month)
 
-            params = {
-                "branch": default_branch,
-                "per_page": 100,
-                "created": f">={prev_month.date()}",
+            if not workflow_runs:
+                yield ResultInfo(
+                    repo,
+                    key,
+                    "-",
+                    textwrap.dedent(
+                        """\
+                            CI/CD Status: {github_url}/actions
+
+                            No workflow runs found for branch '{default_branch}' since '{prev_month}'.
+                            """,
+                    ).format(
+                        github_url=github_url,
+                        default_branch=default_branch,
+                        prev_month=prev_month.date(),
+                    ),
+                )
+                return
+
+            # Count statuses based on most recent run per workflow
+            status_counts = {
+                "success": 0,
+                "failure": 0,
+                "in_progress": 0,
             }
 
-            async with self._session.get(url, params=params) as response:
+            run_details: list[str] = []
+
+            for run in workflow_runs:
+                conclusion = run.get("conclusion")
+                status = run.get("status")
+
+                # Determine the effective status
+                if status in IN_PROGRESS_STATUSES:
+                    status_counts["in_progress"] += 1
+                    status_label = "IN PROG"
+                elif conclusion == "success":
+                    status_counts["success"] += 1
+                    status_label = " PASS  "
+                elif conclusion in ("failure", "cancelled", "timed_out"):
+                    status_counts["failure"] += 1
+                    status_label = " FAIL  "
+                else:
+                    status_label = conclusion or status or "UNKNOWN"
+
+                run_details.append(f"- [{status_label}] {run['created_at']} {run['path']}: {run['name']}")
+
+            # Determine display icon based on priority: failure > in_progress > success
+            if status_counts["failure"] > 0:
+                display_icon = "❌"
+            elif status_counts["in_progress"] > 0:
+                display_icon = "⏳"
+            elif status_counts["success"] > 0:
+                display_icon = "✅"
+            else:
+                display_icon = "🔘"
+
+            # Build additional info
+            additional_info_lines = [
+                f"CI/CD Status: {github_url}/actions",
+                "",
+                f"Default Branch: {default_branch}",
+                "",
+                "Summary (latest run per workflow):",
+                f"  Successful:  {status_counts['success']}",
+                f"  Failed:      {status_counts['failure']}",
+                f"  In Progress: {status_counts['in_progress']}",
+                "",
+            ]
+
+            additional_info_lines.extend(run_details)
+
+            yield ResultInfo(
+                repo,
+                key,
+                display_icon,
+                "\n".join(additional_info_lines),
+            )
+
+        except Exception as ex:
+            yield ErrorInfo(repo, key, ex)
+
+    # ----------------------------------------------------------------------
+    async def _GetLatestWorkflowRuns(
+        self,
+        repo: Repository,
+        default_branch: str,
+        prev_month: datetime,
+    ) -> list[dict]:
+        if self._lean_cicd:
+            return await self._GetLatestWorkflowRunsLean(repo, default_branch, prev_month)
+
+        url = f"https://api.github.com/repos/{repo.github_owner}/{repo.github_repo}/actions/runs"
+
+        params = {
+            "branch": default_branch,
+            "per_page": 100,
+            "created": f">={prev_month.date()}",
+        }
+
+        async with self._session.get(url, params=params) as response:
+            response.raise_for_status()
+            result = await response.json()
+
+        # Group by workflow name and take only the most recent run for each
+        latest_per_workflow: dict[str, dict] = {}
+
+        for run in result.get("workflow_runs", []):
+            workflow_id = run["workflow_id"]
+
+            if workflow_id not in latest_per_workflow:
+                latest_per_workflow[workflow_id] = run
+
+        return list(latest_per_workflow.values())
+
+    # ----------------------------------------------------------------------
+    async def _GetLatestWorkflowRunsLean(
+        self,
+        repo: Repository,
+        default_branch: str,
+        prev_month: datetime,
+    ) -> list[dict]:
+        assert repo.github_owner is not None
+        assert repo.github_repo is not None
+
+        # Rather than requesting (up to) 100 runs and discarding all but the latest run for each workflow,
+        # request only the latest run for each workflow.
+        workflows = (
+            self._cicd_cache.GetWorkflows(repo.github_owner, repo.github_repo) if self._cicd_cache else None
+        )
+
+        if workflows is None:
+            workflows = []
+
+            url: str | None = (
+                f"https://api.github.com/repos/{repo.github_owner}/{repo.github_repo}/actions/workflows"
+            )
+            params: dict[str, str | int] | None = {"per_page": 100}
+
+            while url:
+                async with self._session.get(url, params=params) as response:
+                    response.raise_for_status()
+
+                    workflows += (await response.json()).get("workflows", [])
+
+                    url = ParseLinkHeader(response.headers.get("Link", "")).get("next")
+                    params = None
+
+            if self._cicd_cache is not None:
+                self._cicd_cache.SetWorkflows(repo.github_owner, repo.github_repo, workflows)
+
+        # ----------------------------------------------------------------------
+        async def GetLatestRun(workflow_id: int) -> dict | None:
+            async with self._session.get(
+                f"https://api.github.com/repos/{repo.github_owner}/{repo.github_repo}/actions/workflows/{workflow_id}/runs",
+                params={
+                    "branch": default_branch,
+                    "per_page": 1,
+                    "created": f">={prev_month.date()}",
+                },
+            ) as response:
                 response.raise_for_status()
-                result = await response.json()
 
-                workflow_runs = result.get("workflow_runs", [])
+                workflow_runs = (await response.json()).get("workflow_runs", [])
+                return workflow_runs[0] if workflow_runs else None
 
-                if not workflow_runs:
-                    yield ResultInfo(
-                        repo,
-                        key,
-                        "-",
-                        textwrap.dedent(
-                            """\
-                                CI/CD Status: {github_url}/actions
-
-                                No workflow runs found for branch '{default_branch}' since '{prev_month}'.
-                                """,
-                        ).format(
-                            github_url=github_url,
-                            default_branch=default_branch,
-                            prev_month=prev_month.date(),
-                        ),
-                    )
-                    return
+        # ----------------------------------------------------------------------
 
-                # Group by workflow name and take only the most recent run for each
-                latest_per_workflow: dict[str, dict] = {}
+        latest_runs = [
+            run
+            for run in await asyncio.gather(*(GetLatestRun(workflow["id"]) for workflow in workflows))
+            if run is not None
+        ]
 
-                for run in workflow_runs:
-                    workflow_id = run["workflow_id"]
+        # Most recent runs first, consistent with the list of runs
+        return sorted(latest_runs, key=lambda run: run["created_at"], reverse=True)
 
-                    if workflow_id not in latest_per_workflow:
-                        latest_per_workflow[workflow_id] = run
+    # ----------------------------------------------------------------------
+    async def _GetCachedWorkflowRuns(
+        self,
+        repo: Repository,
+        default_branch: str,
+        prev_month: datetime,
+    ) -> list[dict]:
+        assert self._cicd_cache is not None
+        assert repo.github_owner is not None
+        assert repo.github_repo is not None
+
+        async with self._session.get(
+            f"https://api.github.com/repos/{repo.github_owner}/{repo.github_repo}/branches/{default_branch}"
+        ) as response:
+            response.raise_for_status()
+            head_sha = (await response.json())["commit"]["sha"]
+
+        entry = self._cicd_cache.Get(repo.github_owner, repo.github_repo, default_branch, head_sha)
+
+        if entry is None:
+            newest_run, workflow_runs = await asyncio.gather(
+                self._GetNewestWorkflowRun(repo, default_branch, prev_month),
+                self._GetLatestWorkflowRuns(repo, default_branch, prev_month),
+            )
+            created = datetime.now(UTC)
+        else:
+            # New runs of the head commit (e.g. scheduled or manually triggered runs) and re-runs of the
+            # most recent run change the `updated_at` of the most recent run
+            newest_run = await self._GetNewestWorkflowRun(repo, default_branch, prev_month)
+
+            in_progress_runs = entry.in_progress_runs
+
+            if not in_progress_runs and (newest_run or {}).get("updated_at", "") == entry.updated_at:
+                return entry.workflow_runs
 
-                # Count statuses based on most recent run per workflow
-                status_counts = {
-                    "success": 0,
-                    "failure": 0,
-                    "in_progress": 0,
+            if in_progress_runs and (
+                newest_run is None or newest_run["id"] in {run["id"] for run in entry.workflow_runs}
+            ):
+                # No runs have started since the runs were requested, so only the runs that are in
+                # progress can have changed
+                updated_runs = {
+                    run["id"]: run
+                    for run in await asyncio.gather(
+                        *(self._GetWorkflowRun(repo, run["id"]) for run in in_progress_runs),
+                    )
                 }
 
-                run_details: list[str] = []
-
-                for run in latest_per_workflow.values():
-                    conclusion = run.get("conclusion")
-                    status = run.get("status")
-
-                    # Determine the effective status
-                    if status in ("in_progress", "queued", "pending", "waiting"):
-                        status_counts["in_progress"] += 1
-                        status_label = "IN PROG"
-                    elif conclusion == "success":
-                        status_counts["success"] += 1
-                        status_label = " PASS  "
-                    elif conclusion in ("failure", "cancelled", "timed_out"):
-                        status_counts["failure"] += 1
-                        status_label = " FAIL  "
-                    else:
-                        status_label = conclusion or status or "UNKNOWN"
-
-                    run_details.append(f"- [{status_label}] {run['created_at']} {run['path']}: {run['name']}")
-
-                # Determine display icon based on priority: failure > in_progress > success
-                if status_counts["failure"] > 0:
-                    display_icon = "❌"
-                elif status_counts["in_progress"] > 0:
-                    display_icon = "⏳"
-                elif status_counts["success"] > 0:
-                    display_icon = "✅"
-                else:
-                    display_icon = "🔘"
+                workflow_runs = [updated_runs.get(run["id"], run) for run in entry.workflow_runs]
 
-                # Build additional info
-                additional_info_lines = [
-                    f"CI/CD Status: {github_url}/actions",
-                    "",
-                    f"Default Branch: {default_branch}",
-                    "",
-                    "Summary (latest run per workflow):",
-                    f"  Successful:  {status_counts['success']}",
-                    f"  Failed:      {status_counts['failure']}",
-                    f"  In Progress: {status_counts['in_progress']}",
-                    "",
-                ]
+                # Polling the runs doesn't detect changes to the other runs, so the age of the entry is
+                # not reset
+                created = entry.created
+            else:
+                workflow_runs = await self._GetLatestWorkflowRuns(repo, default_branch, prev_month)
+                created = datetime.now(UTC)
 
-                additional_info_lines.extend(run_details)
+        self._cicd_cache.Set(
+            repo.github_owner,
+            repo.github_repo,
+            default_branch,
+            CICDCacheEntry(head_sha, (newest_run or {}).get("updated_at", ""), workflow_runs, created),
+        )
 
-                yield ResultInfo(
-                    repo,
-                    key,
-                    display_icon,
-                    "\n".join(additional_info_lines),
-                )
+        return workflow_runs
 
-        except Exception as ex:
-            yield ErrorInfo(repo, key, ex)
+    # ----------------------------------------------------------------------
+    async def _GetNewestWorkflowRun(
+        self,
+        repo: Repository,
+        default_branch: str,
+        prev_month: datetime,
+    ) -> dict | None:
+        async with self._session.get(
+            f"https://api.github.com/repos/{repo.github_owner}/{repo.github_repo}/actions/runs",
+            params={
+                "branch": default_branch,
+                "per_page": 1,
+                "created": f">={prev_month.date()}",
+            },
+        ) as response:
+            response.raise_for_status()
+
+            workflow_runs = (await response.json()).get("workflow_runs", [])
+            return workflow_runs[0] if workflow_runs else None
+
+    # ----------------------------------------------------------------------
+    async def _GetWorkflowRun(self, repo: Repository, run_id: int) -> dict:
+        async with self._session.get(
+            f"https://api.github.com/repos/{repo.github_owner}/{repo.github_repo}/actions/runs/{run_id}"
+        ) as response:
+            response.raise_for_status()
+            return await response.json()
 
     # ----------------------------------------------------------------------
     async def _GenerateReleaseInfo(
@@ -536,28 +965,210 @@ class GitHubSource(Source):
             yield ErrorInfo(repo, key, ex)
 
     # ----------------------------------------------------------------------
-    async def _GeneratePaginatedResults(self, url: str) -> AsyncGenerator[dict]:
-        params = {"state": "open", "per_page": 100}
-        next_page_regex = re.compile(r"<([^>]+)>")
+    async def _GetOpenItems(self, repo: Repository, kind: ItemKind) -> list[dict]:
+        assert repo.github_owner is not None
+        assert repo.github_repo is not None
 
-        while url:
-            async with self._session.get(url, params=params) as response:
-                response.raise_for_status()
+        url = f"https://api.github.com/repos/{repo.github_owner}/{repo.github_repo}/{kind}"
+
+        if self._issue_store is None:
+            return [
+                item async for item in self._GeneratePaginatedResults(url, projection=self.ITEM_PROJECTION)
+            ]
+
+        last_sync = self._issue_store.GetLastSync(repo.github_owner, repo.github_repo, kind)
+        sync_time = datetime.now(UTC)
+
+        if last_sync is None:
+            items = [
+                item async for item in self._GeneratePaginatedResults(url, projection=self.ITEM_PROJECTION)
+            ]
+        else:
+            items = [
+                item async for item in self._GenerateUpdatedItems(url, kind, last_sync - self.SYNC_OVERLAP)
+            ]
+
+        self._issue_store.Update(
+            repo.github_owner,
+            repo.github_repo,
+            kind,
+            items,
+            sync_time,
+            full=last_sync is None,
+        )
+
+        return self._issue_store.GetItems(repo.github_owner, repo.github_repo, kind)
+
+    # ----------------------------------------------------------------------
+    async def _GenerateUpdatedItems(
+        self,
+        url: str,
+        kind: ItemKind,
+        since: datetime,
+    ) -> AsyncGenerator[dict]:
+        # Closed items must be included so that they can be removed from the store
+        if kind == "issues":
+            async for item in self._GeneratePaginatedResults(
+                url,
+                {"state": "all", "since": since.strftime("%Y-%m-%dT%H:%M:%SZ"), "per_page": 100},
+                self.ITEM_PROJECTION,
+            ):
+                yield item
+
+            return
+
+        # The pulls api doesn't support `since`, but results can be sorted by the time they were updated.
+        # Pages are requested one at a time, as the first item that was not updated since the last sync
+        # means that all of the items that follow were not updated either.
+        url_or_none: str | None = url
+        params: dict[str, str | int] | None = {
+            "state": "all",
+            "sort": "updated",
+            "direction": "desc",
+            "per_page": 100,
+        }
+
+        while url_or_none:
+            results, links = await self._GetPage(url_or_none, params, self.ITEM_PROJECTION)
+
+            for result in results:
+                if datetime.fromisoformat(result["updated_at"]) < since:
+                    return
+
+                yield result
+
+            url_or_none = links.get("next")
+            params = None
+
+    # ----------------------------------------------------------------------
+    async def _GeneratePaginatedResults(
+        self,
+        url: str,
+        params: dict[str, str | int] | None = None,
+        projection: Projection | None = None,
+    ) -> AsyncGenerator[dict]:
+        results, links = await self._GetPage(url, params or {"state": "open", "per_page": 100}, projection)
+
+        for result in results:
+            yield result
+
+        next_url = links.get("next")
+        if next_url is None:
+            return
 
+        # When GitHub provides the url of the last page, the urls of all remaining pages can be calculated
+        # and the pages fetched concurrently (in a bounded window, so that a single large repository does
+        # not monopolize the requests available). Results are still yielded in page order.
+        page_urls = self._CreatePageUrls(next_url, links.get("last"))
+
+        if page_urls is not None:
+            pending: deque[asyncio.Task[tuple[list[dict], dict[str, str]]]] = deque()
+
+            # ----------------------------------------------------------------------
+            def FillWindow() -> None:
+                while page_urls and len(pending) < self.MAX_CONCURRENT_PAGES:
+                    pending.append(asyncio.create_task(self._GetPage(page_urls.pop(0), None, projection)))
+
+            # ----------------------------------------------------------------------
+
+            try:
+                FillWindow()
+
+                while pending:
+                    results, _ = await pending.popleft()
+
+                    FillWindow()
+
+                    for result in results:
+                        yield result
+
+            finally:
+                for task in pending:
+                    task.cancel()
+
+                await asyncio.gather(*pending, return_exceptions=True)
+
+            return
+
+        # Follow the "next" links one page at a time
+        while next_url:
+            results, links = await self._GetPage(next_url, None, projection)
+
+            for result in results:
+                yield result
+
+            next_url = links.get("next")
+
+    # ----------------------------------------------------------------------
+    async def _GetPage(
+        self,
+        url: str,
+        params: dict[str, str | int] | None,
+        projection: Projection | None = None,
+    ) -> tuple[list[dict], dict[str, str]]:
+        async with self._session.get(url, params=params) as response:
+            response.raise_for_status()
+
+            if projection is None:
                 results = await response.json()
+            else:
+                results = await response.json(loads=CreateLoads(projection))
 
-                for result in results:
-                    yield result
+            return results, ParseLinkHeader(response.headers.get("Link", ""))
 
-                url: str | None = None
-                params = None
+    # ----------------------------------------------------------------------
+    @staticmethod
+    def _CreatePageUrls(next_url: str, last_url: str | None) -> list[str] | None:
+        if last_url is None:
+            return None
+
+        next_page_url = URL(next_url)
+
+        try:
+            next_page = int(next_page_url.query["page"])
+            last_page = int(URL(last_url).query["page"])
+        except (KeyError, ValueError):
+            return None
+
+        return [str(next_page_url.update_query(page=page)) for page in range(next_page, last_page + 1)]
+
+    # ----------------------------------------------------------------------
+    @staticmethod
+    async def _MergeGenerators(
+        *generators: AsyncGenerator[ResultInfo | ErrorInfo],
+    ) -> AsyncGenerator[ResultInfo | ErrorInfo]:
+        queue: asyncio.Queue[ResultInfo | ErrorInfo | None] = asyncio.Queue()
+
+        # ----------------------------------------------------------------------
+        async def Drain(generator: AsyncGenerator[ResultInfo | ErrorInfo]) -> None:
+            try:
+                async for info in generator:
+                    queue.put_nowait(info)
+            finally:
+                queue.put_nowait(None)
+
+        # ----------------------------------------------------------------------
+
+        tasks = [asyncio.create_task(Drain(generator)) for generator in generators]
+
+        try:
+            num_active = len(tasks)
+
+            while num_active:
+                info = await queue.get()
+
+                if info is None:
+                    num_active -= 1
+                    continue
+
+                yield info
 
-                link_header = response.headers.get("Link", "")
+            # Propagate any unexpected exceptions
+            for task in tasks:
+                task.result()
 
-                for link in link_header.split(","):
-                    if 'rel="next"' in link:
-                        match = next_page_regex.search(link)
-                        if match:
-                            url = match.group(1)
+        finally:
+            for task in tasks:
+                task.cancel()
 
-                        break
+            await asyncio.gather(*tasks, return_exceptions=True)
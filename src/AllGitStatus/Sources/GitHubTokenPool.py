@@ -0,0 +1,124 @@
+# noqa: D100
+import time
+
+from collections.abc import Iterable, Mapping
+from dataclasses import dataclass
+
+
+# ----------------------------------------------------------------------
+@dataclass
+class _Quota:
+    limit: int
+    remaining: int
+    reset: float  # Time (in seconds since the epoch) when the quota is replenished
+
+
+# ----------------------------------------------------------------------
+class GitHubTokenPool:
+    """Distributes GitHub API requests across multiple tokens, based on the quota remaining for each.
+
+    The quota of each token is tracked per rate limit resource (e.g. "core" or "search") via the
+    `X-RateLimit-*` headers of its responses. Requests are sent with the token that has the most quota
+    remaining; tokens whose quota is not yet known are assumed to have a full quota.
+    """
+
+    DEFAULT_RESOURCE = "core"
+
+    # ----------------------------------------------------------------------
+    def __init__(self, tokens: Iterable[str]) -> None:
+        self._tokens = list(dict.fromkeys(tokens))
+        assert self._tokens
+
+        self._quotas: dict[tuple[str, str], _Quota] = {}
+
+    # ----------------------------------------------------------------------
+    @property
+    def tokens(self) -> list[str]:
+        """The tokens in the pool."""
+        return list(self._tokens)
+
+    # ----------------------------------------------------------------------
+    def Acquire(self, resource: str = DEFAULT_RESOURCE) -> str:
+        """Return the token that should be used for the next request to the resource."""
+
+        now = time.time()
+
+        # ----------------------------------------------------------------------
+        def GetPriority(token: str) -> tuple[bool, float]:
+            quota = self._GetQuota(token, resource, now)
+
+            if quota is None:
+                return (True, float("inf"))
+
+            if quota.remaining:
+                return (True, quota.remaining)
+
+            # All of the tokens are exhausted; use the one that is replenished first
+            return (False, -quota.reset)
+
+        # ----------------------------------------------------------------------
+
+        token = max(self._tokens, key=GetPriority)
+
+        quota = self._quotas.get((token, resource))
+        if quota is not None and quota.remaining:
+            # Assume that the request will consume quota until GitHub tells us otherwise
+            quota.remaining -= 1
+
+        return token
+
+    # ----------------------------------------------------------------------
+    def Update(self, token: str, headers: Mapping[str, str]) -> None:
+        """Update the quota of the token based on the headers of a response."""
+
+        limit = headers.get("X-RateLimit-Limit")
+        remaining = headers.get("X-RateLimit-Remaining")
+        reset = headers.get("X-RateLimit-Reset")
+
+        if limit is None or remaining is None or reset is None:
+            return
+
+        try:
+            quota = _Quota(int(limit), int(remaining), float(reset))
+        except ValueError:
+            return
+
+        self._quotas[(token, headers.get("X-RateLimit-Resource", self.DEFAULT_RESOURCE))] = quota
+
+    # ----------------------------------------------------------------------
+    def GetRateLimit(
+        self,
+        resource: str = DEFAULT_RESOURCE,
+    ) -> tuple[int, int, float] | None:
+        """Return the combined limit, remaining quota and earliest reset time of all tokens (if known)."""
+
+        now = time.time()
+
+        quotas: list[_Quota] = []
+
+        for token in self._tokens:
+            quota = self._GetQuota(token, resource, now)
+            if quota is None:
+                return None
+
+            quotas.append(quota)
+
+        return (
+            sum(quota.limit for quota in quotas),
+            sum(quota.remaining for quota in quotas),
+            min(quota.reset for quota in quotas),
+        )
+
+    # ----------------------------------------------------------------------
+    # |
+    # |  Private Methods
+    # |
+    # ----------------------------------------------------------------------
+    def _GetQuota(self, token: str, resource: str, now: float) -> _Quota | None:
+        quota = self._quotas.get((token, resource))
+
+        if quota is not None and quota.reset <= now:
+            # The quota has been replenished
+            return _Quota(quota.limit, quota.limit, quota.reset)
+
+        return quota
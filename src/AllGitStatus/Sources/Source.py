@@ -1,6 +1,8 @@
 # noqa: D100
+import asyncio
+
 from abc import ABC, abstractmethod
-from collections.abc import AsyncGenerator
+from collections.abc import AsyncGenerator, Awaitable, Callable
 from dataclasses import dataclass, field
 
 from AllGitStatus.Repository import Repository
@@ -28,6 +30,32 @@ class ResultInfo(Info):
     state_data: object | None = field(kw_only=True, default=None)
 
 
+# ----------------------------------------------------------------------
+class DeferredInfo:
+    """Additional info that is expensive to retrieve, and is only retrieved when it is first displayed."""
+
+    # ----------------------------------------------------------------------
+    def __init__(
+        self,
+        placeholder: object,
+        factory: Callable[[], Awaitable[object]],
+    ) -> None:
+        self.placeholder = placeholder
+        self.factory = factory
+
+        self._task: asyncio.Task[object] | None = None
+
+    # ----------------------------------------------------------------------
+    async def Resolve(self) -> object:
+        """Retrieve the additional info; subsequent calls return the same result."""
+
+        if self._task is None:
+            self._task = asyncio.ensure_future(self.factory())
+
+        # Shield the task so that it isn't cancelled when a single caller is cancelled
+        return await asyncio.shield(self._task)
+
+
 # ----------------------------------------------------------------------
 @dataclass(frozen=True)
 class ErrorInfo(Info):
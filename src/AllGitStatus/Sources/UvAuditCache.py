@@ -0,0 +1,113 @@
+# noqa: D100
+import hashlib
+import sqlite3
+
+from dataclasses import dataclass
+from datetime import datetime, timedelta, UTC
+from pathlib import Path
+
+
+# ----------------------------------------------------------------------
+@dataclass(frozen=True)
+class UvAuditResult:
+    """The result of running `uv audit`."""
+
+    returncode: int
+    output: str
+
+
+# ----------------------------------------------------------------------
+class UvAuditCache:
+    """On-disk cache of `uv audit` results, keyed by the content of a repository's lockfile.
+
+    The result of an audit only changes when the dependencies (`uv.lock` and `pyproject.toml`) change
+    or when the advisory database is updated. Results are reused while the dependencies are unchanged,
+    until they are older than `max_age` (at which point new advisories may have been published).
+    """
+
+    DEFAULT_MAX_AGE = timedelta(hours=24)
+
+    # Files whose content determines the result of an audit
+    DEPENDENCY_FILENAMES = ("uv.lock", "pyproject.toml")
+
+    # ----------------------------------------------------------------------
+    def __init__(self, filename: Path, max_age: timedelta = DEFAULT_MAX_AGE) -> None:
+        filename.parent.mkdir(parents=True, exist_ok=True)
+
+        self._max_age = max_age
+
+        self._connection = sqlite3.connect(filename, isolation_level=None)
+
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute("PRAGMA synchronous=NORMAL")
+        self._connection.execute(
+            """
+            CREATE TABLE IF NOT EXISTS audits (
+                key TEXT PRIMARY KEY,
+                returncode INTEGER NOT NULL,
+                output TEXT NOT NULL,
+                created TEXT NOT NULL
+            )
+            """,
+        )
+
+        # Results for lockfiles that no longer exist would otherwise be retained forever
+        self._connection.execute(
+            "DELETE FROM audits WHERE created < ?",
+            ((datetime.now(UTC) - max_age).isoformat(),),
+        )
+
+    # ----------------------------------------------------------------------
+    def Close(self) -> None:
+        """Close the underlying database."""
+        self._connection.close()
+
+    # ----------------------------------------------------------------------
+    @classmethod
+    def CreateKey(cls, path: Path) -> str:
+        """Create a key based on the content of the dependency files in the directory."""
+
+        hasher = hashlib.sha256()
+
+        for filename in cls.DEPENDENCY_FILENAMES:
+            fullpath = path / filename
+
+            hasher.update(filename.encode())
+
+            if fullpath.is_file():
+                content = fullpath.read_bytes()
+
+                hasher.update(len(content).to_bytes(8))
+                hasher.update(content)
+            else:
+                hasher.update(b"<missing>")
+
+        return hasher.hexdigest()
+
+    # ----------------------------------------------------------------------
+    def Get(self, key: str) -> UvAuditResult | None:
+        """Return the result associated with the key if it is not too old."""
+
+        row = self._connection.execute(
+            "SELECT returncode, output, created FROM audits WHERE key = ?",
+            (key,),
+        ).fetchone()
+
+        if row is None:
+            return None
+
+        returncode, output, created = row
+
+        if datetime.now(UTC) - datetime.fromisoformat(created) > self._max_age:
+            return None
+
+        return UvAuditResult(returncode, output)
+
+    # ----------------------------------------------------------------------
+    def Set(self, key: str, result: UvAuditResult) -> None:
+        """Associate the result with the key."""
+
+        self._connection.execute(
+            "INSERT OR REPLACE INTO audits VALUES (?, ?, ?, ?)",
+            (key, result.returncode, result.output, datetime.now(UTC).isoformat()),
+        )
@@ -0,0 +1,80 @@
+# noqa: D100
+import asyncio
+import shutil
+
+from pathlib import Path
+
+from AllGitStatus.Sources.UvAuditCache import UvAuditResult
+
+
+# ----------------------------------------------------------------------
+class UvAuditRunner:
+    """Runs `uv audit` processes, limiting the number that run at a time.
+
+    Each audit resolves and checks an entire environment, so running an audit for every repository at
+    once saturates the CPU and the package index. Audits can also be run at a lowered CPU and IO priority
+    (via `nice` and `ionice`, where available) so that they don't starve the git queries that populate
+    the rest of the table.
+    """
+
+    DEFAULT_MAX_CONCURRENT_AUDITS = 4
+
+    # Priorities used when `low_priority` is enabled
+    NICENESS = 19
+    IO_PRIORITY = 7  # Lowest priority within the best-effort class
+
+    # ----------------------------------------------------------------------
+    def __init__(
+        self,
+        max_concurrent_audits: int = DEFAULT_MAX_CONCURRENT_AUDITS,
+        *,
+        low_priority: bool = False,
+    ) -> None:
+        assert max_concurrent_audits > 0, max_concurrent_audits
+
+        self._semaphore = asyncio.Semaphore(max_concurrent_audits)
+        self._command_prefix = self._CreateCommandPrefix() if low_priority else []
+
+    # ----------------------------------------------------------------------
+    async def Audit(self, path: Path) -> UvAuditResult:
+        """Audit the dependencies of the project in the directory."""
+
+        async with self._semaphore:
+            proc = await asyncio.create_subprocess_exec(
+                *self._command_prefix,
+                "uv",
+                "audit",
+                "--output-format",
+                "json",
+                cwd=str(path),
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE,
+            )
+
+            stdout, stderr = await proc.communicate()
+
+        assert proc.returncode is not None
+
+        # Diagnostics are written to stderr so that they don't interfere with the JSON output; they are
+        # only retained when there is no other output (e.g. when the audit could not be completed).
+        output = stdout.decode().rstrip() or stderr.decode().rstrip()
+
+        return UvAuditResult(proc.returncode, output)
+
+    # ----------------------------------------------------------------------
+    # |
+    # |  Private Methods
+    # |
+    # ----------------------------------------------------------------------
+    @classmethod
+    def _CreateCommandPrefix(cls) -> list[str]:
+        prefix: list[str] = []
+
+        # `ionice` is only available on Linux, and `nice` is not available on Windows
+        if ionice := shutil.which("ionice"):
+            prefix += [ionice, "-c", "2", "-n", str(cls.IO_PRIORITY)]
+
+        if nice := shutil.which("nice"):
+            prefix += [nice, "-n", str(cls.NICENESS)]
+
+        return prefix
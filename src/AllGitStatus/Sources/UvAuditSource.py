@@ -1,56 +1,317 @@
 # noqa: D100
 import asyncio
+import functools
+import json
 
-from collections.abc import AsyncGenerator
+from collections.abc import AsyncGenerator, Iterable
+from dataclasses import dataclass
+from pathlib import Path
 
 from AllGitStatus.Repository import Repository
-from AllGitStatus.Sources.Source import ErrorInfo, ResultInfo, Source
+from AllGitStatus.Sources.DependencyVulnerabilities import (
+    DependencyVulnerabilities,
+    FindLockfiles,
+    GetSummary,
+    NormalizeName,
+    Pin,
+    SEVERITIES,
+    Vulnerability,
+)
+from AllGitStatus.Sources.Source import DeferredInfo, ErrorInfo, ResultInfo, Source
+from AllGitStatus.Sources.UvAuditCache import UvAuditCache, UvAuditResult
+from AllGitStatus.Sources.UvAuditRunner import UvAuditRunner
+
+
+# ----------------------------------------------------------------------
+@dataclass(frozen=True)
+class AuditSummary:
+    """Summary of the vulnerabilities found in the dependencies of a repository (used as state data)."""
+
+    severity_counts: dict[str, int]  # Number of vulnerabilities by severity ("unknown" when not rated)
+    packages: tuple[str, ...]  # Affected packages ("<name> <version>")
+
+    # ----------------------------------------------------------------------
+    @property
+    def num_vulnerabilities(self) -> int:
+        """Total number of vulnerabilities."""
+        return sum(self.severity_counts.values())
 
 
 # ----------------------------------------------------------------------
 class UvAuditSource(Source):
     """Source of information about Python dependency vulnerabilities via uv audit."""
 
+    # Exit codes of audits that completed (without or with vulnerabilities); other exit codes indicate
+    # that the audit could not be completed (e.g. network errors), so those results are not cached.
+    CACHEABLE_RETURN_CODES = frozenset([0, 1])
+
+    # Severities that are called out in the cell, and their abbreviations
+    DISPLAYED_SEVERITIES = (("critical", "crit"), ("high", "high"))
+
+    # ----------------------------------------------------------------------
+    def __init__(
+        self,
+        cache: UvAuditCache | None = None,
+        dependency_vulnerabilities: DependencyVulnerabilities | None = None,
+        runner: UvAuditRunner | None = None,
+    ) -> None:
+        self._cache = cache
+        self._dependency_vulnerabilities = dependency_vulnerabilities
+
+        # The runner should be shared by all sources so that the number of concurrent audits is limited
+        self._runner = runner or UvAuditRunner()
+
     # ----------------------------------------------------------------------
     async def Query(self, repo: Repository) -> AsyncGenerator[ResultInfo | ErrorInfo]:  # noqa: D102  # ty: ignore[invalid-method-override]
         pyproject_path = repo.path / "pyproject.toml"
 
         key = (self.__class__.__name__, "uv_audit")
 
-        if not pyproject_path.is_file():
-            yield ResultInfo(
-                repo,
-                key,
-                "-",
-                "Not a Python repository (no pyproject.toml found at root)",
-            )
-            return
-
         try:
-            proc = await asyncio.create_subprocess_exec(
-                "uv",
-                "audit",
-                cwd=str(repo.path),
-                stdout=asyncio.subprocess.PIPE,
-                stderr=asyncio.subprocess.STDOUT,
-            )
+            # Each lockfile is audited once, as the members of a uv workspace share a single lockfile
+            lockfiles = await asyncio.to_thread(FindLockfiles, repo.path)
+
+            directories = [lockfile.parent for lockfile in lockfiles]
 
-            stdout, _ = await proc.communicate()
-            output = stdout.decode().rstrip()
+            # A project at the root of the repository is audited even if it hasn't been locked
+            if pyproject_path.is_file() and repo.path not in directories:
+                directories.append(repo.path)
 
-            if proc.returncode == 0:
+            if not directories:
                 yield ResultInfo(
                     repo,
                     key,
-                    "✅",
-                    "No vulnerabilities found",
+                    "-",
+                    "Not a Python repository (no pyproject.toml or uv.lock found)",
                 )
-            else:
+                return
+
+            directories.sort(key=lambda directory: (directory != repo.path, directory))
+
+            labels = [
+                (directory / "uv.lock").relative_to(repo.path).as_posix()
+                if (directory / "uv.lock") in lockfiles
+                else "pyproject.toml"
+                for directory in directories
+            ]
+
+            results = await asyncio.gather(*(self._AuditDirectory(directory) for directory in directories))
+
+            failures = [
+                (label, result)
+                for label, result in zip(labels, results, strict=True)
+                if isinstance(result, UvAuditResult)
+            ]
+
+            if failures:
+                # The output isn't structured (e.g. the audit could not be completed)
+                if len(directories) == 1:
+                    output = failures[0][1].output
+                else:
+                    output = "\n\n".join(f"[{label}]\n{result.output}" for label, result in failures)
+
+                yield ResultInfo(repo, key, "⚠️", output)
+                return
+
+            lockfile_pins = {
+                label: result
+                for label, result in zip(labels, results, strict=True)
+                if result and not isinstance(result, UvAuditResult)
+            }
+
+            vulnerable_pins = self._MergeResults(lockfile_pins.values())
+
+            if not vulnerable_pins:
                 yield ResultInfo(
                     repo,
                     key,
-                    "⚠️",
-                    output,
+                    "✅",
+                    "No vulnerabilities found",
+                    state_data=AuditSummary({}, ()),
                 )
+                return
+
+            summary = self._CreateSummary(vulnerable_pins)
+            heading = self._CreateHeading(summary)
+
+            # The details are only formatted when the cell is displayed
+            yield ResultInfo(
+                repo,
+                key,
+                self._CreateDisplayValue(summary),
+                DeferredInfo(
+                    f"{heading}\n\nLoading...",
+                    functools.partial(
+                        self._CreateDetails,
+                        heading,
+                        lockfile_pins,
+                        show_lockfiles=len(directories) > 1,
+                    ),
+                ),
+                state_data=summary,
+            )
         except Exception as ex:
             yield ErrorInfo(repo, key, ex)
+
+    # ----------------------------------------------------------------------
+    # |
+    # |  Private Methods
+    # |
+    # ----------------------------------------------------------------------
+    async def _AuditDirectory(self, path: Path) -> dict[Pin, list[Vulnerability]] | UvAuditResult:
+        if self._dependency_vulnerabilities is not None:
+            vulnerable_pins = await self._dependency_vulnerabilities.GetVulnerabilities(path / "uv.lock")
+
+            if vulnerable_pins is not None:
+                return vulnerable_pins
+
+        result = await self._GetAuditResult(path)
+
+        if result.returncode in self.CACHEABLE_RETURN_CODES:
+            vulnerable_pins = self._ParseOutput(result.output)
+
+            if vulnerable_pins is not None:
+                return vulnerable_pins
+
+        if result.returncode == 0:
+            return {}
+
+        return result
+
+    # ----------------------------------------------------------------------
+    async def _GetAuditResult(self, path: Path) -> UvAuditResult:
+        if self._cache is None:
+            return await self._runner.Audit(path)
+
+        cache_key = UvAuditCache.CreateKey(path)
+
+        result = self._cache.Get(cache_key)
+        if result is None:
+            result = await self._runner.Audit(path)
+
+            if result.returncode in self.CACHEABLE_RETURN_CODES:
+                self._cache.Set(cache_key, result)
+
+        return result
+
+    # ----------------------------------------------------------------------
+    @staticmethod
+    def _ParseOutput(output: str) -> dict[Pin, list[Vulnerability]] | None:
+        # The JSON output lists each vulnerability along with the dependency that it affects. uv doesn't
+        # rate vulnerabilities, so their severity is unknown.
+        try:
+            content = json.loads(output)
+
+            vulnerable_pins: dict[Pin, list[Vulnerability]] = {}
+
+            for vulnerability in content["vulnerabilities"]:
+                dependency = vulnerability["dependency"]
+
+                vulnerable_pins.setdefault(
+                    Pin(NormalizeName(dependency["name"]), dependency["version"]), []
+                ).append(
+                    Vulnerability(
+                        vulnerability["id"],
+                        GetSummary(
+                            {
+                                "summary": vulnerability.get("summary"),
+                                "details": vulnerability.get("description"),
+                            },
+                        ),
+                    ),
+                )
+
+            return vulnerable_pins
+        except (ValueError, KeyError, TypeError, AttributeError):
+            return None
+
+    # ----------------------------------------------------------------------
+    @staticmethod
+    def _MergeResults(
+        results: Iterable[dict[Pin, list[Vulnerability]]],
+    ) -> dict[Pin, list[Vulnerability]]:
+        merged: dict[Pin, list[Vulnerability]] = {}
+
+        # The same pin is often used by multiple lockfiles
+        for vulnerable_pins in results:
+            for pin, vulnerabilities in vulnerable_pins.items():
+                merged_vulnerabilities = merged.setdefault(pin, [])
+                merged_vulnerabilities += [
+                    vulnerability
+                    for vulnerability in vulnerabilities
+                    if vulnerability not in merged_vulnerabilities
+                ]
+
+        return merged
+
+    # ----------------------------------------------------------------------
+    @staticmethod
+    def _CreateSummary(vulnerable_pins: dict[Pin, list[Vulnerability]]) -> AuditSummary:
+        severity_counts: dict[str, int] = {}
+
+        for vulnerabilities in vulnerable_pins.values():
+            for vulnerability in vulnerabilities:
+                severity = vulnerability.severity or "unknown"
+                severity_counts[severity] = severity_counts.get(severity, 0) + 1
+
+        return AuditSummary(
+            {
+                severity: severity_counts[severity]
+                for severity in (*SEVERITIES, "unknown")
+                if severity in severity_counts
+            },
+            tuple(f"{pin.name} {pin.version}" for pin in sorted(vulnerable_pins)),
+        )
+
+    # ----------------------------------------------------------------------
+    @classmethod
+    def _CreateDisplayValue(cls, summary: AuditSummary) -> str:
+        qualifiers = [
+            f"{summary.severity_counts[severity]} {abbreviation}"
+            for severity, abbreviation in cls.DISPLAYED_SEVERITIES
+            if severity in summary.severity_counts
+        ]
+
+        display_value = f"{summary.num_vulnerabilities} ⚠️"
+
+        if qualifiers:
+            display_value += " ({})".format(", ".join(qualifiers))
+
+        return display_value
+
+    # ----------------------------------------------------------------------
+    @staticmethod
+    def _CreateHeading(summary: AuditSummary) -> str:
+        return "Found {} known {} in {} {}".format(
+            summary.num_vulnerabilities,
+            "vulnerability" if summary.num_vulnerabilities == 1 else "vulnerabilities",
+            len(summary.packages),
+            "package" if len(summary.packages) == 1 else "packages",
+        )
+
+    # ----------------------------------------------------------------------
+    @staticmethod
+    async def _CreateDetails(
+        heading: str,
+        lockfile_pins: dict[str, dict[Pin, list[Vulnerability]]],
+        *,
+        show_lockfiles: bool,
+    ) -> str:
+        lines = [heading]
+
+        for lockfile, vulnerable_pins in lockfile_pins.items():
+            if show_lockfiles:
+                lines += ["", f"[{lockfile}]"]
+
+            for pin, vulnerabilities in sorted(vulnerable_pins.items()):
+                lines += ["", f"{pin.name} {pin.version}"]
+                lines += [
+                    "  - {}{}: {}".format(
+                        vulnerability.id,
+                        "" if vulnerability.severity is None else f" ({vulnerability.severity})",
+                        vulnerability.summary,
+                    )
+                    for vulnerability in vulnerabilities
+                ]
+
+        return "\n".join(lines)
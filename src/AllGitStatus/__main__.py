@@ -1,4 +1,5 @@
 # noqa: D100
+from datetime import timedelta
 from pathlib import Path
 from typing import Annotated
 
@@ -8,6 +9,9 @@ from typer.core import TyperGroup
 
 from AllGitStatus import __version__
 from AllGitStatus.MainApp import MainApp
+from AllGitStatus.Sources.GitHubConnection import ConnectorConfig
+from AllGitStatus.Sources.UvAuditCache import UvAuditCache
+from AllGitStatus.Sources.UvAuditRunner import UvAuditRunner
 
 
 # ----------------------------------------------------------------------
@@ -27,6 +31,9 @@ app = typer.Typer(
 )
 
 
+DEFAULT_CACHE_DIR = Path(typer.get_app_dir("AllGitStatus")) / "Cache"
+
+
 # ----------------------------------------------------------------------
 def _OnVersion(value: bool) -> None:  # noqa: FBT001
     if value:
@@ -36,7 +43,7 @@ def _OnVersion(value: bool) -> None:  # noqa: FBT001
 
 # ----------------------------------------------------------------------
 @app.command("EntryPoint", no_args_is_help=False)
-def EntryPoint(
+def EntryPoint(  # noqa: PLR0913
     working_dir: Annotated[
         Path,
         typer.Argument(
@@ -51,9 +58,159 @@ def EntryPoint(
         typer.Option(
             "--pat",
             envvar="ALLGITSTATUS_PAT",
-            help="GitHub Personal Access Token (PAT) or filename that contains the PAT.",
+            help="GitHub Personal Access Token (PAT) or filename that contains the PAT; the file may contain multiple PATs (one per line), and requests are distributed across them.",
         ),
     ] = None,
+    cache_dir: Annotated[
+        Path,
+        typer.Option(
+            "--cache-dir",
+            envvar="ALLGITSTATUS_CACHE_DIR",
+            file_okay=False,
+            resolve_path=True,
+            help="Directory used to persist GitHub API responses and uv audit results between invocations.",
+        ),
+    ] = DEFAULT_CACHE_DIR,
+    no_cache: Annotated[  # noqa: FBT002
+        bool,
+        typer.Option(
+            "--no-cache", help="Do not persist GitHub API responses or uv audit results between invocations."
+        ),
+    ] = False,
+    uv_audit_max_age: Annotated[
+        float,
+        typer.Option(
+            "--uv-audit-max-age",
+            envvar="ALLGITSTATUS_UV_AUDIT_MAX_AGE",
+            min=0.0,
+            help="Number of hours that cached uv audit results are reused while uv.lock and pyproject.toml are unchanged (new advisories are detected once results are older than this).",
+        ),
+    ] = UvAuditCache.DEFAULT_MAX_AGE.total_seconds() / 3600,
+    uv_audit_concurrency: Annotated[
+        int,
+        typer.Option(
+            "--uv-audit-concurrency",
+            envvar="ALLGITSTATUS_UV_AUDIT_CONCURRENCY",
+            min=1,
+            help="Maximum number of uv audit processes that run at the same time.",
+        ),
+    ] = UvAuditRunner.DEFAULT_MAX_CONCURRENT_AUDITS,
+    uv_audit_low_priority: Annotated[  # noqa: FBT002
+        bool,
+        typer.Option(
+            "--uv-audit-low-priority",
+            help="Run uv audit processes at a lowered CPU and IO priority (using nice and ionice, where available).",
+        ),
+    ] = False,
+    shared_audit: Annotated[  # noqa: FBT002
+        bool,
+        typer.Option(
+            "--shared-audit",
+            help="Audit the dependencies of all repositories together, querying the OSV advisory database once per unique pinned package in uv.lock files (rather than running uv audit in each repository).",
+        ),
+    ] = False,
+    advisory_db: Annotated[
+        Path | None,
+        typer.Option(
+            "--advisory-db",
+            envvar="ALLGITSTATUS_ADVISORY_DB",
+            dir_okay=False,
+            resolve_path=True,
+            help="Local snapshot of the OSV advisory database used to audit the dependencies of all repositories without network access.",
+        ),
+    ] = None,
+    sync_advisory_db: Annotated[  # noqa: FBT002
+        bool,
+        typer.Option(
+            "--sync-advisory-db",
+            help="Download the latest OSV advisories for PyPI into the --advisory-db snapshot when it is older than --uv-audit-max-age.",
+        ),
+    ] = False,
+    lazy_details: Annotated[  # noqa: FBT002
+        bool,
+        typer.Option(
+            "--lazy-details",
+            help="Retrieve the details of open issues and pull requests only when they are displayed.",
+        ),
+    ] = False,
+    search_counts: Annotated[  # noqa: FBT002
+        bool,
+        typer.Option(
+            "--search-counts",
+            help="Retrieve issue and pull request counts for batches of repositories with the GitHub search api (implies --lazy-details).",
+        ),
+    ] = False,
+    owner_listings: Annotated[  # noqa: FBT002
+        bool,
+        typer.Option(
+            "--owner-listings",
+            help="Retrieve repository information for owners with many repositories by listing their repositories in bulk; the number of watchers isn't listed, so it is only retrieved when selected.",
+        ),
+    ] = False,
+    lean_cicd: Annotated[  # noqa: FBT002
+        bool,
+        typer.Option(
+            "--lean-cicd",
+            help="Request only the latest run of each workflow when calculating CI/CD status.",
+        ),
+    ] = False,
+    auto_refresh: Annotated[  # noqa: FBT002
+        bool,
+        typer.Option(
+            "--auto-refresh",
+            help="Poll GitHub for changes in the background; active repositories are polled more frequently than dormant ones.",
+        ),
+    ] = False,
+    events_refresh: Annotated[  # noqa: FBT002
+        bool,
+        typer.Option(
+            "--events-refresh",
+            help="Refresh the GitHub information of repositories when their owner's events feed reveals activity.",
+        ),
+    ] = False,
+    connection_limit: Annotated[
+        int,
+        typer.Option(
+            "--connection-limit",
+            envvar="ALLGITSTATUS_CONNECTION_LIMIT",
+            min=0,
+            help="Maximum number of simultaneous connections to GitHub (0 for no limit).",
+        ),
+    ] = ConnectorConfig.DEFAULT_LIMIT,
+    connection_limit_per_host: Annotated[
+        int,
+        typer.Option(
+            "--connection-limit-per-host",
+            envvar="ALLGITSTATUS_CONNECTION_LIMIT_PER_HOST",
+            min=0,
+            help="Maximum number of simultaneous connections to each GitHub host (0 for no limit).",
+        ),
+    ] = ConnectorConfig.DEFAULT_LIMIT_PER_HOST,
+    keepalive_timeout: Annotated[
+        float,
+        typer.Option(
+            "--keepalive-timeout",
+            envvar="ALLGITSTATUS_KEEPALIVE_TIMEOUT",
+            min=0.0,
+            help="Number of seconds that idle connections to GitHub are kept open for reuse.",
+        ),
+    ] = ConnectorConfig.DEFAULT_KEEPALIVE_TIMEOUT,
+    dns_cache_ttl: Annotated[
+        int,
+        typer.Option(
+            "--dns-cache-ttl",
+            envvar="ALLGITSTATUS_DNS_CACHE_TTL",
+            min=0,
+            help="Number of seconds that DNS lookups of GitHub hosts are cached.",
+        ),
+    ] = ConnectorConfig.DEFAULT_TTL_DNS_CACHE,
+    connection_metrics: Annotated[  # noqa: FBT002
+        bool,
+        typer.Option(
+            "--connection-metrics",
+            help="Display connection reuse, DNS lookup and time-to-first-byte metrics for GitHub requests.",
+        ),
+    ] = False,
     version: Annotated[  # noqa: ARG001, FBT002
         bool,
         typer.Option(
@@ -71,17 +228,46 @@ def EntryPoint(
 
     max_filename_length = 1000
 
+    pat_tokens: str | list[str] | None = pat_token_or_filename
+
     if (
         pat_token_or_filename is not None
         and len(pat_token_or_filename) < max_filename_length
         and (pat_token_filename := Path(pat_token_or_filename)).is_file()
     ):
-        pat_token_or_filename = pat_token_filename.read_text(encoding="utf-8").strip()
+        pat_tokens = [
+            line.strip()
+            for line in pat_token_filename.read_text(encoding="utf-8").splitlines()
+            if line.strip()
+        ]
+
+        if len(pat_tokens) == 1:
+            pat_tokens = pat_tokens[0]
 
     MainApp(
         working_dir,
-        pat_token_or_filename,
+        pat_tokens,
         debug=debug,
+        cache_dir=None if no_cache else cache_dir,
+        lazy_details=lazy_details or search_counts,
+        search_counts=search_counts,
+        owner_listings=owner_listings,
+        lean_cicd=lean_cicd,
+        auto_refresh=auto_refresh,
+        events_refresh=events_refresh,
+        connector_config=ConnectorConfig(
+            connection_limit,
+            connection_limit_per_host,
+            keepalive_timeout,
+            dns_cache_ttl,
+        ),
+        connection_metrics=connection_metrics,
+        uv_audit_max_age=timedelta(hours=uv_audit_max_age),
+        uv_audit_concurrency=uv_audit_concurrency,
+        uv_audit_low_priority=uv_audit_low_priority,
+        shared_audit=shared_audit,
+        advisory_database=advisory_db,
+        sync_advisory_database=sync_advisory_db,
     ).run()
 
 
@@ -0,0 +1,167 @@
+"""Unit tests for AllGitStatus.AdaptivePoller module."""
+
+from AllGitStatus.AdaptivePoller import AdaptivePoller
+
+
+# ----------------------------------------------------------------------
+class FakeClock:
+    """A clock that only advances when told to."""
+
+    # ----------------------------------------------------------------------
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    # ----------------------------------------------------------------------
+    def __call__(self) -> float:
+        return self.now
+
+
+# ----------------------------------------------------------------------
+def create_poller(clock: FakeClock) -> AdaptivePoller:
+    """Create a poller with small intervals."""
+
+    return AdaptivePoller(initial_interval=10, min_interval=5, max_interval=30, clock=clock)
+
+
+# ----------------------------------------------------------------------
+class TestAdaptivePoller:
+    """Tests for AdaptivePoller."""
+
+    # ----------------------------------------------------------------------
+    def test_due_after_initial_interval(self) -> None:
+        """Items are due after the initial interval."""
+
+        clock = FakeClock()
+        poller = create_poller(clock)
+
+        poller.Add("a")
+        assert poller.GetInterval("a") == 10
+        assert poller.GetDue() == []
+
+        clock.now += 10
+        assert poller.GetDue() == ["a"]
+
+    # ----------------------------------------------------------------------
+    def test_not_due_while_polling(self) -> None:
+        """Items are not due again until the results of the poll are reported."""
+
+        clock = FakeClock()
+        poller = create_poller(clock)
+
+        poller.Add("a")
+        clock.now += 10
+        assert poller.GetDue() == ["a"]
+
+        clock.now += 100
+        assert poller.GetDue() == []
+
+        poller.Update("a", changed=True)
+        clock.now += 5
+        assert poller.GetDue() == ["a"]
+
+    # ----------------------------------------------------------------------
+    def test_changed_uses_min_interval(self) -> None:
+        """Items that changed are polled at the minimum interval."""
+
+        poller = create_poller(FakeClock())
+
+        poller.Add("a")
+        poller.Update("a", changed=True)
+
+        assert poller.GetInterval("a") == 5
+
+    # ----------------------------------------------------------------------
+    def test_unchanged_backs_off(self) -> None:
+        """The interval of unchanged items doubles up to the maximum interval."""
+
+        poller = create_poller(FakeClock())
+
+        poller.Add("a")
+
+        intervals = []
+
+        for _ in range(3):
+            poller.Update("a", changed=False)
+            intervals.append(poller.GetInterval("a"))
+
+        assert intervals == [20, 30, 30]
+
+    # ----------------------------------------------------------------------
+    def test_poll_interval(self) -> None:
+        """Intervals are never shorter than the poll interval requested by the server."""
+
+        clock = FakeClock()
+        poller = create_poller(clock)
+
+        poller.Add("a")
+        poller.Update("a", changed=True, poll_interval=60)
+
+        assert poller.GetInterval("a") == 60
+
+        clock.now += 59
+        assert poller.GetDue() == []
+
+        clock.now += 1
+        assert poller.GetDue() == ["a"]
+
+    # ----------------------------------------------------------------------
+    def test_add_restarts_polling(self) -> None:
+        """Adding an existing item restarts it at the initial interval."""
+
+        poller = create_poller(FakeClock())
+
+        poller.Add("a")
+        poller.Update("a", changed=False)
+        poller.Add("a")
+
+        assert poller.GetInterval("a") == 10
+
+    # ----------------------------------------------------------------------
+    def test_clear(self) -> None:
+        """Cleared items are no longer polled, and updates to them are ignored."""
+
+        clock = FakeClock()
+        poller = create_poller(clock)
+
+        poller.Add("a")
+        poller.Add("b")
+        poller.Clear()
+
+        poller.Update("a", changed=True)
+
+        clock.now += 100
+        assert poller.GetDue() == []
+
+    # ----------------------------------------------------------------------
+    def test_mark_due(self) -> None:
+        """Marked items are due immediately."""
+
+        clock = FakeClock()
+        poller = create_poller(clock)
+
+        poller.Add("a")
+        poller.MarkDue("a")
+        poller.MarkDue("unknown")
+
+        assert poller.GetDue() == ["a"]
+
+    # ----------------------------------------------------------------------
+    def test_mark_due_while_polling(self) -> None:
+        """Items marked while they are being polled are due once the poll completes."""
+
+        clock = FakeClock()
+        poller = create_poller(clock)
+
+        poller.Add("a")
+        clock.now += 10
+        assert poller.GetDue() == ["a"]
+
+        poller.MarkDue("a")
+        assert poller.GetDue() == []
+
+        poller.Update("a", changed=False)
+        assert poller.GetDue() == ["a"]
+
+        # The mark only applies to a single poll
+        poller.Update("a", changed=False)
+        assert poller.GetDue() == []
@@ -0,0 +1,116 @@
+"""Unit tests for AllGitStatus.AdditionalInfoStore module."""
+
+from unittest.mock import AsyncMock
+
+import pytest
+
+from AllGitStatus.AdditionalInfoStore import AdditionalInfoStore
+from AllGitStatus.Sources.Source import DeferredInfo
+
+
+# ----------------------------------------------------------------------
+class TestAdditionalInfoStore:
+    """Tests for AdditionalInfoStore."""
+
+    # ----------------------------------------------------------------------
+    def test_get_and_set(self) -> None:
+        """Additional info is retrieved by row and column."""
+
+        store = AdditionalInfoStore()
+
+        store.Set(0, 1, "value")
+
+        assert store.Get(0, 1) == "value"
+        assert store.Get(0, 2) is None
+
+    # ----------------------------------------------------------------------
+    @pytest.mark.asyncio
+    async def test_least_recently_used_is_evicted(self) -> None:
+        """The least recently used payloads are replaced with deferred info once the store is full."""
+
+        store = AdditionalInfoStore(max_size=30, min_evictable_size=1)
+        rebuild = AsyncMock(return_value="Rebuilt")
+
+        store.Set(0, 0, "Heading 0\n" + "x" * 5, rebuild)
+        store.Set(0, 1, "Heading 1\n" + "x" * 5, rebuild)
+
+        # Use the first payload so that the second is evicted instead
+        assert store.Get(0, 0) == "Heading 0\nxxxxx"
+
+        store.Set(0, 2, "Heading 2\n" + "x" * 5, rebuild)
+
+        assert store.Get(0, 0) == "Heading 0\nxxxxx"
+        assert store.Get(0, 2) == "Heading 2\nxxxxx"
+        assert store.size == 30
+
+        evicted = store.Get(0, 1)
+
+        assert isinstance(evicted, DeferredInfo)
+        assert evicted.placeholder == "Heading 1\n\nLoading..."
+        assert await evicted.Resolve() == "Rebuilt"
+
+        # The rebuilt payload is retained (and another payload is evicted in its place)
+        store.Update(0, 1, "Rebuilt")
+
+        assert store.Get(0, 1) == "Rebuilt"
+        assert isinstance(store.Get(0, 0), DeferredInfo)
+
+    # ----------------------------------------------------------------------
+    def test_retained_payloads(self) -> None:
+        """Payloads that are small, can't be rebuilt or are deferred are never evicted."""
+
+        store = AdditionalInfoStore(max_size=0, min_evictable_size=10)
+        deferred_info = DeferredInfo("Loading...", AsyncMock())
+
+        store.Set(0, 0, "small", AsyncMock())
+        store.Set(0, 1, "not rebuilt" * 10)
+        store.Set(0, 2, deferred_info, AsyncMock())
+
+        assert store.Get(0, 0) == "small"
+        assert store.Get(0, 1) == "not rebuilt" * 10
+        assert store.Get(0, 2) is deferred_info
+        assert store.size == 0
+
+    # ----------------------------------------------------------------------
+    def test_most_recent_is_retained(self) -> None:
+        """The payload most recently added is retained, even if it is larger than the store."""
+
+        store = AdditionalInfoStore(max_size=10, min_evictable_size=1)
+
+        store.Set(0, 0, "x" * 20, AsyncMock())
+
+        assert store.Get(0, 0) == "x" * 20
+
+    # ----------------------------------------------------------------------
+    def test_non_text(self) -> None:
+        """Payloads that are not text are evicted based on their estimated size."""
+
+        store = AdditionalInfoStore(max_size=AdditionalInfoStore.NON_TEXT_SIZE, min_evictable_size=1)
+
+        store.Set(0, 0, object(), AsyncMock())
+        store.Set(0, 1, object(), AsyncMock())
+
+        evicted = store.Get(0, 0)
+
+        assert isinstance(evicted, DeferredInfo)
+        assert evicted.placeholder == "Loading..."
+
+    # ----------------------------------------------------------------------
+    def test_remove_row_and_clear(self) -> None:
+        """Additional info is removed by row, or entirely."""
+
+        store = AdditionalInfoStore(min_evictable_size=1)
+
+        store.Set(0, 0, "a", AsyncMock())
+        store.Set(1, 0, "b", AsyncMock())
+
+        store.RemoveRow(0)
+
+        assert store.Get(0, 0) is None
+        assert store.Get(1, 0) == "b"
+        assert store.size == 1
+
+        store.Clear()
+
+        assert store.Get(1, 0) is None
+        assert store.size == 0
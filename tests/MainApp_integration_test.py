@@ -5,16 +5,21 @@ the MainApp UI interactions.
 """
 
 import asyncio
+import sqlite3
+from datetime import datetime, UTC
 from pathlib import Path
 from unittest.mock import AsyncMock, patch
 
 import aiohttp
 import pytest
 from rich.text import Text
+from rich.traceback import Traceback
 from textual.coordinate import Coordinate
-from textual.widgets import DataTable, Footer, Header, Label, RichLog
+from textual.widgets import DataTable, Footer, Header, Label, RichLog, Static
 
 from AllGitStatus import __version__
+from AllGitStatus.AdaptivePoller import AdaptivePoller
+from AllGitStatus.AdditionalInfoStore import AdditionalInfoStore
 from AllGitStatus.MainApp import (
     COLUMN_MAP,
     ArchivedColumn,
@@ -37,8 +42,10 @@ from AllGitStatus.MainApp import (
     _GetRepositoriesModal,
 )
 from AllGitStatus.Repository import Repository
+from AllGitStatus.Sources.GitHubConnection import ConnectionStats, ConnectorConfig
+from AllGitStatus.Sources.GitHubRequestScheduler import RateLimitStatus
 from AllGitStatus.Sources.LocalGitSource import LocalGitSource
-from AllGitStatus.Sources.Source import ErrorInfo, ResultInfo
+from AllGitStatus.Sources.Source import DeferredInfo, ErrorInfo, ResultInfo
 
 
 # ----------------------------------------------------------------------
@@ -204,6 +211,97 @@ class TestMainAppComposition:
             expected_columns = len(set(COLUMN_MAP.values()))
             assert len(data_table.columns) == expected_columns
 
+    # ----------------------------------------------------------------------
+    @pytest.mark.asyncio
+    async def test_github_responses_cached_in_cache_dir(self, working_dir: Path, tmp_path: Path) -> None:
+        """GitHub responses are persisted in the cache directory when one is provided."""
+
+        cache_dir = tmp_path / "cache"
+
+        app = MainApp(working_dir=working_dir, github_pat=None, cache_dir=cache_dir)
+
+        async with app.run_test() as pilot:
+            assert app._github_session is not None
+            assert (cache_dir / "GitHubResponses.db").is_file()
+            assert (cache_dir / "UvAudit.db").is_file()
+
+        assert app._github_session is None
+        assert app._uv_audit_cache is None
+
+    # ----------------------------------------------------------------------
+    @pytest.mark.asyncio
+    async def test_multiple_github_pats(self, working_dir: Path) -> None:
+        """Requests are distributed across the tokens when multiple PATs are provided."""
+
+        app = MainApp(working_dir=working_dir, github_pat=["token1", "token2"])
+
+        async with app.run_test() as pilot:
+            assert app._github_session is not None
+            assert app._github_session._token_pool is not None
+            assert app._github_session._token_pool.tokens == ["token1", "token2"]
+
+    # ----------------------------------------------------------------------
+    @pytest.mark.asyncio
+    async def test_github_status_displayed_in_footer(self, working_dir: Path) -> None:
+        """The GitHub rate limit and queued requests are displayed in the footer."""
+
+        app = MainApp(working_dir=working_dir, github_pat=None)
+
+        async with app.run_test() as pilot:
+            status = app.query_one("#github_status", Static)
+
+            app._OnGitHubStatusChanged(RateLimitStatus(5000, 4123, None, 2, 12, 35.2))
+            assert str(status.render()) == "GitHub: 4,123/5,000 | 12 queued (ETA 0:00:35)"
+
+            app._OnGitHubStatusChanged(RateLimitStatus(None, None, None, 1, 3, None))
+            assert str(status.render()) == "3 queued"
+
+            app._OnGitHubStatusChanged(RateLimitStatus(5000, 5000, None, 0, 0, None))
+            assert str(status.render()) == "GitHub: 5,000/5,000"
+
+    # ----------------------------------------------------------------------
+    @pytest.mark.asyncio
+    async def test_connector_config(self, working_dir: Path) -> None:
+        """The connection pool is configured as specified."""
+
+        app = MainApp(
+            working_dir=working_dir,
+            github_pat=None,
+            connector_config=ConnectorConfig(
+                limit=20, limit_per_host=5, keepalive_timeout=30.0, ttl_dns_cache=60
+            ),
+        )
+
+        async with app.run_test() as pilot:
+            assert app._github_session is not None
+
+            connector = app._github_session._session.connector
+            assert isinstance(connector, aiohttp.TCPConnector)
+
+            assert connector.limit == 20
+            assert connector.limit_per_host == 5
+            assert app._github_session._session.trace_configs == []
+
+    # ----------------------------------------------------------------------
+    @pytest.mark.asyncio
+    async def test_connection_metrics_displayed_in_footer(self, working_dir: Path) -> None:
+        """Connection metrics are displayed in the footer when enabled."""
+
+        app = MainApp(working_dir=working_dir, github_pat=None, connection_metrics=True)
+
+        async with app.run_test() as pilot:
+            assert app._github_session is not None
+            assert len(app._github_session._session.trace_configs) == 1
+
+            status = app.query_one("#github_status", Static)
+
+            app._OnGitHubStatusChanged(RateLimitStatus(5000, 4123, None, 0, 0, None))
+            app._OnConnectionStatsChanged(ConnectionStats(10, 2, 8, 1, 1, 0.0855, 0.25))
+
+            assert str(status.render()) == (
+                "GitHub: 4,123/5,000 | Connections: 2 new, 8 reused | DNS: 1 lookups, 1 cached | TTFB: 86 ms avg, 250 ms max"
+            )
+
 
 # ----------------------------------------------------------------------
 class TestMainAppKeyBindings:
@@ -415,343 +513,1285 @@ class TestMainAppCheckAction:
                 RemoteColumn.value: {"has_remote_changes": False, "has_local_changes": True}
             }
 
-            result = app.check_action("PushSelected", ())
-            assert result is True
+            result = app.check_action("PushSelected", ())
+            assert result is True
+
+    # ----------------------------------------------------------------------
+    @pytest.mark.asyncio
+    async def test_unknown_action_returns_true(self, working_dir: Path) -> None:
+        """Unknown actions return True (enabled by default)."""
+
+        app = MainApp(working_dir=working_dir, github_pat=None)
+
+        result = app.check_action("UnknownAction", ())
+        assert result is True
+
+
+# ----------------------------------------------------------------------
+class TestMainAppWithMockedRepositories:
+    """Tests for MainApp with mocked repository loading."""
+
+    # ----------------------------------------------------------------------
+    @pytest.mark.asyncio
+    async def test_app_shows_loading_modal_on_mount(self, working_dir: Path) -> None:
+        """MainApp shows a loading modal when mounting."""
+
+        with patch(
+            "AllGitStatus.MainApp.EnumerateRepositories",
+            side_effect=lambda wd: mock_enumerate_repositories(wd),
+        ):
+            app = MainApp(working_dir=working_dir, github_pat=None)
+
+            async with app.run_test() as pilot:
+                # Allow modal to appear
+                await pilot.pause()
+
+                # The modal might have already dismissed if repos loaded quickly,
+                # but we can verify the app started correctly
+                assert app.title == "AllGitStatus"
+
+    # ----------------------------------------------------------------------
+    @pytest.mark.asyncio
+    async def test_repositories_loaded_into_data_table(self, working_dir: Path) -> None:
+        """Repositories are loaded into the data table."""
+
+        repos = [
+            create_mock_repository(working_dir / "repo1"),
+            create_mock_repository(working_dir / "repo2"),
+        ]
+
+        async def mock_enum(wd):
+            for repo in repos:
+                yield repo
+
+        with patch("AllGitStatus.MainApp.EnumerateRepositories", side_effect=mock_enum):
+            app = MainApp(working_dir=working_dir, github_pat=None)
+
+            async with app.run_test() as pilot:
+                # Wait for repositories to load
+                await pilot.pause()
+                await asyncio.sleep(0.1)
+                await pilot.pause()
+
+                # Verify repositories were loaded
+                assert app._repositories is not None
+                assert len(app._repositories) == 2
+
+    # ----------------------------------------------------------------------
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("owner_listings", [False, True])
+    async def test_owner_listings(self, working_dir: Path, owner_listings: bool) -> None:  # noqa: FBT001
+        """Repositories are only listed by owner when owner listings are enabled."""
+
+        repos = [create_mock_repository(working_dir / "repo1")]
+
+        async def mock_enum(wd):
+            for repo in repos:
+                yield repo
+
+        with (
+            patch("AllGitStatus.MainApp.EnumerateRepositories", side_effect=mock_enum),
+            patch("AllGitStatus.MainApp.GitHubOwnerListings") as mock_github_owner_listings,
+        ):
+            app = MainApp(working_dir=working_dir, github_pat=None, owner_listings=owner_listings)
+
+            async with app.run_test() as pilot:
+                await pilot.pause()
+                await asyncio.sleep(0.1)
+                await pilot.pause()
+
+                assert app._repositories is not None
+
+                if owner_listings:
+                    mock_github_owner_listings.assert_called_once_with(app._github_session, repos)
+                else:
+                    mock_github_owner_listings.assert_not_called()
+
+    # ----------------------------------------------------------------------
+    @pytest.mark.asyncio
+    async def test_shared_audit(self, working_dir: Path) -> None:
+        """The dependencies of all repositories are audited together when shared audits are enabled."""
+
+        repos = [
+            create_mock_repository(working_dir / "repo1"),
+            create_mock_repository(working_dir / "repo2"),
+        ]
+
+        async def mock_enum(wd):
+            for repo in repos:
+                yield repo
+
+        with patch("AllGitStatus.MainApp.EnumerateRepositories", side_effect=mock_enum):
+            app = MainApp(working_dir=working_dir, github_pat=None, shared_audit=True)
+
+            async with app.run_test() as pilot:
+                assert app._advisory_session is not None
+
+                await pilot.pause()
+                await asyncio.sleep(0.1)
+                await pilot.pause()
+
+                assert app._dependency_vulnerabilities is not None
+                assert app._dependency_vulnerabilities._repositories == repos
+
+            assert app._advisory_session is None
+
+    # ----------------------------------------------------------------------
+    def test_uv_audit_runner(self, working_dir: Path) -> None:
+        """A single uv audit runner limits the audits of all repositories."""
+
+        with patch("shutil.which", return_value="/usr/bin/nice"):
+            app = MainApp(
+                working_dir=working_dir,
+                github_pat=None,
+                uv_audit_concurrency=2,
+                uv_audit_low_priority=True,
+            )
+
+        assert app._uv_audit_runner._semaphore._value == 2
+        assert app._uv_audit_runner._command_prefix[0] == "/usr/bin/nice"
+
+    # ----------------------------------------------------------------------
+    @pytest.mark.asyncio
+    async def test_advisory_database(self, working_dir: Path, tmp_path: Path) -> None:
+        """Dependencies are audited with the local advisory database, including when a repository is refreshed."""
+
+        repos = [create_mock_repository(working_dir / "repo1")]
+
+        async def mock_enum(wd):
+            for repo in repos:
+                yield repo
+
+        with patch("AllGitStatus.MainApp.EnumerateRepositories", side_effect=mock_enum):
+            app = MainApp(
+                working_dir=working_dir, github_pat=None, advisory_database=tmp_path / "Advisories.db"
+            )
+
+            async with app.run_test() as pilot:
+                # The advisory database is queried without network access
+                assert app._advisory_database is not None
+                assert app._advisory_session is None
+
+                await pilot.pause()
+                await asyncio.sleep(0.1)
+                await pilot.pause()
+
+                assert app._dependency_vulnerabilities is not None
+                assert app._dependency_vulnerabilities._advisory_database is app._advisory_database
+
+                with patch(
+                    "AllGitStatus.MainApp.DependencyVulnerabilities"
+                ) as mock_dependency_vulnerabilities:
+                    await app._ResetRepository(repos[0], 0)
+
+                mock_dependency_vulnerabilities.assert_called_once_with(
+                    None,
+                    repos,
+                    advisory_database=app._advisory_database,
+                    wait_for_advisory_database=None,
+                )
+
+            assert app._advisory_database is None
+
+    # ----------------------------------------------------------------------
+    @pytest.mark.asyncio
+    async def test_sync_advisory_database(self, working_dir: Path, tmp_path: Path) -> None:
+        """The local advisory database is synced when it is out of date, and sync errors are ignored."""
+
+        with patch("AllGitStatus.MainApp.AdvisoryDatabase") as mock_advisory_database:
+            database = mock_advisory_database.return_value
+            database.synced = None
+            database.Sync = AsyncMock(side_effect=aiohttp.ClientConnectionError("offline"))
+
+            app = MainApp(
+                working_dir=working_dir,
+                github_pat=None,
+                advisory_database=tmp_path / "Advisories.db",
+                sync_advisory_database=True,
+            )
+
+            async with app.run_test() as pilot:
+                await pilot.pause()
+                await asyncio.sleep(0.1)
+                await pilot.pause()
+
+                database.Sync.assert_called_once_with(app._advisory_session)
+
+                # Dependencies are audited once the snapshot has been synced
+                assert app._advisory_database_sync is not None
+                assert app._dependency_vulnerabilities is not None
+                assert (
+                    app._dependency_vulnerabilities._wait_for_advisory_database
+                    == app._advisory_database_sync.wait
+                )
+
+                # Errors importing the snapshot are ignored
+                database.Sync = AsyncMock(side_effect=sqlite3.OperationalError("disk I/O error"))
+                await app._SyncAdvisoryDatabase()
+
+                database.Sync.assert_called_once_with(app._advisory_session)
+
+                # The snapshot isn't synced again until it expires
+                database.synced = datetime.now(UTC)
+                await app._SyncAdvisoryDatabase()
+
+                assert database.Sync.call_count == 1
+
+            database.Close.assert_called_once_with()
+
+
+# ----------------------------------------------------------------------
+class TestMainAppActions:
+    """Tests for MainApp action methods."""
+
+    # ----------------------------------------------------------------------
+    @pytest.mark.asyncio
+    async def test_action_refresh_all_resets_repositories(self, working_dir: Path) -> None:
+        """action_RefreshAll resets all repositories."""
+
+        repos = [create_mock_repository(working_dir / "repo1")]
+
+        async def mock_enum(wd):
+            for repo in repos:
+                yield repo
+
+        with patch("AllGitStatus.MainApp.EnumerateRepositories", side_effect=mock_enum):
+            app = MainApp(working_dir=working_dir, github_pat=None)
+
+            async with app.run_test() as pilot:
+                # Wait for initial load
+                await pilot.pause()
+                await asyncio.sleep(0.1)
+                await pilot.pause()
+
+                assert app._repositories is not None
+                initial_repos = app._repositories
+
+                # Press 'R' to refresh all
+                await pilot.press("R")
+                await pilot.pause()
+                await asyncio.sleep(0.1)
+                await pilot.pause()
+
+                # Repositories should be reloaded
+                assert app._repositories is not None
+
+    # ----------------------------------------------------------------------
+    @pytest.mark.asyncio
+    async def test_action_refresh_selected_resets_single_repository(self, working_dir: Path) -> None:
+        """action_RefreshSelected resets the selected repository."""
+
+        repos = [
+            create_mock_repository(working_dir / "repo1"),
+            create_mock_repository(working_dir / "repo2"),
+        ]
+
+        async def mock_enum(wd):
+            for repo in repos:
+                yield repo
+
+        with patch("AllGitStatus.MainApp.EnumerateRepositories", side_effect=mock_enum):
+            app = MainApp(working_dir=working_dir, github_pat=None)
+
+            async with app.run_test() as pilot:
+                # Wait for initial load
+                await pilot.pause()
+                await asyncio.sleep(0.1)
+                await pilot.pause()
+
+                assert app._repositories is not None
+                assert len(app._repositories) == 2
+
+                # Press 'r' to refresh selected
+                await pilot.press("r")
+                await pilot.pause()
+
+                # Repository count should remain the same
+                assert len(app._repositories) == 2
+
+    # ----------------------------------------------------------------------
+    @pytest.mark.asyncio
+    async def test_refresh_clears_cicd_cache(self, working_dir: Path) -> None:
+        """Refreshing does not display cached CI/CD status."""
+
+        with patch("AllGitStatus.MainApp.EnumerateRepositories", side_effect=mock_enumerate_repositories):
+            app = MainApp(working_dir=working_dir, github_pat=None)
+
+            async with app.run_test() as pilot:
+                await pilot.pause()
+                await asyncio.sleep(0.1)
+                await pilot.pause()
+
+                with (
+                    patch.object(app._github_cicd_cache, "Clear") as clear,
+                    patch.object(app._github_cicd_cache, "Remove") as remove,
+                ):
+                    await pilot.press("r")
+                    await pilot.pause()
+
+                    clear.assert_not_called()
+                    remove.assert_called_once_with("testowner", "testrepo")
+
+                    await pilot.press("R")
+                    await pilot.pause()
+
+                    clear.assert_called_once_with()
+                    remove.assert_called_once_with("testowner", "testrepo")
+
+                    # Local repositories are not in the cache
+                    await app._data_table.run_action("cursor_down")
+                    await app._data_table.run_action("cursor_down")
+                    await pilot.press("r")
+                    await pilot.pause()
+
+                    remove.assert_called_once_with("testowner", "testrepo")
+
+    # ----------------------------------------------------------------------
+    @pytest.mark.asyncio
+    async def test_action_pull_selected_calls_pull(self, working_dir: Path) -> None:
+        """action_PullSelected calls LocalGitSource.Pull."""
+
+        repos = [create_mock_repository(working_dir / "repo1")]
+
+        async def mock_enum(wd):
+            for repo in repos:
+                yield repo
+
+        with (
+            patch("AllGitStatus.MainApp.EnumerateRepositories", side_effect=mock_enum),
+            patch.object(LocalGitSource, "Pull", new_callable=AsyncMock) as mock_pull,
+        ):
+            app = MainApp(working_dir=working_dir, github_pat=None)
+
+            async with app.run_test() as pilot:
+                # Wait for initial load
+                await pilot.pause()
+                await asyncio.sleep(0.1)
+                await pilot.pause()
+
+                # Set state data with remote changes so pull is enabled
+                app._state_data[0] = {
+                    RemoteColumn.value: {"has_remote_changes": True, "has_local_changes": False}
+                }
+                app.refresh_bindings()
+                await pilot.pause()
+
+                # Press 'p' to pull
+                await pilot.press("p")
+                await pilot.pause()
+
+                # Pull should have been called
+                mock_pull.assert_called_once()
+
+    # ----------------------------------------------------------------------
+    @pytest.mark.asyncio
+    async def test_action_push_selected_calls_push(self, working_dir: Path) -> None:
+        """action_PushSelected calls LocalGitSource.Push."""
+
+        repos = [create_mock_repository(working_dir / "repo1")]
+
+        async def mock_enum(wd):
+            for repo in repos:
+                yield repo
+
+        with (
+            patch("AllGitStatus.MainApp.EnumerateRepositories", side_effect=mock_enum),
+            patch.object(LocalGitSource, "Push", new_callable=AsyncMock) as mock_push,
+        ):
+            app = MainApp(working_dir=working_dir, github_pat=None)
+
+            async with app.run_test() as pilot:
+                # Wait for initial load
+                await pilot.pause()
+                await asyncio.sleep(0.1)
+                await pilot.pause()
+
+                # Set state data with local changes so push is enabled
+                app._state_data[0] = {
+                    RemoteColumn.value: {"has_remote_changes": False, "has_local_changes": True}
+                }
+                app.refresh_bindings()
+                await pilot.pause()
+
+                assert app._github_session is not None
+
+                with patch.object(app._github_session, "StartGeneration") as start_generation:
+                    # Press 'P' to push
+                    await pilot.press("P")
+                    await pilot.pause()
+
+                # Push should have been called
+                mock_push.assert_called_once()
+
+                # GitHub responses from before the push should not be reused
+                start_generation.assert_called_once_with()
+
+
+# ----------------------------------------------------------------------
+class TestMainAppPopulateCell:
+    """Tests for _PopulateCell method."""
+
+    # ----------------------------------------------------------------------
+    @pytest.mark.asyncio
+    async def test_populate_cell_with_error_info(self, working_dir: Path) -> None:
+        """_PopulateCell handles ErrorInfo correctly."""
+
+        repos = [create_mock_repository(working_dir / "repo1")]
+
+        async def mock_enum(wd):
+            for repo in repos:
+                yield repo
+
+        with patch("AllGitStatus.MainApp.EnumerateRepositories", side_effect=mock_enum):
+            app = MainApp(working_dir=working_dir, github_pat=None)
+
+            async with app.run_test() as pilot:
+                # Wait for initial load
+                await pilot.pause()
+                await asyncio.sleep(0.1)
+                await pilot.pause()
+
+                # Create an ErrorInfo and call _PopulateCell
+                error_info = ErrorInfo(
+                    repo=repos[0],
+                    key=("LocalGitSource", "current_branch"),
+                    error=ValueError("Test error"),
+                )
+
+                await app._PopulateCell(0, error_info)
+                await pilot.pause(MainApp.CELL_UPDATE_INTERVAL * 2)
+
+                # Verify the cell was updated with error indicator
+                cell_value = app._data_table.get_cell_at(Coordinate(0, BranchColumn.value))
+                assert "💥" in str(cell_value)
+
+                # The additional_info_data should contain a Traceback
+                assert app._additional_info_data.Get(0, BranchColumn.value) is not None
+
+    # ----------------------------------------------------------------------
+    @pytest.mark.asyncio
+    async def test_populate_cell_with_result_info_with_state_data(self, working_dir: Path) -> None:
+        """_PopulateCell handles ResultInfo with state_data correctly."""
+
+        repos = [create_mock_repository(working_dir / "repo1")]
+
+        async def mock_enum(wd):
+            for repo in repos:
+                yield repo
+
+        with patch("AllGitStatus.MainApp.EnumerateRepositories", side_effect=mock_enum):
+            app = MainApp(working_dir=working_dir, github_pat=None)
+
+            async with app.run_test() as pilot:
+                # Wait for initial load
+                await pilot.pause()
+                await asyncio.sleep(0.1)
+                await pilot.pause()
+
+                # Create a ResultInfo with state_data
+                result_info = ResultInfo(
+                    repo=repos[0],
+                    key=("LocalGitSource", "remote_status"),
+                    display_value="  0 🔼   0 🔽",
+                    additional_info="No changes",
+                    state_data={"has_local_changes": True, "has_remote_changes": False},
+                )
+
+                await app._PopulateCell(0, result_info)
+                await pilot.pause(MainApp.CELL_UPDATE_INTERVAL * 2)
+
+                # Verify the cell was populated with the display value
+                cell_value = app._data_table.get_cell_at(Coordinate(0, RemoteColumn.value))
+                assert "0 🔼" in str(cell_value), (cell_value, result_info.additional_info)
+                assert "0 🔽" in str(cell_value), (cell_value, result_info.additional_info)
+
+                # Verify additional_info was stored
+                assert app._additional_info_data.Get(0, RemoteColumn.value) is not None
+                assert app._additional_info_data.Get(0, RemoteColumn.value) == "No changes"
+
+                # Verify state_data was stored
+                assert 0 in app._state_data
+                assert RemoteColumn.value in app._state_data[0]
+                state_data = app._state_data[0][RemoteColumn.value]
+                assert state_data["has_local_changes"] is True  # ty: ignore[not-subscriptable]
+                assert state_data["has_remote_changes"] is False  # ty: ignore[not-subscriptable]
+
+    # ----------------------------------------------------------------------
+    @pytest.mark.asyncio
+    async def test_populate_cell_with_error_info_debug_mode(self, working_dir: Path) -> None:
+        """_PopulateCell includes traceback in debug mode."""
+
+        repos = [create_mock_repository(working_dir / "repo1")]
+
+        async def mock_enum(wd):
+            for repo in repos:
+                yield repo
+
+        with patch("AllGitStatus.MainApp.EnumerateRepositories", side_effect=mock_enum):
+            # Create app with debug mode enabled
+            app = MainApp(working_dir=working_dir, github_pat=None, debug=True)
+
+            async with app.run_test() as pilot:
+                # Wait for initial load
+                await pilot.pause()
+                await asyncio.sleep(0.1)
+                await pilot.pause()
+
+                # Create an ErrorInfo with a real exception that has a traceback
+                try:
+                    raise ValueError("Test error with traceback")
+                except ValueError as e:
+                    error_info = ErrorInfo(
+                        repo=repos[0],
+                        key=("LocalGitSource", "current_branch"),
+                        error=e,
+                    )
+
+                await app._PopulateCell(0, error_info)
+                await pilot.pause()
+
+                # Verify the cell was updated
+                assert app._additional_info_data.Get(0, BranchColumn.value) is not None
+
+
+# ----------------------------------------------------------------------
+class TestMainAppCellUpdates:
+    """Tests for buffered cell updates."""
+
+    # ----------------------------------------------------------------------
+    @pytest.mark.asyncio
+    async def test_updates_are_coalesced(self, working_dir: Path) -> None:
+        """Cell updates are applied together, and only the latest value of each cell is applied."""
+
+        repos = [create_mock_repository(working_dir / "repo1")]
+
+        async def mock_enum(wd):
+            for repo in repos:
+                yield repo
+
+        with patch("AllGitStatus.MainApp.EnumerateRepositories", side_effect=mock_enum):
+            app = MainApp(working_dir=working_dir, github_pat=None)
+
+            async with app.run_test() as pilot:
+                await pilot.pause()
+                await asyncio.sleep(0.2)
+                await pilot.pause()
+
+                with patch.object(
+                    app._data_table, "update_cell_at", wraps=app._data_table.update_cell_at
+                ) as mock_update:
+                    for display_value in ["feature", "develop", "main"]:
+                        await app._PopulateCell(
+                            0,
+                            ResultInfo(
+                                repo=repos[0],
+                                key=("LocalGitSource", "current_branch"),
+                                display_value=display_value,
+                                additional_info=f"Branch: {display_value}",
+                            ),
+                        )
+
+                    await app._PopulateCell(
+                        0,
+                        ResultInfo(
+                            repo=repos[0],
+                            key=("LocalGitSource", "stashes"),
+                            display_value="3",
+                            additional_info="3 stashes",
+                        ),
+                    )
+
+                    # Nothing is applied until the interval has elapsed
+                    assert mock_update.call_count == 0
+                    assert str(app._data_table.get_cell_at(Coordinate(0, BranchColumn.value))) != "main"
+
+                    await pilot.pause(MainApp.CELL_UPDATE_INTERVAL * 2)
+
+                    assert mock_update.call_count == 2
+
+                assert str(app._data_table.get_cell_at(Coordinate(0, BranchColumn.value))) == "main"
+                assert str(app._data_table.get_cell_at(Coordinate(0, StashesColumn.value))) == "3"
+
+                # The additional info is available immediately
+                assert app._additional_info_data.Get(0, BranchColumn.value) == "Branch: main"
+
+    # ----------------------------------------------------------------------
+    @pytest.mark.asyncio
+    async def test_pending_updates_are_discarded_on_refresh(self, working_dir: Path) -> None:
+        """Updates that haven't been applied are discarded when all repositories are refreshed."""
+
+        async def mock_enum(wd):
+            yield create_mock_repository(working_dir / "repo1")
+
+        with patch("AllGitStatus.MainApp.EnumerateRepositories", side_effect=mock_enum):
+            app = MainApp(working_dir=working_dir, github_pat=None)
+
+            async with app.run_test() as pilot:
+                await pilot.pause()
+                await asyncio.sleep(0.2)
+                await pilot.pause()
+
+                app._UpdateCell(Coordinate(0, StarsColumn.value), Text("stale"))
+                assert app._cell_update_timer is not None
+
+                with patch.object(app, "push_screen"):
+                    await app._ResetAllRepositories()
+
+                assert app._pending_cell_updates == {}
+                assert app._cell_update_timer is None
+
+    # ----------------------------------------------------------------------
+    @pytest.mark.asyncio
+    async def test_updates_for_removed_rows_are_ignored(self, working_dir: Path) -> None:
+        """Updates for rows that no longer exist are ignored when they are applied."""
+
+        async def mock_enum(wd):
+            yield create_mock_repository(working_dir / "repo1")
+
+        with patch("AllGitStatus.MainApp.EnumerateRepositories", side_effect=mock_enum):
+            app = MainApp(working_dir=working_dir, github_pat=None)
+
+            async with app.run_test() as pilot:
+                await pilot.pause()
+                await asyncio.sleep(0.2)
+                await pilot.pause()
+
+                app._UpdateCell(Coordinate(5, StarsColumn.value), Text("missing"))
+                app._UpdateCell(Coordinate(0, StarsColumn.value), Text("42"))
+
+                app._FlushCellUpdates()
+
+                assert app._pending_cell_updates == {}
+                assert str(app._data_table.get_cell_at(Coordinate(0, StarsColumn.value))) == "42"
+
+
+# ----------------------------------------------------------------------
+class TestMainAppDeferredInfo:
+    """Tests for additional info that is retrieved when it is displayed."""
+
+    # ----------------------------------------------------------------------
+    @staticmethod
+    async def _PopulateDeferredInfo(
+        app: MainApp,
+        pilot,
+        repo: Repository,
+        factory,
+    ) -> DeferredInfo:
+        """Populate the issues cell of the first row with deferred info and select it."""
+
+        # Wait for initial load
+        await pilot.pause()
+        await asyncio.sleep(0.1)
+        await pilot.pause()
+
+        app._data_table.move_cursor(row=0, column=IssuesColumn.value)
+        await pilot.pause()
+
+        deferred_info = DeferredInfo("Loading...", factory)
+
+        await app._PopulateCell(0, ResultInfo(repo, ("GitHubSource", "issues"), "1", deferred_info))
+
+        return deferred_info
+
+    # ----------------------------------------------------------------------
+    @pytest.mark.asyncio
+    async def test_deferred_info_resolved_when_selected(self, working_dir: Path) -> None:
+        """Deferred info is resolved when the cell is selected and the result is retained."""
+
+        repos = [create_mock_repository(working_dir / "repo1")]
+        call_count = 0
+
+        async def mock_enum(wd):
+            for repo in repos:
+                yield repo
+
+        async def Factory() -> object:
+            nonlocal call_count
+
+            call_count += 1
+            return "Issue details"
+
+        with patch("AllGitStatus.MainApp.EnumerateRepositories", side_effect=mock_enum):
+            app = MainApp(working_dir=working_dir, github_pat=None)
+
+            async with app.run_test() as pilot:
+                await self._PopulateDeferredInfo(app, pilot, repos[0], Factory)
+
+                await pilot.pause()
+                await asyncio.sleep(0.1)
+                await pilot.pause()
+
+                assert app._additional_info_data.Get(0, IssuesColumn.value) == "Issue details"
+                assert call_count == 1
+
+    # ----------------------------------------------------------------------
+    @pytest.mark.asyncio
+    async def test_deferred_info_error(self, working_dir: Path) -> None:
+        """Errors encountered while resolving deferred info are displayed."""
+
+        repos = [create_mock_repository(working_dir / "repo1")]
+
+        async def mock_enum(wd):
+            for repo in repos:
+                yield repo
+
+        async def Factory() -> object:
+            raise ValueError("boom")
+
+        with patch("AllGitStatus.MainApp.EnumerateRepositories", side_effect=mock_enum):
+            app = MainApp(working_dir=working_dir, github_pat=None)
+
+            async with app.run_test() as pilot:
+                await self._PopulateDeferredInfo(app, pilot, repos[0], Factory)
+
+                await pilot.pause()
+                await asyncio.sleep(0.1)
+                await pilot.pause()
+
+                assert isinstance(app._additional_info_data.Get(0, IssuesColumn.value), Traceback)
+
+    # ----------------------------------------------------------------------
+    @pytest.mark.asyncio
+    async def test_deferred_info_replaced_while_resolving(self, working_dir: Path) -> None:
+        """Deferred info that is resolved after the cell was refreshed is discarded."""
+
+        repos = [create_mock_repository(working_dir / "repo1")]
+        event = asyncio.Event()
+
+        async def mock_enum(wd):
+            for repo in repos:
+                yield repo
+
+        async def Factory() -> object:
+            await event.wait()
+            return "Stale details"
+
+        with patch("AllGitStatus.MainApp.EnumerateRepositories", side_effect=mock_enum):
+            app = MainApp(working_dir=working_dir, github_pat=None)
+
+            async with app.run_test() as pilot:
+                deferred_info = await self._PopulateDeferredInfo(app, pilot, repos[0], Factory)
+
+                await app._PopulateCell(
+                    0, ResultInfo(repos[0], ("GitHubSource", "issues"), "2", "New details")
+                )
+
+                event.set()
+                await deferred_info.Resolve()
+
+                await pilot.pause()
+                await asyncio.sleep(0.1)
+                await pilot.pause()
+
+                assert app._additional_info_data.Get(0, IssuesColumn.value) == "New details"
+
+
+# ----------------------------------------------------------------------
+class TestMainAppAdditionalInfoEviction:
+    """Tests for additional info that is evicted and rebuilt when it is next displayed."""
+
+    # ----------------------------------------------------------------------
+    @staticmethod
+    async def _EnumerateNoRepositories(working_dir: Path):  # noqa: ARG004
+        """Enumerate no repositories, so that sources are only queried by the test."""
+
+        for repo in []:
+            yield repo
+
+    # ----------------------------------------------------------------------
+    @pytest.mark.asyncio
+    async def test_evicted_info_rebuilt_when_selected(self, working_dir: Path) -> None:
+        """Evicted additional info is rebuilt by querying the source again when the cell is selected."""
+
+        repos = [create_mock_repository(working_dir / "repo1")]
+
+        async def mock_enum(wd):
+            for repo in repos:
+                yield repo
+
+        queried_names = []
+
+        async def mock_query_info(self, repo, name):
+            queried_names.append(name)
+            yield ResultInfo(repo, ("GitHubSource", name), "1", "Issues: url\n\nrebuilt")
+
+        with (
+            patch("AllGitStatus.MainApp.EnumerateRepositories", side_effect=mock_enum),
+            patch("AllGitStatus.MainApp.GitHubSource.QueryInfo", mock_query_info),
+        ):
+            app = MainApp(working_dir=working_dir, github_pat=None)
+
+            async with app.run_test() as pilot:
+                await pilot.pause()
+                await asyncio.sleep(0.1)
+                await pilot.pause()
+
+                app._additional_info_data = AdditionalInfoStore(max_size=40, min_evictable_size=1)
+
+                await app._PopulateCell(
+                    0, ResultInfo(repos[0], ("GitHubSource", "issues"), "1", "Issues: url\n\n" + "x" * 20)
+                )
+                await app._PopulateCell(
+                    0,
+                    ResultInfo(
+                        repos[0], ("GitHubSource", "pull_requests"), "1", "Pull Requests: url\n\n" + "x" * 20
+                    ),
+                )
+
+                evicted = app._additional_info_data.Get(0, IssuesColumn.value)
+
+                assert isinstance(evicted, DeferredInfo)
+                assert evicted.placeholder == "Issues: url\n\nLoading..."
+
+                app._data_table.move_cursor(row=0, column=IssuesColumn.value)
+
+                await pilot.pause()
+                await asyncio.sleep(0.1)
+                await pilot.pause()
+
+                assert app._additional_info_data.Get(0, IssuesColumn.value) == "Issues: url\n\nrebuilt"
+
+                # Only the evicted info was generated again
+                assert queried_names == ["issues"]
+
+    # ----------------------------------------------------------------------
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        ("source_name", "method_name", "key"),
+        [
+            ("LocalGitSource", "Query", "current_branch"),
+            ("GitHubSource", "QueryInfo", "issues"),
+            ("UvAuditSource", "Query", "uv_audit"),
+        ],
+    )
+    async def test_rebuild(self, working_dir: Path, source_name: str, method_name: str, key: str) -> None:
+        """Only the source that provided the info is queried again."""
+
+        repo = create_mock_repository(working_dir / "repo1")
+
+        async def mock_query(self, repo, name=None):  # noqa: ARG001
+            yield ResultInfo(repo, (source_name, "other"), "1", "Other")
+            yield ResultInfo(
+                repo, (source_name, key), "1", DeferredInfo("Loading...", AsyncMock(return_value="Rebuilt"))
+            )
+
+        with (
+            patch(
+                "AllGitStatus.MainApp.EnumerateRepositories",
+                side_effect=self._EnumerateNoRepositories,
+            ),
+            patch(f"AllGitStatus.MainApp.{source_name}.{method_name}", mock_query),
+        ):
+            app = MainApp(working_dir=working_dir, github_pat=None)
+
+            async with app.run_test():
+                assert await app._RebuildAdditionalInfo(repo, (source_name, key)) == "Rebuilt"
+                assert await app._RebuildAdditionalInfo(repo, (source_name, "missing")) is None
+
+    # ----------------------------------------------------------------------
+    @pytest.mark.asyncio
+    async def test_deferred_info_rebuilt_without_query(self, working_dir: Path) -> None:
+        """Evicted deferred info is rebuilt by retrieving it again, without querying the source."""
+
+        repo = create_mock_repository(working_dir / "repo1")
+        factory = AsyncMock(return_value="Retrieved")
+
+        with (
+            patch(
+                "AllGitStatus.MainApp.EnumerateRepositories",
+                side_effect=self._EnumerateNoRepositories,
+            ),
+            patch("AllGitStatus.MainApp.GitHubSource.QueryInfo") as mock_query_info,
+        ):
+            app = MainApp(working_dir=working_dir, github_pat=None)
+
+            async with app.run_test():
+                app._repositories = [repo]
+
+                rebuild = app._CreateRebuild(
+                    0, ("GitHubSource", "issues"), DeferredInfo("Loading...", factory)
+                )
+
+                assert rebuild is factory
+                assert app._CreateRebuild(0, ("GitHubSource", "issues"), "Issues") is not None
+
+                app._repositories = None
+
+                assert app._CreateRebuild(0, ("GitHubSource", "issues"), "Issues") is None
+
+            mock_query_info.assert_not_called()
+
+    # ----------------------------------------------------------------------
+    @pytest.mark.asyncio
+    async def test_rebuild_error(self, working_dir: Path) -> None:
+        """Errors encountered while rebuilding the info are displayed."""
+
+        repo = create_mock_repository(working_dir / "repo1")
+
+        async def mock_query(self, repo):
+            yield ErrorInfo(repo, ("LocalGitSource", "current_branch"), ValueError("boom"))
+
+        with (
+            patch(
+                "AllGitStatus.MainApp.EnumerateRepositories",
+                side_effect=self._EnumerateNoRepositories,
+            ),
+            patch("AllGitStatus.MainApp.LocalGitSource.Query", mock_query),
+        ):
+            app = MainApp(working_dir=working_dir, github_pat=None)
+
+            async with app.run_test():
+                assert isinstance(
+                    await app._RebuildAdditionalInfo(repo, ("LocalGitSource", "current_branch")),
+                    Traceback,
+                )
+
+
+# ----------------------------------------------------------------------
+class TestMainAppAutoRefresh:
+    """Tests for polling GitHub in the background."""
+
+    # ----------------------------------------------------------------------
+    class FakeClock:
+        """A clock that only advances when told to."""
+
+        # ----------------------------------------------------------------------
+        def __init__(self) -> None:
+            self.now = 0.0
+
+        # ----------------------------------------------------------------------
+        def __call__(self) -> float:
+            return self.now
 
     # ----------------------------------------------------------------------
-    @pytest.mark.asyncio
-    async def test_unknown_action_returns_true(self, working_dir: Path) -> None:
-        """Unknown actions return True (enabled by default)."""
+    @staticmethod
+    def _CreateApp(working_dir: Path, clock: FakeClock) -> MainApp:
+        """Create an app whose poller uses the clock."""
 
-        app = MainApp(working_dir=working_dir, github_pat=None)
+        app = MainApp(working_dir=working_dir, github_pat=None, auto_refresh=True)
+        app._poller = AdaptivePoller(clock=clock)
 
-        result = app.check_action("UnknownAction", ())
-        assert result is True
+        return app
 
+    # ----------------------------------------------------------------------
+    @staticmethod
+    async def _WaitForLoad(pilot) -> None:
+        """Wait for the repositories to load."""
 
-# ----------------------------------------------------------------------
-class TestMainAppWithMockedRepositories:
-    """Tests for MainApp with mocked repository loading."""
+        await pilot.pause()
+        await asyncio.sleep(0.1)
+        await pilot.pause()
 
     # ----------------------------------------------------------------------
     @pytest.mark.asyncio
-    async def test_app_shows_loading_modal_on_mount(self, working_dir: Path) -> None:
-        """MainApp shows a loading modal when mounting."""
-
-        with patch(
-            "AllGitStatus.MainApp.EnumerateRepositories",
-            side_effect=lambda wd: mock_enumerate_repositories(wd),
-        ):
-            app = MainApp(working_dir=working_dir, github_pat=None)
+    async def test_disabled_by_default(self, working_dir: Path) -> None:
+        """Background polling is not enabled by default."""
 
-            async with app.run_test() as pilot:
-                # Allow modal to appear
-                await pilot.pause()
+        app = MainApp(working_dir=working_dir, github_pat=None)
 
-                # The modal might have already dismissed if repos loaded quickly,
-                # but we can verify the app started correctly
-                assert app.title == "AllGitStatus"
+        assert app._poller is None
 
     # ----------------------------------------------------------------------
     @pytest.mark.asyncio
-    async def test_repositories_loaded_into_data_table(self, working_dir: Path) -> None:
-        """Repositories are loaded into the data table."""
+    async def test_only_changed_cells_are_updated(self, working_dir: Path) -> None:
+        """Polling updates the cells whose values changed, and adapts the polling interval."""
 
-        repos = [
-            create_mock_repository(working_dir / "repo1"),
-            create_mock_repository(working_dir / "repo2"),
-        ]
+        repos = [create_mock_repository(working_dir / "repo1", "https://github.com/testowner/repo1.git")]
+        stars = iter(["1", "2", "2"])
+        clock = self.FakeClock()
 
         async def mock_enum(wd):
             for repo in repos:
                 yield repo
 
-        with patch("AllGitStatus.MainApp.EnumerateRepositories", side_effect=mock_enum):
-            app = MainApp(working_dir=working_dir, github_pat=None)
-
-            async with app.run_test() as pilot:
-                # Wait for repositories to load
-                await pilot.pause()
-                await asyncio.sleep(0.1)
-                await pilot.pause()
+        async def mock_local_query(repo):
+            for _ in []:
+                yield  # pragma: no cover
 
-                # Verify repositories were loaded
-                assert app._repositories is not None
-                assert len(app._repositories) == 2
+        async def mock_github_query(repo):
+            yield ResultInfo(repo, ("GitHubSource", "stars"), next(stars), "Stars")
+            yield ErrorInfo(repo, ("GitHubSource", "forks"), ValueError("forks"))
 
+        with (
+            patch("AllGitStatus.MainApp.EnumerateRepositories", side_effect=mock_enum),
+            patch("AllGitStatus.MainApp.LocalGitSource.Query", side_effect=mock_local_query),
+            patch("AllGitStatus.MainApp.GitHubSource.Query", side_effect=mock_github_query),
+        ):
+            app = self._CreateApp(working_dir, clock)
 
-# ----------------------------------------------------------------------
-class TestMainAppActions:
-    """Tests for MainApp action methods."""
+            async with app.run_test() as pilot:
+                await self._WaitForLoad(pilot)
 
-    # ----------------------------------------------------------------------
-    @pytest.mark.asyncio
-    async def test_action_refresh_all_resets_repositories(self, working_dir: Path) -> None:
-        """action_RefreshAll resets all repositories."""
+                assert app._poller is not None
+                assert app._poller.GetInterval(0) == AdaptivePoller.DEFAULT_INITIAL_INTERVAL
 
-        repos = [create_mock_repository(working_dir / "repo1")]
+                # Nothing is due yet
+                with patch.object(app, "_PollRepository") as mock_poll:
+                    await app._OnPollTimer()
+                    mock_poll.assert_not_called()
 
-        async def mock_enum(wd):
-            for repo in repos:
-                yield repo
+                clock.now += AdaptivePoller.DEFAULT_INITIAL_INTERVAL
 
-        with patch("AllGitStatus.MainApp.EnumerateRepositories", side_effect=mock_enum):
-            app = MainApp(working_dir=working_dir, github_pat=None)
+                with patch.object(app, "_PopulateCell", wraps=app._PopulateCell) as mock_populate:
+                    await app._OnPollTimer()
+                    await self._WaitForLoad(pilot)
 
-            async with app.run_test() as pilot:
-                # Wait for initial load
-                await pilot.pause()
-                await asyncio.sleep(0.1)
-                await pilot.pause()
+                    # Only the stars changed
+                    assert mock_populate.call_count == 1
 
-                assert app._repositories is not None
-                initial_repos = app._repositories
+                assert str(app._data_table.get_cell_at(Coordinate(0, StarsColumn.value))) == "2"
+                assert app._poller.GetInterval(0) == AdaptivePoller.DEFAULT_MIN_INTERVAL
 
-                # Press 'R' to refresh all
-                await pilot.press("R")
-                await pilot.pause()
-                await asyncio.sleep(0.1)
-                await pilot.pause()
+                # Nothing changed
+                await app._PollRepository(repos[0], 0)
 
-                # Repositories should be reloaded
-                assert app._repositories is not None
+                assert app._poller.GetInterval(0) == AdaptivePoller.DEFAULT_MIN_INTERVAL * 2
 
     # ----------------------------------------------------------------------
     @pytest.mark.asyncio
-    async def test_action_refresh_selected_resets_single_repository(self, working_dir: Path) -> None:
-        """action_RefreshSelected resets the selected repository."""
+    async def test_generation_not_started_during_refresh(self, working_dir: Path) -> None:
+        """Polls don't start a new generation of GitHub requests while a refresh is in progress."""
 
         repos = [
-            create_mock_repository(working_dir / "repo1"),
-            create_mock_repository(working_dir / "repo2"),
+            create_mock_repository(working_dir / "repo1", "https://github.com/testowner/repo1.git"),
+            create_mock_repository(working_dir / "repo2", "https://github.com/testowner/repo2.git"),
         ]
+        clock = self.FakeClock()
+        loaded = asyncio.Event()
 
         async def mock_enum(wd):
             for repo in repos:
                 yield repo
 
-        with patch("AllGitStatus.MainApp.EnumerateRepositories", side_effect=mock_enum):
-            app = MainApp(working_dir=working_dir, github_pat=None)
+        async def mock_local_query(repo):
+            for _ in []:
+                yield  # pragma: no cover
+
+        async def mock_github_query(repo):
+            if repo is repos[1] and not loaded.is_set():
+                await loaded.wait()
+
+            yield ResultInfo(repo, ("GitHubSource", "stars"), "1", "Stars")
+
+        with (
+            patch("AllGitStatus.MainApp.EnumerateRepositories", side_effect=mock_enum),
+            patch("AllGitStatus.MainApp.LocalGitSource.Query", side_effect=mock_local_query),
+            patch("AllGitStatus.MainApp.GitHubSource.Query", side_effect=mock_github_query),
+        ):
+            app = self._CreateApp(working_dir, clock)
 
             async with app.run_test() as pilot:
-                # Wait for initial load
-                await pilot.pause()
-                await asyncio.sleep(0.1)
-                await pilot.pause()
+                await self._WaitForLoad(pilot)
 
-                assert app._repositories is not None
-                assert len(app._repositories) == 2
+                assert app._github_session is not None
+                assert app._num_loading_repositories == 1
 
-                # Press 'r' to refresh selected
-                await pilot.press("r")
-                await pilot.pause()
+                clock.now += AdaptivePoller.DEFAULT_INITIAL_INTERVAL
 
-                # Repository count should remain the same
-                assert len(app._repositories) == 2
+                with (
+                    patch.object(app._github_session, "StartGeneration") as mock_start_generation,
+                    patch.object(app, "_PollRepository", new=AsyncMock()) as mock_poll,
+                ):
+                    # The first repository is polled while the second one is still loading
+                    await app._OnPollTimer()
+
+                    mock_poll.assert_called_once_with(repos[0], 0)
+                    mock_start_generation.assert_not_called()
+
+                    loaded.set()
+                    await self._WaitForLoad(pilot)
+
+                    assert app._num_loading_repositories == 0
+
+                    clock.now += AdaptivePoller.DEFAULT_INITIAL_INTERVAL
+
+                    await app._OnPollTimer()
+
+                    mock_start_generation.assert_called_once_with()
 
     # ----------------------------------------------------------------------
     @pytest.mark.asyncio
-    async def test_action_pull_selected_calls_pull(self, working_dir: Path) -> None:
-        """action_PullSelected calls LocalGitSource.Pull."""
+    async def test_deferred_info_compared_by_placeholder(self, working_dir: Path) -> None:
+        """Deferred info is unchanged when its placeholder is unchanged."""
 
-        repos = [create_mock_repository(working_dir / "repo1")]
+        repos = [create_mock_repository(working_dir / "repo1", "https://github.com/testowner/repo1.git")]
 
         async def mock_enum(wd):
             for repo in repos:
                 yield repo
 
+        async def mock_local_query(repo):
+            for _ in []:
+                yield  # pragma: no cover
+
+        async def Factory() -> object:
+            return "Details"  # pragma: no cover
+
+        async def mock_github_query(repo):
+            yield ResultInfo(repo, ("GitHubSource", "issues"), "1", DeferredInfo("1 issue", Factory))
+
         with (
             patch("AllGitStatus.MainApp.EnumerateRepositories", side_effect=mock_enum),
-            patch.object(LocalGitSource, "Pull", new_callable=AsyncMock) as mock_pull,
+            patch("AllGitStatus.MainApp.LocalGitSource.Query", side_effect=mock_local_query),
+            patch("AllGitStatus.MainApp.GitHubSource.Query", side_effect=mock_github_query),
         ):
-            app = MainApp(working_dir=working_dir, github_pat=None)
+            app = self._CreateApp(working_dir, self.FakeClock())
 
             async with app.run_test() as pilot:
-                # Wait for initial load
-                await pilot.pause()
-                await asyncio.sleep(0.1)
-                await pilot.pause()
-
-                # Set state data with remote changes so pull is enabled
-                app._state_data[0] = {
-                    RemoteColumn.value: {"has_remote_changes": True, "has_local_changes": False}
-                }
-                app.refresh_bindings()
-                await pilot.pause()
+                await self._WaitForLoad(pilot)
 
-                # Press 'p' to pull
-                await pilot.press("p")
-                await pilot.pause()
+                await app._PollRepository(repos[0], 0)
 
-                # Pull should have been called
-                mock_pull.assert_called_once()
+                assert app._poller is not None
+                assert app._poller.GetInterval(0) == AdaptivePoller.DEFAULT_INITIAL_INTERVAL * 2
 
     # ----------------------------------------------------------------------
     @pytest.mark.asyncio
-    async def test_action_push_selected_calls_push(self, working_dir: Path) -> None:
-        """action_PushSelected calls LocalGitSource.Push."""
+    async def test_repositories_refreshed_while_polling(self, working_dir: Path) -> None:
+        """Results are discarded when the repositories are refreshed while a repository is polled."""
 
-        repos = [create_mock_repository(working_dir / "repo1")]
+        repos = [create_mock_repository(working_dir / "repo1", "https://github.com/testowner/repo1.git")]
+        polling = False
+        app: MainApp | None = None
 
         async def mock_enum(wd):
             for repo in repos:
                 yield repo
 
+        async def mock_local_query(repo):
+            for _ in []:
+                yield  # pragma: no cover
+
+        async def mock_github_query(repo):
+            if polling:
+                assert app is not None
+                assert app._repositories is not None
+
+                app._repositories = list(app._repositories)
+
+            yield ResultInfo(repo, ("GitHubSource", "stars"), "2" if polling else "1", "")
+
         with (
             patch("AllGitStatus.MainApp.EnumerateRepositories", side_effect=mock_enum),
-            patch.object(LocalGitSource, "Push", new_callable=AsyncMock) as mock_push,
+            patch("AllGitStatus.MainApp.LocalGitSource.Query", side_effect=mock_local_query),
+            patch("AllGitStatus.MainApp.GitHubSource.Query", side_effect=mock_github_query),
         ):
-            app = MainApp(working_dir=working_dir, github_pat=None)
+            app = self._CreateApp(working_dir, self.FakeClock())
 
             async with app.run_test() as pilot:
-                # Wait for initial load
-                await pilot.pause()
-                await asyncio.sleep(0.1)
-                await pilot.pause()
+                await self._WaitForLoad(pilot)
 
-                # Set state data with local changes so push is enabled
-                app._state_data[0] = {
-                    RemoteColumn.value: {"has_remote_changes": False, "has_local_changes": True}
-                }
-                app.refresh_bindings()
-                await pilot.pause()
+                polling = True
+                await app._PollRepository(repos[0], 0)
 
-                # Press 'P' to push
-                await pilot.press("P")
-                await pilot.pause()
+                assert str(app._data_table.get_cell_at(Coordinate(0, StarsColumn.value))) == "1"
 
-                # Push should have been called
-                mock_push.assert_called_once()
+                assert app._poller is not None
+                assert app._poller.GetInterval(0) == AdaptivePoller.DEFAULT_INITIAL_INTERVAL
 
 
 # ----------------------------------------------------------------------
-class TestMainAppPopulateCell:
-    """Tests for _PopulateCell method."""
+class TestMainAppEventsRefresh:
+    """Tests for refreshing repositories when their owner's events feed reveals activity."""
 
     # ----------------------------------------------------------------------
     @pytest.mark.asyncio
-    async def test_populate_cell_with_error_info(self, working_dir: Path) -> None:
-        """_PopulateCell handles ErrorInfo correctly."""
+    async def test_active_repositories_are_polled(self, working_dir: Path) -> None:
+        """Only the repositories with activity are polled."""
 
-        repos = [create_mock_repository(working_dir / "repo1")]
+        repos = [
+            Repository(working_dir / "repo1", "https://github.com/TestOwner/Repo1.git", "TestOwner", "Repo1"),
+            Repository(working_dir / "repo2", "https://github.com/testowner/repo2.git", "testowner", "repo2"),
+        ]
 
         async def mock_enum(wd):
             for repo in repos:
                 yield repo
 
-        with patch("AllGitStatus.MainApp.EnumerateRepositories", side_effect=mock_enum):
-            app = MainApp(working_dir=working_dir, github_pat=None)
+        async def mock_local_query(repo):
+            for _ in []:
+                yield  # pragma: no cover
+
+        async def mock_github_query(repo):
+            yield ResultInfo(repo, ("GitHubSource", "stars"), "1", "")
+
+        with (
+            patch("AllGitStatus.MainApp.EnumerateRepositories", side_effect=mock_enum),
+            patch("AllGitStatus.MainApp.LocalGitSource.Query", side_effect=mock_local_query),
+            patch("AllGitStatus.MainApp.GitHubSource.Query", side_effect=mock_github_query),
+            patch(
+                "AllGitStatus.MainApp.GitHubEventsFeed.GetActiveRepositories",
+                AsyncMock(return_value={"testowner/repo1"}),
+            ),
+        ):
+            app = MainApp(working_dir=working_dir, github_pat=None, events_refresh=True)
 
             async with app.run_test() as pilot:
-                # Wait for initial load
                 await pilot.pause()
                 await asyncio.sleep(0.1)
                 await pilot.pause()
 
-                # Create an ErrorInfo and call _PopulateCell
-                error_info = ErrorInfo(
-                    repo=repos[0],
-                    key=("LocalGitSource", "current_branch"),
-                    error=ValueError("Test error"),
-                )
+                assert app._github_events_feed is not None
 
-                await app._PopulateCell(0, error_info)
-                await pilot.pause()
+                # Repositories are not polled until the feed reveals activity
+                assert app._poller is not None
+                assert app._poller.GetDue() == []
 
-                # Verify the cell was updated with error indicator
-                cell_value = app._data_table.get_cell_at(Coordinate(0, BranchColumn.value))
-                assert "💥" in str(cell_value)
+                with patch.object(app, "_PollRepository") as mock_poll:
+                    await app._OnPollTimer()
 
-                # The additional_info_data should contain a Traceback
-                assert 0 in app._additional_info_data
-                assert BranchColumn.value in app._additional_info_data[0]
+                    # Wait for the feed to be polled
+                    await app.workers.wait_for_complete()
 
-    # ----------------------------------------------------------------------
-    @pytest.mark.asyncio
-    async def test_populate_cell_with_result_info_with_state_data(self, working_dir: Path) -> None:
-        """_PopulateCell handles ResultInfo with state_data correctly."""
+                    mock_poll.assert_not_called()
 
-        repos = [create_mock_repository(working_dir / "repo1")]
+                    await app._OnPollTimer()
 
-        async def mock_enum(wd):
-            for repo in repos:
-                yield repo
+                    mock_poll.assert_called_once_with(repos[0], 0)
 
-        with patch("AllGitStatus.MainApp.EnumerateRepositories", side_effect=mock_enum):
-            app = MainApp(working_dir=working_dir, github_pat=None)
+    # ----------------------------------------------------------------------
+    @pytest.mark.asyncio
+    async def test_feed_not_due(self, working_dir: Path) -> None:
+        """The feed is not polled when it isn't due."""
+
+        with patch("AllGitStatus.MainApp.EnumerateRepositories", side_effect=mock_enumerate_repositories):
+            app = MainApp(working_dir=working_dir, github_pat=None, events_refresh=True)
 
             async with app.run_test() as pilot:
-                # Wait for initial load
                 await pilot.pause()
                 await asyncio.sleep(0.1)
                 await pilot.pause()
 
-                # Create a ResultInfo with state_data
-                result_info = ResultInfo(
-                    repo=repos[0],
-                    key=("LocalGitSource", "remote_status"),
-                    display_value="  0 🔼   0 🔽",
-                    additional_info="No changes",
-                    state_data={"has_local_changes": True, "has_remote_changes": False},
-                )
-
-                await app._PopulateCell(0, result_info)
-                await pilot.pause()
-
-                # Verify the cell was populated with the display value
-                cell_value = app._data_table.get_cell_at(Coordinate(0, RemoteColumn.value))
-                assert "0 🔼" in str(cell_value), (cell_value, result_info.additional_info)
-                assert "0 🔽" in str(cell_value), (cell_value, result_info.additional_info)
-
-                # Verify additional_info was stored
-                assert 0 in app._additional_info_data
-                assert RemoteColumn.value in app._additional_info_data[0]
-                assert app._additional_info_data[0][RemoteColumn.value] == "No changes"
+                with (
+                    patch("AllGitStatus.MainApp.GitHubEventsFeed.is_due", False),
+                    patch.object(app, "_PollEventsFeed") as mock_poll_events_feed,
+                ):
+                    await app._OnPollTimer()
 
-                # Verify state_data was stored
-                assert 0 in app._state_data
-                assert RemoteColumn.value in app._state_data[0]
-                state_data = app._state_data[0][RemoteColumn.value]
-                assert state_data["has_local_changes"] is True  # ty: ignore[not-subscriptable]
-                assert state_data["has_remote_changes"] is False  # ty: ignore[not-subscriptable]
+                    mock_poll_events_feed.assert_not_called()
 
     # ----------------------------------------------------------------------
     @pytest.mark.asyncio
-    async def test_populate_cell_with_error_info_debug_mode(self, working_dir: Path) -> None:
-        """_PopulateCell includes traceback in debug mode."""
+    async def test_repositories_refreshed_while_polling_feed(self, working_dir: Path) -> None:
+        """Activity is ignored when the repositories are refreshed while the feed is polled."""
 
-        repos = [create_mock_repository(working_dir / "repo1")]
-
-        async def mock_enum(wd):
-            for repo in repos:
-                yield repo
-
-        with patch("AllGitStatus.MainApp.EnumerateRepositories", side_effect=mock_enum):
-            # Create app with debug mode enabled
-            app = MainApp(working_dir=working_dir, github_pat=None, debug=True)
+        with patch("AllGitStatus.MainApp.EnumerateRepositories", side_effect=mock_enumerate_repositories):
+            app = MainApp(working_dir=working_dir, github_pat=None, events_refresh=True)
 
             async with app.run_test() as pilot:
-                # Wait for initial load
                 await pilot.pause()
                 await asyncio.sleep(0.1)
                 await pilot.pause()
 
-                # Create an ErrorInfo with a real exception that has a traceback
-                try:
-                    raise ValueError("Test error with traceback")
-                except ValueError as e:
-                    error_info = ErrorInfo(
-                        repo=repos[0],
-                        key=("LocalGitSource", "current_branch"),
-                        error=e,
-                    )
+                stale_feed = AsyncMock()
+                stale_feed.GetActiveRepositories = AsyncMock(return_value={"testowner/testrepo"})
 
-                await app._PopulateCell(0, error_info)
-                await pilot.pause()
+                assert app._poller is not None
 
-                # Verify the cell was updated
-                assert 0 in app._additional_info_data
-                assert BranchColumn.value in app._additional_info_data[0]
+                with patch.object(app._poller, "MarkDue") as mock_mark_due:
+                    await app._PollEventsFeed(stale_feed)
+
+                    mock_mark_due.assert_not_called()
 
 
 # ----------------------------------------------------------------------
@@ -785,8 +1825,7 @@ class TestMainAppRepoNameDisplay:
                 assert len(app._repositories) == 1
 
                 # The additional_info_data should have the name entry
-                assert 0 in app._additional_info_data
-                assert NameColumn.value in app._additional_info_data[0]
+                assert app._additional_info_data.Get(0, NameColumn.value) is not None
 
 
 # ----------------------------------------------------------------------
@@ -1303,7 +2342,7 @@ class TestPendingIconDisplay:
                 )
 
                 await app._PopulateCell(0, result_info)
-                await pilot.pause()
+                await pilot.pause(MainApp.CELL_UPDATE_INTERVAL * 2)
 
                 # The cell should now show "main", not the pending icon
                 branch_cell = app._data_table.get_cell_at(Coordinate(0, BranchColumn.value))
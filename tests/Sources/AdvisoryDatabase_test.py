@@ -0,0 +1,265 @@
+"""Unit tests for AllGitStatus.Sources.AdvisoryDatabase module."""
+
+import json
+import zipfile
+
+from collections.abc import AsyncIterator, Iterator
+from pathlib import Path
+
+import aiohttp
+import pytest
+
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from AllGitStatus.Sources.AdvisoryDatabase import AdvisoryDatabase
+from AllGitStatus.Sources.DependencyVulnerabilities import Pin, Vulnerability
+
+
+# ----------------------------------------------------------------------
+RECORDS = [
+    {
+        "id": "GHSA-versions",
+        "summary": "Enumerated versions",
+        "database_specific": {"severity": "HIGH"},
+        "affected": [
+            {
+                "package": {"ecosystem": "PyPI", "name": "Requests"},
+                "ranges": [{"type": "ECOSYSTEM", "events": [{"introduced": "0"}, {"fixed": "2.1"}]}],
+                "versions": ["1.0", "2.0"],
+            },
+        ],
+    },
+    {
+        "id": "GHSA-ranges",
+        "details": "\nFixed and last affected ranges\n\nMore details",
+        "affected": [
+            {
+                "package": {"ecosystem": "PyPI", "name": "urllib3"},
+                "ranges": [
+                    {"type": "GIT", "events": [{"introduced": "0"}, {"fixed": "abcdef"}]},
+                    {
+                        "type": "ECOSYSTEM",
+                        "events": [
+                            {"introduced": "1.0"},
+                            {"fixed": "1.5"},
+                            {"introduced": "2.0"},
+                            {"last_affected": "2.2"},
+                            {"introduced": "3.0.0"},
+                        ],
+                    },
+                ],
+            },
+            {"package": {"ecosystem": "npm", "name": "urllib3"}, "versions": ["1.0"]},
+        ],
+    },
+    {
+        "id": "PYSEC-withdrawn",
+        "withdrawn": "2024-01-01T00:00:00Z",
+        "affected": [{"package": {"ecosystem": "PyPI", "name": "requests"}, "versions": ["1.0"]}],
+    },
+]
+
+
+# ----------------------------------------------------------------------
+@pytest.fixture
+def database(tmp_path: Path) -> Iterator[AdvisoryDatabase]:
+    """Create a database with the test records."""
+
+    database = AdvisoryDatabase(tmp_path / "Advisories.db")
+
+    try:
+        database.Import(RECORDS)
+        yield database
+    finally:
+        database.Close()
+
+
+# ----------------------------------------------------------------------
+def create_archive(path: Path, records: list[dict]) -> Path:
+    """Create an OSV export that contains the records."""
+
+    with zipfile.ZipFile(path, "w") as zip_file:
+        for record in records:
+            zip_file.writestr(f"{record['id']}.json", json.dumps(record))
+
+    return path
+
+
+# ----------------------------------------------------------------------
+class TestAdvisoryDatabaseQuery:
+    """Tests for querying the database."""
+
+    # ----------------------------------------------------------------------
+    def test_enumerated_versions(self, database: AdvisoryDatabase) -> None:
+        """Affected versions are matched exactly, and withdrawn advisories are ignored."""
+
+        assert database.Query([Pin("requests", "1.0"), Pin("requests", "2.0.1"), Pin("idna", "1.0")]) == {
+            Pin("requests", "1.0"): [Vulnerability("GHSA-versions", "Enumerated versions", "high")],
+        }
+
+    # ----------------------------------------------------------------------
+    @pytest.mark.parametrize(
+        ("version", "is_affected"),
+        [
+            ("0.9", False),
+            ("1", True),
+            ("1.4.9", True),
+            ("1.5.0", False),
+            ("2.0", True),
+            ("2.2", True),
+            ("2.2.1", False),
+            ("3.0", True),
+            ("10.0", True),
+            ("1.2rc1", False),
+        ],
+    )
+    def test_ranges(self, database: AdvisoryDatabase, version: str, is_affected: bool) -> None:  # noqa: FBT001
+        """Versions are matched against ranges when affected versions aren't enumerated."""
+
+        expected = (
+            {Pin("urllib3", version): [Vulnerability("GHSA-ranges", "Fixed and last affected ranges")]}
+            if is_affected
+            else {}
+        )
+
+        assert database.Query([Pin("urllib3", version)]) == expected
+
+    # ----------------------------------------------------------------------
+    def test_empty(self, tmp_path: Path) -> None:
+        """Vulnerabilities are not available before the snapshot is imported."""
+
+        database = AdvisoryDatabase(tmp_path / "Advisories.db")
+
+        try:
+            assert database.synced is None
+            assert database.Query([Pin("requests", "1.0")]) is None
+
+            # An empty export is a valid snapshot
+            database.Import([])
+
+            assert database.Query([Pin("requests", "1.0")]) == {}
+        finally:
+            database.Close()
+
+
+# ----------------------------------------------------------------------
+class TestAdvisoryDatabaseImport:
+    """Tests for importing the snapshot."""
+
+    # ----------------------------------------------------------------------
+    def test_import_replaces_snapshot(self, database: AdvisoryDatabase, tmp_path: Path) -> None:
+        """Importing an export replaces the previous snapshot."""
+
+        previous_synced = database.synced
+        assert previous_synced is not None
+
+        database.ImportArchive(create_archive(tmp_path / "all.zip", RECORDS[1:]))
+
+        assert database.Query([Pin("requests", "1.0")]) == {}
+        assert database.Query([Pin("urllib3", "1.0")]) != {}
+
+        synced = database.synced
+        assert synced is not None
+        assert synced >= previous_synced
+
+    # ----------------------------------------------------------------------
+    def test_malformed_records_are_skipped(self, tmp_path: Path) -> None:
+        """Malformed records are skipped, and the other records are imported."""
+
+        database = AdvisoryDatabase(tmp_path / "Advisories.db")
+
+        try:
+            database.Import(
+                [
+                    {"summary": "No id"},
+                    {
+                        "id": "GHSA-no-name",
+                        "affected": [
+                            {"package": {"ecosystem": "PyPI", "name": "idna"}, "versions": ["1.0"]},
+                            {"package": {"ecosystem": "PyPI"}, "versions": ["1.0"]},
+                        ],
+                    },
+                    *RECORDS,
+                ],
+            )
+
+            assert database.synced is not None
+            assert database.Query([Pin("idna", "1.0")]) == {}
+            assert database.Query([Pin("requests", "1.0")]) == {
+                Pin("requests", "1.0"): [Vulnerability("GHSA-versions", "Enumerated versions", "high")],
+            }
+        finally:
+            database.Close()
+
+    # ----------------------------------------------------------------------
+    def test_snapshot_is_persisted(self, database: AdvisoryDatabase, tmp_path: Path) -> None:
+        """The snapshot is available when the database is opened again."""
+
+        database.Close()
+
+        database = AdvisoryDatabase(tmp_path / "Advisories.db")
+
+        try:
+            assert database.synced is not None
+            assert database.Query([Pin("requests", "2.0")]) != {}
+        finally:
+            database.Close()
+
+
+# ----------------------------------------------------------------------
+class TestAdvisoryDatabaseSync:
+    """Tests for downloading the snapshot."""
+
+    # ----------------------------------------------------------------------
+    @pytest.fixture
+    async def server(self, tmp_path: Path) -> AsyncIterator[TestServer]:
+        """Create a local server that provides the export."""
+
+        archive = create_archive(tmp_path / "export.zip", RECORDS)
+
+        # ----------------------------------------------------------------------
+        async def Handler(request: web.Request) -> web.Response:  # noqa: ARG001
+            return web.Response(body=archive.read_bytes())
+
+        # ----------------------------------------------------------------------
+
+        web_app = web.Application()
+        web_app.router.add_get("/all.zip", Handler)
+
+        test_server = TestServer(web_app, host="127.0.0.1")
+
+        async with test_server:
+            yield test_server
+
+    # ----------------------------------------------------------------------
+    @pytest.mark.asyncio
+    async def test_sync(self, server: TestServer, tmp_path: Path) -> None:
+        """The export is downloaded and imported."""
+
+        database = AdvisoryDatabase(tmp_path / "cache" / "Advisories.db")
+
+        try:
+            async with aiohttp.ClientSession() as session:
+                await database.Sync(session, str(server.make_url("/all.zip")))
+
+            assert database.synced is not None
+            assert database.Query([Pin("requests", "1.0")]) != {}
+        finally:
+            database.Close()
+
+    # ----------------------------------------------------------------------
+    @pytest.mark.asyncio
+    async def test_sync_error(self, server: TestServer, tmp_path: Path) -> None:
+        """Errors are raised when the export can't be downloaded."""
+
+        database = AdvisoryDatabase(tmp_path / "Advisories.db")
+
+        try:
+            async with aiohttp.ClientSession() as session:
+                with pytest.raises(aiohttp.ClientResponseError):
+                    await database.Sync(session, str(server.make_url("/missing.zip")))
+
+            assert database.synced is None
+        finally:
+            database.Close()
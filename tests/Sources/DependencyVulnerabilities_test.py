@@ -0,0 +1,398 @@
+"""Unit tests for AllGitStatus.Sources.DependencyVulnerabilities module."""
+
+import asyncio
+import textwrap
+
+from pathlib import Path
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from AllGitStatus.Repository import Repository
+from AllGitStatus.Sources.DependencyVulnerabilities import (
+    DependencyVulnerabilities,
+    FindLockfiles,
+    NormalizeName,
+    NormalizeSeverity,
+    ParseLockfile,
+    Pin,
+    Vulnerability,
+)
+
+
+# ----------------------------------------------------------------------
+def create_repository(path: Path, packages: list[tuple[str, str]] | None) -> Repository:
+    """Create a repository whose uv.lock file pins the packages (no uv.lock file when None)."""
+
+    path.mkdir(parents=True)
+
+    if packages is not None:
+        (path / "uv.lock").write_text(
+            "version = 1\n"
+            + "".join(
+                textwrap.dedent(
+                    f"""\
+
+                    [[package]]
+                    name = "{name}"
+                    version = "{version}"
+                    source = {{ registry = "https://pypi.org/simple" }}
+                    """,
+                )
+                for name, version in packages
+            ),
+        )
+
+    return Repository(path=path)
+
+
+# ----------------------------------------------------------------------
+def create_mock_session(
+    vulnerabilities: dict[tuple[str, str], list[str]],
+    page_size: int | None = None,
+) -> MagicMock:
+    """Create a mock session that responds to OSV requests."""
+
+    session = MagicMock()
+    session.requests = []
+
+    # ----------------------------------------------------------------------
+    def CreateContextManager(json_data: object) -> MagicMock:
+        response = MagicMock()
+        response.raise_for_status = MagicMock()
+        response.json = AsyncMock(return_value=json_data)
+
+        cm = MagicMock()
+        cm.__aenter__ = AsyncMock(return_value=response)
+        cm.__aexit__ = AsyncMock(return_value=None)
+        return cm
+
+    # ----------------------------------------------------------------------
+    def Post(url: str, json: dict) -> MagicMock:
+        session.requests.append((url, json))
+
+        results = []
+
+        for query in json["queries"]:
+            ids = vulnerabilities.get((query["package"]["name"], query["version"]), [])
+            offset = int(query.get("page_token", 0))
+
+            result: dict = {}
+
+            if page_size is not None:
+                if offset + page_size < len(ids):
+                    result["next_page_token"] = str(offset + page_size)
+
+                ids = ids[offset : offset + page_size]
+
+            if ids:
+                result["vulns"] = [{"id": id_, "modified": "2024-01-01T00:00:00Z"} for id_ in ids]
+
+            results.append(result)
+
+        return CreateContextManager({"results": results})
+
+    # ----------------------------------------------------------------------
+    def Get(url: str) -> MagicMock:
+        session.requests.append((url, None))
+
+        id_ = url.rsplit("/", 1)[-1]
+
+        if id_.startswith("DETAILS-"):
+            return CreateContextManager({"id": id_, "details": "\nFirst line\nSecond line"})
+
+        if id_.startswith("CRITICAL-"):
+            return CreateContextManager(
+                {"id": id_, "summary": f"Summary of {id_}", "database_specific": {"severity": "CRITICAL"}},
+            )
+
+        return CreateContextManager({"id": id_, "summary": f"Summary of {id_}"})
+
+    # ----------------------------------------------------------------------
+
+    session.post = Post
+    session.get = Get
+
+    return session
+
+
+# ----------------------------------------------------------------------
+class TestFindLockfiles:
+    """Tests for FindLockfiles."""
+
+    # ----------------------------------------------------------------------
+    def test_monorepo(self, tmp_path: Path) -> None:
+        """Lockfiles of the workspace and of other projects are found, and excluded directories are pruned."""
+
+        for filename in [
+            "uv.lock",
+            "pyproject.toml",
+            "packages/member/pyproject.toml",  # Workspace member (uses the root lockfile)
+            "tools/standalone/pyproject.toml",
+            "tools/standalone/uv.lock",
+            ".venv/lib/uv.lock",
+            "web/node_modules/package/uv.lock",
+            "nested/.git/HEAD",
+            "nested/uv.lock",
+        ]:
+            (tmp_path / filename).parent.mkdir(parents=True, exist_ok=True)
+            (tmp_path / filename).touch()
+
+        assert FindLockfiles(tmp_path) == [
+            tmp_path / "tools" / "standalone" / "uv.lock",
+            tmp_path / "uv.lock",
+        ]
+
+
+# ----------------------------------------------------------------------
+class TestParseLockfile:
+    """Tests for ParseLockfile."""
+
+    # ----------------------------------------------------------------------
+    def test_registry_packages(self, tmp_path: Path) -> None:
+        """Only packages resolved from a registry are returned, with normalized names."""
+
+        lockfile = tmp_path / "uv.lock"
+        lockfile.write_text(
+            textwrap.dedent(
+                """\
+                version = 1
+
+                [[package]]
+                name = "Some_Package"
+                version = "1.0"
+                source = { registry = "https://pypi.org/simple" }
+
+                [[package]]
+                name = "project"
+                version = "0.1.0"
+                source = { editable = "." }
+
+                [[package]]
+                name = "from-git"
+                version = "2.0"
+                source = { git = "https://github.com/owner/repo" }
+                """,
+            ),
+        )
+
+        assert ParseLockfile(lockfile) == [Pin("some-package", "1.0")]
+
+    # ----------------------------------------------------------------------
+    def test_normalize_name(self) -> None:
+        """Names are normalized."""
+
+        assert NormalizeName("Foo.Bar__baz") == "foo-bar-baz"
+
+    # ----------------------------------------------------------------------
+    @pytest.mark.parametrize(
+        ("severity", "expected"),
+        [("CRITICAL", "critical"), ("Moderate", "medium"), ("low", "low"), ("UNKNOWN", None), (7.5, None)],
+    )
+    def test_normalize_severity(self, severity: object, expected: str | None) -> None:
+        """Severities are normalized."""
+
+        assert NormalizeSeverity(severity) == expected
+
+
+# ----------------------------------------------------------------------
+class TestDependencyVulnerabilities:
+    """Tests for DependencyVulnerabilities."""
+
+    # ----------------------------------------------------------------------
+    @pytest.mark.asyncio
+    async def test_unique_pins_are_queried_once(self, tmp_path: Path) -> None:
+        """Pins shared by repositories are queried once, and vulnerabilities are mapped to each repository."""
+
+        repo1 = create_repository(tmp_path / "repo1", [("requests", "2.0"), ("urllib3", "1.0")])
+        repo2 = create_repository(tmp_path / "repo2", [("requests", "2.0"), ("idna", "3.0")])
+
+        session = create_mock_session(
+            {
+                ("requests", "2.0"): ["GHSA-1", "GHSA-2"],
+                ("idna", "3.0"): ["GHSA-2"],
+            },
+        )
+
+        dependency_vulnerabilities = DependencyVulnerabilities(session, [repo1, repo2])
+
+        assert await dependency_vulnerabilities.GetVulnerabilities(repo1.path / "uv.lock") == {
+            Pin("requests", "2.0"): [
+                Vulnerability("GHSA-1", "Summary of GHSA-1"),
+                Vulnerability("GHSA-2", "Summary of GHSA-2"),
+            ],
+        }
+
+        assert await dependency_vulnerabilities.GetVulnerabilities(repo2.path / "uv.lock") == {
+            Pin("idna", "3.0"): [Vulnerability("GHSA-2", "Summary of GHSA-2")],
+            Pin("requests", "2.0"): [
+                Vulnerability("GHSA-1", "Summary of GHSA-1"),
+                Vulnerability("GHSA-2", "Summary of GHSA-2"),
+            ],
+        }
+
+        queries = [
+            query for url, query in session.requests if url == DependencyVulnerabilities.QUERY_BATCH_URL
+        ]
+
+        assert len(queries) == 1
+        assert [(query["package"]["name"], query["version"]) for query in queries[0]["queries"]] == [
+            ("idna", "3.0"),
+            ("requests", "2.0"),
+            ("urllib3", "1.0"),
+        ]
+
+        # Each vulnerability's details are retrieved once
+        assert sorted(url for url, query in session.requests if query is None) == [
+            "https://api.osv.dev/v1/vulns/GHSA-1",
+            "https://api.osv.dev/v1/vulns/GHSA-2",
+        ]
+
+    # ----------------------------------------------------------------------
+    @pytest.mark.asyncio
+    async def test_batches_and_pages(self, tmp_path: Path) -> None:
+        """Pins are queried in batches, and vulnerabilities are retrieved across pages."""
+
+        repo = create_repository(tmp_path / "repo", [("a", "1"), ("b", "1"), ("c", "1")])
+
+        session = create_mock_session({("a", "1"): ["ID-1", "CRITICAL-2", "DETAILS-3"]}, page_size=2)
+
+        dependency_vulnerabilities = DependencyVulnerabilities(session, [repo], max_batch_size=2)
+
+        assert await dependency_vulnerabilities.GetVulnerabilities(repo.path / "uv.lock") == {
+            Pin("a", "1"): [
+                Vulnerability("ID-1", "Summary of ID-1"),
+                Vulnerability("CRITICAL-2", "Summary of CRITICAL-2", "critical"),
+                Vulnerability("DETAILS-3", "First line"),
+            ],
+        }
+
+        # Batches are queried concurrently
+        assert sorted(
+            [query["package"]["name"] for query in json["queries"]]
+            for url, json in session.requests
+            if url == DependencyVulnerabilities.QUERY_BATCH_URL
+        ) == [["a"], ["a", "b"], ["c"]]
+
+    # ----------------------------------------------------------------------
+    @pytest.mark.asyncio
+    async def test_unavailable(self, tmp_path: Path) -> None:
+        """Vulnerabilities are not available for repositories without a valid lockfile."""
+
+        no_lockfile = create_repository(tmp_path / "no_lockfile", None)
+        invalid_lockfile = create_repository(tmp_path / "invalid_lockfile", None)
+
+        (invalid_lockfile.path / "uv.lock").write_text("not toml = = =")
+
+        dependency_vulnerabilities = DependencyVulnerabilities(
+            create_mock_session({}),
+            [no_lockfile, invalid_lockfile],
+        )
+
+        assert await dependency_vulnerabilities.GetVulnerabilities(no_lockfile.path / "uv.lock") is None
+        assert await dependency_vulnerabilities.GetVulnerabilities(invalid_lockfile.path / "uv.lock") is None
+
+    # ----------------------------------------------------------------------
+    @pytest.mark.asyncio
+    async def test_errors(self, tmp_path: Path) -> None:
+        """Vulnerabilities are not available when the advisory database can't be queried."""
+
+        repo = create_repository(tmp_path / "repo", [("a", "1")])
+
+        session = MagicMock()
+        session.post = MagicMock(side_effect=ConnectionError("offline"))
+
+        dependency_vulnerabilities = DependencyVulnerabilities(session, [repo])
+
+        assert await dependency_vulnerabilities.GetVulnerabilities(repo.path / "uv.lock") is None
+        assert await dependency_vulnerabilities.GetVulnerabilities(repo.path / "uv.lock") is None
+
+        assert session.post.call_count == 1
+
+    # ----------------------------------------------------------------------
+    @pytest.mark.asyncio
+    async def test_advisory_database(self, tmp_path: Path) -> None:
+        """Vulnerabilities are retrieved from the local advisory database without network access."""
+
+        repo = create_repository(tmp_path / "repo", [("a", "1"), ("b", "1")])
+
+        advisory_database = MagicMock()
+        advisory_database.Query = MagicMock(return_value={Pin("a", "1"): [Vulnerability("ID-1", "Summary")]})
+
+        dependency_vulnerabilities = DependencyVulnerabilities(
+            None, [repo], advisory_database=advisory_database
+        )
+
+        assert await dependency_vulnerabilities.GetVulnerabilities(repo.path / "uv.lock") == {
+            Pin("a", "1"): [Vulnerability("ID-1", "Summary")],
+        }
+
+        advisory_database.Query.assert_called_once_with([Pin("a", "1"), Pin("b", "1")])
+
+    # ----------------------------------------------------------------------
+    @pytest.mark.asyncio
+    async def test_advisory_database_not_imported(self, tmp_path: Path) -> None:
+        """Vulnerabilities are not available when the local snapshot has never been imported."""
+
+        repo = create_repository(tmp_path / "repo", [("a", "1")])
+
+        advisory_database = MagicMock()
+        advisory_database.Query = MagicMock(return_value=None)
+
+        dependency_vulnerabilities = DependencyVulnerabilities(
+            None, [repo], advisory_database=advisory_database
+        )
+
+        assert await dependency_vulnerabilities.GetVulnerabilities(repo.path / "uv.lock") is None
+
+    # ----------------------------------------------------------------------
+    @pytest.mark.asyncio
+    async def test_advisory_database_sync(self, tmp_path: Path) -> None:
+        """The local snapshot is queried once it has been synced."""
+
+        repo = create_repository(tmp_path / "repo", [("a", "1")])
+
+        advisory_database = MagicMock()
+        advisory_database.Query = MagicMock(return_value={})
+
+        synced = asyncio.Event()
+
+        dependency_vulnerabilities = DependencyVulnerabilities(
+            None,
+            [repo],
+            advisory_database=advisory_database,
+            wait_for_advisory_database=synced.wait,
+        )
+
+        task = asyncio.create_task(dependency_vulnerabilities.GetVulnerabilities(repo.path / "uv.lock"))
+
+        await asyncio.sleep(0.05)
+
+        assert not task.done()
+        advisory_database.Query.assert_not_called()
+
+        synced.set()
+
+        assert await task == {}
+        advisory_database.Query.assert_called_once_with([Pin("a", "1")])
+
+    # ----------------------------------------------------------------------
+    @pytest.mark.asyncio
+    async def test_monorepo(self, tmp_path: Path) -> None:
+        """Each lockfile within a repository is resolved."""
+
+        repo = create_repository(tmp_path / "repo", [("a", "1")])
+        create_repository(tmp_path / "repo" / "tools" / "standalone", [("b", "1")])
+
+        session = create_mock_session({("a", "1"): ["ID-1"], ("b", "1"): ["ID-2"]})
+
+        dependency_vulnerabilities = DependencyVulnerabilities(session, [repo])
+
+        assert await dependency_vulnerabilities.GetVulnerabilities(repo.path / "uv.lock") == {
+            Pin("a", "1"): [Vulnerability("ID-1", "Summary of ID-1")],
+        }
+        assert await dependency_vulnerabilities.GetVulnerabilities(
+            repo.path / "tools" / "standalone" / "uv.lock",
+        ) == {
+            Pin("b", "1"): [Vulnerability("ID-2", "Summary of ID-2")],
+        }
@@ -0,0 +1,106 @@
+"""Unit tests for AllGitStatus.Sources.GitHubCICDCache module."""
+
+from datetime import datetime, timedelta, UTC
+
+from AllGitStatus.Sources.GitHubCICDCache import CICDCacheEntry, GitHubCICDCache
+
+
+# ----------------------------------------------------------------------
+def create_entry(head_sha: str = "sha1", created: datetime | None = None) -> CICDCacheEntry:
+    """Create a cache entry."""
+
+    return CICDCacheEntry(
+        head_sha,
+        "2024-01-01T00:00:00Z",
+        [{"id": 1, "status": "completed"}, {"id": 2, "status": "queued"}],
+        created or datetime.now(UTC),
+    )
+
+
+# ----------------------------------------------------------------------
+class TestCICDCacheEntry:
+    """Tests for CICDCacheEntry."""
+
+    # ----------------------------------------------------------------------
+    def test_in_progress_runs(self) -> None:
+        """Runs that have not completed are in progress."""
+
+        assert create_entry().in_progress_runs == [{"id": 2, "status": "queued"}]
+
+
+# ----------------------------------------------------------------------
+class TestGitHubCICDCache:
+    """Tests for GitHubCICDCache."""
+
+    # ----------------------------------------------------------------------
+    def test_get(self) -> None:
+        """Entries are returned for the same branch and head commit."""
+
+        cache = GitHubCICDCache()
+        entry = create_entry()
+
+        cache.Set("Owner", "Repo", "main", entry)
+
+        assert cache.Get("owner", "repo", "main", "sha1") is entry
+        assert cache.Get("owner", "repo", "develop", "sha1") is None
+        assert cache.Get("owner", "other", "main", "sha1") is None
+
+    # ----------------------------------------------------------------------
+    def test_head_changed(self) -> None:
+        """Entries are not returned when the head commit has changed."""
+
+        cache = GitHubCICDCache()
+        cache.Set("owner", "repo", "main", create_entry())
+
+        assert cache.Get("owner", "repo", "main", "sha2") is None
+
+    # ----------------------------------------------------------------------
+    def test_max_age(self) -> None:
+        """Entries are not returned once they are older than max_age."""
+
+        cache = GitHubCICDCache(max_age=timedelta(minutes=5))
+        cache.Set("owner", "repo", "main", create_entry(created=datetime.now(UTC) - timedelta(minutes=10)))
+
+        assert cache.Get("owner", "repo", "main", "sha1") is None
+
+    # ----------------------------------------------------------------------
+    def test_remove(self) -> None:
+        """The entries and workflows of a repository are removed."""
+
+        cache = GitHubCICDCache()
+
+        for repo in ["repo", "other"]:
+            cache.Set("owner", repo, "main", create_entry())
+            cache.Set("owner", repo, "develop", create_entry())
+            cache.SetWorkflows("owner", repo, [{"id": 1}])
+
+        cache.Remove("Owner", "Repo")
+
+        assert cache.Get("owner", "repo", "main", "sha1") is None
+        assert cache.Get("owner", "repo", "develop", "sha1") is None
+        assert cache.GetWorkflows("owner", "repo") is None
+
+        assert cache.Get("owner", "other", "main", "sha1") is not None
+        assert cache.GetWorkflows("owner", "other") is not None
+
+        cache.Clear()
+
+        assert cache.Get("owner", "other", "main", "sha1") is None
+        assert cache.GetWorkflows("owner", "other") is None
+
+    # ----------------------------------------------------------------------
+    def test_workflows(self) -> None:
+        """Workflows are cached by repository until they are older than max_age."""
+
+        cache = GitHubCICDCache()
+
+        assert cache.GetWorkflows("owner", "repo") is None
+
+        cache.SetWorkflows("Owner", "Repo", [{"id": 1}])
+
+        assert cache.GetWorkflows("owner", "repo") == [{"id": 1}]
+
+        expired_cache = GitHubCICDCache(max_age=timedelta(0))
+        expired_cache.SetWorkflows("owner", "repo", [{"id": 1}])
+
+        assert expired_cache.GetWorkflows("owner", "repo") is None
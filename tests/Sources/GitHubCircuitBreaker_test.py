@@ -0,0 +1,112 @@
+"""Unit tests for AllGitStatus.Sources.GitHubCircuitBreaker module."""
+
+import asyncio
+
+import pytest
+
+from AllGitStatus.Sources.GitHubCircuitBreaker import CircuitOpenError, GitHubCircuitBreaker
+from TestHelpers import FakeClock
+
+
+# ----------------------------------------------------------------------
+class TestGitHubCircuitBreaker:
+    """Tests for GitHubCircuitBreaker."""
+
+    # ----------------------------------------------------------------------
+    @pytest.mark.asyncio
+    async def test_closed(self) -> None:
+        """Requests are not paused until the failure threshold is reached."""
+
+        clock = FakeClock()
+        circuit_breaker = GitHubCircuitBreaker(failure_threshold=2, clock=clock)
+
+        circuit_breaker.Report("host", success=False)
+        assert not circuit_breaker.IsOpen("host")
+
+        await circuit_breaker.Wait("host", clock.now)
+
+        # Successes reset the failure count
+        circuit_breaker.Report("host", success=True)
+        circuit_breaker.Report("host", success=False)
+        assert not circuit_breaker.IsOpen("host")
+
+    # ----------------------------------------------------------------------
+    @pytest.mark.asyncio
+    async def test_open(self) -> None:
+        """Requests are paused once the failure threshold is reached, and resume after a successful probe."""
+
+        clock = FakeClock()
+        circuit_breaker = GitHubCircuitBreaker(failure_threshold=2, open_duration=30.0, clock=clock)
+
+        circuit_breaker.Report("host", success=False)
+        circuit_breaker.Report("host", success=False)
+        assert circuit_breaker.IsOpen("host")
+        assert not circuit_breaker.IsOpen("other_host")
+
+        with pytest.raises(CircuitOpenError) as ex:
+            await circuit_breaker.Wait("host", clock.now + 29)
+
+        assert ex.value.host == "host"
+
+        clock.now += 30
+
+        # The first request probes the host; other requests wait for the probe
+        await circuit_breaker.Wait("host", clock.now)
+
+        with pytest.raises(CircuitOpenError):
+            await circuit_breaker.Wait("host", clock.now)
+
+        circuit_breaker.Report("host", success=True)
+
+        assert not circuit_breaker.IsOpen("host")
+        await circuit_breaker.Wait("host", clock.now)
+
+    # ----------------------------------------------------------------------
+    @pytest.mark.asyncio
+    async def test_failed_probe(self) -> None:
+        """Requests are paused again when the probe fails."""
+
+        clock = FakeClock()
+        circuit_breaker = GitHubCircuitBreaker(failure_threshold=1, open_duration=30.0, clock=clock)
+
+        circuit_breaker.Report("host", success=False)
+        clock.now += 30
+
+        await circuit_breaker.Wait("host", clock.now)
+        circuit_breaker.Report("host", success=False)
+
+        with pytest.raises(CircuitOpenError):
+            await circuit_breaker.Wait("host", clock.now + 29)
+
+    # ----------------------------------------------------------------------
+    @pytest.mark.asyncio
+    async def test_incomplete_probe(self) -> None:
+        """Another request probes the host when the probe does not complete."""
+
+        clock = FakeClock()
+        circuit_breaker = GitHubCircuitBreaker(failure_threshold=1, open_duration=30.0, clock=clock)
+
+        circuit_breaker.Report("host", success=False)
+        clock.now += 30
+
+        await circuit_breaker.Wait("host", clock.now)
+        circuit_breaker.Report("host", success=None)
+
+        await circuit_breaker.Wait("host", clock.now)
+        assert circuit_breaker.IsOpen("host")
+
+    # ----------------------------------------------------------------------
+    @pytest.mark.asyncio
+    async def test_wait(self) -> None:
+        """Paused requests wait until the host can be probed."""
+
+        circuit_breaker = GitHubCircuitBreaker(failure_threshold=1, open_duration=0.05)
+
+        circuit_breaker.Report("host", success=False)
+
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+
+        await circuit_breaker.Wait("host", float("inf"))
+
+        assert loop.time() - start >= 0.04
@@ -0,0 +1,115 @@
+"""Unit tests for AllGitStatus.Sources.GitHubConnection module."""
+
+from collections.abc import AsyncIterator
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import aiohttp
+import pytest
+
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+from yarl import URL
+
+from AllGitStatus.Sources.GitHubConnection import ConnectionMetrics, ConnectionStats, ConnectorConfig
+
+
+# ----------------------------------------------------------------------
+@pytest.fixture
+async def server() -> AsyncIterator[TestServer]:
+    """Create a local server that responds to every request."""
+
+    # ----------------------------------------------------------------------
+    async def Handler(request: web.Request) -> web.Response:  # noqa: ARG001
+        return web.json_response({"value": 1})
+
+    # ----------------------------------------------------------------------
+
+    web_app = web.Application()
+    web_app.router.add_get("/", Handler)
+
+    test_server = TestServer(web_app, host="127.0.0.1")
+
+    async with test_server:
+        yield test_server
+
+
+# ----------------------------------------------------------------------
+class TestConnectorConfig:
+    """Tests for ConnectorConfig."""
+
+    # ----------------------------------------------------------------------
+    @pytest.mark.asyncio
+    async def test_create_connector(self) -> None:
+        """The connector is created with the configuration."""
+
+        connector = ConnectorConfig(limit=20, limit_per_host=5, keepalive_timeout=30.0).CreateConnector()
+
+        try:
+            assert connector.limit == 20
+            assert connector.limit_per_host == 5
+        finally:
+            await connector.close()
+
+
+# ----------------------------------------------------------------------
+class TestConnectionMetrics:
+    """Tests for ConnectionMetrics."""
+
+    # ----------------------------------------------------------------------
+    def test_initial_stats(self) -> None:
+        """No metrics are available before requests are sent."""
+
+        assert ConnectionMetrics().stats == ConnectionStats(0, 0, 0, 0, 0, None, None)
+
+    # ----------------------------------------------------------------------
+    @pytest.mark.asyncio
+    async def test_time_to_first_byte(self) -> None:
+        """The average and maximum time to first byte are calculated."""
+
+        now = 0.0
+        on_changed = MagicMock()
+
+        metrics = ConnectionMetrics(on_changed, clock=lambda: now)
+
+        for duration in [0.1, 0.3]:
+            context = SimpleNamespace()
+
+            await metrics._OnRequestStart(MagicMock(), context, None)
+            now += duration
+            await metrics._OnRequestEnd(MagicMock(), context, None)
+
+        assert metrics.stats.requests == 2
+        assert metrics.stats.average_time_to_first_byte == pytest.approx(0.2)
+        assert metrics.stats.max_time_to_first_byte == pytest.approx(0.3)
+
+        assert on_changed.call_count == 2
+        assert on_changed.call_args.args[0] == metrics.stats
+
+    # ----------------------------------------------------------------------
+    @pytest.mark.asyncio
+    async def test_requests(self, server: TestServer) -> None:
+        """Connections and DNS lookups are counted as requests are sent."""
+
+        metrics = ConnectionMetrics()
+
+        async with aiohttp.ClientSession(
+            connector=ConnectorConfig().CreateConnector(),
+            trace_configs=[metrics.CreateTraceConfig()],
+        ) as session:
+            url = URL.build(scheme="http", host="localhost", port=server.port, path="/")
+
+            # The first connection is closed, so the second request creates a new connection (using the
+            # cached DNS lookup) which is reused by the third request
+            for headers in [{"Connection": "close"}, None, None]:
+                async with session.get(url, headers=headers) as response:
+                    assert await response.json() == {"value": 1}
+
+        stats = metrics.stats
+
+        assert stats.requests == 3
+        assert stats.new_connections == 2
+        assert stats.reused_connections == 1
+        assert stats.dns_lookups == 1
+        assert stats.dns_cache_hits == 1
+        assert stats.average_time_to_first_byte is not None
@@ -0,0 +1,138 @@
+"""Unit tests for AllGitStatus.Sources.GitHubEventsFeed module."""
+
+import pytest
+
+from AllGitStatus.Sources.GitHubEventsFeed import GitHubEventsFeed
+from TestHelpers import FakeClock, create_mock_response, create_mock_session, create_repository
+
+
+# ----------------------------------------------------------------------
+def create_event(event_id: int, repo: str) -> dict:
+    """Create an event."""
+
+    return {"id": str(event_id), "type": "PushEvent", "repo": {"name": repo}}
+
+
+# ----------------------------------------------------------------------
+class TestGitHubEventsFeed:
+    """Tests for GitHubEventsFeed."""
+
+    # ----------------------------------------------------------------------
+    @pytest.mark.asyncio
+    async def test_active_repositories(self) -> None:
+        """Repositories with events newer than those previously seen are active."""
+
+        clock = FakeClock()
+        session, requests = create_mock_session(
+            {
+                "https://api.github.com/orgs/org/events": [
+                    create_mock_response([create_event(2, "org/repo1"), create_event(1, "org/repo2")]),
+                    create_mock_response(
+                        [
+                            create_event(4, "Org/Repo2"),
+                            create_event(3, "org/repo3"),
+                            create_event(2, "org/repo1"),
+                        ]
+                    ),
+                ],
+            }
+        )
+
+        feed = GitHubEventsFeed(
+            session,
+            [
+                create_repository("Org", "repo1"),
+                create_repository("org", "repo2"),
+                create_repository(None, None),
+            ],
+            clock,
+        )
+
+        assert feed.is_due
+
+        # The first poll establishes a baseline
+        assert await feed.GetActiveRepositories() == set()
+        assert not feed.is_due
+
+        # Owners are not polled again until the poll interval has elapsed
+        assert await feed.GetActiveRepositories() == set()
+
+        clock.now += GitHubEventsFeed.DEFAULT_POLL_INTERVAL
+        assert feed.is_due
+
+        assert await feed.GetActiveRepositories() == {"org/repo2", "org/repo3"}
+
+        assert [url for url, _ in requests] == ["https://api.github.com/orgs/org/events"] * 2
+
+    # ----------------------------------------------------------------------
+    @pytest.mark.asyncio
+    async def test_user_fallback(self) -> None:
+        """The user's events are polled when the owner is not an organization."""
+
+        clock = FakeClock()
+        session, requests = create_mock_session(
+            {
+                "https://api.github.com/orgs/user/events": [create_mock_response(None, status=404)],
+                "https://api.github.com/users/user/events": [
+                    create_mock_response([]),
+                    create_mock_response([create_event(1, "user/repo")]),
+                ],
+            }
+        )
+
+        feed = GitHubEventsFeed(session, [create_repository("user", "repo")], clock)
+
+        assert await feed.GetActiveRepositories() == set()
+
+        clock.now += GitHubEventsFeed.DEFAULT_POLL_INTERVAL
+        assert await feed.GetActiveRepositories() == {"user/repo"}
+
+        assert [url for url, _ in requests] == [
+            "https://api.github.com/orgs/user/events",
+            "https://api.github.com/users/user/events",
+            "https://api.github.com/users/user/events",
+        ]
+
+    # ----------------------------------------------------------------------
+    @pytest.mark.asyncio
+    async def test_poll_interval(self) -> None:
+        """Owners are not polled more frequently than the X-Poll-Interval requested by GitHub."""
+
+        clock = FakeClock()
+        session, _ = create_mock_session(
+            {
+                "https://api.github.com/orgs/org/events": [
+                    create_mock_response([], headers={"X-Poll-Interval": "300"}),
+                ],
+            }
+        )
+
+        feed = GitHubEventsFeed(session, [create_repository("org", "repo")], clock)
+
+        await feed.GetActiveRepositories()
+
+        clock.now += 299
+        assert not feed.is_due
+
+        clock.now += 1
+        assert feed.is_due
+
+    # ----------------------------------------------------------------------
+    @pytest.mark.asyncio
+    async def test_errors(self) -> None:
+        """Errors are ignored, and the owner is polled again after the default interval."""
+
+        clock = FakeClock()
+        session, _ = create_mock_session(
+            {
+                "https://api.github.com/orgs/org/events": [create_mock_response(None, status=500)],
+            }
+        )
+
+        feed = GitHubEventsFeed(session, [create_repository("org", "repo")], clock)
+
+        assert await feed.GetActiveRepositories() == set()
+        assert not feed.is_due
+
+        clock.now += GitHubEventsFeed.DEFAULT_POLL_INTERVAL
+        assert feed.is_due
@@ -0,0 +1,178 @@
+"""Unit tests for AllGitStatus.Sources.GitHubIssueStore module."""
+
+from datetime import datetime, timedelta, UTC
+from pathlib import Path
+
+import pytest
+
+from AllGitStatus.Sources.GitHubIssueStore import GitHubIssueStore
+
+
+# ----------------------------------------------------------------------
+@pytest.fixture
+def store(tmp_path: Path):
+    """Create an issue store."""
+
+    store = GitHubIssueStore(tmp_path / "issues.db", "token")
+
+    try:
+        yield store
+    finally:
+        store.Close()
+
+
+# ----------------------------------------------------------------------
+def create_item(number: int, state: str = "open", **kwargs) -> dict:
+    """Create an item as returned by the GitHub API."""
+
+    return {
+        "number": number,
+        "state": state,
+        "title": f"Item {number}",
+        "user": {"login": "author", "id": 123},
+        "labels": [{"name": "bug", "color": "red"}],
+        "body": "A very long body that should not be persisted",
+        **kwargs,
+    }
+
+
+# ----------------------------------------------------------------------
+class TestSync:
+    """Tests for full and incremental syncs."""
+
+    # ----------------------------------------------------------------------
+    def test_no_sync(self, store: GitHubIssueStore) -> None:
+        """A full sync is required for repositories that have never been synced."""
+
+        assert store.GetLastSync("owner", "repo", "issues") is None
+        assert store.GetItems("owner", "repo", "issues") == []
+
+    # ----------------------------------------------------------------------
+    def test_full_sync(self, store: GitHubIssueStore) -> None:
+        """A full sync replaces the existing items."""
+
+        sync_time = datetime.now(UTC)
+
+        store.Update("owner", "repo", "issues", [create_item(1), create_item(2)], sync_time, full=True)
+        store.Update("Owner", "Repo", "issues", [create_item(3), create_item(2)], sync_time, full=True)
+
+        assert store.GetLastSync("owner", "repo", "issues") == sync_time
+        assert [item["number"] for item in store.GetItems("owner", "repo", "issues")] == [3, 2]
+
+    # ----------------------------------------------------------------------
+    def test_incremental_sync(self, store: GitHubIssueStore) -> None:
+        """Incremental syncs add, update and remove items."""
+
+        first_sync = datetime.now(UTC) - timedelta(hours=1)
+        second_sync = datetime.now(UTC)
+
+        store.Update("owner", "repo", "issues", [create_item(1), create_item(2)], first_sync, full=True)
+        store.Update(
+            "owner",
+            "repo",
+            "issues",
+            [create_item(1, state="closed"), create_item(2, title="Updated"), create_item(3)],
+            second_sync,
+            full=False,
+        )
+
+        assert store.GetLastSync("owner", "repo", "issues") == second_sync
+        assert [(item["number"], item["title"]) for item in store.GetItems("owner", "repo", "issues")] == [
+            (3, "Item 3"),
+            (2, "Updated"),
+        ]
+
+    # ----------------------------------------------------------------------
+    def test_full_sync_required_after_max_sync_age(self, tmp_path: Path) -> None:
+        """A full sync is required once the max sync age has elapsed."""
+
+        store = GitHubIssueStore(tmp_path / "issues.db", "token", max_sync_age=timedelta(days=1))
+
+        try:
+            store.Update("owner", "repo", "pulls", [], datetime.now(UTC) - timedelta(days=2), full=True)
+            store.Update("owner", "repo", "pulls", [], datetime.now(UTC), full=False)
+
+            assert store.GetLastSync("owner", "repo", "pulls") is None
+        finally:
+            store.Close()
+
+    # ----------------------------------------------------------------------
+    def test_kinds_and_identities_are_separate(self, tmp_path: Path, store: GitHubIssueStore) -> None:
+        """Items are separated by kind and by identity."""
+
+        store.Update("owner", "repo", "issues", [create_item(1)], datetime.now(UTC), full=True)
+
+        assert store.GetItems("owner", "repo", "pulls") == []
+
+        other_store = GitHubIssueStore(tmp_path / "issues.db", "other-token")
+
+        try:
+            assert other_store.GetLastSync("owner", "repo", "issues") is None
+            assert other_store.GetItems("owner", "repo", "issues") == []
+        finally:
+            other_store.Close()
+
+    # ----------------------------------------------------------------------
+    def test_errors_roll_back(self, store: GitHubIssueStore) -> None:
+        """Changes are not applied when an error is encountered."""
+
+        store.Update("owner", "repo", "issues", [create_item(1)], datetime.now(UTC), full=True)
+
+        with pytest.raises(KeyError):
+            store.Update("owner", "repo", "issues", [create_item(2), {}], datetime.now(UTC), full=True)
+
+        assert [item["number"] for item in store.GetItems("owner", "repo", "issues")] == [1]
+
+    # ----------------------------------------------------------------------
+    def test_persisted(self, tmp_path: Path) -> None:
+        """Items are persisted across instances."""
+
+        store = GitHubIssueStore(tmp_path / "issues.db", "token")
+
+        try:
+            store.Update("owner", "repo", "issues", [create_item(1)], datetime.now(UTC), full=True)
+        finally:
+            store.Close()
+
+        store = GitHubIssueStore(tmp_path / "issues.db", "token")
+
+        try:
+            assert len(store.GetItems("owner", "repo", "issues")) == 1
+        finally:
+            store.Close()
+
+
+# ----------------------------------------------------------------------
+class TestItems:
+    """Tests for the information persisted for items."""
+
+    # ----------------------------------------------------------------------
+    def test_items_are_trimmed(self, store: GitHubIssueStore) -> None:
+        """Only the information used for display is persisted."""
+
+        store.Update(
+            "owner",
+            "repo",
+            "issues",
+            [create_item(1), create_item(2, pull_request={"url": "..."}, user=None, draft=True)],
+            datetime.now(UTC),
+            full=True,
+        )
+
+        assert store.GetItems("owner", "repo", "issues") == [
+            {
+                "number": 2,
+                "title": "Item 2",
+                "user": {"login": "unknown"},
+                "labels": [{"name": "bug"}],
+                "draft": True,
+                "pull_request": {},
+            },
+            {
+                "number": 1,
+                "title": "Item 1",
+                "user": {"login": "author"},
+                "labels": [{"name": "bug"}],
+                "draft": False,
+            },
+        ]
@@ -0,0 +1,71 @@
+"""Unit tests for AllGitStatus.Sources.GitHubJson module."""
+
+from AllGitStatus.Sources.GitHubJson import CreateLoads, Loads, Project
+
+
+# ----------------------------------------------------------------------
+class TestLoads:
+    """Tests for Loads."""
+
+    # ----------------------------------------------------------------------
+    def test_str(self) -> None:
+        """Strings are decoded."""
+
+        assert Loads('{"a": [1, 2]}') == {"a": [1, 2]}
+
+    # ----------------------------------------------------------------------
+    def test_bytes(self) -> None:
+        """Bytes are decoded."""
+
+        assert Loads(b'{"a": [1, 2]}') == {"a": [1, 2]}
+
+
+# ----------------------------------------------------------------------
+class TestProject:
+    """Tests for Project."""
+
+    # ----------------------------------------------------------------------
+    def test_fields(self) -> None:
+        """Only fields in the projection are retained; missing fields are omitted."""
+
+        assert Project({"a": 1, "b": 2, "c": 3}, {"a": None, "d": None}) == {"a": 1}
+
+    # ----------------------------------------------------------------------
+    def test_nested(self) -> None:
+        """Nested projections are applied to nested objects."""
+
+        assert Project(
+            {"user": {"login": "user1", "id": 2}, "marker": {"url": "https://example.com"}},
+            {"user": {"login": None}, "marker": {}},
+        ) == {"user": {"login": "user1"}, "marker": {}}
+
+    # ----------------------------------------------------------------------
+    def test_lists(self) -> None:
+        """Projections are applied to each item of a list."""
+
+        assert Project(
+            [{"labels": [{"name": "bug", "color": "red"}], "body": "..."}],
+            {"labels": {"name": None}},
+        ) == [{"labels": [{"name": "bug"}]}]
+
+    # ----------------------------------------------------------------------
+    def test_other_values(self) -> None:
+        """Values that are not objects are retained as-is."""
+
+        assert Project({"user": None, "count": 3}, {"user": {"login": None}, "count": {}}) == {
+            "user": None,
+            "count": 3,
+        }
+
+
+# ----------------------------------------------------------------------
+class TestCreateLoads:
+    """Tests for CreateLoads."""
+
+    # ----------------------------------------------------------------------
+    def test_projected(self) -> None:
+        """Content is decoded and projected."""
+
+        loads = CreateLoads({"number": None})
+
+        assert loads(b'[{"number": 1, "body": "..."}, {"number": 2}]') == [{"number": 1}, {"number": 2}]
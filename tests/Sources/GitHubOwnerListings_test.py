@@ -0,0 +1,214 @@
+"""Unit tests for AllGitStatus.Sources.GitHubOwnerListings module."""
+
+import asyncio
+
+from pathlib import Path
+
+import pytest
+
+from AllGitStatus.Repository import Repository
+from AllGitStatus.Sources.GitHubOwnerListings import GitHubOwnerListings
+from TestHelpers import create_mock_response, create_mock_session, create_repository
+
+
+# ----------------------------------------------------------------------
+@pytest.fixture
+def org_repositories() -> list[Repository]:
+    """Repositories that belong to the same organization."""
+
+    return [create_repository("TheOrg", f"repo{index}") for index in range(3)]
+
+
+# ----------------------------------------------------------------------
+class TestGetRepository:
+    """Tests for GitHubOwnerListings.GetRepository."""
+
+    # ----------------------------------------------------------------------
+    @pytest.mark.asyncio
+    async def test_owner_with_few_repositories_is_not_listed(self) -> None:
+        """Owners with fewer than min_repositories repositories are not listed."""
+
+        repositories = [create_repository("owner", "one"), create_repository("owner", "two")]
+        session, requests = create_mock_session({})
+
+        listings = GitHubOwnerListings(session, repositories)
+
+        assert await listings.GetRepository(repositories[0]) is None
+        assert requests == []
+
+    # ----------------------------------------------------------------------
+    @pytest.mark.asyncio
+    async def test_repository_without_github_info(self) -> None:
+        """Repositories without GitHub information are not listed."""
+
+        session, requests = create_mock_session({})
+
+        listings = GitHubOwnerListings(session, [], min_repositories=0)
+
+        assert await listings.GetRepository(Repository(path=Path("/repo"))) is None
+        assert requests == []
+
+    # ----------------------------------------------------------------------
+    @pytest.mark.asyncio
+    async def test_organization_listing_is_shared(self, org_repositories: list[Repository]) -> None:
+        """All of an organization's repositories are answered from a single (paginated) listing."""
+
+        session, requests = create_mock_session(
+            {
+                "https://api.github.com/orgs/theorg/repos": [
+                    create_mock_response(
+                        [
+                            {"name": "Repo0", "stargazers_count": 10},
+                            {"name": "repo1", "stargazers_count": 11},
+                        ],
+                        headers={"Link": '<https://api.github.com/page2>; rel="next"'},
+                    )
+                ],
+                "https://api.github.com/page2": [
+                    create_mock_response(
+                        [{"name": "repo2", "stargazers_count": 12}],
+                    )
+                ],
+            }
+        )
+
+        listings = GitHubOwnerListings(session, org_repositories)
+
+        results = await asyncio.gather(*(listings.GetRepository(repo) for repo in org_repositories))
+
+        assert [result["stargazers_count"] for result in results if result is not None] == [10, 11, 12]
+        assert [url for url, _ in requests] == [
+            "https://api.github.com/orgs/theorg/repos",
+            "https://api.github.com/page2",
+        ]
+
+    # ----------------------------------------------------------------------
+    @pytest.mark.asyncio
+    async def test_large_listing_is_abandoned(self, org_repositories: list[Repository]) -> None:
+        """Listings are abandoned when the remaining pages outnumber the repositories not yet listed."""
+
+        session, requests = create_mock_session(
+            {
+                "https://api.github.com/orgs/theorg/repos": [
+                    create_mock_response(
+                        [{"name": "repo0", "stargazers_count": 10}],
+                        headers={
+                            "Link": (
+                                '<https://api.github.com/orgs/theorg/repos?page=2>; rel="next", '
+                                '<https://api.github.com/orgs/theorg/repos?page=50>; rel="last"'
+                            ),
+                        },
+                    )
+                ],
+            }
+        )
+
+        listings = GitHubOwnerListings(session, org_repositories)
+
+        # Repositories in the first page are still provided by the listing
+        assert await listings.GetRepository(org_repositories[0]) == {"name": "repo0", "stargazers_count": 10}
+
+        # The others are requested individually rather than listing the remaining 49 pages
+        assert await listings.GetRepository(org_repositories[1]) is None
+        assert await listings.GetRepository(org_repositories[2]) is None
+
+        assert [url for url, _ in requests] == ["https://api.github.com/orgs/theorg/repos"]
+
+    # ----------------------------------------------------------------------
+    @pytest.mark.asyncio
+    async def test_listing_with_few_remaining_pages(self, org_repositories: list[Repository]) -> None:
+        """Listings continue when the remaining pages don't outnumber the repositories not yet listed."""
+
+        session, requests = create_mock_session(
+            {
+                "https://api.github.com/orgs/theorg/repos": [
+                    create_mock_response(
+                        [{"name": "other"}],
+                        headers={
+                            "Link": (
+                                '<https://api.github.com/page2>; rel="next", '
+                                '<https://api.github.com/orgs/theorg/repos?page=3>; rel="last"'
+                            ),
+                        },
+                    )
+                ],
+                "https://api.github.com/page2": [
+                    create_mock_response(
+                        [{"name": "repo0"}, {"name": "repo1"}, {"name": "repo2"}],
+                        headers={
+                            "Link": '<https://api.github.com/page3>; rel="next", <invalid?page=x>; rel="last"'
+                        },
+                    )
+                ],
+                "https://api.github.com/page3": [create_mock_response([])],
+            }
+        )
+
+        listings = GitHubOwnerListings(session, org_repositories)
+
+        assert await listings.GetRepository(org_repositories[2]) == {"name": "repo2"}
+        assert [url for url, _ in requests] == [
+            "https://api.github.com/orgs/theorg/repos",
+            "https://api.github.com/page2",
+            "https://api.github.com/page3",
+        ]
+
+    # ----------------------------------------------------------------------
+    @pytest.mark.asyncio
+    async def test_user_listing(self, org_repositories: list[Repository]) -> None:
+        """Owners that are users (rather than organizations) are listed via the users endpoint."""
+
+        session, requests = create_mock_session(
+            {
+                "https://api.github.com/orgs/theorg/repos": [create_mock_response({}, status=404)],
+                "https://api.github.com/users/theorg/repos": [
+                    create_mock_response(
+                        [{"name": "repo0", "forks_count": 3}],
+                    )
+                ],
+            }
+        )
+
+        listings = GitHubOwnerListings(session, org_repositories)
+
+        assert await listings.GetRepository(org_repositories[0]) == {"name": "repo0", "forks_count": 3}
+
+        # Repositories not in the listing (e.g. private repositories of a user) are not available
+        assert await listings.GetRepository(org_repositories[1]) is None
+
+        assert [url for url, _ in requests] == [
+            "https://api.github.com/orgs/theorg/repos",
+            "https://api.github.com/users/theorg/repos",
+        ]
+
+    # ----------------------------------------------------------------------
+    @pytest.mark.asyncio
+    async def test_listing_error(self, org_repositories: list[Repository]) -> None:
+        """Repositories are not available when the listing fails."""
+
+        session, requests = create_mock_session(
+            {"https://api.github.com/orgs/theorg/repos": [create_mock_response({}, status=500)]}
+        )
+
+        listings = GitHubOwnerListings(session, org_repositories)
+
+        assert await listings.GetRepository(org_repositories[0]) is None
+        assert await listings.GetRepository(org_repositories[1]) is None
+        assert len(requests) == 1
+
+    # ----------------------------------------------------------------------
+    @pytest.mark.asyncio
+    async def test_cancelled_caller_does_not_cancel_listing(self, org_repositories: list[Repository]) -> None:
+        """Cancelling one caller does not cancel the listing shared with other callers."""
+
+        session, _ = create_mock_session(
+            {"https://api.github.com/orgs/theorg/repos": [create_mock_response([{"name": "repo1"}])]}
+        )
+
+        listings = GitHubOwnerListings(session, org_repositories)
+
+        task = asyncio.create_task(listings.GetRepository(org_repositories[0]))
+        await asyncio.sleep(0)
+        task.cancel()
+
+        assert await listings.GetRepository(org_repositories[1]) == {"name": "repo1"}
@@ -0,0 +1,373 @@
+"""Unit tests for AllGitStatus.Sources.GitHubRequestScheduler module."""
+
+import asyncio
+import time
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from multidict import CIMultiDict, CIMultiDictProxy
+
+from AllGitStatus.Sources.GitHubRequestScheduler import GitHubRequestScheduler, RateLimitStatus
+from AllGitStatus.Sources.GitHubSession import GitHubResponse
+from AllGitStatus.Sources.GitHubTokenPool import GitHubTokenPool
+
+
+# ----------------------------------------------------------------------
+def create_response(
+    status: int = 200,
+    headers: dict[str, str] | None = None,
+    content: bytes = b"",
+) -> GitHubResponse:
+    """Create a GitHubResponse."""
+
+    return GitHubResponse(MagicMock(), status, CIMultiDictProxy(CIMultiDict(headers or {})), content)
+
+
+# ----------------------------------------------------------------------
+def rate_limit_headers(remaining: int, reset: float, limit: int = 5000) -> dict[str, str]:
+    """Create rate limit headers."""
+
+    return {
+        "X-RateLimit-Limit": str(limit),
+        "X-RateLimit-Remaining": str(remaining),
+        "X-RateLimit-Reset": str(reset),
+    }
+
+
+# ----------------------------------------------------------------------
+@pytest.fixture(autouse=True)
+def no_jitter():
+    """Remove jitter so that tests are deterministic."""
+
+    with patch("AllGitStatus.Sources.GitHubRequestScheduler.random.uniform", return_value=0.0):
+        yield
+
+
+# ----------------------------------------------------------------------
+class TestConcurrency:
+    """Tests for the concurrent request cap."""
+
+    # ----------------------------------------------------------------------
+    @pytest.mark.asyncio
+    async def test_concurrent_requests_are_capped(self) -> None:
+        """No more than max_concurrent_requests are active at once."""
+
+        scheduler = GitHubRequestScheduler(max_concurrent_requests=2)
+
+        active = 0
+        max_active = 0
+
+        async def Request() -> GitHubResponse:
+            nonlocal active, max_active
+
+            active += 1
+            max_active = max(max_active, active)
+
+            await asyncio.sleep(0.01)
+
+            active -= 1
+            return create_response()
+
+        responses = await asyncio.gather(*(scheduler.Execute(Request) for _ in range(6)))
+
+        assert len(responses) == 6
+        assert max_active == 2
+        assert scheduler.status.active == 0
+        assert scheduler.status.queued == 0
+
+    # ----------------------------------------------------------------------
+    @pytest.mark.asyncio
+    async def test_exceptions_are_propagated(self) -> None:
+        """Exceptions raised by the request are propagated and do not leak capacity."""
+
+        scheduler = GitHubRequestScheduler(max_concurrent_requests=1)
+
+        async def Request() -> GitHubResponse:
+            raise ValueError("boom")
+
+        with pytest.raises(ValueError, match="boom"):
+            await scheduler.Execute(Request)
+
+        assert scheduler.status.active == 0
+        assert scheduler.status.queued == 0
+
+        async def Success() -> GitHubResponse:
+            return create_response()
+
+        assert (await scheduler.Execute(Success)).status == 200
+
+
+# ----------------------------------------------------------------------
+class TestRateLimitTracking:
+    """Tests for rate limit tracking."""
+
+    # ----------------------------------------------------------------------
+    @pytest.mark.asyncio
+    async def test_status_reflects_headers(self) -> None:
+        """The status reflects the most recent rate limit headers."""
+
+        statuses: list[RateLimitStatus] = []
+        scheduler = GitHubRequestScheduler(on_status_changed=statuses.append)
+
+        async def Request() -> GitHubResponse:
+            return create_response(headers=rate_limit_headers(4999, 1234.0))
+
+        await scheduler.Execute(Request)
+
+        assert scheduler.status.limit == 5000
+        assert scheduler.status.remaining == 4999
+        assert scheduler.status.reset == 1234.0
+        assert scheduler.status.eta is None
+
+        assert statuses
+        assert statuses[-1] == scheduler.status
+
+    # ----------------------------------------------------------------------
+    @pytest.mark.asyncio
+    async def test_invalid_headers_are_ignored(self) -> None:
+        """Invalid rate limit headers are ignored."""
+
+        scheduler = GitHubRequestScheduler()
+
+        async def Request() -> GitHubResponse:
+            return create_response(
+                headers={
+                    "X-RateLimit-Limit": "invalid",
+                    "X-RateLimit-Remaining": "1",
+                    "X-RateLimit-Reset": "1",
+                }
+            )
+
+        await scheduler.Execute(Request)
+
+        assert scheduler.status.remaining is None
+
+    # ----------------------------------------------------------------------
+    @pytest.mark.asyncio
+    async def test_requests_wait_for_quota_reset(self) -> None:
+        """Requests are held until the quota resets once it has been exhausted."""
+
+        scheduler = GitHubRequestScheduler()
+        reset = time.time() + 0.1
+
+        async def Exhausted() -> GitHubResponse:
+            return create_response(headers=rate_limit_headers(0, reset))
+
+        await scheduler.Execute(Exhausted)
+
+        assert scheduler.status.remaining == 0
+
+        request_time: float | None = None
+
+        async def Request() -> GitHubResponse:
+            nonlocal request_time
+
+            request_time = time.time()
+            return create_response(headers=rate_limit_headers(4999, reset + 3600))
+
+        await scheduler.Execute(Request)
+
+        assert request_time is not None
+        assert request_time >= reset
+        assert scheduler.status.remaining == 4999
+
+    # ----------------------------------------------------------------------
+    @pytest.mark.asyncio
+    async def test_eta_while_queued(self) -> None:
+        """The ETA of queued requests accounts for the time until the quota resets."""
+
+        statuses: list[RateLimitStatus] = []
+        scheduler = GitHubRequestScheduler(on_status_changed=statuses.append)
+        reset = time.time() + 0.1
+
+        async def Exhausted() -> GitHubResponse:
+            return create_response(headers=rate_limit_headers(0, reset))
+
+        async def Request() -> GitHubResponse:
+            return create_response(headers=rate_limit_headers(10, reset + 3600))
+
+        await scheduler.Execute(Exhausted)
+        await asyncio.gather(*(scheduler.Execute(Request) for _ in range(3)))
+
+        queued_statuses = [status for status in statuses if status.queued]
+
+        assert queued_statuses
+        assert all(status.eta is not None for status in queued_statuses)
+        assert max(status.eta for status in queued_statuses if status.eta is not None) > 0.0
+
+
+# ----------------------------------------------------------------------
+class TestRetries:
+    """Tests for retrying rate-limited requests."""
+
+    # ----------------------------------------------------------------------
+    @pytest.mark.asyncio
+    async def test_retry_after_is_honored(self) -> None:
+        """Requests rejected with Retry-After are retried."""
+
+        scheduler = GitHubRequestScheduler()
+        responses = iter(
+            [
+                create_response(429, {"Retry-After": "0"}),
+                create_response(403, {"Retry-After": "0"}),
+                create_response(200),
+            ]
+        )
+
+        async def Request() -> GitHubResponse:
+            return next(responses)
+
+        assert (await scheduler.Execute(Request)).status == 200
+
+    # ----------------------------------------------------------------------
+    @pytest.mark.asyncio
+    async def test_primary_rate_limit_waits_for_reset(self) -> None:
+        """Requests rejected by the primary rate limit are retried after the reset."""
+
+        scheduler = GitHubRequestScheduler()
+        reset = time.time() + 0.05
+
+        responses = iter(
+            [
+                create_response(403, rate_limit_headers(0, reset)),
+                create_response(200, rate_limit_headers(4999, reset + 3600)),
+            ]
+        )
+
+        async def Request() -> GitHubResponse:
+            return next(responses)
+
+        response = await scheduler.Execute(Request)
+
+        assert response.status == 200
+        assert time.time() >= reset
+
+    # ----------------------------------------------------------------------
+    @pytest.mark.asyncio
+    async def test_secondary_rate_limit_backs_off(self) -> None:
+        """Requests rejected by the secondary rate limit are retried with exponential backoff."""
+
+        scheduler = GitHubRequestScheduler()
+        scheduler.SECONDARY_RATE_LIMIT_DELAY = 0.01
+
+        responses = iter(
+            [
+                create_response(403, content=b'{"message": "You have exceeded a secondary rate limit"}'),
+                create_response(429),
+                create_response(200),
+            ]
+        )
+
+        async def Request() -> GitHubResponse:
+            return next(responses)
+
+        start = time.time()
+
+        assert (await scheduler.Execute(Request)).status == 200
+        assert time.time() - start >= 0.03
+
+    # ----------------------------------------------------------------------
+    @pytest.mark.asyncio
+    async def test_permission_errors_are_not_retried(self) -> None:
+        """403 responses that are not related to rate limits are returned immediately."""
+
+        scheduler = GitHubRequestScheduler()
+        request = MagicMock(return_value=asyncio.sleep(0, create_response(403, content=b"Forbidden")))
+
+        assert (await scheduler.Execute(request)).status == 403
+        assert request.call_count == 1
+
+    # ----------------------------------------------------------------------
+    @pytest.mark.asyncio
+    async def test_invalid_retry_after(self) -> None:
+        """Retry-After values that are not numbers fall back to the secondary rate limit backoff."""
+
+        scheduler = GitHubRequestScheduler()
+        scheduler.SECONDARY_RATE_LIMIT_DELAY = 0.0
+
+        responses = iter([create_response(429, {"Retry-After": "invalid"}), create_response(200)])
+
+        async def Request() -> GitHubResponse:
+            return next(responses)
+
+        assert (await scheduler.Execute(Request)).status == 200
+
+    # ----------------------------------------------------------------------
+    @pytest.mark.asyncio
+    async def test_max_attempts(self) -> None:
+        """The last response is returned once the maximum number of attempts is reached."""
+
+        scheduler = GitHubRequestScheduler(max_attempts=2)
+        call_count = 0
+
+        async def Request() -> GitHubResponse:
+            nonlocal call_count
+
+            call_count += 1
+            return create_response(429, {"Retry-After": "0"})
+
+        assert (await scheduler.Execute(Request)).status == 429
+        assert call_count == 2
+
+
+# ----------------------------------------------------------------------
+class TestTokenPool:
+    """Tests for schedulers that use a token pool."""
+
+    # ----------------------------------------------------------------------
+    @pytest.mark.asyncio
+    async def test_combined_quota(self) -> None:
+        """The rate limit is the combined quota of all tokens."""
+
+        pool = GitHubTokenPool(["a", "b"])
+        scheduler = GitHubRequestScheduler(token_pool=pool)
+        reset = time.time() + 3600
+
+        async def Request() -> GitHubResponse:
+            token = pool.Acquire()
+            headers = rate_limit_headers(0 if token == "a" else 100, reset)
+
+            pool.Update(token, headers)
+            return create_response(headers=headers)
+
+        # The quota is not known until every token has been used
+        await scheduler.Execute(Request)
+        assert scheduler.status.remaining is None
+
+        await scheduler.Execute(Request)
+        assert scheduler.status.limit == 10000
+        assert scheduler.status.remaining == 100
+        assert scheduler.status.reset == reset
+
+    # ----------------------------------------------------------------------
+    @pytest.mark.asyncio
+    async def test_rate_limited_token_retried_immediately(self) -> None:
+        """Requests rejected because a token is exhausted are retried with other tokens immediately."""
+
+        pool = GitHubTokenPool(["a", "b"])
+        scheduler = GitHubRequestScheduler(token_pool=pool)
+        reset = time.time() + 3600
+
+        pool.Update("a", rate_limit_headers(1, reset))
+        pool.Update("b", rate_limit_headers(0, reset))
+
+        tokens: list[str] = []
+
+        async def Request() -> GitHubResponse:
+            token = pool.Acquire()
+            tokens.append(token)
+
+            if token == "a":
+                # The quota was consumed by another client
+                headers = rate_limit_headers(0, reset)
+                pool.Update(token, headers)
+                pool.Update("b", rate_limit_headers(5000, reset))
+
+                return create_response(403, headers)
+
+            return create_response(headers=rate_limit_headers(4999, reset))
+
+        assert (await scheduler.Execute(Request)).status == 200
+        assert tokens == ["a", "b"]
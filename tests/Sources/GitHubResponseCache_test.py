@@ -0,0 +1,202 @@
+"""Unit tests for AllGitStatus.Sources.GitHubResponseCache module."""
+
+import time
+
+from pathlib import Path
+
+import pytest
+
+from AllGitStatus.Sources.GitHubResponseCache import GitHubResponseCache
+
+
+# ----------------------------------------------------------------------
+@pytest.fixture
+def cache(tmp_path: Path):
+    """Create a cache in a temporary directory."""
+
+    cache = GitHubResponseCache(tmp_path / "cache" / "responses.db", "token")
+
+    try:
+        yield cache
+    finally:
+        cache.Close()
+
+
+# ----------------------------------------------------------------------
+class TestCreateKey:
+    """Tests for GitHubResponseCache.CreateKey."""
+
+    # ----------------------------------------------------------------------
+    def test_same_url_produces_same_key(self, cache: GitHubResponseCache) -> None:
+        """Identical requests produce identical keys."""
+
+        assert cache.CreateKey("https://api.github.com/a") == cache.CreateKey("https://api.github.com/a")
+
+    # ----------------------------------------------------------------------
+    def test_params_are_order_independent(self, cache: GitHubResponseCache) -> None:
+        """The order of parameters does not impact the key."""
+
+        assert cache.CreateKey("url", {"a": 1, "b": "2"}) == cache.CreateKey("url", {"b": 2, "a": "1"})
+
+    # ----------------------------------------------------------------------
+    def test_params_impact_key(self, cache: GitHubResponseCache) -> None:
+        """Different parameters produce different keys."""
+
+        assert cache.CreateKey("url", {"page": 1}) != cache.CreateKey("url", {"page": 2})
+        assert cache.CreateKey("url", {"page": 1}) != cache.CreateKey("url")
+
+    # ----------------------------------------------------------------------
+    def test_identity_impacts_key(self, tmp_path: Path, cache: GitHubResponseCache) -> None:
+        """Keys are never shared between different credentials."""
+
+        other = GitHubResponseCache(tmp_path / "other.db", "other_token")
+
+        try:
+            assert other.CreateKey("url") != cache.CreateKey("url")
+        finally:
+            other.Close()
+
+
+# ----------------------------------------------------------------------
+class TestGetAndSet:
+    """Tests for GitHubResponseCache.Get and GitHubResponseCache.Set."""
+
+    # ----------------------------------------------------------------------
+    def test_missing_entry(self, cache: GitHubResponseCache) -> None:
+        """None is returned for unknown keys."""
+
+        assert cache.Get("unknown") is None
+
+    # ----------------------------------------------------------------------
+    def test_round_trip(self, cache: GitHubResponseCache) -> None:
+        """Stored entries can be retrieved."""
+
+        entry = cache.Set("key", {"ETag": '"abc"', "Link": "<next>"}, b"[1, 2, 3]")
+        assert entry is not None
+
+        result = cache.Get("key")
+
+        assert result is not None
+        assert result.etag == '"abc"'
+        assert result.last_modified is None
+        assert result.headers["Link"] == "<next>"
+        assert result.content == b"[1, 2, 3]"
+        assert cache.size == len(b"[1, 2, 3]")
+
+    # ----------------------------------------------------------------------
+    def test_persisted_between_instances(self, tmp_path: Path) -> None:
+        """Entries are persisted on disk."""
+
+        filename = tmp_path / "responses.db"
+
+        cache = GitHubResponseCache(filename, None)
+        cache.Set("key", {"Last-Modified": "yesterday"}, b"{}")
+        cache.Close()
+
+        cache = GitHubResponseCache(filename, None)
+
+        try:
+            result = cache.Get("key")
+
+            assert result is not None
+            assert result.last_modified == "yesterday"
+            assert cache.size == 2
+        finally:
+            cache.Close()
+
+    # ----------------------------------------------------------------------
+    def test_max_age_determines_freshness(self, cache: GitHubResponseCache) -> None:
+        """Cache-Control max-age determines how long the entry is fresh."""
+
+        fresh = cache.Set("fresh", {"ETag": "1", "Cache-Control": "private, max-age=60, s-maxage=60"}, b"")
+        stale = cache.Set("stale", {"ETag": "1"}, b"")
+
+        assert fresh is not None and fresh.is_fresh
+        assert stale is not None and not stale.is_fresh
+
+    # ----------------------------------------------------------------------
+    def test_no_cache_is_never_fresh(self, cache: GitHubResponseCache) -> None:
+        """Cache-Control no-cache entries must always be revalidated."""
+
+        entry = cache.Set("key", {"ETag": "1", "Cache-Control": "no-cache, max-age=60"}, b"")
+
+        assert entry is not None
+        assert not entry.is_fresh
+
+    # ----------------------------------------------------------------------
+    def test_no_store_is_not_cached(self, cache: GitHubResponseCache) -> None:
+        """Cache-Control no-store entries are not persisted."""
+
+        assert cache.Set("key", {"ETag": "1", "Cache-Control": "no-store"}, b"") is None
+        assert cache.Get("key") is None
+
+    # ----------------------------------------------------------------------
+    def test_unusable_response_is_not_cached(self, cache: GitHubResponseCache) -> None:
+        """Responses without validators or a max-age are not persisted."""
+
+        assert cache.Set("key", {}, b"content") is None
+        assert cache.Get("key") is None
+
+    # ----------------------------------------------------------------------
+    def test_replace_updates_size(self, cache: GitHubResponseCache) -> None:
+        """Replacing an entry accounts for the size of the previous content."""
+
+        cache.Set("key", {"ETag": "1"}, b"12345")
+        cache.Set("key", {"ETag": "2"}, b"12")
+
+        assert cache.size == 2
+
+
+# ----------------------------------------------------------------------
+class TestRefresh:
+    """Tests for GitHubResponseCache.Refresh."""
+
+    # ----------------------------------------------------------------------
+    def test_refresh_updates_expiration_and_validators(self, cache: GitHubResponseCache) -> None:
+        """Refreshing an entry updates its validators and expiration."""
+
+        entry = cache.Set("key", {"ETag": "1"}, b"content")
+        assert entry is not None
+        assert not entry.is_fresh
+
+        entry = cache.Refresh(entry, {"ETag": "2", "Cache-Control": "max-age=60"})
+
+        assert entry.is_fresh
+        assert entry.etag == "2"
+        assert entry.content == b"content"
+
+        result = cache.Get("key")
+
+        assert result is not None
+        assert result.etag == "2"
+        assert result.is_fresh
+
+
+# ----------------------------------------------------------------------
+class TestEviction:
+    """Tests for LRU eviction."""
+
+    # ----------------------------------------------------------------------
+    def test_least_recently_used_entries_are_evicted(self, tmp_path: Path) -> None:
+        """The least recently used entries are evicted when the cache exceeds its max size."""
+
+        cache = GitHubResponseCache(tmp_path / "responses.db", None, max_size=10)
+
+        try:
+            cache.Set("one", {"ETag": "1"}, b"1111")
+            time.sleep(0.01)
+            cache.Set("two", {"ETag": "2"}, b"2222")
+            time.sleep(0.01)
+
+            # Access "one" so that "two" becomes the least recently used entry
+            assert cache.Get("one") is not None
+            time.sleep(0.01)
+
+            cache.Set("three", {"ETag": "3"}, b"3333")
+
+            assert cache.Get("one") is not None
+            assert cache.Get("two") is None
+            assert cache.Get("three") is not None
+            assert cache.size == 8
+        finally:
+            cache.Close()
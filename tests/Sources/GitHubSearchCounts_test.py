@@ -0,0 +1,202 @@
+"""Unit tests for AllGitStatus.Sources.GitHubSearchCounts module."""
+
+import asyncio
+
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import pytest
+
+from AllGitStatus.Repository import Repository
+from AllGitStatus.Sources.GitHubSearchCounts import GitHubSearchCounts, SearchCounts
+from TestHelpers import create_mock_response, create_mock_session, create_repository
+
+
+# ----------------------------------------------------------------------
+def create_search_result(
+    names: list[str],
+    total_count: int | None = None,
+    *,
+    incomplete_results: bool = False,
+) -> dict:
+    """Create a search result with an item for each name."""
+
+    return {
+        "total_count": len(names) if total_count is None else total_count,
+        "incomplete_results": incomplete_results,
+        "items": [{"repository_url": f"https://api.github.com/repos/{name}"} for name in names],
+    }
+
+
+# ----------------------------------------------------------------------
+class TestBatches:
+    """Tests for grouping repositories into batches."""
+
+    # ----------------------------------------------------------------------
+    def test_batches_bounded_by_query_length(self) -> None:
+        """Repositories are grouped into batches whose queries do not exceed the max query length."""
+
+        repositories = [create_repository("owner", f"repo{index}") for index in range(10)]
+        max_query_length = 70
+
+        counts = GitHubSearchCounts(MagicMock(), repositories, max_query_length=max_query_length)
+
+        assert [len(batch) for batch in counts._batches] == [3, 3, 3, 1]
+        assert all(
+            len(GitHubSearchCounts._CreateQuery("issue", batch)) <= max_query_length
+            for batch in counts._batches
+        )
+
+    # ----------------------------------------------------------------------
+    def test_duplicates_and_non_github_repositories_ignored(self) -> None:
+        """Repositories are only searched once and repositories without GitHub info are ignored."""
+
+        counts = GitHubSearchCounts(
+            MagicMock(),
+            [
+                create_repository("Owner", "Repo"),
+                create_repository("owner", "repo"),
+                Repository(path=Path("/local")),
+            ],
+        )
+
+        assert counts._batches == [["owner/repo"]]
+
+
+# ----------------------------------------------------------------------
+class TestGetCounts:
+    """Tests for GitHubSearchCounts.GetCounts."""
+
+    # ----------------------------------------------------------------------
+    @pytest.mark.asyncio
+    async def test_batch_counted_by_repository(self) -> None:
+        """Counts for all repositories in a batch are calculated from the same searches."""
+
+        repositories = [create_repository("owner", name) for name in ["one", "two", "three"]]
+
+        session, requests = create_mock_session(
+            {
+                "https://api.github.com/search/issues": [
+                    create_mock_response(
+                        create_search_result(["owner/one", "owner/one"], total_count=3),
+                        headers={"Link": '<https://api.github.com/search/issues?page=2>; rel="next"'},
+                    ),
+                    create_mock_response(create_search_result(["owner/two"])),
+                ],
+                "https://api.github.com/search/issues?page=2": [
+                    create_mock_response(create_search_result(["Owner/Two"], total_count=3)),
+                ],
+            }
+        )
+
+        counts = GitHubSearchCounts(session, repositories)
+
+        results = await asyncio.gather(*(counts.GetCounts(repo) for repo in repositories))
+
+        assert results == [
+            SearchCounts(issues=2, pull_requests=0),
+            SearchCounts(issues=1, pull_requests=1),
+            SearchCounts(issues=0, pull_requests=0),
+        ]
+
+        assert requests == [
+            (
+                "https://api.github.com/search/issues",
+                {"q": "is:issue is:open repo:owner/one repo:owner/two repo:owner/three", "per_page": 100},
+            ),
+            ("https://api.github.com/search/issues?page=2", None),
+            (
+                "https://api.github.com/search/issues",
+                {"q": "is:pr is:open repo:owner/one repo:owner/two repo:owner/three", "per_page": 100},
+            ),
+        ]
+
+    # ----------------------------------------------------------------------
+    @pytest.mark.asyncio
+    async def test_single_repository_uses_total_count(self) -> None:
+        """The total count is used when a batch contains a single repository."""
+
+        repo = create_repository("owner", "repo")
+
+        session, requests = create_mock_session(
+            {
+                "https://api.github.com/search/issues": [
+                    create_mock_response(create_search_result(["owner/repo"], total_count=5000)),
+                    create_mock_response(create_search_result(["owner/repo"], total_count=12)),
+                ],
+            }
+        )
+
+        counts = GitHubSearchCounts(session, [repo])
+
+        assert await counts.GetCounts(repo) == SearchCounts(issues=5000, pull_requests=12)
+        assert [params["per_page"] for _, params in requests if params is not None] == [1, 1]
+
+    # ----------------------------------------------------------------------
+    @pytest.mark.asyncio
+    async def test_too_many_results(self) -> None:
+        """Counts are not available when a batch has too many results to count."""
+
+        repositories = [create_repository("owner", name) for name in ["one", "two"]]
+
+        session, _ = create_mock_session(
+            {
+                "https://api.github.com/search/issues": [
+                    create_mock_response(create_search_result([], total_count=1001)),
+                ],
+            }
+        )
+
+        counts = GitHubSearchCounts(session, repositories)
+
+        assert await counts.GetCounts(repositories[0]) is None
+        assert await counts.GetCounts(repositories[1]) is None
+
+    # ----------------------------------------------------------------------
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("failing_search", [0, 1])
+    async def test_incomplete_results(self, failing_search: int) -> None:
+        """Counts are not available when the search results are incomplete."""
+
+        repo = create_repository("owner", "repo")
+
+        responses = [create_mock_response(create_search_result([])) for _ in range(2)]
+        responses[failing_search] = create_mock_response(
+            create_search_result([], incomplete_results=True),
+        )
+
+        session, _ = create_mock_session({"https://api.github.com/search/issues": responses})
+
+        counts = GitHubSearchCounts(session, [repo])
+
+        assert await counts.GetCounts(repo) is None
+
+    # ----------------------------------------------------------------------
+    @pytest.mark.asyncio
+    async def test_search_error(self) -> None:
+        """Counts are not available when the search fails."""
+
+        repo = create_repository("owner", "repo")
+
+        session, requests = create_mock_session(
+            {"https://api.github.com/search/issues": [create_mock_response({}, status=403)]}
+        )
+
+        counts = GitHubSearchCounts(session, [repo])
+
+        assert await counts.GetCounts(repo) is None
+        assert await counts.GetCounts(repo) is None
+        assert len(requests) == 1
+
+    # ----------------------------------------------------------------------
+    @pytest.mark.asyncio
+    async def test_unknown_repositories(self) -> None:
+        """Counts are not available for repositories that were not provided."""
+
+        session, requests = create_mock_session({})
+
+        counts = GitHubSearchCounts(session, [])
+
+        assert await counts.GetCounts(create_repository("owner", "repo")) is None
+        assert await counts.GetCounts(Repository(path=Path("/local"))) is None
+        assert requests == []
@@ -0,0 +1,784 @@
+"""Unit tests for AllGitStatus.Sources.GitHubSession module."""
+
+import asyncio
+import json
+import time
+
+from pathlib import Path
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import aiohttp
+import pytest
+
+from multidict import CIMultiDict, CIMultiDictProxy
+from yarl import URL
+
+from AllGitStatus.Sources.GitHubCircuitBreaker import CircuitOpenError, GitHubCircuitBreaker
+from AllGitStatus.Sources.GitHubJson import CreateLoads
+from AllGitStatus.Sources.GitHubRequestScheduler import GitHubRequestScheduler
+from AllGitStatus.Sources.GitHubResponseCache import GitHubResponseCache
+from AllGitStatus.Sources.GitHubSession import GitHubResponse, GitHubSession, ParseLinkHeader, RetryPolicy
+from AllGitStatus.Sources.GitHubTokenPool import GitHubTokenPool
+
+
+# ----------------------------------------------------------------------
+def create_raw_response(
+    content: object,
+    status: int = 200,
+    headers: dict[str, str] | None = None,
+) -> MagicMock:
+    """Create a mock aiohttp.ClientResponse."""
+
+    response = MagicMock()
+    response.status = status
+    response.headers = CIMultiDictProxy(CIMultiDict(headers or {}))
+    response.read = AsyncMock(return_value=b"" if content is None else json.dumps(content).encode())
+    response.request_info = aiohttp.RequestInfo(
+        URL("https://api.github.com"), "GET", CIMultiDictProxy(CIMultiDict())
+    )
+
+    return response
+
+
+# ----------------------------------------------------------------------
+def create_raw_session(responses: list[MagicMock]) -> MagicMock:
+    """Create a mock aiohttp.ClientSession that returns the responses in order."""
+
+    session = MagicMock()
+    session.close = AsyncMock()
+    response_iter = iter(responses)
+
+    def get_context_manager(*args, **kwargs):  # noqa: ARG001
+        cm = MagicMock()
+        cm.__aenter__ = AsyncMock(return_value=next(response_iter))
+        cm.__aexit__ = AsyncMock(return_value=None)
+        return cm
+
+    session.get = MagicMock(side_effect=get_context_manager)
+
+    return session
+
+
+# ----------------------------------------------------------------------
+@pytest.fixture
+def cache(tmp_path: Path):
+    """Create a response cache."""
+
+    cache = GitHubResponseCache(tmp_path / "responses.db", "token")
+
+    try:
+        yield cache
+    finally:
+        cache.Close()
+
+
+# ----------------------------------------------------------------------
+class TestParseLinkHeader:
+    """Tests for ParseLinkHeader."""
+
+    # ----------------------------------------------------------------------
+    def test_parse(self) -> None:
+        """Link headers are parsed by relation."""
+
+        assert ParseLinkHeader(
+            '<https://a?page=2>; rel="next", <https://a?page=9>; rel="last", <https://a?page=1>; rel="first"'
+        ) == {
+            "next": "https://a?page=2",
+            "last": "https://a?page=9",
+            "first": "https://a?page=1",
+        }
+
+    # ----------------------------------------------------------------------
+    def test_empty(self) -> None:
+        """Empty headers produce no links."""
+
+        assert ParseLinkHeader("") == {}
+
+
+# ----------------------------------------------------------------------
+class TestGitHubResponse:
+    """Tests for GitHubResponse."""
+
+    # ----------------------------------------------------------------------
+    @pytest.mark.asyncio
+    async def test_json(self) -> None:
+        """Content is decoded as json."""
+
+        response = GitHubResponse(MagicMock(), 200, CIMultiDictProxy(CIMultiDict()), b'{"a": 1}')
+
+        assert await response.json() == {"a": 1}
+
+    # ----------------------------------------------------------------------
+    @pytest.mark.asyncio
+    async def test_json_loads(self) -> None:
+        """Content is decoded with the provided function."""
+
+        response = GitHubResponse(MagicMock(), 200, CIMultiDictProxy(CIMultiDict()), b'{"a": 1, "b": 2}')
+
+        assert await response.json(loads=CreateLoads({"b": None})) == {"b": 2}
+
+    # ----------------------------------------------------------------------
+    def test_raise_for_status_success(self) -> None:
+        """Successful responses do not raise."""
+
+        GitHubResponse(MagicMock(), 200, CIMultiDictProxy(CIMultiDict()), b"").raise_for_status()
+
+    # ----------------------------------------------------------------------
+    def test_raise_for_status_error(self) -> None:
+        """Error responses raise ClientResponseError."""
+
+        response = GitHubResponse(MagicMock(), 404, CIMultiDictProxy(CIMultiDict()), b"")
+
+        with pytest.raises(aiohttp.ClientResponseError) as ex:
+            response.raise_for_status()
+
+        assert ex.value.status == 404
+        assert ex.value.message == "Not Found"
+
+    # ----------------------------------------------------------------------
+    def test_raise_for_status_unknown_status(self) -> None:
+        """Non-standard error codes raise ClientResponseError."""
+
+        response = GitHubResponse(MagicMock(), 499, CIMultiDictProxy(CIMultiDict()), b"")
+
+        with pytest.raises(aiohttp.ClientResponseError) as ex:
+            response.raise_for_status()
+
+        assert ex.value.status == 499
+
+
+# ----------------------------------------------------------------------
+class TestWithoutCache:
+    """Tests for GitHubSession without a cache."""
+
+    # ----------------------------------------------------------------------
+    @pytest.mark.asyncio
+    async def test_get(self) -> None:
+        """Responses are read and returned."""
+
+        raw_session = create_raw_session([create_raw_response([1, 2], headers={"Link": "<next>"})])
+        session = GitHubSession(raw_session)
+
+        async with session.get("https://api.github.com/url", params={"per_page": 100}) as response:
+            response.raise_for_status()
+
+            assert response.status == 200
+            assert response.headers["Link"] == "<next>"
+            assert await response.json() == [1, 2]
+            assert response.from_cache is False
+
+        raw_session.get.assert_called_once_with(
+            "https://api.github.com/url", params={"per_page": 100}, headers={}
+        )
+
+    # ----------------------------------------------------------------------
+    @pytest.mark.asyncio
+    async def test_close(self) -> None:
+        """Closing the session closes the underlying session."""
+
+        raw_session = create_raw_session([])
+        session = GitHubSession(raw_session)
+
+        await session.close()
+
+        raw_session.close.assert_awaited_once()
+
+    # ----------------------------------------------------------------------
+    @pytest.mark.asyncio
+    async def test_poll_interval(self) -> None:
+        """The most recent X-Poll-Interval header is available."""
+
+        raw_session = create_raw_session(
+            [
+                create_raw_response([], headers={"X-Poll-Interval": "60"}),
+                create_raw_response([]),
+                create_raw_response([], headers={"X-Poll-Interval": "120"}),
+            ]
+        )
+        session = GitHubSession(raw_session)
+
+        assert session.poll_interval is None
+
+        for url, expected in [("url1", 60.0), ("url2", 60.0), ("url3", 120.0)]:
+            async with session.get(f"https://api.github.com/{url}"):
+                pass
+
+            assert session.poll_interval == expected
+
+
+# ----------------------------------------------------------------------
+class TestWithTokenPool:
+    """Tests for GitHubSession with a token pool."""
+
+    # ----------------------------------------------------------------------
+    @pytest.mark.asyncio
+    async def test_requests_use_pool_tokens(self) -> None:
+        """Requests are authorized with the token that has the most quota remaining."""
+
+        raw_session = create_raw_session(
+            [
+                create_raw_response(
+                    [],
+                    headers={
+                        "X-RateLimit-Limit": "5000",
+                        "X-RateLimit-Remaining": "10",
+                        "X-RateLimit-Reset": "9999999999",
+                    },
+                ),
+                create_raw_response(
+                    [],
+                    headers={
+                        "X-RateLimit-Limit": "30",
+                        "X-RateLimit-Remaining": "29",
+                        "X-RateLimit-Reset": "9999999999",
+                        "X-RateLimit-Resource": "search",
+                    },
+                ),
+                create_raw_response([]),
+            ]
+        )
+
+        pool = GitHubTokenPool(["a", "b"])
+        session = GitHubSession(raw_session, token_pool=pool)
+
+        for url in ["repos/a/b", "search/issues", "repos/c/d"]:
+            async with session.get(f"https://api.github.com/{url}"):
+                pass
+
+        assert [call.kwargs["headers"]["Authorization"] for call in raw_session.get.call_args_list] == [
+            "Bearer a",
+            "Bearer a",
+            "Bearer b",
+        ]
+
+        assert pool.GetRateLimit("search") is None
+        assert pool.Acquire("search") == "b"
+
+
+# ----------------------------------------------------------------------
+def create_failing_raw_session(outcomes: list[MagicMock | BaseException]) -> MagicMock:
+    """Create a mock aiohttp.ClientSession that raises or returns the outcomes in order."""
+
+    raw_session = create_raw_session([outcome for outcome in outcomes if isinstance(outcome, MagicMock)])
+    get_context_manager = raw_session.get.side_effect
+    outcome_iter = iter(outcomes)
+
+    # ----------------------------------------------------------------------
+    def Get(*args, **kwargs):
+        outcome = next(outcome_iter)
+        if isinstance(outcome, BaseException):
+            raise outcome
+
+        return get_context_manager(*args, **kwargs)
+
+    # ----------------------------------------------------------------------
+
+    raw_session.get.side_effect = Get
+
+    return raw_session
+
+
+# ----------------------------------------------------------------------
+class TestWithRetries:
+    """Tests for GitHubSession with a retry policy."""
+
+    RETRY_POLICY = RetryPolicy(initial_delay=0.01, max_delay=0.02)
+
+    # ----------------------------------------------------------------------
+    @pytest.mark.asyncio
+    async def test_transient_statuses_are_retried(self) -> None:
+        """Responses with transient error statuses are retried."""
+
+        raw_session = create_failing_raw_session(
+            [
+                create_raw_response(None, status=502),
+                create_raw_response(None, status=503),
+                create_raw_response({"value": 1}),
+            ]
+        )
+        session = GitHubSession(raw_session, retry_policy=self.RETRY_POLICY)
+
+        async with session.get("https://api.github.com/url") as response:
+            assert response.status == 200
+
+        assert raw_session.get.call_count == 3
+
+    # ----------------------------------------------------------------------
+    @pytest.mark.asyncio
+    async def test_transient_exceptions_are_retried(self) -> None:
+        """Connection errors and timeouts are retried."""
+
+        raw_session = create_failing_raw_session(
+            [
+                aiohttp.ServerDisconnectedError(),
+                TimeoutError(),
+                create_raw_response({"value": 1}),
+            ]
+        )
+        session = GitHubSession(raw_session, retry_policy=self.RETRY_POLICY)
+
+        async with session.get("https://api.github.com/url") as response:
+            assert response.status == 200
+
+    # ----------------------------------------------------------------------
+    @pytest.mark.asyncio
+    async def test_other_errors_are_not_retried(self) -> None:
+        """Responses and exceptions that do not indicate transient errors are not retried."""
+
+        raw_session = create_failing_raw_session(
+            [
+                create_raw_response(None, status=404),
+                aiohttp.ClientResponseError(MagicMock(), ()),
+            ]
+        )
+        session = GitHubSession(raw_session, retry_policy=self.RETRY_POLICY)
+
+        async with session.get("https://api.github.com/url1") as response:
+            assert response.status == 404
+
+        with pytest.raises(aiohttp.ClientResponseError):
+            async with session.get("https://api.github.com/url2"):
+                pass  # pragma: no cover
+
+        assert raw_session.get.call_count == 2
+
+    # ----------------------------------------------------------------------
+    @pytest.mark.asyncio
+    async def test_max_attempts(self) -> None:
+        """The last outcome is returned once the maximum number of attempts is reached."""
+
+        raw_session = create_failing_raw_session(
+            [
+                create_raw_response(None, status=500),
+                create_raw_response(None, status=500),
+                aiohttp.ClientOSError(),
+                aiohttp.ClientOSError(),
+            ]
+        )
+        session = GitHubSession(raw_session, retry_policy=RetryPolicy(max_attempts=2, initial_delay=0.01))
+
+        async with session.get("https://api.github.com/url1") as response:
+            assert response.status == 500
+
+        with pytest.raises(aiohttp.ClientOSError):
+            async with session.get("https://api.github.com/url2"):
+                pass  # pragma: no cover
+
+        assert raw_session.get.call_count == 4
+
+    # ----------------------------------------------------------------------
+    @pytest.mark.asyncio
+    async def test_deadline(self) -> None:
+        """Requests are not retried once the deadline would be exceeded."""
+
+        raw_session = create_failing_raw_session([create_raw_response(None, status=502)])
+        session = GitHubSession(raw_session, retry_policy=RetryPolicy(initial_delay=10.0, deadline=1.0))
+
+        async with session.get("https://api.github.com/url") as response:
+            assert response.status == 502
+
+    # ----------------------------------------------------------------------
+    @pytest.mark.asyncio
+    async def test_attempt_timeout(self) -> None:
+        """Attempts that take too long time out."""
+
+        # ----------------------------------------------------------------------
+        async def Enter(*args, **kwargs):  # noqa: ARG001
+            await asyncio.sleep(10)
+
+        # ----------------------------------------------------------------------
+        def Get(*args, **kwargs):  # noqa: ARG001
+            cm = MagicMock()
+            cm.__aenter__ = Enter
+            cm.__aexit__ = AsyncMock(return_value=None)
+            return cm
+
+        # ----------------------------------------------------------------------
+
+        raw_session = MagicMock()
+        raw_session.get = MagicMock(side_effect=Get)
+
+        session = GitHubSession(
+            raw_session, retry_policy=RetryPolicy(max_attempts=2, attempt_timeout=0.01, initial_delay=0.01)
+        )
+
+        with pytest.raises(TimeoutError):
+            async with session.get("https://api.github.com/url"):
+                pass  # pragma: no cover
+
+        assert raw_session.get.call_count == 2
+
+    # ----------------------------------------------------------------------
+    @pytest.mark.asyncio
+    async def test_circuit_breaker(self) -> None:
+        """Requests are paused once the circuit breaker opens."""
+
+        raw_session = create_failing_raw_session(
+            [
+                create_raw_response(None, status=502),
+                create_raw_response(None, status=502),
+                create_raw_response({"value": 1}),
+            ]
+        )
+        circuit_breaker = GitHubCircuitBreaker(failure_threshold=2, open_duration=0.05)
+        session = GitHubSession(raw_session, retry_policy=self.RETRY_POLICY, circuit_breaker=circuit_breaker)
+
+        start = time.monotonic()
+
+        async with session.get("https://api.github.com/url") as response:
+            assert response.status == 200
+
+        assert time.monotonic() - start >= 0.05
+        assert not circuit_breaker.IsOpen("api.github.com")
+
+    # ----------------------------------------------------------------------
+    @pytest.mark.asyncio
+    async def test_circuit_open_beyond_deadline(self) -> None:
+        """Requests fail when the circuit breaker would pause them beyond the deadline."""
+
+        raw_session = create_failing_raw_session([create_raw_response(None, status=502)])
+        circuit_breaker = GitHubCircuitBreaker(failure_threshold=1, open_duration=60.0)
+        session = GitHubSession(
+            raw_session,
+            retry_policy=RetryPolicy(initial_delay=0.01, deadline=1.0),
+            circuit_breaker=circuit_breaker,
+        )
+
+        with pytest.raises(CircuitOpenError):
+            async with session.get("https://api.github.com/url"):
+                pass  # pragma: no cover
+
+    # ----------------------------------------------------------------------
+    @pytest.mark.asyncio
+    async def test_cancelled_probe(self) -> None:
+        """Cancelled requests do not affect the circuit breaker's failure count."""
+
+        raw_session = create_failing_raw_session([asyncio.CancelledError()])
+        circuit_breaker = GitHubCircuitBreaker(failure_threshold=1)
+        session = GitHubSession(raw_session, retry_policy=self.RETRY_POLICY, circuit_breaker=circuit_breaker)
+
+        with pytest.raises(asyncio.CancelledError):
+            async with session.get("https://api.github.com/url"):
+                pass  # pragma: no cover
+
+        assert not circuit_breaker.IsOpen("api.github.com")
+
+
+# ----------------------------------------------------------------------
+class TestWithCache:
+    """Tests for GitHubSession with a cache."""
+
+    # ----------------------------------------------------------------------
+    @pytest.mark.asyncio
+    async def test_not_modified_uses_cached_content(self, cache: GitHubResponseCache) -> None:
+        """A 304 response returns the previously cached content."""
+
+        raw_session = create_raw_session(
+            [
+                create_raw_response({"value": 1}, headers={"ETag": '"v1"', "Link": "<next>"}),
+                create_raw_response(None, status=304, headers={"ETag": '"v1"'}),
+            ]
+        )
+        session = GitHubSession(raw_session, cache=cache)
+
+        async with session.get("https://api.github.com/url") as response:
+            assert await response.json() == {"value": 1}
+            assert response.from_cache is False
+
+        session.StartGeneration()
+
+        async with session.get("https://api.github.com/url") as response:
+            response.raise_for_status()
+
+            assert response.status == 200
+            assert response.from_cache is True
+            assert response.headers["Link"] == "<next>"
+            assert await response.json() == {"value": 1}
+
+        assert raw_session.get.call_args_list[0].kwargs["headers"] == {}
+        assert raw_session.get.call_args_list[1].kwargs["headers"] == {"If-None-Match": '"v1"'}
+
+    # ----------------------------------------------------------------------
+    @pytest.mark.asyncio
+    async def test_last_modified_is_sent(self, cache: GitHubResponseCache) -> None:
+        """If-Modified-Since is sent when the cached response has a Last-Modified header."""
+
+        raw_session = create_raw_session(
+            [
+                create_raw_response({}, headers={"Last-Modified": "yesterday"}),
+                create_raw_response({}, headers={"Last-Modified": "today"}),
+            ]
+        )
+        session = GitHubSession(raw_session, cache=cache)
+
+        async with session.get("https://api.github.com/url"):
+            pass
+
+        session.StartGeneration()
+
+        async with session.get("https://api.github.com/url"):
+            pass
+
+        assert raw_session.get.call_args_list[1].kwargs["headers"] == {"If-Modified-Since": "yesterday"}
+
+    # ----------------------------------------------------------------------
+    @pytest.mark.asyncio
+    async def test_modified_content_replaces_cache(self, cache: GitHubResponseCache) -> None:
+        """A 200 response replaces the previously cached content."""
+
+        raw_session = create_raw_session(
+            [
+                create_raw_response({"value": 1}, headers={"ETag": '"v1"'}),
+                create_raw_response({"value": 2}, headers={"ETag": '"v2"'}),
+                create_raw_response(None, status=304),
+            ]
+        )
+        session = GitHubSession(raw_session, cache=cache)
+
+        for expected in [1, 2, 2]:
+            session.StartGeneration()
+
+            async with session.get("https://api.github.com/url") as response:
+                assert await response.json() == {"value": expected}
+
+        assert raw_session.get.call_args_list[2].kwargs["headers"] == {"If-None-Match": '"v2"'}
+
+    # ----------------------------------------------------------------------
+    @pytest.mark.asyncio
+    async def test_fresh_entries_do_not_make_requests(self, cache: GitHubResponseCache) -> None:
+        """Responses within their max-age are returned without a request."""
+
+        raw_session = create_raw_session(
+            [create_raw_response({"value": 1}, headers={"ETag": '"v1"', "Cache-Control": "max-age=60"})]
+        )
+        session = GitHubSession(raw_session, cache=cache)
+
+        for _ in range(3):
+            session.StartGeneration()
+
+            async with session.get("https://api.github.com/url", params={"a": 1}) as response:
+                assert await response.json() == {"value": 1}
+
+        assert raw_session.get.call_count == 1
+
+    # ----------------------------------------------------------------------
+    @pytest.mark.asyncio
+    async def test_errors_are_not_cached(self, cache: GitHubResponseCache) -> None:
+        """Error responses are not cached."""
+
+        raw_session = create_raw_session(
+            [
+                create_raw_response({"message": "Not Found"}, status=404, headers={"ETag": "1"}),
+                create_raw_response({"value": 1}, headers={"ETag": "2"}),
+            ]
+        )
+        session = GitHubSession(raw_session, cache=cache)
+
+        async with session.get("https://api.github.com/url") as response:
+            assert response.status == 404
+
+        async with session.get("https://api.github.com/url") as response:
+            assert await response.json() == {"value": 1}
+
+        assert raw_session.get.call_args_list[1].kwargs["headers"] == {}
+
+    # ----------------------------------------------------------------------
+    @pytest.mark.asyncio
+    async def test_close_closes_cache(self, tmp_path: Path) -> None:
+        """Closing the session closes the cache."""
+
+        cache = MagicMock()
+        raw_session = create_raw_session([])
+
+        await GitHubSession(raw_session, cache=cache).close()
+
+        cache.Close.assert_called_once()
+
+
+# ----------------------------------------------------------------------
+class TestWithScheduler:
+    """Tests for GitHubSession with a scheduler."""
+
+    # ----------------------------------------------------------------------
+    @pytest.mark.asyncio
+    async def test_requests_are_scheduled(self) -> None:
+        """Requests are sent through the scheduler."""
+
+        raw_session = create_raw_session([create_raw_response({"value": 1})])
+        scheduler = GitHubRequestScheduler()
+
+        session = GitHubSession(raw_session, scheduler=scheduler)
+
+        with patch.object(scheduler, "Execute", wraps=scheduler.Execute) as execute:
+            async with session.get("https://api.github.com/url") as response:
+                assert await response.json() == {"value": 1}
+
+        execute.assert_called_once()
+
+    # ----------------------------------------------------------------------
+    @pytest.mark.asyncio
+    async def test_search_requests_use_search_scheduler(self) -> None:
+        """Search requests are sent through the search scheduler."""
+
+        raw_session = create_raw_session(
+            [create_raw_response({"value": 1}), create_raw_response({"value": 2})]
+        )
+        scheduler = GitHubRequestScheduler()
+        search_scheduler = GitHubRequestScheduler()
+
+        session = GitHubSession(raw_session, scheduler=scheduler, search_scheduler=search_scheduler)
+
+        with (
+            patch.object(scheduler, "Execute", wraps=scheduler.Execute) as execute,
+            patch.object(search_scheduler, "Execute", wraps=search_scheduler.Execute) as search_execute,
+        ):
+            async with session.get("https://api.github.com/search/issues"):
+                pass
+
+            async with session.get("https://api.github.com/repos/owner/repo"):
+                pass
+
+        assert search_execute.call_count == 1
+        assert execute.call_count == 1
+
+
+# ----------------------------------------------------------------------
+class TestCoalescing:
+    """Tests for coalescing identical requests."""
+
+    # ----------------------------------------------------------------------
+    @pytest.mark.asyncio
+    async def test_concurrent_requests_are_coalesced(self) -> None:
+        """Concurrent identical requests share a single request."""
+
+        raw_session = create_raw_session([create_raw_response({"value": 1})])
+        session = GitHubSession(raw_session)
+
+        # ----------------------------------------------------------------------
+        async def Get(params: dict[str, str | int]) -> object:
+            async with session.get("https://api.github.com/url", params=params) as response:
+                return await response.json()
+
+        # ----------------------------------------------------------------------
+
+        results = await asyncio.gather(
+            Get({"a": 1, "b": "2"}), Get({"b": 2, "a": "1"}), Get({"a": 1, "b": 2})
+        )
+
+        assert results == [{"value": 1}] * 3
+        assert raw_session.get.call_count == 1
+
+    # ----------------------------------------------------------------------
+    @pytest.mark.asyncio
+    async def test_completed_responses_are_reused(self) -> None:
+        """Responses are reused by identical requests until a new generation starts."""
+
+        raw_session = create_raw_session(
+            [create_raw_response({"value": 1}), create_raw_response({"value": 2})]
+        )
+        session = GitHubSession(raw_session)
+
+        for expected in [1, 1]:
+            async with session.get("https://api.github.com/url") as response:
+                assert await response.json() == {"value": expected}
+
+            assert session._in_flight == {}
+
+        assert raw_session.get.call_count == 1
+
+        session.StartGeneration()
+
+        async with session.get("https://api.github.com/url") as response:
+            assert await response.json() == {"value": 2}
+
+        assert raw_session.get.call_count == 2
+
+    # ----------------------------------------------------------------------
+    @pytest.mark.asyncio
+    async def test_different_requests_are_not_coalesced(self) -> None:
+        """Requests with different urls or parameters are sent separately."""
+
+        raw_session = create_raw_session([create_raw_response(index) for index in range(3)])
+        session = GitHubSession(raw_session)
+
+        for url, params in [("one", None), ("two", None), ("two", {"page": 2})]:
+            async with session.get(f"https://api.github.com/{url}", params=params):
+                pass
+
+        assert raw_session.get.call_count == 3
+
+    # ----------------------------------------------------------------------
+    @pytest.mark.asyncio
+    async def test_errors_are_not_reused(self) -> None:
+        """Error responses and exceptions are not reused by later requests."""
+
+        raw_session = create_raw_session(
+            [
+                create_raw_response({"message": "Server Error"}, status=500),
+                create_raw_response({"value": 1}),
+            ]
+        )
+        get_context_manager = raw_session.get.side_effect
+        exceptions = iter([aiohttp.ClientError("boom")])
+
+        # ----------------------------------------------------------------------
+        def Get(*args, **kwargs):
+            exception = next(exceptions, None)
+            if exception is not None:
+                raise exception
+
+            return get_context_manager(*args, **kwargs)
+
+        # ----------------------------------------------------------------------
+
+        raw_session.get.side_effect = Get
+
+        session = GitHubSession(raw_session)
+
+        with pytest.raises(aiohttp.ClientError):
+            async with session.get("https://api.github.com/url"):
+                pass  # pragma: no cover
+
+        async with session.get("https://api.github.com/url") as response:
+            assert response.status == 500
+
+        async with session.get("https://api.github.com/url") as response:
+            assert await response.json() == {"value": 1}
+
+        assert raw_session.get.call_count == 3
+
+    # ----------------------------------------------------------------------
+    @pytest.mark.asyncio
+    async def test_request_in_flight_during_new_generation(self) -> None:
+        """Requests in flight when a new generation starts are not reused by the new generation."""
+
+        raw_session = create_raw_session(
+            [create_raw_response({"value": 1}), create_raw_response({"value": 2})]
+        )
+        session = GitHubSession(raw_session)
+
+        # ----------------------------------------------------------------------
+        async def Get() -> object:
+            async with session.get("https://api.github.com/url") as response:
+                return await response.json()
+
+        # ----------------------------------------------------------------------
+
+        task = asyncio.create_task(Get())
+        await asyncio.sleep(0)
+
+        session.StartGeneration()
+
+        new_task = asyncio.create_task(Get())
+        await asyncio.sleep(0)
+
+        # Requests in the new generation are still coalesced
+        assert await asyncio.gather(new_task, Get()) == [{"value": 2}] * 2
+        assert await task == {"value": 1}
+
+        assert raw_session.get.call_count == 2
+        assert session._in_flight == {}
+
+        # Only the response from the new generation is retained
+        assert await Get() == {"value": 2}
+        assert raw_session.get.call_count == 2
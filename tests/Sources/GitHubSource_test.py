@@ -1,14 +1,22 @@
 """Unit tests for AllGitStatus.Sources.GitHubSource module with mocked API responses."""
 
+import asyncio
+import json
+import time
+
+from datetime import datetime, timedelta, UTC
 from pathlib import Path
-from unittest.mock import AsyncMock, MagicMock
+from unittest.mock import AsyncMock, MagicMock, patch
 from typing import cast
 
 import pytest
 
 from AllGitStatus.Repository import Repository
+from AllGitStatus.Sources.GitHubCICDCache import GitHubCICDCache
+from AllGitStatus.Sources.GitHubIssueStore import GitHubIssueStore
+from AllGitStatus.Sources.GitHubSearchCounts import SearchCounts
 from AllGitStatus.Sources.GitHubSource import GitHubSource
-from AllGitStatus.Sources.Source import ErrorInfo, ResultInfo
+from AllGitStatus.Sources.Source import DeferredInfo, ErrorInfo, ResultInfo
 
 
 # ----------------------------------------------------------------------
@@ -3046,3 +3054,1170 @@ class TestRelease:
         assert "Assets:" in additional_info
         assert "app-linux.tar.gz (1500 downloads)" in additional_info
         assert "app-windows.zip (2300 downloads)" in additional_info
+
+
+# ----------------------------------------------------------------------
+class TestConcurrentQueries:
+    """Tests for the concurrent execution of the GitHub queries for a repository."""
+
+    # ----------------------------------------------------------------------
+    @staticmethod
+    def _CreateDelayedSession(delay: float) -> tuple[MagicMock, list[str]]:
+        """Create a session whose responses are delayed and that records the requested urls."""
+
+        requested_urls: list[str] = []
+
+        def get_context_manager(url: str, *args, **kwargs):  # noqa: ARG001
+            requested_urls.append(url)
+
+            if url.endswith("/repos/owner/repo"):
+                response = create_mock_response({"default_branch": "main"})
+            elif url.endswith("/actions/runs"):
+                response = create_mock_response({"workflow_runs": []})
+            elif url.endswith("/releases/latest"):
+                response = create_mock_response({"tag_name": "v1.0.0"})
+            else:
+                response = create_mock_response([])
+
+            async def enter(*args, **kwargs):  # noqa: ARG001
+                await asyncio.sleep(delay)
+                return response
+
+            cm = MagicMock()
+            cm.__aenter__ = enter
+            cm.__aexit__ = AsyncMock(return_value=None)
+            return cm
+
+        session = MagicMock()
+        session.get = get_context_manager
+
+        return session, requested_urls
+
+    # ----------------------------------------------------------------------
+    @pytest.mark.asyncio
+    async def test_queries_are_concurrent(self, github_repo: Repository) -> None:
+        """Independent queries are issued before any of them complete."""
+
+        delay = 0.2
+        session, requested_urls = self._CreateDelayedSession(delay)
+
+        start = time.perf_counter()
+        results = [info async for info in GitHubSource(session).Query(github_repo)]
+        duration = time.perf_counter() - start
+
+        assert len(requested_urls) == 6
+        assert requested_urls[-1].endswith("/actions/runs")
+        assert all(isinstance(result, ResultInfo) for result in results), results
+
+        # Standard info and CI/CD status are sequential, everything else happens concurrently
+        assert duration < delay * 4
+
+    # ----------------------------------------------------------------------
+    @pytest.mark.asyncio
+    async def test_results_yielded_as_they_complete(self, github_repo: Repository) -> None:
+        """Results are yielded as soon as each query completes."""
+
+        session, _ = self._CreateDelayedSession(0.01)
+
+        keys = [info.key[1] async for info in GitHubSource(session).Query(github_repo)]
+
+        assert sorted(keys) == sorted(
+            [
+                "stars",
+                "forks",
+                "watchers",
+                "archived",
+                "issues",
+                "pull_requests",
+                "security_alerts",
+                "release",
+                "cicd_status",
+            ]
+        )
+
+        # CI/CD status depends on the standard info and is therefore last
+        assert keys[-1] == "cicd_status"
+
+    # ----------------------------------------------------------------------
+    @pytest.mark.asyncio
+    async def test_unexpected_exceptions_are_propagated(self, github_repo: Repository) -> None:
+        """Exceptions that escape a query are propagated to the caller."""
+
+        session, _ = self._CreateDelayedSession(0.0)
+        source = GitHubSource(session)
+
+        async def Raise(*args, **kwargs):  # noqa: ARG001
+            raise ValueError("unexpected")
+            yield  # pragma: no cover
+
+        with (
+            patch.object(source, "_GenerateReleaseInfo", Raise),
+            pytest.raises(ValueError, match="unexpected"),
+        ):
+            _ = [info async for info in source.Query(github_repo)]
+
+    # ----------------------------------------------------------------------
+    @pytest.mark.asyncio
+    async def test_early_exit_cancels_queries(self, github_repo: Repository) -> None:
+        """Queries that are still running are cancelled when the caller stops iterating."""
+
+        session, _ = self._CreateDelayedSession(0.01)
+
+        generator = GitHubSource(session).Query(github_repo)
+
+        info = await anext(generator)
+        assert info is not None
+
+        await generator.aclose()
+
+
+# ----------------------------------------------------------------------
+class TestParallelPagination:
+    """Tests for fetching pages concurrently when the last page is known."""
+
+    # ----------------------------------------------------------------------
+    @staticmethod
+    def _CreatePagedSession(num_pages: int, delay: float) -> tuple[MagicMock, list[str]]:
+        """Create a session that returns `num_pages` pages of issues."""
+
+        base_url = "https://api.github.com/repositories/1/issues?state=open&per_page=100"
+        requested_urls: list[str] = []
+
+        def get_context_manager(url: str, *args, **kwargs):  # noqa: ARG001
+            requested_urls.append(url)
+
+            page = int(url.rsplit("page=", 1)[1]) if "page=" in url and "per_page=100&" in url else 1
+
+            headers = {}
+
+            if page < num_pages:
+                headers["Link"] = (
+                    f'<{base_url}&page={page + 1}>; rel="next", <{base_url}&page={num_pages}>; rel="last"'
+                )
+
+            response = create_mock_response([{"number": page}], headers=headers)
+
+            async def enter(*args, **kwargs):  # noqa: ARG001
+                await asyncio.sleep(delay * (num_pages - page))
+                return response
+
+            cm = MagicMock()
+            cm.__aenter__ = enter
+            cm.__aexit__ = AsyncMock(return_value=None)
+            return cm
+
+        session = MagicMock()
+        session.get = get_context_manager
+
+        return session, requested_urls
+
+    # ----------------------------------------------------------------------
+    @pytest.mark.asyncio
+    async def test_pages_fetched_concurrently_and_yielded_in_order(self) -> None:
+        """Remaining pages are fetched concurrently and results are yielded in page order."""
+
+        session, requested_urls = self._CreatePagedSession(5, 0.01)
+        source = GitHubSource(session)
+
+        results = [
+            result["number"]
+            async for result in source._GeneratePaginatedResults("https://api.github.com/repos/o/r/issues")
+        ]
+
+        assert results == [1, 2, 3, 4, 5]
+        assert len(requested_urls) == 5
+        assert requested_urls[1:] == [
+            f"https://api.github.com/repositories/1/issues?state=open&per_page=100&page={page}"
+            for page in range(2, 6)
+        ]
+
+    # ----------------------------------------------------------------------
+    @pytest.mark.asyncio
+    async def test_window_limits_concurrent_pages(self) -> None:
+        """No more than MAX_CONCURRENT_PAGES pages are requested at once."""
+
+        session, requested_urls = self._CreatePagedSession(6, 0.0)
+        source = GitHubSource(session)
+        source.MAX_CONCURRENT_PAGES = 2
+
+        results = [
+            result["number"]
+            async for result in source._GeneratePaginatedResults("https://api.github.com/repos/o/r/issues")
+        ]
+
+        assert results == [1, 2, 3, 4, 5, 6]
+        assert len(requested_urls) == 6
+
+    # ----------------------------------------------------------------------
+    @pytest.mark.asyncio
+    async def test_early_exit_cancels_pending_pages(self) -> None:
+        """Pages that are still being fetched are cancelled when the caller stops iterating."""
+
+        session, _ = self._CreatePagedSession(5, 0.01)
+        source = GitHubSource(session)
+
+        generator = source._GeneratePaginatedResults("https://api.github.com/repos/o/r/issues")
+
+        assert (await anext(generator))["number"] == 1
+        assert (await anext(generator))["number"] == 2
+
+        await generator.aclose()
+
+    # ----------------------------------------------------------------------
+    def test_page_urls_require_page_numbers(self) -> None:
+        """Page urls are not calculated when the links do not contain page numbers."""
+
+        assert GitHubSource._CreatePageUrls("https://a?page=2", None) is None
+        assert GitHubSource._CreatePageUrls("https://a?after=abc", "https://a?page=3") is None
+        assert GitHubSource._CreatePageUrls("https://a?page=2", "https://a?page=last") is None
+        assert GitHubSource._CreatePageUrls("https://a.com/b?page=2&x=1", "https://a.com/b?page=3") == [
+            "https://a.com/b?page=2&x=1",
+            "https://a.com/b?page=3&x=1",
+        ]
+
+
+# ----------------------------------------------------------------------
+class TestOwnerListings:
+    """Tests for standard info provided by owner listings."""
+
+    # ----------------------------------------------------------------------
+    @pytest.mark.asyncio
+    async def test_standard_info_from_listing(self, github_repo: Repository) -> None:
+        """Stars, forks, archived and the default branch are provided by the owner listing."""
+
+        listings = MagicMock()
+        listings.GetRepository = AsyncMock(
+            return_value={
+                "stargazers_count": 42,
+                "forks_count": 7,
+                "archived": True,
+                "default_branch": "develop",
+            }
+        )
+
+        responses = [
+            create_mock_response([]),  # Issues API
+            create_mock_response([]),  # PRs API
+            create_mock_response([]),  # Security alerts API
+            create_mock_response({}, status=404),  # Release API
+            create_mock_response({"workflow_runs": []}),  # CI/CD API
+            create_mock_response({"subscribers_count": 9}),  # Repo API (for watchers, when selected)
+        ]
+
+        session = create_mock_session(responses)
+        session.get = MagicMock(side_effect=session.get)
+
+        source = GitHubSource(session, listings)
+
+        results = {info.key[1]: info async for info in source.Query(github_repo)}
+
+        listings.GetRepository.assert_awaited_once_with(github_repo)
+
+        # The repository isn't requested until the watchers are displayed
+        assert session.get.call_count == 5
+
+        assert isinstance(results["stars"], ResultInfo)
+        assert "42" in results["stars"].display_value
+        assert isinstance(results["forks"], ResultInfo)
+        assert "7" in results["forks"].display_value
+        assert isinstance(results["archived"], ResultInfo)
+        assert results["archived"].display_value == "📦"
+        assert isinstance(results["cicd_status"], ResultInfo)
+        assert "develop" in cast(str, results["cicd_status"].additional_info)
+
+        assert isinstance(results["watchers"], ResultInfo)
+        assert "?" in results["watchers"].display_value
+
+        deferred_info = results["watchers"].additional_info
+        assert isinstance(deferred_info, DeferredInfo)
+        assert deferred_info.placeholder == "https://github.com/owner/repo/watchers\n\nLoading..."
+        assert await deferred_info.Resolve() == "Watchers: 9\n\nhttps://github.com/owner/repo/watchers"
+        assert session.get.call_count == 6
+
+    # ----------------------------------------------------------------------
+    @pytest.mark.asyncio
+    async def test_watchers_error_only_impacts_watchers(self, github_repo: Repository) -> None:
+        """An error retrieving watchers does not impact the values provided by the owner listing."""
+
+        listings = MagicMock()
+        listings.GetRepository = AsyncMock(return_value={"stargazers_count": 42, "default_branch": "main"})
+
+        responses = [
+            create_mock_response([]),  # Issues API
+            create_mock_response([]),  # PRs API
+            create_mock_response([]),  # Security alerts API
+            create_mock_response({}, status=404),  # Release API
+            create_mock_response({"workflow_runs": []}),  # CI/CD API
+            create_mock_response({}, status=500),  # Repo API (for watchers, when selected)
+        ]
+
+        source = GitHubSource(create_mock_session(responses), listings)
+
+        results = {info.key[1]: info async for info in source.Query(github_repo)}
+
+        assert isinstance(results["stars"], ResultInfo)
+        assert isinstance(results["cicd_status"], ResultInfo)
+
+        assert isinstance(results["watchers"], ResultInfo)
+        assert isinstance(results["watchers"].additional_info, DeferredInfo)
+
+        from aiohttp import ClientResponseError
+
+        with pytest.raises(ClientResponseError):
+            await results["watchers"].additional_info.Resolve()
+
+    # ----------------------------------------------------------------------
+    @pytest.mark.asyncio
+    async def test_repository_not_in_listing(self, github_repo: Repository) -> None:
+        """Repositories that are not in the owner listing are requested directly."""
+
+        listings = MagicMock()
+        listings.GetRepository = AsyncMock(return_value=None)
+
+        responses = [
+            create_mock_response({"stargazers_count": 3, "subscribers_count": 4, "default_branch": "main"}),
+            create_mock_response([]),  # Issues API
+            create_mock_response([]),  # PRs API
+            create_mock_response([]),  # Security alerts API
+        ]
+
+        source = GitHubSource(create_mock_session(responses), listings)
+
+        results = {info.key[1]: info async for info in source.Query(github_repo)}
+
+        assert isinstance(results["stars"], ResultInfo)
+        assert "3" in results["stars"].display_value
+        assert isinstance(results["watchers"], ResultInfo)
+        assert "4" in results["watchers"].display_value
+
+
+# ----------------------------------------------------------------------
+class TestIssueStore:
+    """Tests for syncing issues and pull requests incrementally with an issue store."""
+
+    # ----------------------------------------------------------------------
+    @pytest.fixture
+    def store(self, tmp_path: Path):
+        """Create an issue store."""
+
+        store = GitHubIssueStore(tmp_path / "issues.db", "token")
+
+        try:
+            yield store
+        finally:
+            store.Close()
+
+    # ----------------------------------------------------------------------
+    @staticmethod
+    def _CreateSession(responses: list[MagicMock]) -> tuple[MagicMock, list[tuple[str, dict | None]]]:
+        """Create a session that returns the responses in order and records the requests."""
+
+        requests: list[tuple[str, dict | None]] = []
+        session = create_mock_session(responses)
+        get_context_manager = session.get
+
+        def get(url: str, params: dict | None = None):
+            requests.append((url, params))
+            return get_context_manager(url, params=params)
+
+        session.get = get
+
+        return session, requests
+
+    # ----------------------------------------------------------------------
+    @staticmethod
+    def _CreateItem(number: int, updated_at: datetime, state: str = "open") -> dict:
+        return {
+            "number": number,
+            "state": state,
+            "title": f"Item {number}",
+            "updated_at": updated_at.strftime("%Y-%m-%dT%H:%M:%SZ"),
+        }
+
+    # ----------------------------------------------------------------------
+    @pytest.mark.asyncio
+    async def test_issues_synced_incrementally(
+        self, github_repo: Repository, store: GitHubIssueStore
+    ) -> None:
+        """Only issues updated since the last sync are requested after the initial sync."""
+
+        now = datetime.now(UTC)
+
+        session, requests = self._CreateSession(
+            [
+                create_mock_response([self._CreateItem(2, now), self._CreateItem(1, now)]),
+                create_mock_response(
+                    [self._CreateItem(3, now), self._CreateItem(1, now, state="closed")],
+                ),
+            ]
+        )
+
+        source = GitHubSource(session, issue_store=store)
+
+        assert [item["number"] for item in await source._GetOpenItems(github_repo, "issues")] == [2, 1]
+        assert [item["number"] for item in await source._GetOpenItems(github_repo, "issues")] == [3, 2]
+
+        assert requests[0] == (
+            "https://api.github.com/repos/owner/repo/issues",
+            {"state": "open", "per_page": 100},
+        )
+
+        url, params = requests[1]
+
+        assert url == "https://api.github.com/repos/owner/repo/issues"
+        assert params is not None
+        assert params["state"] == "all"
+        assert datetime.fromisoformat(params["since"]) <= now - GitHubSource.SYNC_OVERLAP
+
+    # ----------------------------------------------------------------------
+    @pytest.mark.asyncio
+    async def test_pulls_stop_at_first_older_item(
+        self, github_repo: Repository, store: GitHubIssueStore
+    ) -> None:
+        """Pull requests are requested by update time until the first item older than the last sync."""
+
+        now = datetime.now(UTC)
+        old = now - timedelta(days=1)
+
+        store.Update(
+            "owner",
+            "repo",
+            "pulls",
+            [self._CreateItem(1, old), self._CreateItem(2, old)],
+            now - timedelta(hours=1),
+            full=True,
+        )
+
+        session, requests = self._CreateSession(
+            [
+                create_mock_response(
+                    [self._CreateItem(3, now), self._CreateItem(2, now, state="closed")],
+                    headers={"Link": '<https://api.github.com/page2>; rel="next"'},
+                ),
+                create_mock_response(
+                    [self._CreateItem(4, now), self._CreateItem(1, old)],
+                    headers={"Link": '<https://api.github.com/page3>; rel="next"'},
+                ),
+            ]
+        )
+
+        source = GitHubSource(session, issue_store=store)
+
+        assert [item["number"] for item in await source._GetOpenItems(github_repo, "pulls")] == [4, 3, 1]
+
+        assert requests == [
+            (
+                "https://api.github.com/repos/owner/repo/pulls",
+                {"state": "all", "sort": "updated", "direction": "desc", "per_page": 100},
+            ),
+            ("https://api.github.com/page2", None),
+        ]
+
+    # ----------------------------------------------------------------------
+    @pytest.mark.asyncio
+    async def test_errors_do_not_update_store(self, github_repo: Repository, store: GitHubIssueStore) -> None:
+        """The store is not updated when the sync fails."""
+
+        session, _ = self._CreateSession([create_mock_response({}, status=500)])
+
+        source = GitHubSource(session, issue_store=store)
+
+        with pytest.raises(Exception, match="Error"):
+            await source._GetOpenItems(github_repo, "issues")
+
+        assert store.GetLastSync("owner", "repo", "issues") is None
+
+    # ----------------------------------------------------------------------
+    @pytest.mark.asyncio
+    async def test_query_uses_store(self, github_repo: Repository, store: GitHubIssueStore) -> None:
+        """Issue and pull request info is calculated from the store."""
+
+        now = datetime.now(UTC)
+
+        store.Update(
+            "owner",
+            "repo",
+            "issues",
+            [{"number": 7, "title": "Stored", "labels": [{"name": "bug"}]}],
+            now,
+            full=True,
+        )
+
+        responses = [
+            create_mock_response({"stargazers_count": 1, "default_branch": None}),  # Repo API
+            create_mock_response([]),  # Issues API (no changes)
+            create_mock_response([]),  # PRs API (initial sync)
+            create_mock_response([]),  # Security alerts API
+            create_mock_response({}, status=404),  # Release API
+        ]
+
+        source = GitHubSource(create_mock_session(responses), issue_store=store)
+
+        results = {info.key[1]: info async for info in source.Query(github_repo)}
+
+        assert isinstance(results["issues"], ResultInfo)
+        assert "1" in results["issues"].display_value
+        assert "bug: 1" in cast(str, results["issues"].additional_info)
+        assert "#7 [bug] Stored" in cast(str, results["issues"].additional_info)
+
+
+# ----------------------------------------------------------------------
+class TestLazyDetails:
+    """Tests for retrieving issue and pull request details only when they are displayed."""
+
+    # ----------------------------------------------------------------------
+    @staticmethod
+    def _CreateSession(
+        repo_result: dict,
+        pulls_headers: dict[str, str] | None = None,
+        repo_status: int = 200,
+    ) -> tuple[MagicMock, list[tuple[str, dict | None]]]:
+        """Create a session that returns responses based on the requested url."""
+
+        requests: list[tuple[str, dict | None]] = []
+
+        def get_context_manager(url: str, params: dict | None = None, *args, **kwargs):  # noqa: ARG001
+            requests.append((url, params))
+
+            if url.endswith("/repos/owner/repo"):
+                response = create_mock_response(repo_result, status=repo_status)
+            elif url.endswith("/pulls") and params and params["per_page"] == 1:
+                response = create_mock_response([{"number": 10}], headers=pulls_headers)
+            elif url.endswith("/pulls"):
+                response = create_mock_response([{"number": 10, "title": "PR", "user": {"login": "me"}}])
+            elif url.endswith("/issues"):
+                response = create_mock_response(
+                    [
+                        {"number": 11, "title": "Issue", "labels": [{"name": "bug"}]},
+                        {"number": 10, "pull_request": {}},
+                    ]
+                )
+            elif url.endswith("/releases/latest"):
+                response = create_mock_response({}, status=404)
+            elif url.endswith("/actions/runs"):
+                response = create_mock_response({"workflow_runs": []})
+            else:
+                response = create_mock_response([])
+
+            cm = MagicMock()
+            cm.__aenter__ = AsyncMock(return_value=response)
+            cm.__aexit__ = AsyncMock(return_value=None)
+            return cm
+
+        session = MagicMock()
+        session.get = get_context_manager
+
+        return session, requests
+
+    # ----------------------------------------------------------------------
+    @pytest.mark.asyncio
+    async def test_counts_without_details(self, github_repo: Repository) -> None:
+        """Counts are calculated without retrieving the issues and pull requests."""
+
+        session, requests = self._CreateSession(
+            {"open_issues_count": 50, "default_branch": "main"},
+            pulls_headers={
+                "Link": '<https://api.github.com/repositories/1/pulls?state=open&per_page=1&page=8>; rel="last"',
+            },
+        )
+
+        source = GitHubSource(session, lazy_details=True)
+
+        results = {info.key[1]: info async for info in source.Query(github_repo)}
+
+        issues = results["issues"]
+        pull_requests = results["pull_requests"]
+
+        assert isinstance(issues, ResultInfo)
+        assert issues.display_value == "   42 🐛"
+        assert isinstance(issues.additional_info, DeferredInfo)
+
+        assert isinstance(pull_requests, ResultInfo)
+        assert pull_requests.display_value == "    8 🔀"
+        assert isinstance(pull_requests.additional_info, DeferredInfo)
+
+        assert not any(url.endswith("/issues") for url, _ in requests)
+        assert [params for url, params in requests if url.endswith("/pulls")] == [
+            {"state": "open", "per_page": 1}
+        ]
+
+        # Details are retrieved when resolved
+        issue_details = await issues.additional_info.Resolve()
+
+        assert isinstance(issue_details, str)
+        assert "Total Open Issues: 1" in issue_details
+        assert "#11 [bug] Issue" in issue_details
+
+        pull_request_details = await pull_requests.additional_info.Resolve()
+
+        assert isinstance(pull_request_details, str)
+        assert "#10 PR (by me)" in pull_request_details
+
+    # ----------------------------------------------------------------------
+    @pytest.mark.asyncio
+    async def test_pull_request_count_without_last_link(self, github_repo: Repository) -> None:
+        """The number of pull requests is the number of results when there is a single page."""
+
+        session, _ = self._CreateSession({"open_issues_count": 3})
+
+        source = GitHubSource(session, lazy_details=True)
+
+        results = {info.key[1]: info async for info in source.Query(github_repo)}
+
+        assert isinstance(results["issues"], ResultInfo)
+        assert results["issues"].display_value == "    2 🐛"
+        assert isinstance(results["pull_requests"], ResultInfo)
+        assert results["pull_requests"].display_value == "    1 🔀"
+
+    # ----------------------------------------------------------------------
+    @pytest.mark.asyncio
+    async def test_pull_request_count_with_cursor_pagination(self, github_repo: Repository) -> None:
+        """Pull requests are counted when the number of pages can't be determined."""
+
+        session, requests = self._CreateSession(
+            {"open_issues_count": 3},
+            pulls_headers={"Link": '<https://api.github.com/pulls?after=abc>; rel="next"'},
+        )
+
+        source = GitHubSource(session, lazy_details=True)
+
+        results = {info.key[1]: info async for info in source.Query(github_repo)}
+
+        assert isinstance(results["pull_requests"], ResultInfo)
+        assert results["pull_requests"].display_value == "    1 🔀"
+        assert [params for url, params in requests if url.endswith("/pulls")] == [
+            {"state": "open", "per_page": 1},
+            {"state": "open", "per_page": 100},
+        ]
+
+    # ----------------------------------------------------------------------
+    @pytest.mark.asyncio
+    async def test_issues_without_repository_info(self, github_repo: Repository) -> None:
+        """Issues are retrieved when the open issue count is not available."""
+
+        session, _ = self._CreateSession({}, repo_status=500)
+
+        source = GitHubSource(session, lazy_details=True)
+
+        results = {info.key[1]: info async for info in source.Query(github_repo)}
+
+        assert isinstance(results["issues"], ResultInfo)
+        assert results["issues"].display_value == "    1 🐛"
+        assert isinstance(results["issues"].additional_info, str)
+
+    # ----------------------------------------------------------------------
+    @pytest.mark.asyncio
+    async def test_pull_request_count_error(self, github_repo: Repository) -> None:
+        """Errors retrieving the number of pull requests are reported for issues and pull requests."""
+
+        session, _ = self._CreateSession({"open_issues_count": 3}, pulls_headers=None)
+
+        get_context_manager = session.get
+
+        def get(url: str, params: dict | None = None, *args, **kwargs):
+            if url.endswith("/pulls"):
+                raise ValueError("boom")
+
+            return get_context_manager(url, params, *args, **kwargs)
+
+        session.get = get
+
+        source = GitHubSource(session, lazy_details=True)
+
+        results = {info.key[1]: info async for info in source.Query(github_repo)}
+
+        assert isinstance(results["issues"], ErrorInfo)
+        assert isinstance(results["pull_requests"], ErrorInfo)
+
+
+# ----------------------------------------------------------------------
+class TestQueryInfo:
+    """Tests for generating a single piece of information."""
+
+    # ----------------------------------------------------------------------
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        ("name", "expected_urls"),
+        [
+            ("stars", ["https://api.github.com/repos/owner/repo"]),
+            ("issues", ["https://api.github.com/repos/owner/repo/issues"]),
+            ("pull_requests", ["https://api.github.com/repos/owner/repo/pulls"]),
+            ("security_alerts", ["https://api.github.com/repos/owner/repo/dependabot/alerts"]),
+            ("release", ["https://api.github.com/repos/owner/repo/releases/latest"]),
+            (
+                "cicd_status",
+                [
+                    "https://api.github.com/repos/owner/repo",
+                    "https://api.github.com/repos/owner/repo/actions/runs",
+                ],
+            ),
+        ],
+    )
+    async def test_only_needed_requests(
+        self, github_repo: Repository, name: str, expected_urls: list[str]
+    ) -> None:
+        """Only the requests needed to generate the information are made."""
+
+        session, requests = TestLazyDetails._CreateSession(
+            {"open_issues_count": 50, "default_branch": "main"}
+        )
+
+        source = GitHubSource(session)
+
+        results = [info async for info in source.QueryInfo(github_repo, name)]
+
+        assert [info.key for info in results] == [("GitHubSource", name)]
+        assert [url for url, _ in requests] == expected_urls
+
+    # ----------------------------------------------------------------------
+    @pytest.mark.asyncio
+    async def test_details_retrieved(self, github_repo: Repository) -> None:
+        """Details are retrieved even when the source retrieves details lazily."""
+
+        session, requests = TestLazyDetails._CreateSession({"open_issues_count": 50})
+
+        source = GitHubSource(session, lazy_details=True)
+
+        results = [info async for info in source.QueryInfo(github_repo, "issues")]
+
+        assert len(results) == 1
+        assert isinstance(results[0], ResultInfo)
+        assert isinstance(results[0].additional_info, str)
+        assert "#11 [bug] Issue" in results[0].additional_info
+        assert len(requests) == 1
+
+
+# ----------------------------------------------------------------------
+class TestSearchCounts:
+    """Tests for issue and pull request counts provided by search counts."""
+
+    # ----------------------------------------------------------------------
+    @pytest.mark.asyncio
+    async def test_counts_from_search(self, github_repo: Repository) -> None:
+        """Counts are provided by the search counts when available."""
+
+        session, requests = TestLazyDetails._CreateSession({"open_issues_count": 50})
+
+        search_counts = MagicMock()
+        search_counts.GetCounts = AsyncMock(return_value=SearchCounts(issues=4, pull_requests=2))
+
+        source = GitHubSource(session, lazy_details=True, search_counts=search_counts)
+
+        results = {info.key[1]: info async for info in source.Query(github_repo)}
+
+        assert isinstance(results["issues"], ResultInfo)
+        assert results["issues"].display_value == "    4 🐛"
+        assert isinstance(results["pull_requests"], ResultInfo)
+        assert results["pull_requests"].display_value == "    2 🔀"
+
+        assert not any(url.endswith(("/issues", "/pulls")) for url, _ in requests)
+
+    # ----------------------------------------------------------------------
+    @pytest.mark.asyncio
+    async def test_counts_not_available(self, github_repo: Repository) -> None:
+        """Counts are calculated directly when not available from the search counts."""
+
+        session, _ = TestLazyDetails._CreateSession({"open_issues_count": 50})
+
+        search_counts = MagicMock()
+        search_counts.GetCounts = AsyncMock(return_value=None)
+
+        source = GitHubSource(session, lazy_details=True, search_counts=search_counts)
+
+        results = {info.key[1]: info async for info in source.Query(github_repo)}
+
+        assert isinstance(results["issues"], ResultInfo)
+        assert results["issues"].display_value == "   49 🐛"
+        assert isinstance(results["pull_requests"], ResultInfo)
+        assert results["pull_requests"].display_value == "    1 🔀"
+
+
+# ----------------------------------------------------------------------
+class TestCICDCache:
+    """Tests for CI/CD status cached by the head commit of the default branch and its most recent run."""
+
+    # ----------------------------------------------------------------------
+    class FakeServer:
+        """The head commit and workflow runs (most recent first) of the default branch."""
+
+        # ----------------------------------------------------------------------
+        def __init__(self, head_sha: str, workflow_runs: list[dict]) -> None:
+            self.head_sha = head_sha
+            self.workflow_runs = workflow_runs
+            self.requests: list[str] = []
+
+        # ----------------------------------------------------------------------
+        def CreateSession(self) -> MagicMock:
+            """Create a session that returns responses based on the requested url."""
+
+            def get_context_manager(url: str, params: dict | None = None, *args, **kwargs):  # noqa: ARG001
+                if url.endswith("/branches/main"):
+                    self.requests.append("branch")
+                    response = create_mock_response({"commit": {"sha": self.head_sha}})
+                elif url.endswith("/actions/runs") and params is not None and params["per_page"] == 1:
+                    self.requests.append("newest")
+                    response = create_mock_response({"workflow_runs": self.workflow_runs[:1]})
+                elif url.endswith("/actions/runs"):
+                    self.requests.append("runs")
+                    response = create_mock_response({"workflow_runs": self.workflow_runs})
+                else:
+                    run_id = int(url.rsplit("/", 1)[1])
+                    self.requests.append(f"run {run_id}")
+                    response = create_mock_response(
+                        next(run for run in self.workflow_runs if run["id"] == run_id),
+                    )
+
+                cm = MagicMock()
+                cm.__aenter__ = AsyncMock(return_value=response)
+                cm.__aexit__ = AsyncMock(return_value=None)
+                return cm
+
+            session = MagicMock()
+            session.get = get_context_manager
+
+            return session
+
+    # ----------------------------------------------------------------------
+    @staticmethod
+    def _CreateRun(run_id: int, workflow_id: int, status: str, conclusion: str | None = None) -> dict:
+        return {
+            "id": run_id,
+            "workflow_id": workflow_id,
+            "status": status,
+            "conclusion": conclusion,
+            "created_at": "2024-01-01T00:00:00Z",
+            "updated_at": f"2024-01-01T00:00:0{run_id}Z",
+            "path": f".github/workflows/{workflow_id}.yml",
+            "name": f"Workflow {workflow_id}",
+        }
+
+    # ----------------------------------------------------------------------
+    @staticmethod
+    async def _Query(source: GitHubSource, repo: Repository) -> ResultInfo | ErrorInfo:
+        return [
+            info async for info in source._GenerateCICDInfo(repo, "https://github.com/owner/repo", "main")
+        ][0]
+
+    @pytest.mark.asyncio
+    async def test_completed_runs_not_requested_again(self, github_repo: Repository) -> None:
+        """Runs are not requested again when the head commit and most recent run are unchanged."""
+
+        server = self.FakeServer("sha1", [self._CreateRun(1, 1, "completed", "success")])
+
+        source = GitHubSource(server.CreateSession(), cicd_cache=GitHubCICDCache())
+
+        for _ in range(2):
+            result = await self._Query(source, github_repo)
+
+            assert isinstance(result, ResultInfo)
+            assert result.display_value == "✅"
+
+        assert server.requests == ["branch", "newest", "runs", "branch", "newest"]
+
+    # ----------------------------------------------------------------------
+    @pytest.mark.asyncio
+    async def test_new_head_requests_runs(self, github_repo: Repository) -> None:
+        """Runs are requested when the head commit changes."""
+
+        server = self.FakeServer("sha1", [self._CreateRun(1, 1, "completed", "success")])
+
+        source = GitHubSource(server.CreateSession(), cicd_cache=GitHubCICDCache())
+
+        await self._Query(source, github_repo)
+
+        server.head_sha = "sha2"
+        server.workflow_runs = [self._CreateRun(2, 1, "completed", "failure"), *server.workflow_runs]
+
+        result = await self._Query(source, github_repo)
+
+        assert isinstance(result, ResultInfo)
+        assert result.display_value == "❌"
+        assert server.requests == ["branch", "newest", "runs", "branch", "newest", "runs"]
+
+    # ----------------------------------------------------------------------
+    @pytest.mark.asyncio
+    async def test_new_run_of_head_requests_runs(self, github_repo: Repository) -> None:
+        """Runs are requested when a run starts without a change to the head commit (e.g. scheduled runs)."""
+
+        server = self.FakeServer("sha1", [self._CreateRun(1, 1, "completed", "success")])
+
+        source = GitHubSource(server.CreateSession(), cicd_cache=GitHubCICDCache())
+
+        await self._Query(source, github_repo)
+
+        server.workflow_runs = [self._CreateRun(2, 2, "queued"), *server.workflow_runs]
+
+        result = await self._Query(source, github_repo)
+
+        assert isinstance(result, ResultInfo)
+        assert result.display_value == "⏳"
+        assert server.requests == ["branch", "newest", "runs", "branch", "newest", "runs"]
+
+    # ----------------------------------------------------------------------
+    @pytest.mark.asyncio
+    async def test_rerun_requests_runs(self, github_repo: Repository) -> None:
+        """Runs are requested when the most recent run is re-run."""
+
+        server = self.FakeServer("sha1", [self._CreateRun(1, 1, "completed", "failure")])
+
+        source = GitHubSource(server.CreateSession(), cicd_cache=GitHubCICDCache())
+
+        await self._Query(source, github_repo)
+
+        server.workflow_runs = [
+            {**self._CreateRun(1, 1, "completed", "success"), "updated_at": "2024-01-02T00:00:00Z"},
+        ]
+
+        result = await self._Query(source, github_repo)
+
+        assert isinstance(result, ResultInfo)
+        assert result.display_value == "✅"
+        assert server.requests == ["branch", "newest", "runs", "branch", "newest", "runs"]
+
+    # ----------------------------------------------------------------------
+    @pytest.mark.asyncio
+    async def test_in_progress_runs_polled(self, github_repo: Repository) -> None:
+        """Only the runs that are in progress are requested while they are in progress."""
+
+        server = self.FakeServer(
+            "sha1",
+            [self._CreateRun(2, 2, "in_progress"), self._CreateRun(1, 1, "completed", "success")],
+        )
+
+        source = GitHubSource(server.CreateSession(), cicd_cache=GitHubCICDCache())
+
+        display_values = []
+
+        for index in range(4):
+            if index == 2:
+                server.workflow_runs = [
+                    {**self._CreateRun(2, 2, "completed", "success"), "updated_at": "2024-01-02T00:00:00Z"},
+                    self._CreateRun(1, 1, "completed", "success"),
+                ]
+
+            result = await self._Query(source, github_repo)
+
+            assert isinstance(result, ResultInfo)
+            display_values.append(result.display_value)
+
+        assert display_values == ["⏳", "⏳", "✅", "✅"]
+        assert server.requests == [
+            "branch",
+            "newest",
+            "runs",
+            "branch",
+            "newest",
+            "run 2",
+            "branch",
+            "newest",
+            "run 2",
+            "branch",
+            "newest",
+        ]
+
+    # ----------------------------------------------------------------------
+    @pytest.mark.asyncio
+    async def test_new_run_while_in_progress_requests_runs(self, github_repo: Repository) -> None:
+        """Runs are requested when a run starts while other runs are in progress."""
+
+        server = self.FakeServer("sha1", [self._CreateRun(1, 1, "in_progress")])
+
+        source = GitHubSource(server.CreateSession(), cicd_cache=GitHubCICDCache())
+
+        await self._Query(source, github_repo)
+
+        server.workflow_runs = [self._CreateRun(2, 2, "completed", "failure"), *server.workflow_runs]
+
+        result = await self._Query(source, github_repo)
+
+        assert isinstance(result, ResultInfo)
+        assert result.display_value == "❌"
+        assert server.requests == ["branch", "newest", "runs", "branch", "newest", "runs"]
+
+    # ----------------------------------------------------------------------
+    @pytest.mark.asyncio
+    async def test_no_runs(self, github_repo: Repository) -> None:
+        """The absence of runs is cached."""
+
+        server = self.FakeServer("sha1", [])
+
+        source = GitHubSource(server.CreateSession(), cicd_cache=GitHubCICDCache())
+
+        for _ in range(2):
+            result = await self._Query(source, github_repo)
+
+            assert isinstance(result, ResultInfo)
+            assert result.display_value == "-"
+
+        assert server.requests == ["branch", "newest", "runs", "branch", "newest"]
+
+    # ----------------------------------------------------------------------
+    @pytest.mark.asyncio
+    async def test_branch_error(self, github_repo: Repository) -> None:
+        """Errors retrieving the head commit are reported."""
+
+        source = GitHubSource(
+            create_mock_session([create_mock_response({}, status=404)]),
+            cicd_cache=GitHubCICDCache(),
+        )
+
+        assert isinstance(await self._Query(source, github_repo), ErrorInfo)
+
+
+# ----------------------------------------------------------------------
+class TestLeanCICD:
+    """Tests for CI/CD status calculated from the latest run of each workflow."""
+
+    # ----------------------------------------------------------------------
+    @staticmethod
+    def _CreateSession(
+        workflow_runs: dict[int, list[dict]],
+    ) -> tuple[MagicMock, list[tuple[str, dict | None]]]:
+        """Create a session that returns workflows and their latest runs."""
+
+        requests: list[tuple[str, dict | None]] = []
+
+        def get_context_manager(url: str, params: dict | None = None, *args, **kwargs):  # noqa: ARG001
+            requests.append((url, params))
+
+            if url.endswith("/actions/workflows"):
+                response = create_mock_response(
+                    {"workflows": [{"id": workflow_id} for workflow_id in workflow_runs]},
+                    headers={"Link": '<https://api.github.com/workflows?page=2>; rel="next"'},
+                )
+            elif url == "https://api.github.com/workflows?page=2":
+                response = create_mock_response({"workflows": []})
+            else:
+                workflow_id = int(url.split("/")[-2])
+                response = create_mock_response({"workflow_runs": workflow_runs[workflow_id]})
+
+            cm = MagicMock()
+            cm.__aenter__ = AsyncMock(return_value=response)
+            cm.__aexit__ = AsyncMock(return_value=None)
+            return cm
+
+        session = MagicMock()
+        session.get = get_context_manager
+
+        return session, requests
+
+    # ----------------------------------------------------------------------
+    @pytest.mark.asyncio
+    async def test_latest_run_per_workflow(self, github_repo: Repository) -> None:
+        """Only the latest run of each workflow is requested."""
+
+        session, requests = self._CreateSession(
+            {
+                1: [TestCICDCache._CreateRun(1, 1, "completed", "success")],
+                2: [],
+                3: [
+                    {
+                        **TestCICDCache._CreateRun(3, 3, "completed", "failure"),
+                        "created_at": "2024-02-01T00:00:00Z",
+                    }
+                ],
+            }
+        )
+
+        source = GitHubSource(session, lean_cicd=True)
+
+        result = await TestCICDCache._Query(source, github_repo)
+
+        assert isinstance(result, ResultInfo)
+        assert result.display_value == "❌"
+
+        additional_info = cast(str, result.additional_info)
+
+        # Most recent runs first
+        assert additional_info.index("Workflow 3") < additional_info.index("Workflow 1")
+
+        run_requests = [params for url, params in requests if url.endswith("/runs")]
+
+        assert len(run_requests) == 3
+        assert all(params is not None and params["per_page"] == 1 for params in run_requests)
+        assert all(params is not None and params["branch"] == "main" for params in run_requests)
+
+    # ----------------------------------------------------------------------
+    @pytest.mark.asyncio
+    async def test_workflows_cached(self, github_repo: Repository) -> None:
+        """Workflows are only listed once when a CI/CD cache is provided."""
+
+        session, requests = self._CreateSession({1: [TestCICDCache._CreateRun(1, 1, "in_progress")]})
+
+        source = GitHubSource(session, cicd_cache=GitHubCICDCache(), lean_cicd=True)
+
+        for _ in range(2):
+            result = await source._GetLatestWorkflowRuns(github_repo, "main", datetime.now(UTC))
+
+            assert [run["id"] for run in result] == [1]
+
+        assert len([url for url, _ in requests if "workflows" in url and not url.endswith("/runs")]) == 2
+        assert len([url for url, _ in requests if url.endswith("/runs")]) == 2
+
+
+# ----------------------------------------------------------------------
+class TestProjections:
+    """Tests for reducing decoded pages to the fields used to generate information."""
+
+    # ----------------------------------------------------------------------
+    @staticmethod
+    def _CreateResponse(json_data: object) -> MagicMock:
+        response = create_mock_response(None)
+
+        # Decode the content with the provided `loads`, as `GitHubResponse.json` does
+        response.json = AsyncMock(side_effect=lambda loads=json.loads: loads(json.dumps(json_data)))
+
+        return response
+
+    # ----------------------------------------------------------------------
+    @pytest.mark.asyncio
+    async def test_items(self, github_repo: Repository) -> None:
+        """Issues are reduced to the fields used to display them."""
+
+        issue = {
+            "number": 1,
+            "title": "Bug report",
+            "body": "A very long description",
+            "state": "open",
+            "updated_at": "2024-01-01T00:00:00Z",
+            "user": {"login": "user1", "avatar_url": "https://example.com/avatar"},
+            "labels": [{"name": "bug", "color": "red"}],
+            "pull_request": {"url": "https://example.com/pull/1"},
+            "reactions": {"total_count": 10},
+        }
+
+        source = GitHubSource(create_mock_session([self._CreateResponse([issue])]))
+
+        assert await source._GetOpenItems(github_repo, "issues") == [
+            {
+                "number": 1,
+                "title": "Bug report",
+                "state": "open",
+                "updated_at": "2024-01-01T00:00:00Z",
+                "pull_request": {},
+                "user": {"login": "user1"},
+                "labels": [{"name": "bug"}],
+            },
+        ]
+
+    # ----------------------------------------------------------------------
+    @pytest.mark.asyncio
+    async def test_alerts(self, github_repo: Repository) -> None:
+        """Alerts are reduced to the fields used to display them."""
+
+        alert = {
+            "number": 1,
+            "security_advisory": {"severity": "high", "summary": "Bad thing", "description": "Details"},
+            "security_vulnerability": {"package": {"name": "package-a", "ecosystem": "pip"}},
+        }
+
+        source = GitHubSource(create_mock_session([self._CreateResponse([alert])]))
+
+        results = [
+            info
+            async for info in source._GenerateSecurityAlertInfo(github_repo, "https://github.com/owner/repo")
+        ]
+
+        assert len(results) == 1
+        assert isinstance(results[0], ResultInfo)
+        assert "- [HIGH] package-a: Bad thing" in cast(str, results[0].additional_info)
@@ -0,0 +1,112 @@
+"""Unit tests for AllGitStatus.Sources.GitHubTokenPool module."""
+
+import time
+
+from AllGitStatus.Sources.GitHubTokenPool import GitHubTokenPool
+
+
+# ----------------------------------------------------------------------
+def rate_limit_headers(
+    remaining: int,
+    reset: float,
+    limit: int = 5000,
+    resource: str | None = None,
+) -> dict[str, str]:
+    """Create rate limit headers."""
+
+    headers = {
+        "X-RateLimit-Limit": str(limit),
+        "X-RateLimit-Remaining": str(remaining),
+        "X-RateLimit-Reset": str(reset),
+    }
+
+    if resource is not None:
+        headers["X-RateLimit-Resource"] = resource
+
+    return headers
+
+
+# ----------------------------------------------------------------------
+class TestGitHubTokenPool:
+    """Tests for GitHubTokenPool."""
+
+    # ----------------------------------------------------------------------
+    def test_tokens(self) -> None:
+        """Duplicate tokens are removed."""
+
+        assert GitHubTokenPool(["a", "b", "a"]).tokens == ["a", "b"]
+
+    # ----------------------------------------------------------------------
+    def test_unknown_quotas_are_used_first(self) -> None:
+        """Tokens whose quota is not yet known are assumed to have a full quota."""
+
+        pool = GitHubTokenPool(["a", "b"])
+
+        pool.Update("a", rate_limit_headers(4999, time.time() + 3600))
+
+        assert pool.Acquire() == "b"
+
+    # ----------------------------------------------------------------------
+    def test_most_remaining_quota(self) -> None:
+        """The token with the most quota remaining is used, and its quota is consumed."""
+
+        pool = GitHubTokenPool(["a", "b"])
+        reset = time.time() + 3600
+
+        pool.Update("a", rate_limit_headers(10, reset))
+        pool.Update("b", rate_limit_headers(11, reset))
+
+        assert [pool.Acquire() for _ in range(4)] == ["b", "a", "b", "a"]
+        assert pool.GetRateLimit() == (10000, 17, reset)
+
+    # ----------------------------------------------------------------------
+    def test_exhausted(self) -> None:
+        """The token that is replenished first is used when all tokens are exhausted."""
+
+        pool = GitHubTokenPool(["a", "b"])
+        reset = time.time() + 3600
+
+        pool.Update("a", rate_limit_headers(0, reset + 10))
+        pool.Update("b", rate_limit_headers(0, reset))
+
+        assert pool.Acquire() == "b"
+        assert pool.GetRateLimit() == (10000, 0, reset)
+
+    # ----------------------------------------------------------------------
+    def test_replenished(self) -> None:
+        """Quotas are replenished after their reset time."""
+
+        pool = GitHubTokenPool(["a", "b"])
+        reset = time.time() - 1
+
+        pool.Update("a", rate_limit_headers(0, reset))
+        pool.Update("b", rate_limit_headers(1, time.time() + 3600))
+
+        assert pool.Acquire() == "a"
+        assert pool.GetRateLimit() == (10000, 5001, reset)
+
+    # ----------------------------------------------------------------------
+    def test_resources(self) -> None:
+        """Quotas are tracked per resource."""
+
+        pool = GitHubTokenPool(["a", "b"])
+        reset = time.time() + 3600
+
+        pool.Update("a", rate_limit_headers(0, reset, 30, "search"))
+        pool.Update("b", rate_limit_headers(1000, reset))
+
+        assert pool.Acquire("search") == "b"
+        assert pool.Acquire() == "a"
+
+        assert pool.GetRateLimit("search") is None
+
+    # ----------------------------------------------------------------------
+    def test_invalid_headers_are_ignored(self) -> None:
+        """Missing or invalid headers do not change the quota."""
+
+        pool = GitHubTokenPool(["a"])
+
+        pool.Update("a", {})
+        pool.Update("a", rate_limit_headers(10, time.time()) | {"X-RateLimit-Remaining": "many"})
+
+        assert pool.GetRateLimit() is None
@@ -1,12 +1,14 @@
 """Unit tests for AllGitStatus.Sources.Source module."""
 
+import asyncio
+
 from collections.abc import AsyncGenerator
 from pathlib import Path
 
 import pytest
 
 from AllGitStatus.Repository import Repository
-from AllGitStatus.Sources.Source import ErrorInfo, Info, ResultInfo, Source
+from AllGitStatus.Sources.Source import DeferredInfo, ErrorInfo, Info, ResultInfo, Source
 
 
 # ----------------------------------------------------------------------
@@ -125,6 +127,47 @@ class TestResultInfo:
         assert result.state_data == "state"
 
 
+# ----------------------------------------------------------------------
+class TestDeferredInfo:
+    """Tests for the DeferredInfo class."""
+
+    # ----------------------------------------------------------------------
+    @pytest.mark.asyncio
+    async def test_resolved_once(self) -> None:
+        """The factory is only invoked once, even when resolved concurrently."""
+
+        call_count = 0
+
+        async def Factory() -> object:
+            nonlocal call_count
+
+            call_count += 1
+            await asyncio.sleep(0)
+
+            return "details"
+
+        deferred_info = DeferredInfo("Loading...", Factory)
+
+        assert deferred_info.placeholder == "Loading..."
+        assert await asyncio.gather(deferred_info.Resolve(), deferred_info.Resolve()) == ["details"] * 2
+        assert await deferred_info.Resolve() == "details"
+        assert call_count == 1
+
+    # ----------------------------------------------------------------------
+    @pytest.mark.asyncio
+    async def test_exceptions(self) -> None:
+        """Exceptions raised by the factory are raised by every call to Resolve."""
+
+        async def Factory() -> object:
+            raise ValueError("boom")
+
+        deferred_info = DeferredInfo("Loading...", Factory)
+
+        for _ in range(2):
+            with pytest.raises(ValueError, match="boom"):
+                await deferred_info.Resolve()
+
+
 # ----------------------------------------------------------------------
 class TestErrorInfo:
     """Tests for the ErrorInfo dataclass."""
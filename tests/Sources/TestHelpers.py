@@ -0,0 +1,88 @@
+"""Helpers shared by the unit tests of the GitHub sources."""
+
+import asyncio
+
+from pathlib import Path
+from unittest.mock import AsyncMock, MagicMock
+
+from aiohttp import ClientResponseError
+
+from AllGitStatus.Repository import Repository
+
+
+# ----------------------------------------------------------------------
+class FakeClock:
+    """A clock that only advances when told to."""
+
+    # ----------------------------------------------------------------------
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    # ----------------------------------------------------------------------
+    def __call__(self) -> float:
+        return self.now
+
+
+# ----------------------------------------------------------------------
+def create_repository(owner: str | None, name: str | None) -> Repository:
+    """Create a Repository hosted on GitHub."""
+
+    return Repository(
+        path=Path(f"/repos/{name}"),
+        remote_url=f"https://github.com/{owner}/{name}.git",
+        github_owner=owner,
+        github_repo=name,
+    )
+
+
+# ----------------------------------------------------------------------
+def create_mock_response(
+    json_data: object,
+    status: int = 200,
+    headers: dict[str, str] | None = None,
+) -> MagicMock:
+    """Create a mock response."""
+
+    response = MagicMock()
+    response.status = status
+    response.json = AsyncMock(return_value=json_data)
+    response.headers = headers or {}
+    response.raise_for_status = MagicMock()
+
+    if status >= 400:
+        response.raise_for_status.side_effect = ClientResponseError(
+            request_info=MagicMock(),
+            history=(),
+            status=status,
+            message="Error",
+        )
+
+    return response
+
+
+# ----------------------------------------------------------------------
+def create_mock_session(
+    responses: dict[str, list[MagicMock]],
+) -> tuple[MagicMock, list[tuple[str, dict | None]]]:
+    """Create a mock session that returns the responses for each requested url in order."""
+
+    requests: list[tuple[str, dict | None]] = []
+
+    def get_context_manager(url: str, params: dict | None = None):
+        requests.append((url, params))
+
+        response = responses[url].pop(0)
+
+        async def enter(*args, **kwargs):  # noqa: ARG001
+            await asyncio.sleep(0)
+            return response
+
+        cm = MagicMock()
+        cm.__aenter__ = enter
+        cm.__aexit__ = AsyncMock(return_value=None)
+        return cm
+
+    session = MagicMock()
+    session.get = get_context_manager
+
+    return session, requests
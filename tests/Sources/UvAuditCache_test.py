@@ -0,0 +1,116 @@
+"""Unit tests for AllGitStatus.Sources.UvAuditCache module."""
+
+from datetime import datetime, timedelta, UTC
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from AllGitStatus.Sources.UvAuditCache import UvAuditCache, UvAuditResult
+
+
+# ----------------------------------------------------------------------
+@pytest.fixture
+def cache(tmp_path: Path):
+    """Create a cache in a temporary directory."""
+
+    cache = UvAuditCache(tmp_path / "cache" / "UvAudit.db")
+    yield cache
+    cache.Close()
+
+
+# ----------------------------------------------------------------------
+class TestCreateKey:
+    """Tests for UvAuditCache.CreateKey."""
+
+    # ----------------------------------------------------------------------
+    def test_content(self, tmp_path: Path) -> None:
+        """Keys are based on the content of the dependency files rather than their location."""
+
+        for name in ["a", "b"]:
+            (tmp_path / name).mkdir()
+            (tmp_path / name / "pyproject.toml").write_text("[project]\n")
+            (tmp_path / name / "uv.lock").write_text("version = 1\n")
+
+        assert UvAuditCache.CreateKey(tmp_path / "a") == UvAuditCache.CreateKey(tmp_path / "b")
+
+    # ----------------------------------------------------------------------
+    @pytest.mark.parametrize("filename", UvAuditCache.DEPENDENCY_FILENAMES)
+    def test_changes(self, tmp_path: Path, filename: str) -> None:
+        """Keys change when any of the dependency files change."""
+
+        (tmp_path / "pyproject.toml").write_text("[project]\n")
+        (tmp_path / "uv.lock").write_text("version = 1\n")
+
+        key = UvAuditCache.CreateKey(tmp_path)
+
+        (tmp_path / filename).write_text("changed\n")
+
+        assert UvAuditCache.CreateKey(tmp_path) != key
+
+    # ----------------------------------------------------------------------
+    def test_missing_lockfile(self, tmp_path: Path) -> None:
+        """A missing lockfile is distinct from an empty one."""
+
+        (tmp_path / "pyproject.toml").write_text("[project]\n")
+
+        key = UvAuditCache.CreateKey(tmp_path)
+
+        (tmp_path / "uv.lock").write_text("")
+
+        assert UvAuditCache.CreateKey(tmp_path) != key
+
+
+# ----------------------------------------------------------------------
+class TestUvAuditCache:
+    """Tests for UvAuditCache."""
+
+    # ----------------------------------------------------------------------
+    def test_get_and_set(self, cache: UvAuditCache) -> None:
+        """Results are retrieved by key."""
+
+        assert cache.Get("key") is None
+
+        cache.Set("key", UvAuditResult(1, "Found 1 vulnerability"))
+
+        assert cache.Get("key") == UvAuditResult(1, "Found 1 vulnerability")
+        assert cache.Get("other") is None
+
+    # ----------------------------------------------------------------------
+    def test_persisted(self, tmp_path: Path) -> None:
+        """Results are persisted between instances."""
+
+        cache = UvAuditCache(tmp_path / "UvAudit.db")
+        cache.Set("key", UvAuditResult(0, ""))
+        cache.Close()
+
+        cache = UvAuditCache(tmp_path / "UvAudit.db")
+
+        try:
+            assert cache.Get("key") == UvAuditResult(0, "")
+        finally:
+            cache.Close()
+
+    # ----------------------------------------------------------------------
+    def test_max_age(self, tmp_path: Path) -> None:
+        """Results older than the max age are not returned, and are removed when the cache is opened."""
+
+        cache = UvAuditCache(tmp_path / "UvAudit.db", timedelta(hours=1))
+
+        with patch("AllGitStatus.Sources.UvAuditCache.datetime") as mock_datetime:
+            mock_datetime.now.return_value = datetime.now(UTC) - timedelta(hours=2)
+            cache.Set("old", UvAuditResult(0, ""))
+
+        cache.Set("new", UvAuditResult(0, ""))
+
+        assert cache.Get("old") is None
+        assert cache.Get("new") == UvAuditResult(0, "")
+
+        cache.Close()
+
+        cache = UvAuditCache(tmp_path / "UvAudit.db", timedelta(hours=1))
+
+        try:
+            assert cache._connection.execute("SELECT key FROM audits").fetchall() == [("new",)]
+        finally:
+            cache.Close()
@@ -0,0 +1,122 @@
+"""Unit tests for AllGitStatus.Sources.UvAuditRunner module."""
+
+import asyncio
+
+from pathlib import Path
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from AllGitStatus.Sources.UvAuditCache import UvAuditResult
+from AllGitStatus.Sources.UvAuditRunner import UvAuditRunner
+
+
+# ----------------------------------------------------------------------
+def create_process(returncode: int = 0, stdout: bytes = b"{}", stderr: bytes = b"") -> MagicMock:
+    """Create a mock uv process."""
+
+    process = MagicMock()
+    process.communicate = AsyncMock(return_value=(stdout, stderr))
+    process.returncode = returncode
+
+    return process
+
+
+# ----------------------------------------------------------------------
+class TestUvAuditRunner:
+    """Tests for UvAuditRunner."""
+
+    # ----------------------------------------------------------------------
+    @pytest.mark.asyncio
+    async def test_concurrent_audits_are_limited(self, tmp_path: Path) -> None:
+        """No more than the maximum number of audits run at the same time."""
+
+        active = 0
+        max_active = 0
+
+        # ----------------------------------------------------------------------
+        async def Communicate() -> tuple[bytes, bytes]:
+            nonlocal active, max_active
+
+            active += 1
+            max_active = max(max_active, active)
+
+            await asyncio.sleep(0.01)
+
+            active -= 1
+            return b"{}", b""
+
+        # ----------------------------------------------------------------------
+        def CreateProcess(*args, **kwargs) -> MagicMock:  # noqa: ARG001
+            process = create_process()
+            process.communicate = Communicate
+            return process
+
+        # ----------------------------------------------------------------------
+
+        runner = UvAuditRunner(2)
+
+        with patch("asyncio.create_subprocess_exec", side_effect=CreateProcess) as mock_exec:
+            results = await asyncio.gather(*(runner.Audit(tmp_path) for _ in range(6)))
+
+        assert results == [UvAuditResult(0, "{}")] * 6
+        assert mock_exec.call_count == 6
+        assert max_active == 2
+
+    # ----------------------------------------------------------------------
+    @pytest.mark.asyncio
+    async def test_stderr_is_used_without_output(self, tmp_path: Path) -> None:
+        """Diagnostics are only returned when the audit doesn't produce any output."""
+
+        runner = UvAuditRunner()
+
+        with patch(
+            "asyncio.create_subprocess_exec",
+            return_value=create_process(2, b"", b"error: failed to fetch\n"),
+        ):
+            assert await runner.Audit(tmp_path) == UvAuditResult(2, "error: failed to fetch")
+
+        with patch(
+            "asyncio.create_subprocess_exec",
+            return_value=create_process(1, b'{"vulnerabilities": []}\n', b"Resolved 3 packages\n"),
+        ):
+            assert await runner.Audit(tmp_path) == UvAuditResult(1, '{"vulnerabilities": []}')
+
+    # ----------------------------------------------------------------------
+    @pytest.mark.asyncio
+    async def test_low_priority(self, tmp_path: Path) -> None:
+        """Audits are run with nice and ionice when they are available."""
+
+        with patch("shutil.which", side_effect=lambda name: f"/usr/bin/{name}"):
+            runner = UvAuditRunner(low_priority=True)
+
+        with patch("asyncio.create_subprocess_exec", return_value=create_process()) as mock_exec:
+            await runner.Audit(tmp_path)
+
+        assert mock_exec.call_args.args == (
+            "/usr/bin/ionice",
+            "-c",
+            "2",
+            "-n",
+            "7",
+            "/usr/bin/nice",
+            "-n",
+            "19",
+            "uv",
+            "audit",
+            "--output-format",
+            "json",
+        )
+
+    # ----------------------------------------------------------------------
+    @pytest.mark.asyncio
+    async def test_low_priority_unavailable(self, tmp_path: Path) -> None:
+        """Audits are run normally when nice and ionice aren't available (e.g. on Windows)."""
+
+        with patch("shutil.which", return_value=None):
+            runner = UvAuditRunner(low_priority=True)
+
+        with patch("asyncio.create_subprocess_exec", return_value=create_process()) as mock_exec:
+            await runner.Audit(tmp_path)
+
+        assert mock_exec.call_args.args == ("uv", "audit", "--output-format", "json")
@@ -1,14 +1,18 @@
 """Unit tests for AllGitStatus.Sources.UvAuditSource module."""
 
 import asyncio
+import json
+import textwrap
 from pathlib import Path
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
 from AllGitStatus.Repository import Repository
-from AllGitStatus.Sources.Source import ErrorInfo, ResultInfo
-from AllGitStatus.Sources.UvAuditSource import UvAuditSource
+from AllGitStatus.Sources.DependencyVulnerabilities import Pin, Vulnerability
+from AllGitStatus.Sources.Source import DeferredInfo, ErrorInfo, ResultInfo
+from AllGitStatus.Sources.UvAuditCache import UvAuditCache, UvAuditResult
+from AllGitStatus.Sources.UvAuditSource import AuditSummary, UvAuditSource
 
 
 # ----------------------------------------------------------------------
@@ -56,7 +60,7 @@ class TestUvAuditSourceNonPythonRepo:
 
         assert len(results) == 1
         assert isinstance(results[0], ResultInfo)
-        assert results[0].additional_info == "Not a Python repository (no pyproject.toml found at root)"
+        assert results[0].additional_info == "Not a Python repository (no pyproject.toml or uv.lock found)"
 
     # ----------------------------------------------------------------------
     @pytest.mark.asyncio
@@ -107,9 +111,11 @@ class TestUvAuditSourcePythonRepo:
             mock_exec.assert_called_once_with(
                 "uv",
                 "audit",
+                "--output-format",
+                "json",
                 cwd=str(python_repo.path),
                 stdout=asyncio.subprocess.PIPE,
-                stderr=asyncio.subprocess.STDOUT,
+                stderr=asyncio.subprocess.PIPE,
             )
 
     # ----------------------------------------------------------------------
@@ -289,3 +295,478 @@ class TestUvAuditSourceQueryStructure:
 
             for result in results:
                 assert result.key[0] == "UvAuditSource"
+
+
+# ----------------------------------------------------------------------
+class TestUvAuditSourceCache:
+    """Tests for reusing cached uv audit results."""
+
+    # ----------------------------------------------------------------------
+    @staticmethod
+    def _CreateProcess(returncode: int, output: bytes) -> MagicMock:
+        process = MagicMock()
+        process.communicate = AsyncMock(return_value=(output, b""))
+        process.returncode = returncode
+
+        return process
+
+    # ----------------------------------------------------------------------
+    @pytest.mark.asyncio
+    async def test_results_are_reused(self, python_repo: Repository, tmp_path: Path) -> None:
+        """uv is only run again once the dependencies change."""
+
+        cache = UvAuditCache(tmp_path / "cache" / "UvAudit.db")
+
+        try:
+            with patch(
+                "asyncio.create_subprocess_exec",
+                return_value=self._CreateProcess(1, b"Found 1 vulnerability"),
+            ) as mock_exec:
+                source = UvAuditSource(cache)
+
+                for _ in range(2):
+                    results = [info async for info in source.Query(python_repo)]
+
+                    assert isinstance(results[0], ResultInfo)
+                    assert results[0].additional_info == "Found 1 vulnerability"
+
+                assert mock_exec.call_count == 1
+
+                (python_repo.path / "uv.lock").write_text("version = 1\n")
+
+                _ = [info async for info in source.Query(python_repo)]
+
+                assert mock_exec.call_count == 2
+        finally:
+            cache.Close()
+
+    # ----------------------------------------------------------------------
+    @pytest.mark.asyncio
+    async def test_failures_are_not_cached(self, python_repo: Repository, tmp_path: Path) -> None:
+        """Audits that could not be completed are run again."""
+
+        cache = UvAuditCache(tmp_path / "cache" / "UvAudit.db")
+
+        try:
+            with patch(
+                "asyncio.create_subprocess_exec",
+                return_value=self._CreateProcess(2, b"error: network unavailable"),
+            ) as mock_exec:
+                source = UvAuditSource(cache)
+
+                for _ in range(2):
+                    results = [info async for info in source.Query(python_repo)]
+
+                    assert isinstance(results[0], ResultInfo)
+                    assert results[0].display_value == "⚠️"
+
+                assert mock_exec.call_count == 2
+        finally:
+            cache.Close()
+
+
+# ----------------------------------------------------------------------
+class TestUvAuditSourceDependencyVulnerabilities:
+    """Tests for using vulnerabilities resolved across all repositories."""
+
+    # ----------------------------------------------------------------------
+    @staticmethod
+    def _CreateDependencyVulnerabilities(
+        vulnerabilities: dict[Pin, list[Vulnerability]] | None,
+    ) -> MagicMock:
+        dependency_vulnerabilities = MagicMock()
+        dependency_vulnerabilities.GetVulnerabilities = AsyncMock(return_value=vulnerabilities)
+
+        return dependency_vulnerabilities
+
+    # ----------------------------------------------------------------------
+    @pytest.mark.asyncio
+    async def test_no_vulnerabilities(self, python_repo: Repository) -> None:
+        """uv is not run when the repository's dependencies have no known vulnerabilities."""
+
+        with patch("asyncio.create_subprocess_exec") as mock_exec:
+            source = UvAuditSource(dependency_vulnerabilities=self._CreateDependencyVulnerabilities({}))
+
+            results = [info async for info in source.Query(python_repo)]
+
+        assert isinstance(results[0], ResultInfo)
+        assert results[0].display_value == "✅"
+        assert mock_exec.call_count == 0
+
+    # ----------------------------------------------------------------------
+    @pytest.mark.asyncio
+    async def test_vulnerabilities(self, python_repo: Repository) -> None:
+        """Vulnerabilities are listed by package."""
+
+        source = UvAuditSource(
+            dependency_vulnerabilities=self._CreateDependencyVulnerabilities(
+                {
+                    Pin("urllib3", "1.0"): [Vulnerability("GHSA-3", "Redirects")],
+                    Pin("requests", "2.0"): [
+                        Vulnerability("GHSA-1", "Leaks headers", "critical"),
+                        Vulnerability("GHSA-2", "Bad certificates", "medium"),
+                    ],
+                },
+            ),
+        )
+
+        results = [info async for info in source.Query(python_repo)]
+
+        assert isinstance(results[0], ResultInfo)
+        assert results[0].display_value == "3 ⚠️ (1 crit)"
+        assert results[0].state_data == AuditSummary(
+            {"critical": 1, "medium": 1, "unknown": 1},
+            ("requests 2.0", "urllib3 1.0"),
+        )
+
+        # The details are only created when they are displayed
+        assert isinstance(results[0].additional_info, DeferredInfo)
+        assert results[0].additional_info.placeholder == (
+            "Found 3 known vulnerabilities in 2 packages\n\nLoading..."
+        )
+        assert await results[0].additional_info.Resolve() == (
+            "Found 3 known vulnerabilities in 2 packages\n"
+            "\n"
+            "requests 2.0\n"
+            "  - GHSA-1 (critical): Leaks headers\n"
+            "  - GHSA-2 (medium): Bad certificates\n"
+            "\n"
+            "urllib3 1.0\n"
+            "  - GHSA-3: Redirects"
+        )
+
+    # ----------------------------------------------------------------------
+    @pytest.mark.asyncio
+    async def test_unavailable(self, python_repo: Repository) -> None:
+        """uv is run when the vulnerabilities of the repository are not available."""
+
+        process = MagicMock()
+        process.communicate = AsyncMock(return_value=(b"Found 1 vulnerability", b""))
+        process.returncode = 1
+
+        with patch("asyncio.create_subprocess_exec", return_value=process) as mock_exec:
+            source = UvAuditSource(dependency_vulnerabilities=self._CreateDependencyVulnerabilities(None))
+
+            results = [info async for info in source.Query(python_repo)]
+
+        assert isinstance(results[0], ResultInfo)
+        assert results[0].additional_info == "Found 1 vulnerability"
+        assert mock_exec.call_count == 1
+
+
+# ----------------------------------------------------------------------
+class TestUvAuditSourceStructuredOutput:
+    """Tests for parsing the JSON output of uv audit."""
+
+    # Output of `uv audit --output-format json` (uv 0.13.1) for a project that pins jinja2 3.1.2
+    VULNERABLE_OUTPUT = textwrap.dedent(
+        """\
+        {
+          "schema": {
+            "version": "preview"
+          },
+          "summary": {
+            "audited_packages": 3,
+            "vulnerabilities": 2,
+            "adverse_statuses": 0
+          },
+          "vulnerabilities": [
+            {
+              "dependency": {
+                "name": "jinja2",
+                "version": "3.1.2"
+              },
+              "id": "GHSA-h5c8-rqwp-cp95",
+              "display_id": "GHSA-h5c8-rqwp-cp95",
+              "aliases": [
+                "CVE-2024-22195"
+              ],
+              "summary": "Jinja vulnerable to HTML attribute injection when passing user input as keys to xmlattr filter",
+              "description": "The `xmlattr` filter in affected versions of Jinja accepts keys containing spaces.",
+              "link": "https://nvd.nist.gov/vuln/detail/CVE-2024-22195",
+              "fix_versions": [
+                "3.1.3"
+              ],
+              "published": "2024-01-11T15:20:48Z",
+              "modified": "2024-01-11T15:20:48Z"
+            },
+            {
+              "dependency": {
+                "name": "jinja2",
+                "version": "3.1.2"
+              },
+              "id": "PYSEC-2024-4",
+              "display_id": "PYSEC-2024-4",
+              "aliases": [
+                "CVE-2024-22195",
+                "GHSA-h5c8-rqwp-cp95"
+              ],
+              "summary": null,
+              "description": "Jinja is an extensible templating engine. The `xmlattr` filter accepts keys containing spaces.",
+              "link": "https://osv.dev/vulnerability/PYSEC-2024-4",
+              "fix_versions": [
+                "3.1.3"
+              ],
+              "published": "2024-01-11T03:15:00Z",
+              "modified": "2024-01-19T00:00:00Z"
+            }
+          ],
+          "adverse_statuses": []
+        }
+        """,
+    )
+
+    # Output of `uv audit --output-format json` (uv 0.13.1) for a project without vulnerabilities
+    CLEAN_OUTPUT = textwrap.dedent(
+        """\
+        {
+          "schema": {
+            "version": "preview"
+          },
+          "summary": {
+            "audited_packages": 1,
+            "vulnerabilities": 0,
+            "adverse_statuses": 0
+          },
+          "vulnerabilities": [],
+          "adverse_statuses": []
+        }
+        """,
+    )
+
+    # ----------------------------------------------------------------------
+    @staticmethod
+    def _CreateProcess(returncode: int, output: str) -> MagicMock:
+        process = MagicMock()
+        process.communicate = AsyncMock(return_value=(output.encode(), b"Resolved 3 packages"))
+        process.returncode = returncode
+
+        return process
+
+    # ----------------------------------------------------------------------
+    @pytest.mark.asyncio
+    async def test_vulnerabilities(self, python_repo: Repository) -> None:
+        """Vulnerabilities are grouped by dependency, and their severity is unknown."""
+
+        with patch(
+            "asyncio.create_subprocess_exec", return_value=self._CreateProcess(1, self.VULNERABLE_OUTPUT)
+        ):
+            results = [info async for info in UvAuditSource().Query(python_repo)]
+
+        assert isinstance(results[0], ResultInfo)
+        assert results[0].display_value == "2 ⚠️"
+        assert results[0].state_data == AuditSummary({"unknown": 2}, ("jinja2 3.1.2",))
+        assert results[0].state_data.num_vulnerabilities == 2
+
+        assert isinstance(results[0].additional_info, DeferredInfo)
+        assert await results[0].additional_info.Resolve() == (
+            "Found 2 known vulnerabilities in 1 package\n"
+            "\n"
+            "jinja2 3.1.2\n"
+            "  - GHSA-h5c8-rqwp-cp95: Jinja vulnerable to HTML attribute injection when passing user input "
+            "as keys to xmlattr filter\n"
+            "  - PYSEC-2024-4: Jinja is an extensible templating engine. The `xmlattr` filter accepts keys "
+            "containing spaces."
+        )
+
+    # ----------------------------------------------------------------------
+    @pytest.mark.asyncio
+    async def test_single_vulnerability(self, python_repo: Repository) -> None:
+        """A single vulnerability without a summary is summarized."""
+
+        output = json.dumps(
+            {
+                "vulnerabilities": [
+                    {
+                        "dependency": {"name": "Jinja2", "version": "2.0"},
+                        "id": "ID-1",
+                        "summary": None,
+                        "description": None,
+                    },
+                ],
+            },
+        )
+
+        with patch("asyncio.create_subprocess_exec", return_value=self._CreateProcess(1, output)):
+            results = [info async for info in UvAuditSource().Query(python_repo)]
+
+        assert isinstance(results[0], ResultInfo)
+        assert results[0].display_value == "1 ⚠️"
+        assert results[0].state_data == AuditSummary({"unknown": 1}, ("jinja2 2.0",))
+        assert isinstance(results[0].additional_info, DeferredInfo)
+        assert (
+            results[0].additional_info.placeholder == "Found 1 known vulnerability in 1 package\n\nLoading..."
+        )
+        assert await results[0].additional_info.Resolve() == (
+            "Found 1 known vulnerability in 1 package\n\njinja2 2.0\n  - ID-1: No summary"
+        )
+
+    # ----------------------------------------------------------------------
+    @pytest.mark.asyncio
+    async def test_no_vulnerabilities(self, python_repo: Repository) -> None:
+        """Dependencies without vulnerabilities are summarized as such."""
+
+        with patch("asyncio.create_subprocess_exec", return_value=self._CreateProcess(0, self.CLEAN_OUTPUT)):
+            results = [info async for info in UvAuditSource().Query(python_repo)]
+
+        assert isinstance(results[0], ResultInfo)
+        assert results[0].display_value == "✅"
+        assert results[0].state_data == AuditSummary({}, ())
+
+    # ----------------------------------------------------------------------
+    @pytest.mark.asyncio
+    async def test_unexpected_output(self, python_repo: Repository) -> None:
+        """Output in an unexpected format is displayed as is."""
+
+        output = json.dumps({"dependencies": [{"name": "a", "version": "1", "vulns": [{"id": "ID-1"}]}]})
+
+        with patch("asyncio.create_subprocess_exec", return_value=self._CreateProcess(1, output)):
+            results = [info async for info in UvAuditSource().Query(python_repo)]
+
+        assert isinstance(results[0], ResultInfo)
+        assert results[0].display_value == "⚠️"
+        assert results[0].additional_info == output
+        assert results[0].state_data is None
+
+    # ----------------------------------------------------------------------
+    @pytest.mark.asyncio
+    async def test_errors_are_written_to_stderr(self, python_repo: Repository) -> None:
+        """Diagnostics are displayed when the audit could not be completed."""
+
+        process = MagicMock()
+        process.communicate = AsyncMock(return_value=(b"", b"error: network unavailable\n"))
+        process.returncode = 2
+
+        with patch("asyncio.create_subprocess_exec", return_value=process):
+            results = [info async for info in UvAuditSource().Query(python_repo)]
+
+        assert isinstance(results[0], ResultInfo)
+        assert results[0].display_value == "⚠️"
+        assert results[0].additional_info == "error: network unavailable"
+        assert results[0].state_data is None
+
+
+# ----------------------------------------------------------------------
+class TestUvAuditSourceMonorepo:
+    """Tests for repositories that contain multiple lockfiles."""
+
+    # ----------------------------------------------------------------------
+    @pytest.fixture
+    def monorepo(self, tmp_path: Path) -> Repository:
+        """Create a repository with a uv workspace and a standalone project."""
+
+        for filename in [
+            "pyproject.toml",
+            "uv.lock",
+            "packages/member/pyproject.toml",
+            "tools/standalone/pyproject.toml",
+            "tools/standalone/uv.lock",
+        ]:
+            (tmp_path / filename).parent.mkdir(parents=True, exist_ok=True)
+            (tmp_path / filename).touch()
+
+        return Repository(path=tmp_path)
+
+    # ----------------------------------------------------------------------
+    @staticmethod
+    def _CreateRunner(results: dict[str, UvAuditResult]) -> MagicMock:
+        runner = MagicMock()
+        runner.Audit = AsyncMock(side_effect=lambda path: results[path.name])
+
+        return runner
+
+    # ----------------------------------------------------------------------
+    @pytest.mark.asyncio
+    async def test_lockfiles_are_audited_once(self, monorepo: Repository) -> None:
+        """Each lockfile is audited once, and the results are combined."""
+
+        shared = {"dependency": {"name": "a", "version": "1"}, "id": "GHSA-1", "summary": "Shared"}
+
+        runner = self._CreateRunner(
+            {
+                monorepo.path.name: UvAuditResult(1, json.dumps({"vulnerabilities": [shared]})),
+                "standalone": UvAuditResult(
+                    1,
+                    json.dumps(
+                        {
+                            "vulnerabilities": [
+                                shared,
+                                {
+                                    "dependency": {"name": "b", "version": "2"},
+                                    "id": "GHSA-2",
+                                    "summary": "Other",
+                                },
+                            ],
+                        },
+                    ),
+                ),
+            },
+        )
+
+        results = [info async for info in UvAuditSource(runner=runner).Query(monorepo)]
+
+        assert sorted(call.args[0] for call in runner.Audit.call_args_list) == [
+            monorepo.path,
+            monorepo.path / "tools" / "standalone",
+        ]
+
+        assert isinstance(results[0], ResultInfo)
+        assert results[0].display_value == "2 ⚠️"
+        assert results[0].state_data == AuditSummary({"unknown": 2}, ("a 1", "b 2"))
+
+        assert isinstance(results[0].additional_info, DeferredInfo)
+        assert await results[0].additional_info.Resolve() == (
+            "Found 2 known vulnerabilities in 2 packages\n"
+            "\n"
+            "[uv.lock]\n"
+            "\n"
+            "a 1\n"
+            "  - GHSA-1: Shared\n"
+            "\n"
+            "[tools/standalone/uv.lock]\n"
+            "\n"
+            "a 1\n"
+            "  - GHSA-1: Shared\n"
+            "\n"
+            "b 2\n"
+            "  - GHSA-2: Other"
+        )
+
+    # ----------------------------------------------------------------------
+    @pytest.mark.asyncio
+    async def test_unlocked_root_project(self, monorepo: Repository) -> None:
+        """A project at the root of the repository is audited when it hasn't been locked."""
+
+        (monorepo.path / "uv.lock").unlink()
+
+        runner = self._CreateRunner(
+            {
+                monorepo.path.name: UvAuditResult(0, ""),
+                "standalone": UvAuditResult(2, "error: network unavailable"),
+            },
+        )
+
+        results = [info async for info in UvAuditSource(runner=runner).Query(monorepo)]
+
+        assert runner.Audit.call_count == 2
+
+        assert isinstance(results[0], ResultInfo)
+        assert results[0].display_value == "⚠️"
+        assert results[0].additional_info == "[tools/standalone/uv.lock]\nerror: network unavailable"
+
+    # ----------------------------------------------------------------------
+    @pytest.mark.asyncio
+    async def test_no_root_project(self, monorepo: Repository) -> None:
+        """Repositories without a project at the root are audited."""
+
+        (monorepo.path / "pyproject.toml").unlink()
+        (monorepo.path / "uv.lock").unlink()
+
+        runner = self._CreateRunner({"standalone": UvAuditResult(0, '{"vulnerabilities": []}')})
+
+        results = [info async for info in UvAuditSource(runner=runner).Query(monorepo)]
+
+        runner.Audit.assert_called_once_with(monorepo.path / "tools" / "standalone")
+
+        assert isinstance(results[0], ResultInfo)
+        assert results[0].display_value == "✅"
@@ -1,5 +1,6 @@
 """Unit tests for AllGitStatus.__main__ module."""
 
+from datetime import timedelta
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
@@ -7,7 +8,8 @@ import pytest
 import typer
 from typer.testing import CliRunner
 
-from AllGitStatus.__main__ import EntryPoint, NaturalOrderGrouper, _OnVersion, app
+from AllGitStatus.Sources.GitHubConnection import ConnectorConfig
+from AllGitStatus.__main__ import DEFAULT_CACHE_DIR, EntryPoint, NaturalOrderGrouper, _OnVersion, app
 
 
 # ----------------------------------------------------------------------
@@ -54,7 +56,26 @@ class TestEntryPoint:
 
             EntryPoint(working_dir=tmp_path)
 
-            mock_main_app.assert_called_once_with(tmp_path, None, debug=False)
+            mock_main_app.assert_called_once_with(
+                tmp_path,
+                None,
+                debug=False,
+                cache_dir=DEFAULT_CACHE_DIR,
+                lazy_details=False,
+                search_counts=False,
+                owner_listings=False,
+                lean_cicd=False,
+                auto_refresh=False,
+                events_refresh=False,
+                connector_config=ConnectorConfig(),
+                connection_metrics=False,
+                uv_audit_max_age=timedelta(hours=24),
+                uv_audit_concurrency=4,
+                uv_audit_low_priority=False,
+                shared_audit=False,
+                advisory_database=None,
+                sync_advisory_database=False,
+            )
             mock_instance.run.assert_called_once()
 
     # ----------------------------------------------------------------------
@@ -67,7 +88,26 @@ class TestEntryPoint:
 
             EntryPoint(working_dir=tmp_path, pat_token_or_filename="ghp_my_token_12345")
 
-            mock_main_app.assert_called_once_with(tmp_path, "ghp_my_token_12345", debug=False)
+            mock_main_app.assert_called_once_with(
+                tmp_path,
+                "ghp_my_token_12345",
+                debug=False,
+                cache_dir=DEFAULT_CACHE_DIR,
+                lazy_details=False,
+                search_counts=False,
+                owner_listings=False,
+                lean_cicd=False,
+                auto_refresh=False,
+                events_refresh=False,
+                connector_config=ConnectorConfig(),
+                connection_metrics=False,
+                uv_audit_max_age=timedelta(hours=24),
+                uv_audit_concurrency=4,
+                uv_audit_low_priority=False,
+                shared_audit=False,
+                advisory_database=None,
+                sync_advisory_database=False,
+            )
 
     # ----------------------------------------------------------------------
     def test_with_pat_from_file(self, tmp_path: Path) -> None:
@@ -82,7 +122,26 @@ class TestEntryPoint:
 
             EntryPoint(working_dir=tmp_path, pat_token_or_filename=str(pat_file))
 
-            mock_main_app.assert_called_once_with(tmp_path, "ghp_token_from_file", debug=False)
+            mock_main_app.assert_called_once_with(
+                tmp_path,
+                "ghp_token_from_file",
+                debug=False,
+                cache_dir=DEFAULT_CACHE_DIR,
+                lazy_details=False,
+                search_counts=False,
+                owner_listings=False,
+                lean_cicd=False,
+                auto_refresh=False,
+                events_refresh=False,
+                connector_config=ConnectorConfig(),
+                connection_metrics=False,
+                uv_audit_max_age=timedelta(hours=24),
+                uv_audit_concurrency=4,
+                uv_audit_low_priority=False,
+                shared_audit=False,
+                advisory_database=None,
+                sync_advisory_database=False,
+            )
 
     # ----------------------------------------------------------------------
     def test_with_pat_from_file_strips_whitespace(self, tmp_path: Path) -> None:
@@ -97,7 +156,57 @@ class TestEntryPoint:
 
             EntryPoint(working_dir=tmp_path, pat_token_or_filename=str(pat_file))
 
-            mock_main_app.assert_called_once_with(tmp_path, "ghp_token_with_spaces", debug=False)
+            mock_main_app.assert_called_once_with(
+                tmp_path,
+                "ghp_token_with_spaces",
+                debug=False,
+                cache_dir=DEFAULT_CACHE_DIR,
+                lazy_details=False,
+                search_counts=False,
+                owner_listings=False,
+                lean_cicd=False,
+                auto_refresh=False,
+                events_refresh=False,
+                connector_config=ConnectorConfig(),
+                connection_metrics=False,
+                uv_audit_max_age=timedelta(hours=24),
+                uv_audit_concurrency=4,
+                uv_audit_low_priority=False,
+                shared_audit=False,
+                advisory_database=None,
+                sync_advisory_database=False,
+            )
+
+    # ----------------------------------------------------------------------
+    def test_with_multiple_pats_from_file(self, tmp_path: Path) -> None:
+        """All of the PATs are passed when the file contains one PAT per line."""
+
+        pat_file = tmp_path / "pat_tokens.txt"
+        pat_file.write_text("ghp_token_1\n\n  ghp_token_2  \n", encoding="utf-8")
+
+        with patch("AllGitStatus.__main__.MainApp") as mock_main_app:
+            EntryPoint(working_dir=tmp_path, pat_token_or_filename=str(pat_file))
+
+            mock_main_app.assert_called_once_with(
+                tmp_path,
+                ["ghp_token_1", "ghp_token_2"],
+                debug=False,
+                cache_dir=DEFAULT_CACHE_DIR,
+                lazy_details=False,
+                search_counts=False,
+                owner_listings=False,
+                lean_cicd=False,
+                auto_refresh=False,
+                events_refresh=False,
+                connector_config=ConnectorConfig(),
+                connection_metrics=False,
+                uv_audit_max_age=timedelta(hours=24),
+                uv_audit_concurrency=4,
+                uv_audit_low_priority=False,
+                shared_audit=False,
+                advisory_database=None,
+                sync_advisory_database=False,
+            )
 
     # ----------------------------------------------------------------------
     def test_with_pat_nonexistent_file_used_as_token(self, tmp_path: Path) -> None:
@@ -111,7 +220,26 @@ class TestEntryPoint:
 
             EntryPoint(working_dir=tmp_path, pat_token_or_filename=nonexistent_path)
 
-            mock_main_app.assert_called_once_with(tmp_path, nonexistent_path, debug=False)
+            mock_main_app.assert_called_once_with(
+                tmp_path,
+                nonexistent_path,
+                debug=False,
+                cache_dir=DEFAULT_CACHE_DIR,
+                lazy_details=False,
+                search_counts=False,
+                owner_listings=False,
+                lean_cicd=False,
+                auto_refresh=False,
+                events_refresh=False,
+                connector_config=ConnectorConfig(),
+                connection_metrics=False,
+                uv_audit_max_age=timedelta(hours=24),
+                uv_audit_concurrency=4,
+                uv_audit_low_priority=False,
+                shared_audit=False,
+                advisory_database=None,
+                sync_advisory_database=False,
+            )
 
     # ----------------------------------------------------------------------
     def test_with_debug_true(self, tmp_path: Path) -> None:
@@ -121,9 +249,28 @@ class TestEntryPoint:
             mock_instance = MagicMock()
             mock_main_app.return_value = mock_instance
 
-            EntryPoint(working_dir=tmp_path, debug=True)
-
-            mock_main_app.assert_called_once_with(tmp_path, None, debug=True)
+            EntryPoint(working_dir=tmp_path, debug=True, cache_dir=DEFAULT_CACHE_DIR)
+
+            mock_main_app.assert_called_once_with(
+                tmp_path,
+                None,
+                debug=True,
+                cache_dir=DEFAULT_CACHE_DIR,
+                lazy_details=False,
+                search_counts=False,
+                owner_listings=False,
+                lean_cicd=False,
+                auto_refresh=False,
+                events_refresh=False,
+                connector_config=ConnectorConfig(),
+                connection_metrics=False,
+                uv_audit_max_age=timedelta(hours=24),
+                uv_audit_concurrency=4,
+                uv_audit_low_priority=False,
+                shared_audit=False,
+                advisory_database=None,
+                sync_advisory_database=False,
+            )
             mock_instance.run.assert_called_once()
 
     # ----------------------------------------------------------------------
@@ -136,7 +283,26 @@ class TestEntryPoint:
 
             EntryPoint(working_dir=tmp_path, pat_token_or_filename=None)
 
-            mock_main_app.assert_called_once_with(tmp_path, None, debug=False)
+            mock_main_app.assert_called_once_with(
+                tmp_path,
+                None,
+                debug=False,
+                cache_dir=DEFAULT_CACHE_DIR,
+                lazy_details=False,
+                search_counts=False,
+                owner_listings=False,
+                lean_cicd=False,
+                auto_refresh=False,
+                events_refresh=False,
+                connector_config=ConnectorConfig(),
+                connection_metrics=False,
+                uv_audit_max_age=timedelta(hours=24),
+                uv_audit_concurrency=4,
+                uv_audit_low_priority=False,
+                shared_audit=False,
+                advisory_database=None,
+                sync_advisory_database=False,
+            )
 
     # ----------------------------------------------------------------------
     def test_very_long_string_not_treated_as_filename(self, tmp_path: Path) -> None:
@@ -151,7 +317,401 @@ class TestEntryPoint:
             EntryPoint(working_dir=tmp_path, pat_token_or_filename=long_token)
 
             # Should pass the long string directly without trying to read as file
-            mock_main_app.assert_called_once_with(tmp_path, long_token, debug=False)
+            mock_main_app.assert_called_once_with(
+                tmp_path,
+                long_token,
+                debug=False,
+                cache_dir=DEFAULT_CACHE_DIR,
+                lazy_details=False,
+                search_counts=False,
+                owner_listings=False,
+                lean_cicd=False,
+                auto_refresh=False,
+                events_refresh=False,
+                connector_config=ConnectorConfig(),
+                connection_metrics=False,
+                uv_audit_max_age=timedelta(hours=24),
+                uv_audit_concurrency=4,
+                uv_audit_low_priority=False,
+                shared_audit=False,
+                advisory_database=None,
+                sync_advisory_database=False,
+            )
+
+    # ----------------------------------------------------------------------
+    def test_with_cache_dir(self, tmp_path: Path) -> None:
+        """The cache directory is passed to MainApp."""
+
+        with patch("AllGitStatus.__main__.MainApp") as mock_main_app:
+            EntryPoint(working_dir=tmp_path, cache_dir=tmp_path / "cache")
+
+            mock_main_app.assert_called_once_with(
+                tmp_path,
+                None,
+                debug=False,
+                cache_dir=tmp_path / "cache",
+                lazy_details=False,
+                search_counts=False,
+                owner_listings=False,
+                lean_cicd=False,
+                auto_refresh=False,
+                events_refresh=False,
+                connector_config=ConnectorConfig(),
+                connection_metrics=False,
+                uv_audit_max_age=timedelta(hours=24),
+                uv_audit_concurrency=4,
+                uv_audit_low_priority=False,
+                shared_audit=False,
+                advisory_database=None,
+                sync_advisory_database=False,
+            )
+
+    # ----------------------------------------------------------------------
+    def test_with_no_cache(self, tmp_path: Path) -> None:
+        """The cache is disabled when --no-cache is provided."""
+
+        with patch("AllGitStatus.__main__.MainApp") as mock_main_app:
+            EntryPoint(working_dir=tmp_path, no_cache=True)
+
+            mock_main_app.assert_called_once_with(
+                tmp_path,
+                None,
+                debug=False,
+                cache_dir=None,
+                lazy_details=False,
+                search_counts=False,
+                owner_listings=False,
+                lean_cicd=False,
+                auto_refresh=False,
+                events_refresh=False,
+                connector_config=ConnectorConfig(),
+                connection_metrics=False,
+                uv_audit_max_age=timedelta(hours=24),
+                uv_audit_concurrency=4,
+                uv_audit_low_priority=False,
+                shared_audit=False,
+                advisory_database=None,
+                sync_advisory_database=False,
+            )
+
+    # ----------------------------------------------------------------------
+    def test_with_lazy_details(self, tmp_path: Path) -> None:
+        """Lazy details are enabled when --lazy-details is provided."""
+
+        with patch("AllGitStatus.__main__.MainApp") as mock_main_app:
+            EntryPoint(working_dir=tmp_path, lazy_details=True)
+
+            mock_main_app.assert_called_once_with(
+                tmp_path,
+                None,
+                debug=False,
+                cache_dir=DEFAULT_CACHE_DIR,
+                lazy_details=True,
+                search_counts=False,
+                owner_listings=False,
+                lean_cicd=False,
+                auto_refresh=False,
+                events_refresh=False,
+                connector_config=ConnectorConfig(),
+                connection_metrics=False,
+                uv_audit_max_age=timedelta(hours=24),
+                uv_audit_concurrency=4,
+                uv_audit_low_priority=False,
+                shared_audit=False,
+                advisory_database=None,
+                sync_advisory_database=False,
+            )
+
+    # ----------------------------------------------------------------------
+    def test_with_owner_listings(self, tmp_path: Path) -> None:
+        """Owner listings are enabled when --owner-listings is provided."""
+
+        with patch("AllGitStatus.__main__.MainApp") as mock_main_app:
+            EntryPoint(working_dir=tmp_path, owner_listings=True)
+
+            mock_main_app.assert_called_once_with(
+                tmp_path,
+                None,
+                debug=False,
+                cache_dir=DEFAULT_CACHE_DIR,
+                lazy_details=False,
+                search_counts=False,
+                owner_listings=True,
+                lean_cicd=False,
+                auto_refresh=False,
+                events_refresh=False,
+                connector_config=ConnectorConfig(),
+                connection_metrics=False,
+                uv_audit_max_age=timedelta(hours=24),
+                uv_audit_concurrency=4,
+                uv_audit_low_priority=False,
+                shared_audit=False,
+                advisory_database=None,
+                sync_advisory_database=False,
+            )
+
+    # ----------------------------------------------------------------------
+    def test_with_search_counts(self, tmp_path: Path) -> None:
+        """Search counts (and lazy details) are enabled when --search-counts is provided."""
+
+        with patch("AllGitStatus.__main__.MainApp") as mock_main_app:
+            EntryPoint(working_dir=tmp_path, search_counts=True)
+
+            mock_main_app.assert_called_once_with(
+                tmp_path,
+                None,
+                debug=False,
+                cache_dir=DEFAULT_CACHE_DIR,
+                lazy_details=True,
+                search_counts=True,
+                owner_listings=False,
+                lean_cicd=False,
+                auto_refresh=False,
+                events_refresh=False,
+                connector_config=ConnectorConfig(),
+                connection_metrics=False,
+                uv_audit_max_age=timedelta(hours=24),
+                uv_audit_concurrency=4,
+                uv_audit_low_priority=False,
+                shared_audit=False,
+                advisory_database=None,
+                sync_advisory_database=False,
+            )
+
+    # ----------------------------------------------------------------------
+    def test_with_lean_cicd(self, tmp_path: Path) -> None:
+        """Lean CI/CD queries are enabled when --lean-cicd is provided."""
+
+        with patch("AllGitStatus.__main__.MainApp") as mock_main_app:
+            EntryPoint(working_dir=tmp_path, lean_cicd=True)
+
+            mock_main_app.assert_called_once_with(
+                tmp_path,
+                None,
+                debug=False,
+                cache_dir=DEFAULT_CACHE_DIR,
+                lazy_details=False,
+                search_counts=False,
+                owner_listings=False,
+                lean_cicd=True,
+                auto_refresh=False,
+                events_refresh=False,
+                connector_config=ConnectorConfig(),
+                connection_metrics=False,
+                uv_audit_max_age=timedelta(hours=24),
+                uv_audit_concurrency=4,
+                uv_audit_low_priority=False,
+                shared_audit=False,
+                advisory_database=None,
+                sync_advisory_database=False,
+            )
+
+    # ----------------------------------------------------------------------
+    def test_with_auto_refresh(self, tmp_path: Path) -> None:
+        """Background polling is enabled when --auto-refresh is provided."""
+
+        with patch("AllGitStatus.__main__.MainApp") as mock_main_app:
+            EntryPoint(working_dir=tmp_path, auto_refresh=True)
+
+            mock_main_app.assert_called_once_with(
+                tmp_path,
+                None,
+                debug=False,
+                cache_dir=DEFAULT_CACHE_DIR,
+                lazy_details=False,
+                search_counts=False,
+                owner_listings=False,
+                lean_cicd=False,
+                auto_refresh=True,
+                events_refresh=False,
+                connector_config=ConnectorConfig(),
+                connection_metrics=False,
+                uv_audit_max_age=timedelta(hours=24),
+                uv_audit_concurrency=4,
+                uv_audit_low_priority=False,
+                shared_audit=False,
+                advisory_database=None,
+                sync_advisory_database=False,
+            )
+
+    # ----------------------------------------------------------------------
+    def test_with_events_refresh(self, tmp_path: Path) -> None:
+        """Events feed refreshes are enabled when --events-refresh is provided."""
+
+        with patch("AllGitStatus.__main__.MainApp") as mock_main_app:
+            EntryPoint(working_dir=tmp_path, events_refresh=True)
+
+            mock_main_app.assert_called_once_with(
+                tmp_path,
+                None,
+                debug=False,
+                cache_dir=DEFAULT_CACHE_DIR,
+                lazy_details=False,
+                search_counts=False,
+                owner_listings=False,
+                lean_cicd=False,
+                auto_refresh=False,
+                events_refresh=True,
+                connector_config=ConnectorConfig(),
+                connection_metrics=False,
+                uv_audit_max_age=timedelta(hours=24),
+                uv_audit_concurrency=4,
+                uv_audit_low_priority=False,
+                shared_audit=False,
+                advisory_database=None,
+                sync_advisory_database=False,
+            )
+
+    # ----------------------------------------------------------------------
+    def test_with_connection_options(self, tmp_path: Path) -> None:
+        """Connection pool options and metrics are provided to MainApp."""
+
+        with patch("AllGitStatus.__main__.MainApp") as mock_main_app:
+            EntryPoint(
+                working_dir=tmp_path,
+                connection_limit=20,
+                connection_limit_per_host=5,
+                keepalive_timeout=30.0,
+                dns_cache_ttl=300,
+                connection_metrics=True,
+            )
+
+            mock_main_app.assert_called_once_with(
+                tmp_path,
+                None,
+                debug=False,
+                cache_dir=DEFAULT_CACHE_DIR,
+                lazy_details=False,
+                search_counts=False,
+                owner_listings=False,
+                lean_cicd=False,
+                auto_refresh=False,
+                events_refresh=False,
+                connector_config=ConnectorConfig(20, 5, 30.0, 300),
+                connection_metrics=True,
+                uv_audit_max_age=timedelta(hours=24),
+                uv_audit_concurrency=4,
+                uv_audit_low_priority=False,
+                shared_audit=False,
+                advisory_database=None,
+                sync_advisory_database=False,
+            )
+
+    # ----------------------------------------------------------------------
+    def test_with_uv_audit_max_age(self, tmp_path: Path) -> None:
+        """The maximum age of cached uv audit results is provided to MainApp."""
+
+        with patch("AllGitStatus.__main__.MainApp") as mock_main_app:
+            EntryPoint(working_dir=tmp_path, uv_audit_max_age=1.5)
+
+            mock_main_app.assert_called_once_with(
+                tmp_path,
+                None,
+                debug=False,
+                cache_dir=DEFAULT_CACHE_DIR,
+                lazy_details=False,
+                search_counts=False,
+                owner_listings=False,
+                lean_cicd=False,
+                auto_refresh=False,
+                events_refresh=False,
+                connector_config=ConnectorConfig(),
+                connection_metrics=False,
+                uv_audit_max_age=timedelta(minutes=90),
+                uv_audit_concurrency=4,
+                uv_audit_low_priority=False,
+                shared_audit=False,
+                advisory_database=None,
+                sync_advisory_database=False,
+            )
+
+    # ----------------------------------------------------------------------
+    def test_with_shared_audit(self, tmp_path: Path) -> None:
+        """Shared dependency audits are enabled in MainApp."""
+
+        with patch("AllGitStatus.__main__.MainApp") as mock_main_app:
+            EntryPoint(working_dir=tmp_path, shared_audit=True)
+
+            mock_main_app.assert_called_once_with(
+                tmp_path,
+                None,
+                debug=False,
+                cache_dir=DEFAULT_CACHE_DIR,
+                lazy_details=False,
+                search_counts=False,
+                owner_listings=False,
+                lean_cicd=False,
+                auto_refresh=False,
+                events_refresh=False,
+                connector_config=ConnectorConfig(),
+                connection_metrics=False,
+                uv_audit_max_age=timedelta(hours=24),
+                uv_audit_concurrency=4,
+                uv_audit_low_priority=False,
+                shared_audit=True,
+                advisory_database=None,
+                sync_advisory_database=False,
+            )
+
+    # ----------------------------------------------------------------------
+    def test_with_advisory_db(self, tmp_path: Path) -> None:
+        """The local advisory database is provided to MainApp."""
+
+        with patch("AllGitStatus.__main__.MainApp") as mock_main_app:
+            EntryPoint(
+                working_dir=tmp_path,
+                advisory_db=tmp_path / "Advisories.db",
+                sync_advisory_db=True,
+            )
+
+            mock_main_app.assert_called_once_with(
+                tmp_path,
+                None,
+                debug=False,
+                cache_dir=DEFAULT_CACHE_DIR,
+                lazy_details=False,
+                search_counts=False,
+                owner_listings=False,
+                lean_cicd=False,
+                auto_refresh=False,
+                events_refresh=False,
+                connector_config=ConnectorConfig(),
+                connection_metrics=False,
+                uv_audit_max_age=timedelta(hours=24),
+                uv_audit_concurrency=4,
+                uv_audit_low_priority=False,
+                shared_audit=False,
+                advisory_database=tmp_path / "Advisories.db",
+                sync_advisory_database=True,
+            )
+
+    # ----------------------------------------------------------------------
+    def test_with_uv_audit_concurrency(self, tmp_path: Path) -> None:
+        """The uv audit concurrency limit and priority are provided to MainApp."""
+
+        with patch("AllGitStatus.__main__.MainApp") as mock_main_app:
+            EntryPoint(working_dir=tmp_path, uv_audit_concurrency=2, uv_audit_low_priority=True)
+
+            mock_main_app.assert_called_once_with(
+                tmp_path,
+                None,
+                debug=False,
+                cache_dir=DEFAULT_CACHE_DIR,
+                lazy_details=False,
+                search_counts=False,
+                owner_listings=False,
+                lean_cicd=False,
+                auto_refresh=False,
+                events_refresh=False,
+                connector_config=ConnectorConfig(),
+                connection_metrics=False,
+                uv_audit_max_age=timedelta(hours=24),
+                uv_audit_concurrency=2,
+                uv_audit_low_priority=True,
+                shared_audit=False,
+                advisory_database=None,
+                sync_advisory_database=False,
+            )
 
     # ----------------------------------------------------------------------
     def test_mainapp_run_is_called(self, tmp_path: Path) -> None: